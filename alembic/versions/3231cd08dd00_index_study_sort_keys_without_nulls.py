@@ -0,0 +1,39 @@
+"""index_study_sort_keys_without_nulls
+
+Revision ID: 3231cd08dd00
+Revises: 6bd9015f98eb
+Create Date: 2026-10-19 21:47:30.207614
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '3231cd08dd00'
+down_revision = '6bd9015f98eb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The sort keys of the studies without a name or a creation date are not NULL
+    with op.batch_alter_table('study', schema=None) as batch_op:
+        batch_op.drop_index('ix_study_created_at_id')
+        batch_op.drop_index('ix_study_upper_name_id')
+        batch_op.drop_index('ix_study_name_id')
+        batch_op.create_index('ix_study_name_id', [sa.text("coalesce(name, '')"), 'id'], unique=False)
+        batch_op.create_index('ix_study_upper_name_id', [sa.text("upper(coalesce(name, ''))"), 'id'], unique=False)
+        batch_op.create_index(
+            'ix_study_created_at_id', [sa.text("coalesce(created_at, '0001-01-01 00:00:00')"), 'id'], unique=False
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('study', schema=None) as batch_op:
+        batch_op.drop_index('ix_study_created_at_id')
+        batch_op.drop_index('ix_study_upper_name_id')
+        batch_op.drop_index('ix_study_name_id')
+        batch_op.create_index('ix_study_name_id', ['name', 'id'], unique=False)
+        batch_op.create_index('ix_study_upper_name_id', [sa.text('upper(name)'), 'id'], unique=False)
+        batch_op.create_index('ix_study_created_at_id', ['created_at', 'id'], unique=False)
@@ -0,0 +1,26 @@
+"""add_commandblock_matrices_index_failure
+
+Revision ID: 6bd9015f98eb
+Revises: 9dc070bcdf90
+Create Date: 2026-10-19 21:04:12.518376
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '6bd9015f98eb'
+down_revision = '9dc070bcdf90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('commandblock', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('matrices_index_failure', sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('commandblock', schema=None) as batch_op:
+        batch_op.drop_column('matrices_index_failure')
@@ -0,0 +1,30 @@
+"""add_study_sort_key_indexes
+
+Revision ID: 9dc070bcdf90
+Revises: e1b7d04c5a93
+Create Date: 2026-10-19 18:24:37.104512
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '9dc070bcdf90'
+down_revision = 'e1b7d04c5a93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('study', schema=None) as batch_op:
+        batch_op.create_index('ix_study_name_id', ['name', 'id'], unique=False)
+        batch_op.create_index('ix_study_upper_name_id', [sa.text('upper(name)'), 'id'], unique=False)
+        batch_op.create_index('ix_study_created_at_id', ['created_at', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('study', schema=None) as batch_op:
+        batch_op.drop_index('ix_study_created_at_id')
+        batch_op.drop_index('ix_study_upper_name_id')
+        batch_op.drop_index('ix_study_name_id')
@@ -0,0 +1,43 @@
+"""add_commandblock_matrix_table
+
+Revision ID: c3e58a1f9d42
+Revises: 80fdf2408ede
+Create Date: 2026-10-19 10:12:43.318270
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'c3e58a1f9d42'
+down_revision = '80fdf2408ede'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The existing command blocks are not indexed: their matrices are extracted when they are first read
+    with op.batch_alter_table('commandblock', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('matrices_indexed', sa.Boolean(), server_default=sa.false(), nullable=False))
+        batch_op.add_column(sa.Column('generates_matrices', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+    op.create_table('commandblock_matrix',
+        sa.Column('block_id', sa.String(length=36), nullable=False),
+        sa.Column('matrix_id', sa.String(length=64), nullable=False),
+        sa.ForeignKeyConstraint(['block_id'], ['commandblock.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('block_id', 'matrix_id')
+    )
+    with op.batch_alter_table('commandblock_matrix', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_commandblock_matrix_matrix_id'), ['matrix_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('commandblock_matrix', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_commandblock_matrix_matrix_id'))
+
+    op.drop_table('commandblock_matrix')
+
+    with op.batch_alter_table('commandblock', schema=None) as batch_op:
+        batch_op.drop_column('generates_matrices')
+        batch_op.drop_column('matrices_indexed')
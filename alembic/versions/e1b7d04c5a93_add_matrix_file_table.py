@@ -0,0 +1,37 @@
+"""add_matrix_file_table
+
+Revision ID: e1b7d04c5a93
+Revises: c3e58a1f9d42
+Create Date: 2026-10-19 16:02:11.527384
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'e1b7d04c5a93'
+down_revision = 'c3e58a1f9d42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('matrix_file',
+        sa.Column('path', sa.String(), nullable=False),
+        sa.Column('size', sa.BigInteger(), nullable=False),
+        sa.Column('mtime_ns', sa.BigInteger(), nullable=False),
+        sa.Column('inode', sa.BigInteger(), nullable=False),
+        sa.Column('matrix_id', sa.String(length=64), nullable=False),
+        sa.ForeignKeyConstraint(['matrix_id'], ['matrix.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('path')
+    )
+    with op.batch_alter_table('matrix_file', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_matrix_file_matrix_id'), ['matrix_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('matrix_file', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_matrix_file_matrix_id'))
+
+    op.drop_table('matrix_file')
@@ -25,6 +25,7 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator, model_valida
 
 from antarest.core.roles import RoleType
 from antarest.core.utils.archives import ArchiveFormat
+from antarest.core.utils.files import CopyMode
 from antarest.output.storage.output_storage import OutputStorageType
 from antarest.study.model import DEFAULT_WORKSPACE_NAME
 
@@ -109,6 +110,7 @@ class DbConfig(ConfigBaseModel):
     pool_max_overflow: int = 10
     pool_size: int = 5
     pool_use_lifo: bool = False
+    async_reads: bool = False
 
 
 class V2OutputStorageConfig(ConfigBaseModel):
@@ -188,6 +190,16 @@ class StorageConfig(ConfigBaseModel):
     auto_archive_sleeping_time: int = 3600
     auto_archive_cron: str = "0 20-23,0-7 * * * "
     snapshot_retention_days: int = 7
+    snapshot_copy_mode: CopyMode = CopyMode.COPY
+    snapshot_max_layers: int = 10
+    variant_generation_workers: int = 1
+    snapshot_checkpoint_interval: int = 0
+    snapshot_checkpoint_min_seconds: float = 5
+    snapshot_checkpoint_sharing: bool = True
+    snapshot_pregeneration_delay: int = 10
+    snapshot_pregeneration_workers: int = 1
+    snapshot_pregeneration_access_days: int = 7
+    db_import_workers: int = 4
     matrixstore_format: InternalMatrixFormat = InternalMatrixFormat.TSV
     blobstore: Path = Path("./blobstore")
     blob_gc_sleeping_time: int = 86400
@@ -222,6 +222,16 @@ class StudyNotFoundError(HTTPException):
         super().__init__(HTTPStatus.NOT_FOUND, message)
 
 
+class StudyCursorNotFound(HTTPException):
+    """
+    Exception raised when the study given as a pagination cursor of a search does not exist.
+    """
+
+    def __init__(self, study_id: str) -> None:
+        message = f"Study '{study_id}' of the pagination cursor not found"
+        super().__init__(HTTPStatus.UNPROCESSABLE_ENTITY, message)
+
+
 class VariantGenerationError(HTTPException):
     def __init__(self, message: str) -> None:
         super().__init__(HTTPStatus.EXPECTATION_FAILED, message)
@@ -461,6 +471,11 @@ class IncorrectPathError(HTTPException):
         super().__init__(HTTPStatus.NOT_FOUND, message)
 
 
+class InvalidMatrixSliceError(HTTPException):
+    def __init__(self, message: str) -> None:
+        super().__init__(HTTPStatus.BAD_REQUEST, message)
+
+
 class UrlNotMatchJsonDataError(HTTPException):
     def __init__(self, message: str) -> None:
         super().__init__(HTTPStatus.NOT_FOUND, message)
@@ -27,6 +27,7 @@ class EventType(StrEnum):
     STUDY_DELETED = "STUDY_DELETED"
     STUDY_EDITED = "STUDY_EDITED"
     STUDY_DATA_EDITED = "STUDY_DATA_EDITED"
+    STUDY_SNAPSHOT_OUTDATED = "STUDY_SNAPSHOT_OUTDATED"
     STUDY_JOB_STARTED = "STUDY_JOB_STARTED"
     STUDY_JOB_LOG_UPDATE = "STUDY_JOB_LOG_UPDATE"
     STUDY_JOB_COMPLETED = "STUDY_JOB_COMPLETED"
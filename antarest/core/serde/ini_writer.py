@@ -20,6 +20,7 @@ from typing_extensions import override
 
 from antarest.core.model import JSON
 from antarest.core.serde.ini_common import OptionMatcher, PrimitiveType, any_section_option_matcher
+from antarest.core.utils.files import break_hardlink
 
 # Value serializers may be used to customize the way INI options are serialized
 ValueSerializer: TypeAlias = Callable[[str], PrimitiveType]
@@ -124,6 +125,7 @@ class IniWriter:
         """
         config_parser = IniConfigParser(special_keys=self.special_keys, value_serializers=self._value_serializers)
         config_parser.read_dict(data)
+        break_hardlink(path)
         with path.open("w") as fp:
             config_parser.write(fp)
 
@@ -142,6 +144,7 @@ class SimpleKeyValueWriter(IniWriter):
             data: JSON content.
             path: path to `.ini` file.
         """
+        break_hardlink(path)
         with path.open("w") as fp:
             for key, value in data.items():
                 if value is not None:
@@ -33,6 +33,7 @@ if TYPE_CHECKING:
 class TaskType(StrEnum):
     EXPORT = "EXPORT"
     VARIANT_GENERATION = "VARIANT_GENERATION"
+    VARIANT_COMMANDS_IMPORT = "VARIANT_COMMANDS_IMPORT"
     COPY = "COPY"
     ARCHIVE = "ARCHIVE"
     UNARCHIVE = "UNARCHIVE"
@@ -14,7 +14,8 @@ import datetime
 from http import HTTPStatus
 
 from fastapi import HTTPException
-from sqlalchemy import and_, select
+from sqlalchemy import Select, and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from antarest.core.tasks.model import TaskJob, TaskListFilter
@@ -57,7 +58,21 @@ class TaskJobRepository:
             raise HTTPException(HTTPStatus.NOT_FOUND, f"Task {id} not found")
         return task
 
+    async def list_async(self, session: AsyncSession, filter: TaskListFilter, user: int | None = None) -> list[TaskJob]:
+        """
+        Same as `list`, with an async session.
+        """
+        result = await session.execute(self._select_tasks(filter, user))
+        tasks: list[TaskJob] = list(result.scalars().all())
+        return tasks
+
     def list(self, filter: TaskListFilter, user: int | None = None) -> list[TaskJob]:
+        result = self.session.execute(self._select_tasks(filter, user))
+        tasks: list[TaskJob] = list(result.scalars().all())
+        return tasks
+
+    @staticmethod
+    def _select_tasks(filter: TaskListFilter, user: int | None) -> Select[tuple[TaskJob]]:
         stmt = select(TaskJob)
         if user:
             stmt = stmt.where(TaskJob.owner_id == user)
@@ -85,10 +100,7 @@ class TaskJobRepository:
         if filter.type:
             _types = [task_type.value for task_type in filter.type]
             stmt = stmt.where(TaskJob.type.in_(_types))
-
-        result = self.session.execute(stmt)
-        tasks: list[TaskJob] = list(result.scalars().all())
-        return tasks
+        return stmt
 
     def delete(self, tid: str) -> None:
         session = self.session
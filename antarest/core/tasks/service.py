@@ -19,7 +19,9 @@ from typing import TypeAlias
 
 from fastapi import HTTPException
 from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from typing_extensions import override
 
 from antarest.core.config import Config
@@ -99,6 +101,15 @@ class ITaskService(ABC):
     def list_tasks(self, task_filter: TaskListFilter) -> list[TaskDTO]:
         raise NotImplementedError()
 
+    async def list_tasks_async(self, task_filter: TaskListFilter, session: AsyncSession | None) -> list[TaskDTO]:
+        """
+        Same as `list_tasks`, with an async session.
+
+        If no session is given, the tasks are listed with the sync session, in the thread pool.
+        The default implementation always does so.
+        """
+        return await run_in_threadpool(self.list_tasks, task_filter)
+
     @abstractmethod
     def await_task(self, task_id: str, timeout_sec: int = DEFAULT_AWAIT_MAX_TIMEOUT) -> None:
         """
@@ -350,10 +361,21 @@ class TaskJobService(ITaskService):
     def list_tasks(self, task_filter: TaskListFilter) -> list[TaskDTO]:
         return [task.to_dto() for task in self._list_db_tasks(task_filter)]
 
+    @override
+    async def list_tasks_async(self, task_filter: TaskListFilter, session: AsyncSession | None) -> list[TaskDTO]:
+        if session is None:
+            return await run_in_threadpool(self.list_tasks, task_filter)
+        tasks = await self.repo.list_async(session, task_filter, self._get_tasks_owner())
+        return [task.to_dto() for task in tasks]
+
     def _list_db_tasks(self, task_filter: TaskListFilter) -> list[TaskJob]:
+        return self.repo.list(task_filter, self._get_tasks_owner())
+
+    @staticmethod
+    def _get_tasks_owner() -> int | None:
+        # The site administrators see the tasks of all the users
         current_user = require_current_user()
-        user = None if current_user.is_site_admin() else current_user.impersonator
-        return self.repo.list(task_filter, user)
+        return None if current_user.is_site_admin() else current_user.impersonator
 
     @override
     def await_task(self, task_id: str, timeout_sec: int = DEFAULT_AWAIT_MAX_TIMEOUT) -> None:
@@ -21,7 +21,7 @@ from antarest.core.api_types import UuidStr
 from antarest.core.tasks.model import TaskDTO, TaskListFilter
 from antarest.core.tasks.service import DEFAULT_AWAIT_MAX_TIMEOUT
 from antarest.core.utils.web import APITag
-from antarest.dependencies import TaskServiceDep, auth_required
+from antarest.dependencies import AsyncSessionDep, TaskServiceDep, auth_required
 
 logger = logging.getLogger(__name__)
 
@@ -29,13 +29,17 @@ logger = logging.getLogger(__name__)
 def create_tasks_api() -> APIRouter:
     bp = APIRouter(prefix="/v1", tags=[APITag.tasks], dependencies=[Depends(auth_required)])
 
+    # The listing of tasks is read-only: it doesn't hold a thread while waiting on the database
+
     @bp.post("/tasks", deprecated=True)
-    def list_tasks(service: TaskServiceDep, filter: TaskListFilter) -> list[TaskDTO]:
-        return service.list_tasks(filter)
+    async def list_tasks(service: TaskServiceDep, session: AsyncSessionDep, filter: TaskListFilter) -> list[TaskDTO]:
+        return await service.list_tasks_async(filter, session)
 
     @bp.get("/tasks")
-    def get_task_list(service: TaskServiceDep, task_filter: Annotated[TaskListFilter, Query()]) -> list[TaskDTO]:
-        return service.list_tasks(task_filter)
+    async def get_task_list(
+        service: TaskServiceDep, session: AsyncSessionDep, task_filter: Annotated[TaskListFilter, Query()]
+    ) -> list[TaskDTO]:
+        return await service.list_tasks_async(task_filter, session)
 
     @bp.get("/tasks/{task_id}")
     def get_task(
@@ -15,7 +15,8 @@ import os
 import shutil
 import tempfile
 import zipfile
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
 from subprocess import CalledProcessError, run
@@ -58,7 +59,11 @@ def archive_dir(
             logger.info("Using 7z to create archive")
             target_archive_path.unlink(missing_ok=True)
             try:
-                run(["7z", "a", str(target_archive_path.resolve()), "."], cwd=str(src_dir_path), check=True)
+                run(
+                    ["7z", "a", "-mmt=on", str(target_archive_path.resolve()), "."],
+                    cwd=str(src_dir_path),
+                    check=True,
+                )
             except CalledProcessError as e:
                 logger.error(f"Error while creating archive: {e}")
                 raise
@@ -68,18 +73,100 @@ def archive_dir(
             with py7zr.SevenZipFile(target_archive_path, mode="w") as szf:
                 szf.writeall(src_dir_path, arcname="")
     elif target_archive_path.suffix == ArchiveFormat.ZIP:
-        with zipfile.ZipFile(target_archive_path, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=2) as zipf:
-            len_dir_path = len(str(src_dir_path))
-            for root, _, files in os.walk(src_dir_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    zipf.write(file_path, file_path[len_dir_path:])
+        with target_archive_path.open("wb") as target:
+            write_zip_archive(src_dir_path, target)
     else:
         raise ShouldNotHappenException(f"Unsupported archive format {target_archive_path.suffix}")
     if remove_source_dir:
         shutil.rmtree(src_dir_path)
 
 
+# Size of the chunks read from the archived files
+_CHUNK_SIZE = 1024 * 1024
+
+_ZIP_COMPRESS_LEVEL = 2
+
+
+class _ChunkBuffer:
+    """
+    Non-seekable stream keeping the written bytes until they are consumed.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def pop(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_zip_archive(src_dir_path: Path) -> Iterator[bytes]:
+    """
+    Compresses a directory as a ZIP archive, produced incrementally.
+
+    Files are read and compressed chunk by chunk, without any intermediate copy on disk,
+    so that the archive can be sent while it is compressed (in an HTTP response for instance).
+
+    Args:
+        src_dir_path: the directory to compress, which is the root of the archive.
+
+    Returns:
+        The successive chunks of the archive.
+    """
+    buffer = _ChunkBuffer()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zipf:
+        for root, _, files in os.walk(src_dir_path):
+            for file in files:
+                file_path = Path(root) / file
+                info = zipfile.ZipInfo.from_file(file_path, file_path.relative_to(src_dir_path).as_posix())
+                info.compress_type = zipfile.ZIP_DEFLATED
+                # `ZipFile.write` sets this private attribute too, there is no public API for it
+                info._compresslevel = _ZIP_COMPRESS_LEVEL  # type: ignore[attr-defined]
+                with file_path.open("rb") as src, zipf.open(info, mode="w") as dst:
+                    while chunk := src.read(_CHUNK_SIZE):
+                        dst.write(chunk)
+                        if compressed := buffer.pop():
+                            yield compressed
+                # The entry ends with its data descriptor
+                yield buffer.pop()
+    # The archive ends with its central directory
+    yield buffer.pop()
+
+
+def iter_chunks(stream: BinaryIO) -> Iterator[bytes]:
+    """
+    Reads a stream chunk by chunk, and closes it once it is consumed.
+    """
+    with stream:
+        while chunk := stream.read(_CHUNK_SIZE):
+            yield chunk
+
+
+def write_zip_archive(src_dir_path: Path, target: BinaryIO) -> None:
+    """
+    Compresses a directory as a ZIP archive, written directly to the given stream.
+
+    The target may be any writable stream, even a non-seekable one (a pipe, an HTTP response body ...).
+
+    Args:
+        src_dir_path: the directory to compress, which is the root of the archive.
+        target: the binary stream where the archive is written.
+    """
+    for chunk in iter_zip_archive(src_dir_path):
+        target.write(chunk)
+
+
 def extract_archive_from_path(archive_path: Path, target_dir: Path) -> None:
     """
     Extract an archive from a file path, using the native 7z CLI when available.
@@ -121,6 +208,7 @@ def extract_archive_from_path(archive_path: Path, target_dir: Path) -> None:
 def unzip(dir_path: Path, zip_path: Path) -> None:
     """Extract an archive to ``dir_path`` and delete the archive file afterwards."""
     extract_archive_from_path(zip_path, dir_path)
+    clear_zip_indexes()
     zip_path.unlink()
 
 
@@ -206,6 +294,69 @@ def extract_file_to_tmp_dir(archive_path: Path, inside_archive_path: Path) -> tu
     return path, tmp_dir
 
 
+@dataclass(frozen=True)
+class _ZipIndex:
+    zip_file: zipfile.ZipFile
+    members: dict[str, zipfile.ZipInfo]
+
+
+@functools.lru_cache(maxsize=64)
+def _read_zip_index(archive_path: Path, mtime_ns: int, size: int) -> _ZipIndex:
+    # The modification time and size are part of the cache key, to invalidate it when the archive changes.
+    # The archive stays open while it is cached: `ZipFile` supports concurrent reads of its members.
+    zip_file = zipfile.ZipFile(archive_path)
+    return _ZipIndex(zip_file, {info.filename: info for info in zip_file.infolist()})
+
+
+def _get_zip_index(archive_path: Path) -> _ZipIndex:
+    stat = archive_path.stat()
+    return _read_zip_index(archive_path, stat.st_mtime_ns, stat.st_size)
+
+
+def get_zip_index(archive_path: Path) -> dict[str, zipfile.ZipInfo]:
+    """
+    Returns the central directory of a ZIP archive, as a mapping from member names to their info.
+
+    The central directory is read once per archive and kept in cache, as long as the archive is not modified.
+    """
+    return _get_zip_index(archive_path).members
+
+
+def clear_zip_indexes() -> None:
+    """
+    Clears the cache of the ZIP central directories, which closes the cached archives.
+
+    Must be called before deleting an archive, since open files cannot be deleted on Windows.
+    """
+    _read_zip_index.cache_clear()
+
+
+def open_file_in_zip(archive_path: Path, posix_path: str) -> BinaryIO:
+    """
+    Opens a member of a ZIP archive for reading, without extracting it.
+
+    The member is located with the cached central directory, then its data is
+    decompressed on the fly while it is read.
+
+    Args:
+        archive_path: the path to the ZIP archive.
+        posix_path: path to the file inside the archive.
+
+    Returns:
+        A binary stream, which must be closed by the caller.
+
+    Raises:
+        KeyError: if the file does not exist in the archive.
+        BadArchiveContent: if the archive is corrupted.
+    """
+    index = _get_zip_index(archive_path)
+    info = index.members[posix_path]
+    try:
+        return index.zip_file.open(info)  # type: ignore[return-value]
+    except zipfile.BadZipFile as e:
+        raise BadArchiveContent(f"Cannot read '{posix_path}' in {archive_path}: {e}") from e
+
+
 def read_original_file_in_archive(archive_path: Path, posix_path: str) -> bytes:
     """
     Read a file from an archive.
@@ -219,9 +370,8 @@ def read_original_file_in_archive(archive_path: Path, posix_path: str) -> bytes:
     """
 
     if archive_path.suffix == ArchiveFormat.ZIP:
-        with zipfile.ZipFile(archive_path) as zip_obj:
-            with zip_obj.open(posix_path) as f:
-                return f.read()
+        with open_file_in_zip(archive_path, posix_path) as f:
+            return f.read()
     elif archive_path.suffix == ArchiveFormat.SEVEN_ZIP:
         with py7zr.SevenZipFile(archive_path, mode="r") as szf:
             output: bytes = szf.read([posix_path])[posix_path].read()
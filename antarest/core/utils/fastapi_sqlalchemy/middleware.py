@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from contextvars import ContextVar, Token
 from typing import Any, TypeAlias
 
@@ -6,6 +6,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import URL
 from sqlalchemy.event import listen
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
@@ -17,6 +18,7 @@ from antarest.core.utils.fastapi_sqlalchemy.exceptions import MissingSessionErro
 
 _Session: sessionmaker[Session] | None = None
 _session: ContextVar[Session | None] = ContextVar("_session", default=None)
+_AsyncSession: async_sessionmaker[AsyncSession] | None = None
 
 
 def _is_sqlite_engine(engine: Engine) -> bool:
@@ -57,6 +59,36 @@ def init_db_singleton(
     _Session = sessionmaker(bind=engine, **session_args)
 
 
+def init_async_db_singleton(
+    async_engine: AsyncEngine | None,
+    session_args: dict[str, Any] | None = None,
+) -> None:
+    """
+    Sets the engine of the async sessions used by the read-only routes.
+
+    The async path is disabled if no engine is given: the routes then use the sync sessions.
+    """
+    global _AsyncSession
+    if async_engine is None:
+        _AsyncSession = None
+    else:
+        _AsyncSession = async_sessionmaker(bind=async_engine, **(session_args or {}))
+
+
+async def get_async_session() -> AsyncIterator[AsyncSession | None]:
+    """
+    FastAPI dependency returning an async session for the duration of the request,
+    or `None` if the async path is disabled.
+
+    The session is meant for reads: it is rolled back when closed.
+    """
+    if _AsyncSession is None:
+        yield None
+    else:
+        async with _AsyncSession() as session:
+            yield session
+
+
 class DBSessionMiddleware(BaseHTTPMiddleware):
     def __init__(
         self,
@@ -10,9 +10,19 @@
 #
 # This file is part of the Antares project.
 import contextlib
+import dataclasses
+import errno
+import logging
+import os
+import shutil
 import uuid
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterator
+from contextvars import ContextVar
+from enum import StrEnum
 from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
 
 
 @contextlib.contextmanager
@@ -26,3 +36,155 @@ def temp_file_path(dir: Path) -> Generator[Path, None, None]:
         yield file_path
     finally:
         file_path.unlink(missing_ok=True)
+
+
+class CopyMode(StrEnum):
+    """
+    How files are duplicated when copying a directory tree.
+
+    - `copy`: files are fully copied.
+    - `reflink`: files are cloned (copy-on-write at the file system level, on Btrfs, XFS ...),
+      falling back to a full copy when the file system does not support it.
+    - `hardlink`: files are hard-linked, falling back to a full copy across file systems.
+      Writers must call `break_hardlink` before rewriting a file.
+    """
+
+    COPY = "copy"
+    REFLINK = "reflink"
+    HARDLINK = "hardlink"
+
+
+# Linux `FICLONE` ioctl request: `_IOW(0x94, 9, int)`
+_FICLONE = 0x40049409
+_CLONE_UNSUPPORTED_ERRNOS = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.EBADF}
+
+
+def _clone_file(src: str, dst: str) -> bool:
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        return False
+
+    with open(src, "rb") as f_src, open(dst, "wb") as f_dst:
+        try:
+            fcntl.ioctl(f_dst.fileno(), _FICLONE, f_src.fileno())
+        except OSError as e:
+            if e.errno in _CLONE_UNSUPPORTED_ERRNOS:
+                return False
+            raise
+    shutil.copystat(src, dst)
+    return True
+
+
+def reflink_or_copy(src: str, dst: str) -> Any:
+    """
+    Clones a file with a reflink when the file system supports it, else copies it.
+    Can be used as the `copy_function` of `shutil.copytree`.
+    """
+    if not _clone_file(src, dst):
+        shutil.copy2(src, dst)
+    return dst
+
+
+def hardlink_or_copy(src: str, dst: str) -> Any:
+    """
+    Hard-links a file when possible (same file system), else copies it.
+    Can be used as the `copy_function` of `shutil.copytree`.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+_COPY_FUNCTIONS: dict[CopyMode, Callable[[str, str], Any]] = {
+    CopyMode.COPY: shutil.copy2,
+    CopyMode.REFLINK: reflink_or_copy,
+    CopyMode.HARDLINK: hardlink_or_copy,
+}
+
+
+def get_copy_function(copy_mode: CopyMode) -> Callable[[str, str], Any]:
+    """
+    Returns the `copy_function` to use with `shutil.copytree` for the given mode.
+    """
+    return _COPY_FUNCTIONS[copy_mode]
+
+
+def break_hardlink(path: Path) -> None:
+    """
+    Ensures that a file about to be fully rewritten is not shared with another directory tree.
+
+    If the file has several hard links (see `CopyMode.HARDLINK`), it is unlinked, so that
+    the new content is written to a new file and the other trees keep the original one.
+    The file is also recorded as written (see `track_file_changes`).
+    """
+    record_file_written(path)
+    try:
+        if path.stat().st_nlink > 1:
+            path.unlink()
+            logger.debug(f"Hard link broken for '{path}'")
+    except FileNotFoundError:
+        pass
+
+
+_current_changes: ContextVar["FileChanges | None"] = ContextVar("file_changes", default=None)
+
+
+@dataclasses.dataclass
+class FileChanges:
+    """
+    Changes made to the file system by a unit of work (for instance, the generation of a snapshot).
+
+    Attributes:
+        written: Paths of the files created or rewritten.
+        removed: Paths of the files and directories removed.
+        created_dirs: Paths of the directories created.
+    """
+
+    written: set[Path] = dataclasses.field(default_factory=set)
+    removed: set[Path] = dataclasses.field(default_factory=set)
+    created_dirs: set[Path] = dataclasses.field(default_factory=set)
+
+
+@contextlib.contextmanager
+def track_file_changes() -> Iterator[FileChanges]:
+    """
+    Tracks the changes made to the file system in the current context until the end of the `with` block.
+
+    The writers report the files and directories they create or remove with the `record_*` functions,
+    which do nothing unless changes are tracked in the current context.
+    The tracked changes are shared with the threads running in a copy of the context.
+    """
+    changes = FileChanges()
+    token = _current_changes.set(changes)
+    try:
+        yield changes
+    finally:
+        _current_changes.reset(token)
+
+
+def discard_file_changes() -> None:
+    """
+    Forgets the changes tracked so far in the current context, for instance when the directory is rebuilt.
+    """
+    if changes := _current_changes.get():
+        changes.written.clear()
+        changes.removed.clear()
+        changes.created_dirs.clear()
+
+
+def record_file_written(path: Path) -> None:
+    if changes := _current_changes.get():
+        changes.written.add(path)
+
+
+def record_file_removed(path: Path) -> None:
+    if changes := _current_changes.get():
+        changes.removed.add(path)
+
+
+def record_dir_created(path: Path) -> None:
+    if changes := _current_changes.get():
+        changes.created_dirs.add(path)
@@ -0,0 +1,95 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Profiling of the I/O performed by a unit of work (for instance, the application of a command).
+
+The storage layers report the matrices and INI files they access with the `record_*` functions,
+which do nothing unless a profile is active in the current context (see `io_profile`).
+The bytes read and written are measured with the I/O counters of the current thread,
+when the platform provides them (Linux).
+"""
+
+import contextlib
+import dataclasses
+from collections.abc import Iterator
+from contextvars import ContextVar
+from pathlib import Path
+
+_THREAD_IO_PATH = Path("/proc/thread-self/io")
+
+_current_profile: ContextVar["IOProfile | None"] = ContextVar("io_profile", default=None)
+
+
+@dataclasses.dataclass
+class IOProfile:
+    """
+    I/O performed by a unit of work.
+
+    Attributes:
+        matrices_read: Number of matrices read (from the matrix store or from study files).
+        matrices_written: Number of matrices written (to the matrix store or to study files).
+        ini_files: Paths of the INI files read, written or deleted.
+        bytes_read: Number of bytes read by the thread, `None` if not measurable.
+        bytes_written: Number of bytes written by the thread, `None` if not measurable.
+    """
+
+    matrices_read: int = 0
+    matrices_written: int = 0
+    ini_files: set[str] = dataclasses.field(default_factory=set)
+    bytes_read: int | None = None
+    bytes_written: int | None = None
+
+
+def _read_thread_io() -> tuple[int, int] | None:
+    """
+    Returns the numbers of bytes read and written by the current thread, if available.
+    """
+    try:
+        counters = dict(line.split(": ", 1) for line in _THREAD_IO_PATH.read_text().splitlines())
+        return int(counters["rchar"]), int(counters["wchar"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+@contextlib.contextmanager
+def io_profile() -> Iterator[IOProfile]:
+    """
+    Profiles the I/O performed in the current context until the end of the `with` block.
+
+    The work must be done by the current thread for the bytes to be measured.
+    """
+    profile = IOProfile()
+    token = _current_profile.set(profile)
+    start = _read_thread_io()
+    try:
+        yield profile
+    finally:
+        end = _read_thread_io()
+        if start is not None and end is not None:
+            profile.bytes_read = end[0] - start[0]
+            profile.bytes_written = end[1] - start[1]
+        _current_profile.reset(token)
+
+
+def record_matrix_read() -> None:
+    if profile := _current_profile.get():
+        profile.matrices_read += 1
+
+
+def record_matrix_written() -> None:
+    if profile := _current_profile.get():
+        profile.matrices_written += 1
+
+
+def record_ini_file(path: Path) -> None:
+    if profile := _current_profile.get():
+        profile.ini_files.add(str(path))
@@ -32,6 +32,7 @@ from pathlib import Path
 from typing import Annotated, Any, TypeAlias, cast
 
 from fastapi import BackgroundTasks, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import HTTPConnection, Request
 from starlette.responses import Response
 from starlette.websockets import WebSocket
@@ -43,6 +44,7 @@ from antarest.core.maintenance.service import MaintenanceService
 from antarest.core.serde.json import from_json
 from antarest.core.tasks.service import ITaskService
 from antarest.core.utils.fastapi_sqlalchemy import db
+from antarest.core.utils.fastapi_sqlalchemy.middleware import get_async_session
 from antarest.eventbus.connections import ConnectionManager
 from antarest.fastapi_jwt_auth import AuthJWT
 from antarest.favorite.service import FavoriteDirectoryService, FavoriteExternalDirectoryService, FavoriteStudyService
@@ -216,6 +218,7 @@ TaskServiceDep: TypeAlias = Annotated[ITaskService, Depends(get_task_service)]
 MaintenanceServiceDep: TypeAlias = Annotated[MaintenanceService, Depends(get_maintenance_service)]
 TmpExportFileDep: TypeAlias = Annotated[Path, Depends(get_tmp_export_file)]
 ConnectionManagerDep: TypeAlias = Annotated[ConnectionManager, Depends(get_ws_manager)]
+AsyncSessionDep: TypeAlias = Annotated[AsyncSession | None, Depends(get_async_session)]
 
 
 async def auth_required(
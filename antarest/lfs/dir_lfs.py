@@ -35,6 +35,10 @@ class DirLargeFileStorage(ILargeFileStorage):
     def read_file(self, blob_id: str, target_path: Path) -> None:
         shutil.copy(self._get_path(blob_id), target_path)
 
+    @override
+    def open_file(self, blob_id: str) -> BinaryIO:
+        return self._get_path(blob_id).open("rb")
+
     @override
     def write_file(self, blob_id: str, source: Path | BinaryIO) -> None:
         if isinstance(source, Path):
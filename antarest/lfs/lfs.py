@@ -19,7 +19,6 @@ class ILargeFileStorage(ABC):
     Interface for storing large files, possibly larger than memory.
 
     Typical implementations will be filesystem based or S3 based.
-    Relies on paths for the moment, could use streams if needed.
     """
 
     @abstractmethod
@@ -29,6 +28,13 @@ class ILargeFileStorage(ABC):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def open_file(self, blob_id: str) -> BinaryIO:
+        """
+        Opens a file of the storage system, to read it as a stream.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def write_file(self, blob_id: str, source: Path | BinaryIO) -> None:
         """
@@ -40,7 +40,7 @@ from antarest.core.maintenance.web import create_maintenance_api
 from antarest.core.metrics import add_metrics
 from antarest.core.tasks.web import create_tasks_api
 from antarest.core.utils.fastapi_sqlalchemy import DBSessionMiddleware
-from antarest.core.utils.fastapi_sqlalchemy.middleware import init_db_singleton
+from antarest.core.utils.fastapi_sqlalchemy.middleware import init_async_db_singleton, init_db_singleton
 from antarest.core.utils.utils import get_local_path
 from antarest.core.utils.web import tags_metadata
 from antarest.dependencies import AppState
@@ -60,6 +60,7 @@ from antarest.service_creator import (
     Module,
     Services,
     create_services,
+    init_async_db_engine,
     init_db_engine,
 )
 from antarest.singleton_services import start_all_services
@@ -331,6 +332,7 @@ def init_db(config: Config, config_file: Path, auto_upgrade: bool, init_admin: b
     """
     engine = init_db_engine(config, auto_upgrade, config_file=config_file)
     init_db_singleton(custom_engine=engine, session_args=SESSION_ARGS)
+    init_async_db_singleton(init_async_db_engine(config), session_args=SESSION_ARGS)
     if init_admin:
         init_admin_user(engine, SESSION_ARGS, config.security.admin_pwd)
 
@@ -365,6 +367,8 @@ def inject_services(app: FastAPI, config: Config) -> Services:
         services.blob_gc.start()
     if services.variable_view_gc and Module.VARIABLE_VIEW_GC in config.server.services:
         services.variable_view_gc.start()
+    if services.snapshot_pregenerator and Module.SNAPSHOT_PREGENERATOR in config.server.services:
+        services.snapshot_pregenerator.start()
 
     return services
 
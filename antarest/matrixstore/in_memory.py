@@ -10,13 +10,21 @@
 #
 # This file is part of the Antares project.
 
-from collections.abc import Callable, Iterator, Sequence
+import os
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from pathlib import Path
 
 import polars as pl
 from typing_extensions import override
 
 from antarest.matrixstore.matrix_usage_provider import IMatrixUsageProvider
-from antarest.matrixstore.model import MatrixContent, MatrixMetadataDTO, MatrixMismatchDTO, MatrixReferencesDTO
+from antarest.matrixstore.model import (
+    MatrixContent,
+    MatrixFileFingerprint,
+    MatrixMetadataDTO,
+    MatrixMismatchDTO,
+    MatrixReferencesDTO,
+)
 from antarest.matrixstore.repository import compute_hash
 from antarest.matrixstore.service import ISimpleMatrixService
 
@@ -30,6 +38,7 @@ class InMemorySimpleMatrixService(ISimpleMatrixService):
         self._content: dict[str, pl.DataFrame] = {}
         self.usage_providers: list[IMatrixUsageProvider] = []
         self._predefined_matrices: dict[str, Callable[[], pl.DataFrame]] = {}
+        self._file_matrix_ids: dict[str, tuple[MatrixFileFingerprint, str]] = {}
 
     @override
     def add_predefined_matrix(self, matrix_factory: Callable[[], pl.DataFrame]) -> str:
@@ -53,6 +62,26 @@ class InMemorySimpleMatrixService(ISimpleMatrixService):
             return self._predefined_matrices[matrix_id]()
         return self._content[matrix_id]
 
+    @override
+    def get_file_matrix_ids(self, fingerprints: Sequence[MatrixFileFingerprint]) -> dict[MatrixFileFingerprint, str]:
+        matrix_ids = {}
+        for fingerprint in fingerprints:
+            known_fingerprint, matrix_id = self._file_matrix_ids.get(fingerprint.path, (None, ""))
+            if known_fingerprint == fingerprint and self.exists(matrix_id):
+                matrix_ids[fingerprint] = matrix_id
+        return matrix_ids
+
+    @override
+    def save_file_matrix_ids(self, matrix_ids: Mapping[MatrixFileFingerprint, str]) -> None:
+        for fingerprint, matrix_id in matrix_ids.items():
+            self._file_matrix_ids[fingerprint.path] = (fingerprint, matrix_id)
+
+    @override
+    def delete_file_matrix_ids(self, directory: Path) -> None:
+        prefix = os.path.join(directory.absolute(), "")
+        for path in [path for path in self._file_matrix_ids if path.startswith(prefix)]:
+            del self._file_matrix_ids[path]
+
     @override
     def exists(self, matrix_id: str) -> bool:
         return self.all_exist([matrix_id])
@@ -13,11 +13,12 @@
 import datetime
 import uuid
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, TypeAlias
 
 import polars as pl
 from pydantic import ConfigDict, field_serializer
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Table
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, ForeignKey, Integer, String, Table
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing_extensions import override
 
@@ -72,6 +73,59 @@ class Matrix(Base):
         return res
 
 
+@dataclass(frozen=True)
+class MatrixFileFingerprint:
+    """
+    Identifies the content of a matrix file by its status, without reading it.
+
+    Attributes:
+        path: The absolute path of the file.
+        size: The size of the file, in bytes.
+        mtime_ns: The modification time of the file, in nanoseconds.
+        inode: The inode number (or file index) of the file.
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def from_path(cls, path: Path) -> "MatrixFileFingerprint":
+        path = path.absolute()
+        stat = path.stat()
+        # The file indexes of Windows are unsigned 64-bit integers: they are stored as signed ones
+        inode = stat.st_ino - 2**64 if stat.st_ino >= 2**63 else stat.st_ino
+        return cls(path=str(path), size=stat.st_size, mtime_ns=stat.st_mtime_ns, inode=inode)
+
+
+class MatrixFile(Base):
+    """
+    Matrix parsed from a file of a study, identified by the fingerprint of the file.
+
+    As long as the fingerprint of the file is unchanged, the ID of its matrix
+    can be retrieved without reading it (see `MatrixFileFingerprint`).
+
+    Attributes:
+        path: The absolute path of the file (primary key).
+        size: The size of the file, in bytes.
+        mtime_ns: The modification time of the file, in nanoseconds.
+        inode: The inode number (or file index) of the file.
+        matrix_id: The ID of the matrix parsed from the file.
+    """
+
+    __tablename__ = "matrix_file"
+
+    path: Mapped[str] = mapped_column(String, primary_key=True)
+    size: Mapped[int] = mapped_column(BigInteger)
+    mtime_ns: Mapped[int] = mapped_column(BigInteger)
+    inode: Mapped[int] = mapped_column(BigInteger)
+    matrix_id: Mapped[str] = mapped_column(String(64), ForeignKey("matrix.id", ondelete="CASCADE"), index=True)
+
+    def get_fingerprint(self) -> MatrixFileFingerprint:
+        return MatrixFileFingerprint(path=self.path, size=self.size, mtime_ns=self.mtime_ns, inode=self.inode)
+
+
 class MatrixInfoDTO(AntaresBaseModel):
     id: str
     name: str
@@ -12,23 +12,34 @@
 import hashlib
 import logging
 import os
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
+from typing import cast
 
 import numpy as np
 import pandas as pd
 import polars as pl
 from filelock import FileLock
 from pandas import util
-from sqlalchemy import select
+from sqlalchemy import Table, delete, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from antarest.core.config import InternalMatrixFormat
 from antarest.core.utils.fastapi_sqlalchemy import db
+from antarest.core.utils.io_profile import record_matrix_read, record_matrix_written
 from antarest.core.utils.utils import current_time
-from antarest.matrixstore.model import LEGACY_MATRIX_VERSION, NEW_MATRIX_VERSION, Matrix, MatrixDataSet
+from antarest.matrixstore.model import (
+    LEGACY_MATRIX_VERSION,
+    NEW_MATRIX_VERSION,
+    Matrix,
+    MatrixDataSet,
+    MatrixFile,
+    MatrixFileFingerprint,
+)
 from antarest.matrixstore.parsing import load_matrix, save_matrix
+from antarest.study.dao.database.sql_utils import begin_nested, upsert_multiple
 
 logger = logging.getLogger(__name__)
 LOCK_SUFFIX = ".tsv.lock"
@@ -116,6 +127,13 @@ class MatrixRepository:
             return db.session
         return self._session
 
+    def _commit(self) -> None:
+        # Inside a SAVEPOINT, the matrices are saved by a unit of work, which commits them with its other writes
+        if self.session.in_nested_transaction():
+            self.session.flush()
+        else:
+            self.session.commit()
+
     def save(self, matrix: Matrix) -> Matrix:
         existing = self.session.get(Matrix, matrix.id)
 
@@ -125,18 +143,19 @@ class MatrixRepository:
             self.session.add(matrix)
             merged_matrix = matrix
 
-        self.session.commit()
+        self._commit()
         return merged_matrix
 
     def save_batch(self, matrices: list[Matrix]) -> None:
         try:
-            self.session.add_all(matrices)
-            self.session.commit()
+            with begin_nested(self.session):
+                self.session.add_all(matrices)
         except IntegrityError:
             # Can happen if one the matrices is already inside DB.
-            self.session.rollback()
             for matrix in matrices:
                 self.save(matrix)
+        else:
+            self._commit()
 
     def get(self, matrix_hash: str) -> Matrix | None:
         return self.session.get(Matrix, matrix_hash)
@@ -155,12 +174,81 @@ class MatrixRepository:
         matrix = self.session.get(Matrix, matrix_hash)
         if matrix:
             self.session.delete(matrix)
-            self.session.commit()
+            self._commit()
             logger.debug(f"Matrix {matrix_hash} deleted")
         else:
             logger.warning(f"Trying to delete matrix {matrix_hash}, but was not found in database!")
 
 
+class MatrixFileRepository:
+    """
+    Database connector to manage the IDs of the matrices parsed from study files.
+    """
+
+    # Number of paths queried at once
+    CHUNK_SIZE = 500
+
+    def __init__(self, session: Session | None = None) -> None:
+        self._session = session
+
+    @property
+    def session(self) -> Session:
+        """Get the SqlAlchemy session or create a new one on the fly if not available in the current thread."""
+        if self._session is None:
+            return db.session
+        return self._session
+
+    def get_matrix_ids(self, fingerprints: Sequence[MatrixFileFingerprint]) -> dict[MatrixFileFingerprint, str]:
+        """
+        Returns the IDs of the matrices parsed from the files whose fingerprint is unchanged.
+        """
+        matrix_ids = {}
+        expected = {fingerprint.path: fingerprint for fingerprint in fingerprints}
+        paths = list(expected)
+        for start in range(0, len(paths), self.CHUNK_SIZE):
+            stmt = select(MatrixFile).where(MatrixFile.path.in_(paths[start : start + self.CHUNK_SIZE]))
+            for matrix_file in self.session.scalars(stmt):
+                fingerprint = matrix_file.get_fingerprint()
+                if expected[matrix_file.path] == fingerprint:
+                    matrix_ids[fingerprint] = matrix_file.matrix_id
+        return matrix_ids
+
+    def save_matrix_ids(self, matrix_ids: Mapping[MatrixFileFingerprint, str]) -> None:
+        """
+        Records the IDs of the matrices parsed from files, replacing the previous ones.
+
+        Nothing is recorded if one of the matrices is missing from the database (or not committed yet).
+        The rows are committed in a short-lived session of their own: the fingerprints are mostly saved
+        while reading studies, in requests whose session is rolled back at the end.
+        """
+        if not matrix_ids:
+            return
+        rows = [
+            {
+                "path": fingerprint.path,
+                "size": fingerprint.size,
+                "mtime_ns": fingerprint.mtime_ns,
+                "inode": fingerprint.inode,
+                "matrix_id": matrix_id,
+            }
+            for fingerprint, matrix_id in matrix_ids.items()
+        ]
+        try:
+            with Session(self.session.get_bind()) as session, session.begin():
+                upsert_multiple(session, cast(Table, MatrixFile.__table__), rows)
+        except IntegrityError:
+            # The fingerprints are only a cache: the matrices will be parsed again
+            logger.warning("Matrix file fingerprints not saved: some matrices are missing", exc_info=True)
+
+    def delete_matrix_ids(self, directory: Path) -> None:
+        """
+        Forgets the IDs of the matrices parsed from the files of a directory, once it is removed.
+        """
+        prefix = os.path.join(directory.absolute(), "")
+        self.session.execute(delete(MatrixFile).where(MatrixFile.path.startswith(prefix, autoescape=True)))
+        self.session.commit()
+
+
 @dataclass(frozen=True)
 class MatrixCreationResult:
     hash: str
@@ -254,6 +342,7 @@ class MatrixContentRepository:
         """
         matrix_path, internal_format = self._get_matrix_path_n_format(matrix_hash)
         if matrix_path:
+            record_matrix_read()
             return load_matrix(internal_format, matrix_path, matrix_version)
         raise FileNotFoundError(str(self.bucket_dir.joinpath(matrix_hash)))
 
@@ -324,10 +413,12 @@ class MatrixContentRepository:
                     # We want to migrate the old matrix in the given repository format.
                     # Ensure exclusive access to the matrix file between multiple processes (or threads).
                     save_matrix(self.format, content, matrix_path)
+                    record_matrix_written()
                     matrix_in_another_format_path.unlink()
                     return MatrixCreationResult(hash=matrix_hash, new=True)
 
             save_matrix(self.format, content, matrix_path)
+            record_matrix_written()
 
             # IMPORTANT: Deleting the lock file under Linux can make locking unreliable.
             # See https://github.com/tox-dev/py-filelock/issues/31
@@ -18,7 +18,7 @@ import logging
 import tempfile
 import zipfile
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable, Iterator, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
 
 import numpy as np
@@ -53,6 +53,7 @@ from antarest.matrixstore.model import (
     MatrixDataSetRelation,
     MatrixDataSetUpdateDTO,
     MatrixDescriptionDTO,
+    MatrixFileFingerprint,
     MatrixInfoDTO,
     MatrixMetadataDTO,
     MatrixMismatchDTO,
@@ -63,6 +64,7 @@ from antarest.matrixstore.parsing import save_matrix
 from antarest.matrixstore.repository import (
     MatrixContentRepository,
     MatrixDataSetRepository,
+    MatrixFileRepository,
     MatrixRepository,
     compute_hash,
 )
@@ -112,6 +114,29 @@ class ISimpleMatrixService(ABC):
     def get(self, matrix_id: str) -> pl.DataFrame:
         raise NotImplementedError()
 
+    @abstractmethod
+    def get_file_matrix_ids(self, fingerprints: Sequence[MatrixFileFingerprint]) -> dict[MatrixFileFingerprint, str]:
+        """
+        Returns the IDs of the matrices previously parsed from files which are unchanged since then.
+
+        The files whose fingerprint is unknown or different are absent from the result.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def save_file_matrix_ids(self, matrix_ids: Mapping[MatrixFileFingerprint, str]) -> None:
+        """
+        Records the IDs of the matrices parsed from files, by fingerprint of the files.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete_file_matrix_ids(self, directory: Path) -> None:
+        """
+        Forgets the IDs of the matrices parsed from the files of a removed directory.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def get_matrices(self) -> list[MatrixMetadataDTO]:
         raise NotImplementedError()
@@ -174,6 +199,19 @@ class SimpleMatrixService(ISimpleMatrixService):
             return self._predefined_matrices[matrix_id]()
         return self.matrix_content_repository.get(matrix_id, matrix_version=NEW_MATRIX_VERSION)
 
+    @override
+    def get_file_matrix_ids(self, fingerprints: Sequence[MatrixFileFingerprint]) -> dict[MatrixFileFingerprint, str]:
+        # Without database, the matrix files are always parsed
+        return {}
+
+    @override
+    def save_file_matrix_ids(self, matrix_ids: Mapping[MatrixFileFingerprint, str]) -> None:
+        pass
+
+    @override
+    def delete_file_matrix_ids(self, directory: Path) -> None:
+        pass
+
     @override
     def get_matrices(self) -> list[MatrixMetadataDTO]:
         raise NotImplementedError()
@@ -252,9 +290,11 @@ class MatrixService(ISimpleMatrixService):
         task_service: ITaskService,
         config: Config,
         user_service: LoginService,
+        file_repo: MatrixFileRepository | None = None,
     ):
         self.matrix_content_repository = matrix_content_repository
         self.repo = repo
+        self.file_repo = file_repo or MatrixFileRepository()
         self.repo_dataset = repo_dataset
         self.user_service = user_service
         self.file_transfer_manager = file_transfer_manager
@@ -485,6 +525,18 @@ class MatrixService(ISimpleMatrixService):
             raise MatrixNotFound(matrix_id)
         return self.matrix_content_repository.get(matrix_id, matrix.version)
 
+    @override
+    def get_file_matrix_ids(self, fingerprints: Sequence[MatrixFileFingerprint]) -> dict[MatrixFileFingerprint, str]:
+        return self.file_repo.get_matrix_ids(fingerprints)
+
+    @override
+    def save_file_matrix_ids(self, matrix_ids: Mapping[MatrixFileFingerprint, str]) -> None:
+        self.file_repo.save_matrix_ids(matrix_ids)
+
+    @override
+    def delete_file_matrix_ids(self, directory: Path) -> None:
+        self.file_repo.delete_matrix_ids(directory)
+
     @override
     def get_matrices(self) -> list[MatrixMetadataDTO]:
         """
@@ -34,6 +34,7 @@ from antarest.output.filestudy.utils import (
     get_start_column,
     normalize_df_column_names,
     parse_output_file,
+    read_output_headers,
 )
 from antarest.output.utils import find_mode_dir
 from antarest.study.model import MatrixFrequency
@@ -126,8 +127,36 @@ class AggregatorManager:
         self._output_first_column = get_start_column(self.frequency)
         self.transform_columns_headers = transform_columns_headers
 
-    def _parse_output_file(self, file_path: Path, normalize_column_names: bool) -> OutputDataFrame:
-        output_data = parse_output_file(file_path, self._output_first_column)
+    def _projected_columns(self, headers: MultipleOutputHeaders, is_details: bool) -> list[int] | None:
+        """
+        Indices of the file columns which will be kept by `columns_filtering`, so that other columns are not parsed.
+
+        Returns:
+            None if all columns need to be parsed.
+        """
+        if not self.columns_names or not self.transform_columns_headers:
+            return None
+
+        lower_case_columns = [c.lower() for c in self.columns_names]
+        if is_details:
+            names = [header[ACTUAL_COLUMN_COMPONENT] for header in headers]
+        elif self.mc_root == MCRoot.MC_ALL:
+            names = normalize_df_column_names(self.mc_root, headers)
+        else:
+            names = [header[0] for header in headers]
+
+        if is_details or self.mc_root == MCRoot.MC_ALL:
+            indices = [k for k, c in enumerate(names) if any(regex in c.lower() for regex in lower_case_columns)]
+        else:
+            indices = [k for k, c in enumerate(names) if c.lower() in lower_case_columns]
+
+        # When nothing matches, we keep the legacy behaviour of `columns_filtering` on the whole file
+        return indices or None
+
+    def _parse_output_file(self, file_path: Path, normalize_column_names: bool, is_details: bool) -> OutputDataFrame:
+        headers = read_output_headers(file_path, self._output_first_column)
+        columns = self._projected_columns(headers, is_details)
+        output_data = parse_output_file(file_path, self._output_first_column, columns)
 
         if normalize_column_names:
             headers = cast(MultipleOutputHeaders, output_data.headers)
@@ -239,7 +268,7 @@ class AggregatorManager:
             the DataFrame with the correct columns and values
         """
         normalize_cols = self.transform_columns_headers and not is_details
-        output_data = self._parse_output_file(file_path, normalize_column_names=normalize_cols)
+        output_data = self._parse_output_file(file_path, normalize_column_names=normalize_cols, is_details=is_details)
         if not self.transform_columns_headers or not is_details:
             return output_data
 
@@ -9,18 +9,20 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
-from collections.abc import Iterator
+import itertools
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from enum import Enum, StrEnum
 from pathlib import Path
-from typing import TypeAlias
+from typing import BinaryIO, TypeAlias
 
 import numpy as np
 import pandas as pd
 import polars as pl
 from polars.exceptions import ComputeError
 
-from antarest.study.model import MatrixFrequency, MatrixIndex, TimeSerie
+from antarest.core.exceptions import InvalidMatrixSliceError
+from antarest.study.model import MatrixFrequency, MatrixIndex, MatrixSlice, TimeSerie
 
 """Column name for the Monte Carlo year."""
 MCYEAR_COL = "mcYear"
@@ -146,9 +148,21 @@ def add_time_index_to_dataframe(df: pd.DataFrame, matrix_index: MatrixIndex) ->
     df.index = time_column
 
 
-def _parse_output_dataframe(file_path: Path) -> pl.DataFrame:
+def _parse_output_dataframe(
+    file_path: Path | bytes, columns: Sequence[int] | None = None, n_rows: int | None = None
+) -> pl.DataFrame:
+    projection = list(columns) if columns is not None else None
     try:
-        return pl.read_csv(file_path, skip_lines=7, separator="\t", has_header=False, null_values="N/A", n_threads=1)
+        return pl.read_csv(
+            file_path,
+            skip_lines=7,
+            separator="\t",
+            has_header=False,
+            null_values="N/A",
+            columns=projection,
+            n_rows=n_rows,
+            n_threads=1,
+        )
     except ComputeError:
         # Happens if polars wrongly inferred the schema.
         # If so, we specify that it should read the entire file to be sure it doesn't infer a false schema.
@@ -161,16 +175,60 @@ def _parse_output_dataframe(file_path: Path) -> pl.DataFrame:
             has_header=False,
             null_values="N/A",
             infer_schema_length=10000,
+            columns=projection,
+            n_rows=n_rows,
             n_threads=1,
         )
 
 
-def parse_output_file(file_path: Path, first_column: int) -> OutputDataFrame:
-    content = file_path.read_text(encoding="utf-8")
-    output_headers = parse_headers(content, first_column)
-    polars_df = _parse_output_dataframe(file_path)
+def read_output_headers(file_path: Path | bytes, first_column: int) -> MultipleOutputHeaders:
+    """
+    Parses the headers of an output file (given by its path or its content), without reading the values.
+    """
+    if isinstance(file_path, bytes):
+        content = "\n".join(file_path.decode("utf-8").split("\n", 7)[:7])
+    else:
+        with file_path.open(encoding="utf-8") as f:
+            content = "".join(itertools.islice(f, 7))
+    return parse_headers(content, first_column)
+
+
+def parse_output_file(
+    file_path: Path | BinaryIO,
+    first_column: int,
+    columns: Sequence[int] | None = None,
+    row_offset: int = 0,
+    row_count: int | None = None,
+) -> OutputDataFrame:
+    """
+    Parses an output file.
+
+    Args:
+        file_path: path of the output file, or a binary stream of its content.
+        first_column: index of the first data column, previous ones being the time index columns.
+        columns: if specified, indices (counted from `first_column`) of the data columns to read.
+                 Other columns are not parsed at all.
+        row_offset: number of data rows to skip.
+        row_count: if specified, maximum number of data rows to read.
+    """
+    source = file_path if isinstance(file_path, Path) else file_path.read()
+    output_headers = read_output_headers(source, first_column)
+    # Rows before `row_offset` still need to be parsed, but we stop parsing after the last needed row
+    n_rows = None if row_count is None else row_offset + row_count
+
+    if columns is None:
+        polars_df = _parse_output_dataframe(source, n_rows=n_rows)
+        df = polars_df[polars_df.columns[first_column:]]
+    else:
+        if any(k >= len(output_headers) for k in columns):
+            raise InvalidMatrixSliceError(
+                f"Column indices {list(columns)} are out of bounds ({len(output_headers)} columns)"
+            )
+        df = _parse_output_dataframe(source, [first_column + k for k in columns], n_rows)
+        output_headers = [output_headers[k] for k in columns]
 
-    df = polars_df[polars_df.columns[first_column:]]
+    if row_offset:
+        df = df.slice(row_offset, row_count)
 
     # At this point we only have numeric values in our df. But NaN columns are considered to be String by polars.
     # So we change this to be Float64 to harmonize everything.
@@ -179,8 +237,15 @@ def parse_output_file(file_path: Path, first_column: int) -> OutputDataFrame:
     return OutputDataFrame(data=df, headers=output_headers)
 
 
-def parse_output_file_as_pandas_dataframe(file_path: Path, first_column: int) -> pd.DataFrame:
-    output = parse_output_file(file_path, first_column)
+def parse_output_file_as_pandas_dataframe(
+    file_path: Path | BinaryIO, first_column: int, matrix_slice: MatrixSlice | None = None
+) -> pd.DataFrame:
+    if matrix_slice is None:
+        output = parse_output_file(file_path, first_column)
+    else:
+        output = parse_output_file(
+            file_path, first_column, matrix_slice.columns, matrix_slice.row_from, matrix_slice.row_count
+        )
     df = output.data.to_pandas().astype(np.float64)
     df.columns = pd.MultiIndex.from_tuples(output.headers)  # type: ignore
     return df
@@ -93,3 +93,32 @@ class OutputVariablesViewStatus(StrEnum):
 class OutputVariablesViewResponse(AntaresBaseModel, extra="forbid", alias_generator=to_camel, populate_by_name=True):
     status: OutputVariablesViewStatus
     task_id: str | None
+
+
+class OutputVariableStatistics(AntaresBaseModel, extra="forbid", alias_generator=to_camel, populate_by_name=True):
+    """
+    Summary statistics of one output variable, for one item (area, link or cluster), across all Monte Carlo years.
+
+    Attributes:
+        item_id: the area, district or link ID
+        cluster_id: the cluster ID, for `details` query files
+        variable: the variable name
+        min: minimum value over all time steps and years
+        max: maximum value over all time steps and years
+        mean: mean value over all time steps and years
+        q10: 10th percentile
+        q50: median
+        q90: 90th percentile
+        year_totals: sum of the values over the time steps, for each Monte Carlo year (in ascending order of years)
+    """
+
+    item_id: str
+    cluster_id: str | None = None
+    variable: str
+    min: float | None
+    max: float | None
+    mean: float | None
+    q10: float | None
+    q50: float | None
+    q90: float | None
+    year_totals: list[float | None]
@@ -19,7 +19,7 @@ from typing import Annotated, Any, TypeAlias
 import pandas as pd
 from fastapi import APIRouter, Depends, Query, UploadFile
 from pydantic import TypeAdapter
-from starlette.responses import FileResponse, Response
+from starlette.responses import Response, StreamingResponse
 
 from antarest.core.api_types import SanitizedStr, UuidStr
 from antarest.core.filetransfer.model import FileDownloadTaskDTO
@@ -27,7 +27,7 @@ from antarest.core.serde.json import to_json
 from antarest.core.serde.matrix_export import TableExportFormat
 from antarest.core.utils.dict_utils import remove_nones
 from antarest.core.utils.web import APITag
-from antarest.dependencies import OutputServiceDep, TmpExportFileDep, auth_required
+from antarest.dependencies import OutputServiceDep, auth_required
 from antarest.output.filestudy.utils import (
     MCAllAreasQueryFile,
     MCAllLinksQueryFile,
@@ -37,6 +37,7 @@ from antarest.output.filestudy.utils import (
 from antarest.output.model import (
     OutputVariablesInformation,
     OutputVariablesList,
+    OutputVariableStatistics,
     OutputVariablesType,
     OutputVariablesViewResponse,
 )
@@ -151,6 +152,16 @@ def create_output_routes() -> APIRouter:
         logger.info(f"Fetching whole output of the simulation {output_id} for study {study_id}")
         return output_service.export_output(study_uuid=study_id, output_uuid=output_id)
 
+    @bp.get(
+        "/studies/{study_id}/outputs/{output_id}/archive",
+        summary="Stream outputs data as a zip archive",
+    )
+    def output_archive(
+        output_service: OutputServiceDep, study_id: UuidStr, output_id: SanitizedStr
+    ) -> StreamingResponse:
+        logger.info(f"Streaming whole output of the simulation {output_id} for study {study_id}")
+        return output_service.stream_output(study_uuid=study_id, output_uuid=output_id)
+
     @bp.get(
         "/studies/{uuid}/output/{output_id}/time-index",
         summary="Get time index for output matrices by frequency",
@@ -184,15 +195,14 @@ def create_output_routes() -> APIRouter:
     @bp.post("/studies/{study_id}/outputs/{output_id}/download", summary="Get outputs data")
     def output_download(
         output_service: OutputServiceDep,
-        tmp_export_file: TmpExportFileDep,
         study_id: UuidStr,
         output_id: SanitizedStr,
         data: StudyDownloadDTO,
         use_task: Annotated[bool, Query(deprecated=True)] = False,
-    ) -> FileResponse:
+    ) -> Response:
         logger.info(f"Fetching batch outputs of simulation {output_id} for study {study_id}")
 
-        return output_service.download_outputs(study_id, output_id, data, tmp_export_file)
+        return output_service.download_outputs(study_id, output_id, data)
 
     @bp.delete(
         "/studies/{study_id}/outputs/{output_id}",
@@ -548,6 +558,74 @@ def create_output_routes() -> APIRouter:
     ) -> OutputVariablesList:
         return output_service.get_output_variables_list(uuid, output_id)
 
+    @bp.get(
+        "/studies/{uuid}/outputs/{output_id}/statistics/areas/mc-ind",
+        summary="Retrieve summary statistics of areas variables across Monte Carlo years",
+    )
+    def get_areas_statistics(
+        output_service: OutputServiceDep,
+        uuid: UuidStr,
+        output_id: SanitizedStr,
+        query_file: MCIndAreasQueryFile,
+        frequency: MatrixFrequency,
+        areas_ids: SanitizedStr = "",
+        variables: SanitizedStr = "",
+    ) -> list[OutputVariableStatistics]:
+        """
+        Retrieve the min, max, mean, percentiles and totals per Monte Carlo year of areas variables.
+
+        Parameters:
+
+        - `uuid`: study ID
+        - `output_id`: the output ID aka the simulation ID
+        - `query_file`: "values", "details", "details-STstorage", "details-res"
+        - `frequency`: "hourly", "daily", "weekly", "monthly", "annual"
+        - `areas_ids`: which areas to be selected. If empty, all are selected (comma separated)
+        - `variables`: which variables to be selected. If empty, all are selected (comma separated)
+        """
+        return output_service.get_output_statistics(
+            uuid,
+            output_id,
+            query_file,
+            frequency,
+            ids_to_consider=_split_comma_separated_values(areas_ids),
+            variables=_split_comma_separated_values(variables),
+        )
+
+    @bp.get(
+        "/studies/{uuid}/outputs/{output_id}/statistics/links/mc-ind",
+        summary="Retrieve summary statistics of links variables across Monte Carlo years",
+    )
+    def get_links_statistics(
+        output_service: OutputServiceDep,
+        uuid: UuidStr,
+        output_id: SanitizedStr,
+        query_file: MCIndLinksQueryFile,
+        frequency: MatrixFrequency,
+        links_ids: SanitizedStr = "",
+        variables: SanitizedStr = "",
+    ) -> list[OutputVariableStatistics]:
+        """
+        Retrieve the min, max, mean, percentiles and totals per Monte Carlo year of links variables.
+
+        Parameters:
+
+        - `uuid`: study ID
+        - `output_id`: the output ID aka the simulation ID
+        - `query_file`: "values"
+        - `frequency`: "hourly", "daily", "weekly", "monthly", "annual"
+        - `links_ids`: which links to be selected. If empty, all are selected (comma separated)
+        - `variables`: which variables to be selected. If empty, all are selected (comma separated)
+        """
+        return output_service.get_output_statistics(
+            uuid,
+            output_id,
+            query_file,
+            frequency,
+            ids_to_consider=_split_comma_separated_values(links_ids),
+            variables=_split_comma_separated_values(variables),
+        )
+
     @bp.get(
         "/studies/{uuid}/output/{output_id}/variables-views/data",
         summary="Fetches the variables view for a given output and a given configuration",
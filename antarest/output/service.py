@@ -22,7 +22,7 @@ from typing import Any, BinaryIO
 import pandas as pd
 import polars as pl
 from fastapi import HTTPException
-from starlette.responses import FileResponse
+from starlette.responses import Response, StreamingResponse
 
 from antarest.core.exceptions import (
     InvalidOutputConversionRequest,
@@ -43,7 +43,6 @@ from antarest.core.tasks.model import TaskListFilter, TaskResult, TaskStatus, Ta
 from antarest.core.tasks.service import ITaskNotifier, ITaskService
 from antarest.core.utils.archives import ArchiveFormat
 from antarest.core.utils.fastapi_sqlalchemy import db
-from antarest.core.utils.files import temp_file_path
 from antarest.core.utils.utils import StopWatch, current_time
 from antarest.launcher.adapters.abstractlauncher import SimulationLogs
 from antarest.launcher.model import LogType
@@ -51,7 +50,6 @@ from antarest.login.utils import get_user_id
 from antarest.matrixstore.service import ISimpleMatrixService
 from antarest.output.filestudy.aggregator_management import (
     AREA_COL,
-    CLUSTER_ID_COL,
     LINK_COL,
 )
 from antarest.output.filestudy.utils import (
@@ -67,6 +65,7 @@ from antarest.output.filestudy.utils import (
 from antarest.output.model import (
     OutputVariablesInformation,
     OutputVariablesList,
+    OutputVariableStatistics,
     OutputVariablesViewResponse,
     OutputVariablesViewStatus,
 )
@@ -77,17 +76,18 @@ from antarest.output.storage.output_storage import (
     OutputStorageType,
 )
 from antarest.output.variable_view.db import create_output_view_db_model, get_output_view_inside_db
+from antarest.output.variable_view.materializer import VariablesViewDefinition, materialize_variables_views
 from antarest.output.variable_view.matrix_usage_provider import OutputVariablesMatrixUsageProvider
 from antarest.output.variable_view.model import (
     OutputItemId,
     check_output_variable_exists,
     get_ids_for_aggregation,
-    get_query_file,
 )
 from antarest.study.model import (
     MatrixAggregationResultDTO,
     MatrixFrequency,
     MatrixIndex,
+    MatrixSlice,
     StorageMode,
     StudyDownloadDTO,
     StudyDownloadType,
@@ -130,7 +130,10 @@ class IStudyMetadataProvider(ABC):
 
 class OutputVariablesViewMaterializationTask:
     """
-    Task to materialize an output variables view
+    Task to materialize output variables views.
+
+    The data is read and pivoted inside the task itself, without launching an intermediate aggregation task.
+    Several views can be materialized at once, they will share the reading of output files.
     """
 
     def __init__(
@@ -138,64 +141,38 @@ class OutputVariablesViewMaterializationTask:
         study_id: str,
         output_id: str,
         output_service: "OutputService",
-        variable_name: str,
         frequency: MatrixFrequency,
-        output_identifier: OutputItemId,
+        views: Sequence[VariablesViewDefinition],
     ) -> None:
         self._study_id = study_id
         self._output_id = output_id
         self._frequency = frequency
-        self._variable_name = variable_name
+        self._views = views
         self._output_service = output_service
-        self._output_identifier = output_identifier
 
-    def _materialize_view(self) -> None:
+    def _materialize_views(self) -> None:
         """Run the task"""
-        with temp_file_path(dir=self._output_service._tmp_dir) as tmp_path:
-            item_id, subitem_id = get_ids_for_aggregation(self._output_identifier)
-            # Calls the aggregation with the right arguments
-            task_id = self._output_service.start_aggregate_output_data(
+        storage = self._output_service._find_output_storage(self._study_id, self._output_id)
+        views_data = materialize_variables_views(storage, self._study_id, self._output_id, self._frequency, self._views)
+
+        # Save the matrices and the models inside DB
+        matrices_ids = self._output_service._matrix_service.create_batch(iter(views_data))
+        for view, matrix_id in zip(self._views, matrices_ids, strict=True):
+            db_model = create_output_view_db_model(
                 self._study_id,
                 self._output_id,
-                get_query_file(self._output_identifier),
+                view.variable_name,
                 self._frequency,
-                TableExportFormat.PARQUET,
-                [self._variable_name],
-                [item_id],
-                tmp_path,
+                view.output_identifier,
+                matrix_id,
             )
-
-            # Wait for the aggregation to end
-            self._output_service._task_service.await_task(task_id)
-
-            # Transform the dataframe to have the expected format
-            if subitem_id:
-                dataframe = pd.read_parquet(tmp_path, columns=[MCYEAR_COL, self._variable_name, CLUSTER_ID_COL])
-                dataframe = dataframe[dataframe[CLUSTER_ID_COL] == subitem_id].drop(columns=[CLUSTER_ID_COL])
-            else:
-                dataframe = pd.read_parquet(tmp_path, columns=[MCYEAR_COL, self._variable_name])
-
-        # Transform the dataframe to save only what's needed inside DB
-        dataframe["idx"] = dataframe.groupby(MCYEAR_COL).cumcount()
-        df_pivot = dataframe.pivot(index="idx", columns=MCYEAR_COL, values=self._variable_name)
-        matrix_id = self._output_service._matrix_service.create(pl.from_pandas(df_pivot))
-
-        # Save the model inside DB
-        db_model = create_output_view_db_model(
-            self._study_id,
-            self._output_id,
-            self._variable_name,
-            self._frequency,
-            self._output_identifier,
-            matrix_id,
-        )
-        db.session.add(db_model)
+            db.session.add(db_model)
         db.session.commit()
 
     def run_task(self, notifier: ITaskNotifier) -> TaskResult:
         msg = f"Materializing output variables view for study '{self._study_id}' and output '{self._output_id}'"
         notifier.notify_message(msg)
-        self._materialize_view()
+        self._materialize_views()
         msg = f"Successfully materialized output variables view for study '{self._study_id}' and output '{self._output_id}'"
         notifier.notify_message(msg)
         return TaskResult(success=True, message=msg)
@@ -482,7 +459,22 @@ class OutputService:
 
         return FileDownloadTaskDTO(file=export_file_download.to_dto(), task=task_id)
 
-    def download_outputs(self, study_id: str, output_id: str, data: StudyDownloadDTO, tmp_file: Path) -> FileResponse:
+    def stream_output(self, study_uuid: str, output_uuid: str) -> StreamingResponse:
+        """
+        Streams study output as a zip archive, compressed while it is sent.
+        Args:
+            study_uuid: study id
+            output_uuid: output id
+
+        Returns: StreamingResponse containing the zip archive.
+        """
+        self._studies_repository.assert_permission(study_uuid, StudyPermissionType.READ)
+        logger.info(f"Streaming {output_uuid} from study {study_uuid}")
+        chunks = self._find_output_storage(study_uuid, output_uuid).iter_output_archive(study_uuid, output_uuid)
+        headers = {"Content-Disposition": f"attachment; filename={output_uuid}{ArchiveFormat.ZIP}"}
+        return StreamingResponse(chunks, media_type="application/zip", headers=headers)
+
+    def download_outputs(self, study_id: str, output_id: str, data: StudyDownloadDTO) -> Response:
         """
         Download outputs
         Args:
@@ -490,7 +482,7 @@ class OutputService:
             output_id: output ID.
             data: Json parameters.
 
-        Returns: FileResponse containing the asked data.
+        Returns: Response containing the asked data.
 
         """
         self._studies_repository.assert_permission(study_id, StudyPermissionType.READ)
@@ -566,14 +558,13 @@ class OutputService:
                 }
             )
 
-            with open(tmp_file, "w", encoding="utf-8") as fh:
-                fh.write(response.model_dump_json())
-
         finally:
             for file_path in file_paths:
                 file_path.unlink(missing_ok=True)
 
-        return FileResponse(tmp_file, headers={"Content-Disposition": "inline"}, media_type="application/json")
+        return Response(
+            response.model_dump_json(), headers={"Content-Disposition": "inline"}, media_type="application/json"
+        )
 
     def delete_output(self, uuid: str, output_name: str) -> None:
         """
@@ -797,6 +788,30 @@ class OutputService:
         storage = self._find_output_storage(study_id, output_id)
         return storage.get_variables_list(study_id, output_id)
 
+    def get_output_statistics(
+        self,
+        study_id: str,
+        output_id: str,
+        query_file: MCIndAreasQueryFile | MCIndLinksQueryFile,
+        frequency: MatrixFrequency,
+        ids_to_consider: Sequence[str],
+        variables: Sequence[str],
+    ) -> list[OutputVariableStatistics]:
+        """
+        Returns the summary statistics of the output variables, across all Monte Carlo years.
+
+        Args:
+            study_id: study ID
+            output_id: simulation output ID
+            query_file: which types of data to consider: "values", "details", "details-STstorage", "details-res"
+            frequency: yearly, monthly, weekly, daily or hourly.
+            ids_to_consider: areas or links IDs, if empty, all of them are considered
+            variables: variable names, if empty, all of them are considered
+        """
+        self._studies_repository.assert_permission(study_id, StudyPermissionType.READ)
+        storage = self._find_output_storage(study_id, output_id)
+        return storage.get_output_statistics(study_id, output_id, query_file, frequency, ids_to_consider, variables)
+
     def get_output_variables_information(self, study_id: str, output_id: str) -> OutputVariablesInformation:
         """
         Endpoint used by ImaGrid
@@ -879,9 +894,8 @@ class OutputService:
         check_output_variable_exists(output_id, variable_name, available_variables, output_item_id)
 
         # Materialize the view
-        task = OutputVariablesViewMaterializationTask(
-            study_id, output_id, self, variable_name, frequency, output_item_id
-        )
+        view = VariablesViewDefinition(output_identifier=output_item_id, variable_name=variable_name)
+        task = OutputVariablesViewMaterializationTask(study_id, output_id, self, frequency, [view])
 
         return self._task_service.add_task(
             task,
@@ -932,14 +946,28 @@ class OutputService:
             target_storage.import_output(study_id, tmp_zip)
             current_storage.delete_output(study_id, output_id)
 
-    def get_output_raw_content(self, study_id: str, output_id: str, url: list[str], formatted: bool) -> Any:
-        return self._find_output_storage(study_id, output_id).get_raw_content(study_id, output_id, url, formatted)
+    def get_output_raw_content(
+        self,
+        study_id: str,
+        output_id: str,
+        url: list[str],
+        formatted: bool,
+        matrix_slice: MatrixSlice | None = None,
+    ) -> Any:
+        return self._find_output_storage(study_id, output_id).get_raw_content(
+            study_id, output_id, url, formatted, matrix_slice
+        )
 
     def get_matrix_as_dataframe(
-        self, study_id: str, output_id: str, url: list[str], frequency: MatrixFrequency
+        self,
+        study_id: str,
+        output_id: str,
+        url: list[str],
+        frequency: MatrixFrequency,
+        matrix_slice: MatrixSlice | None = None,
     ) -> pd.DataFrame:
         return self._find_output_storage(study_id, output_id).get_matrix_as_dataframe(
-            study_id, output_id, url, frequency
+            study_id, output_id, url, frequency, matrix_slice
         )
 
     def get_original_file(self, study_id: str, output_id: str, url: list[str]) -> OriginalFile:
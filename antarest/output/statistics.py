@@ -0,0 +1,95 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Summary statistics of Monte Carlo individual outputs.
+
+Statistics are computed per (item, variable) over all time steps and Monte Carlo years,
+from the dataframes produced by the output aggregation (one column per variable).
+"""
+
+from collections.abc import Sequence
+
+import polars as pl
+
+from antarest.output.filestudy.aggregator_management import AREA_COL, CLUSTER_ID_COL, LINK_COL
+from antarest.output.filestudy.utils import MCYEAR_COL, TIME_ID_COL
+from antarest.output.model import OutputVariableStatistics
+
+ITEM_ID_COL = "item_id"
+VARIABLE_COL = "variable"
+_VALUE_COL = "value"
+_INDEX_COLUMNS = {AREA_COL, LINK_COL, CLUSTER_ID_COL, MCYEAR_COL, TIME_ID_COL}
+
+
+def compute_statistics(data: pl.LazyFrame) -> pl.DataFrame:
+    """
+    Computes the summary statistics of all numeric variables of an aggregated output.
+
+    Args:
+        data: aggregated mc-ind data, with an `area` or `link` column, an optional `cluster` column,
+            the `mcYear` and `timeId` columns, and one column per variable.
+
+    Returns:
+        one row per (item, cluster, variable), with the columns of `OutputVariableStatistics`.
+    """
+    schema = data.collect_schema()
+    item_col = LINK_COL if LINK_COL in schema else AREA_COL
+    cluster_expr = pl.col(CLUSTER_ID_COL) if CLUSTER_ID_COL in schema else pl.lit(None, dtype=pl.String)
+    variables = [name for name, dtype in schema.items() if name not in _INDEX_COLUMNS and dtype.is_numeric()]
+
+    values = data.select(
+        pl.col(item_col).alias(ITEM_ID_COL),
+        cluster_expr.alias(CLUSTER_ID_COL),
+        pl.col(MCYEAR_COL),
+        *[pl.col(v).cast(pl.Float64) for v in variables],
+    ).unpivot(
+        index=[ITEM_ID_COL, CLUSTER_ID_COL, MCYEAR_COL],
+        on=variables,
+        variable_name=VARIABLE_COL,
+        value_name=_VALUE_COL,
+    )
+    keys = [ITEM_ID_COL, CLUSTER_ID_COL, VARIABLE_COL]
+
+    value = pl.col(_VALUE_COL)
+    summary = values.group_by(keys).agg(
+        value.min().alias("min"),
+        value.max().alias("max"),
+        value.mean().alias("mean"),
+        value.quantile(0.1, "linear").alias("q10"),
+        value.quantile(0.5, "linear").alias("q50"),
+        value.quantile(0.9, "linear").alias("q90"),
+    )
+    year_totals = (
+        values.group_by([*keys, MCYEAR_COL])
+        .agg(value.sum().alias("total"))
+        .sort(MCYEAR_COL)
+        .group_by(keys)
+        .agg(pl.col("total").alias("year_totals"))
+    )
+    return summary.join(year_totals, on=keys, nulls_equal=True).sort(keys, nulls_last=True).collect()
+
+
+def filter_statistics(
+    statistics: pl.LazyFrame, ids_to_consider: Sequence[str], variables: Sequence[str]
+) -> list[OutputVariableStatistics]:
+    """
+    Selects the statistics of the given items and variables (all of them if empty).
+    Variables are matched case-insensitively.
+    """
+    if ids_to_consider:
+        statistics = statistics.filter(pl.col(ITEM_ID_COL).is_in(list(ids_to_consider)))
+    if variables:
+        statistics = statistics.filter(pl.col(VARIABLE_COL).str.to_lowercase().is_in([v.lower() for v in variables]))
+    return [
+        OutputVariableStatistics.model_validate(row)
+        for row in statistics.rename({CLUSTER_ID_COL: "cluster_id"}).collect().iter_rows(named=True)
+    ]
@@ -25,6 +25,7 @@ from typing_extensions import override
 
 from antarest.core.exceptions import (
     ChildNotFoundError,
+    IncorrectPathError,
     OutputAlreadyArchived,
     OutputAlreadyExists,
     OutputAlreadyUnarchived,
@@ -35,9 +36,14 @@ from antarest.core.remote.remote_executor import IRemoteExecutor
 from antarest.core.utils.archives import (
     ArchiveFormat,
     archive_dir,
+    clear_zip_indexes,
     extract_archive_from_path,
     extract_archive_from_stream,
+    get_zip_index,
     is_zip,
+    iter_chunks,
+    iter_zip_archive,
+    open_file_in_zip,
     unzip,
 )
 from antarest.core.utils.utils import StopWatch
@@ -46,8 +52,15 @@ from antarest.launcher.model import LogType
 from antarest.matrixstore.in_memory import InMemorySimpleMatrixService
 from antarest.output.filestudy.aggregator_management import AggregatorManager
 from antarest.output.filestudy.file_output_utils import extract_variables_list, parse_output_config
-from antarest.output.filestudy.utils import QueryFileType, get_start_column, parse_output_file_as_pandas_dataframe
-from antarest.output.model import OutputVariablesList
+from antarest.output.filestudy.utils import (
+    MCIndAreasQueryFile,
+    MCIndLinksQueryFile,
+    QueryFileType,
+    get_start_column,
+    parse_output_file_as_pandas_dataframe,
+)
+from antarest.output.model import OutputVariablesList, OutputVariableStatistics
+from antarest.output.statistics import compute_statistics, filter_statistics
 from antarest.output.storage.file.repository import FileOutputRepository
 from antarest.output.storage.output_storage import (
     IOutputStorage,
@@ -61,6 +74,7 @@ from antarest.study.model import (
     STUDY_VERSION_8,
     MatrixFrequency,
     MatrixIndex,
+    MatrixSlice,
 )
 from antarest.study.storage.rawstudy.model.filesystem.config.files import (
     get_playlist,
@@ -70,6 +84,7 @@ from antarest.study.storage.rawstudy.model.filesystem.config.files import (
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig
 from antarest.study.storage.rawstudy.model.filesystem.inode import OriginalFile
 from antarest.study.storage.rawstudy.model.filesystem.matrix.matrix_storage_context import MatrixStorageContext
+from antarest.study.storage.rawstudy.model.filesystem.matrix.output_series_matrix import OutputSeriesMatrix
 from antarest.study.storage.rawstudy.model.filesystem.root.output.output import Output
 from antarest.study.storage.rawstudy.model.filesystem.root.output.simulation.mode.mcall.digest import (
     DigestSynthesis,
@@ -355,6 +370,7 @@ class AbstractFileOutputStorage(IOutputStorage):
         if output_path.exists() and output_path.is_dir():
             shutil.rmtree(output_path, ignore_errors=True)
         if archived_output_path.exists():
+            clear_zip_indexes()
             archived_output_path.unlink()
 
         remove_from_cache(self._cache, study_id)
@@ -403,6 +419,18 @@ class AbstractFileOutputStorage(IOutputStorage):
         archive_dir(output_path, target, archive_format=ArchiveFormat.ZIP)
         logger.info(f"Output {output_id} from study {study_id} exported in {stopwatch}s")
 
+    @override
+    def iter_output_archive(self, study_id: str, output_id: str) -> Iterator[bytes]:
+        study_outputs = self._outputs_provider.get_outputs(study_id)
+
+        if not _output_exists(study_outputs.outputs_path, output_id):
+            raise OutputNotFound(output_id)
+
+        output_path, archived_output_path = _output_paths(study_outputs.outputs_path, output_id)
+        if archived_output_path.exists():
+            return iter_chunks(archived_output_path.open("rb"))
+        return iter_zip_archive(output_path)
+
     @override
     def output_exists(self, study_id: str, output_id: str) -> bool:
         """Check if a study output exists."""
@@ -521,6 +549,29 @@ class AbstractFileOutputStorage(IOutputStorage):
         )
         return aggregator_manager.aggregate_output_data()
 
+    @override
+    def get_output_statistics(
+        self,
+        study_id: str,
+        output_id: str,
+        query_file: MCIndAreasQueryFile | MCIndLinksQueryFile,
+        frequency: MatrixFrequency,
+        ids_to_consider: Sequence[str],
+        variables: Sequence[str],
+    ) -> list[OutputVariableStatistics]:
+        # No statistics index for file outputs: they are computed from the raw files
+        study_outputs = self._outputs_provider.get_outputs(study_id)
+        aggregator_manager = AggregatorManager(
+            _output_path(study_outputs.outputs_path, output_id),
+            query_file,
+            frequency,
+            ids_to_consider,
+            [],
+            True,
+        )
+        data = pl.concat(aggregator_manager.aggregate_output_data(), how="diagonal_relaxed")
+        return filter_statistics(compute_statistics(data.lazy()).lazy(), ids_to_consider, variables)
+
     @override
     def get_variables_list(self, study_id: str, output_id: str) -> OutputVariablesList:
         study_outputs = self._outputs_provider.get_outputs(study_id)
@@ -564,20 +615,51 @@ class AbstractFileOutputStorage(IOutputStorage):
         return get_disk_usage(output_dir)
 
     @override
-    def get_raw_content(self, study_id: str, output_id: str, url: list[str], formatted: bool) -> Any:
+    def get_raw_content(
+        self,
+        study_id: str,
+        output_id: str,
+        url: list[str],
+        formatted: bool,
+        matrix_slice: MatrixSlice | None = None,
+    ) -> Any:
+        outputs_path = self._outputs_provider.get_outputs(study_id).outputs_path
+        if (formatted or matrix_slice) and _is_output_archived(outputs_path, output_id):
+            # Matrices are parsed directly from the archive, without extracting it
+            archive_path = _archived_output_path(outputs_path, output_id)
+            frequency = _matrix_frequency(url)
+            if frequency is not None and _build_matrix_member(url) in get_zip_index(archive_path):
+                df = _parse_archived_matrix(archive_path, url, get_start_column(frequency), matrix_slice)
+                return df.to_dict(orient="split", index=False)
+
         output_node = self._build_output_node(study_id, output_id)
-        return output_node.get([output_id] + url, formatted=formatted)
+        if matrix_slice is None:
+            return output_node.get([output_id] + url, formatted=formatted)
+
+        node = output_node.get_node([output_id] + url)
+        if not isinstance(node, OutputSeriesMatrix):
+            path = "/".join([output_id] + url)
+            raise IncorrectPathError(f"The provided path does not point to a valid matrix: 'output/{path}'")
+        return node.parse_dataframe(matrix_slice).to_dict(orient="split", index=False)
 
     @override
     def get_matrix_as_dataframe(
-        self, study_id: str, output_id: str, url: list[str], frequency: MatrixFrequency
+        self,
+        study_id: str,
+        output_id: str,
+        url: list[str],
+        frequency: MatrixFrequency,
+        matrix_slice: MatrixSlice | None = None,
     ) -> pd.DataFrame:
         study_outputs = self._outputs_provider.get_outputs(study_id)
-        output_dir = _output_path(study_outputs.outputs_path, output_id)
+        if _is_output_archived(study_outputs.outputs_path, output_id):
+            archive_path = _archived_output_path(study_outputs.outputs_path, output_id)
+            return _parse_archived_matrix(archive_path, url, get_start_column(frequency), matrix_slice)
 
+        output_dir = _output_path(study_outputs.outputs_path, output_id)
         file_path = _build_matrix_file_path(output_dir, url)
         first_column = get_start_column(frequency)
-        return parse_output_file_as_pandas_dataframe(file_path, first_column)
+        return parse_output_file_as_pandas_dataframe(file_path, first_column, matrix_slice)
 
     @override
     def get_original_file(self, study_id: str, output_id: str, url: list[str]) -> OriginalFile:
@@ -626,3 +708,34 @@ def _build_matrix_file_path(output_dir: Path, url: list[str]) -> Path:
 
     except Exception as e:
         raise ValueError(f"Failed to fetch output matrix for path `{url}`") from e
+
+
+def _build_matrix_member(url: list[str]) -> str:
+    """
+    Path of a matrix inside an output archive.
+    """
+    return _build_matrix_file_path(Path(), url).as_posix()
+
+
+def _matrix_frequency(url: list[str]) -> MatrixFrequency | None:
+    """
+    Frequency of an output matrix, from its name (`values-hourly`, `details-annual` ...), if it is one.
+    """
+    try:
+        return MatrixFrequency(url[-1].rsplit("-", 1)[-1]) if len(url) > 1 else None
+    except ValueError:
+        return None
+
+
+def _parse_archived_matrix(
+    archive_path: Path, url: list[str], first_column: int, matrix_slice: MatrixSlice | None
+) -> pd.DataFrame:
+    """
+    Parses an output matrix streamed from the output archive.
+    """
+    member = _build_matrix_member(url)
+    try:
+        with open_file_in_zip(archive_path, member) as f:
+            return parse_output_file_as_pandas_dataframe(f, first_column, matrix_slice)
+    except KeyError:
+        raise ChildNotFoundError(f"File '{member}' not found in the archive '{archive_path.name}'") from None
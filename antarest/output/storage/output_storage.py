@@ -25,10 +25,10 @@ from pydantic.alias_generators import to_camel
 from antarest.core.serde import AntaresBaseModel
 from antarest.launcher.adapters.abstractlauncher import SimulationLogs
 from antarest.launcher.model import LogType
-from antarest.output.filestudy.utils import QueryFileType
-from antarest.output.model import OutputVariablesList
+from antarest.output.filestudy.utils import MCIndAreasQueryFile, MCIndLinksQueryFile, QueryFileType
+from antarest.output.model import OutputVariablesList, OutputVariableStatistics
 from antarest.study.business.model.config.general_model import Mode
-from antarest.study.model import MatrixFrequency, MatrixIndex
+from antarest.study.model import MatrixFrequency, MatrixIndex, MatrixSlice
 from antarest.study.storage.rawstudy.model.filesystem.inode import OriginalFile
 from antarest.study.storage.rawstudy.model.filesystem.root.output.simulation.mode.mcall.digest import DigestUI
 
@@ -213,6 +213,13 @@ class IOutputStorage(ABC):
         Export and compresses study inside zip.
         """
 
+    @abstractmethod
+    def iter_output_archive(self, study_id: str, output_id: str) -> Iterator[bytes]:
+        """
+        Streams the output compressed as a zip archive, chunk by chunk.
+        The existence of the output is checked before the stream is returned.
+        """
+
     @abstractmethod
     def output_exists(self, study_id: str, output_id: str) -> bool:
         """Check if a study output exists."""
@@ -265,6 +272,21 @@ class IOutputStorage(ABC):
         Aggregates output data based on several filtering conditions, as a stream of dataframes.
         """
 
+    @abstractmethod
+    def get_output_statistics(
+        self,
+        study_id: str,
+        output_id: str,
+        query_file: MCIndAreasQueryFile | MCIndLinksQueryFile,
+        frequency: MatrixFrequency,
+        ids_to_consider: Sequence[str],
+        variables: Sequence[str],
+    ) -> list[OutputVariableStatistics]:
+        """
+        Summary statistics (min, max, mean, percentiles, totals per year) of the output variables,
+        across all Monte Carlo years.
+        """
+
     @abstractmethod
     def get_variables_list(self, study_id: str, output_id: str) -> OutputVariablesList:
         """
@@ -284,17 +306,32 @@ class IOutputStorage(ABC):
         """
 
     @abstractmethod
-    def get_raw_content(self, study_id: str, output_id: str, url: list[str], formatted: bool) -> Any:
+    def get_raw_content(
+        self,
+        study_id: str,
+        output_id: str,
+        url: list[str],
+        formatted: bool,
+        matrix_slice: MatrixSlice | None = None,
+    ) -> Any:
         """
-        Retrieves raw content based on a given url
+        Retrieves raw content based on a given url.
+
+        If a matrix slice is given, the url must point to a matrix, and only the requested
+        columns and rows are read. The result is then always formatted.
         """
 
     @abstractmethod
     def get_matrix_as_dataframe(
-        self, study_id: str, output_id: str, url: list[str], frequency: MatrixFrequency
+        self,
+        study_id: str,
+        output_id: str,
+        url: list[str],
+        frequency: MatrixFrequency,
+        matrix_slice: MatrixSlice | None = None,
     ) -> pd.DataFrame:
         """
-        Parses a matrix from a given url and returns it as a dataframe
+        Parses a matrix, or only the requested slice of it, from a given url and returns it as a dataframe
         """
 
     @abstractmethod
@@ -30,9 +30,10 @@ from antarest.core.exceptions import (
 from antarest.core.serde.ini_reader import IniReader
 from antarest.core.utils.archives import (
     ArchiveFormat,
-    archive_dir,
     extract_archive_from_path,
     extract_archive_from_stream,
+    iter_chunks,
+    write_zip_archive,
 )
 from antarest.core.utils.sqlalchemy import clone_orm_object
 from antarest.core.utils.utils import StopWatch
@@ -44,8 +45,8 @@ from antarest.output.filestudy.file_output_utils import (
     extract_variables_list,
     find_simulation_log,
 )
-from antarest.output.filestudy.utils import QueryFileType
-from antarest.output.model import OutputVariablesList
+from antarest.output.filestudy.utils import MCIndAreasQueryFile, MCIndLinksQueryFile, QueryFileType
+from antarest.output.model import OutputVariablesList, OutputVariableStatistics
 from antarest.output.storage.output_storage import (
     IOutputStorage,
     OutputDetails,
@@ -60,9 +61,10 @@ from antarest.output.storage.v2.variables_storage import (
     extract_output_to_parquet,
     parquet_output_dir,
     read_output_from_parquet,
+    read_output_statistics,
 )
 from antarest.study.business.model.config.general_model import Mode
-from antarest.study.model import MatrixFrequency, MatrixIndex
+from antarest.study.model import MatrixFrequency, MatrixIndex, MatrixSlice
 from antarest.study.storage.rawstudy.model.filesystem.inode import OriginalFile
 from antarest.study.storage.rawstudy.model.filesystem.root.output.simulation.mode.mcall.digest import DigestUI
 from antarest.study.storage.utils import (
@@ -90,33 +92,27 @@ def _write_temporary_files(tmp_dir: Path, output: BinaryIO | Path) -> tuple[Path
     Returns:
         the path to the compressed archive, and the path to the uncompressed directory.
     """
-    archive_path = tmp_dir / f"{uuid.uuid4()}.zip"
+    archive_path = tmp_dir / f"{uuid.uuid4()}{ArchiveFormat.ZIP}"
     dir_path = tmp_dir / f"{uuid.uuid4()}"
     try:
+        # The output is extracted (or copied) once, directly from its source
         if isinstance(output, Path):
             if output.is_dir():
                 shutil.copytree(output, dir_path, dirs_exist_ok=False)
-                archive_path = tmp_dir / f"{uuid.uuid4()}{ArchiveFormat.ZIP}"
-                archive_dir(dir_path, archive_path, remove_source_dir=False, archive_format=ArchiveFormat.ZIP)
             else:
-                shutil.copy(output, archive_path)
-                with archive_path.open("rb") as f:
-                    extract_archive_from_stream(f, dir_path)
+                with output.open("rb") as f:
+                    extract_archive_from_stream(f, dir_path, tmp_dir=tmp_dir)
         else:
-            # write the archive to one dir and extract to the second
-            with archive_path.open("wb") as f:
-                shutil.copyfileobj(output, f)
-            with archive_path.open("rb") as f:
-                extract_archive_from_stream(f, dir_path)
+            extract_archive_from_stream(output, dir_path, tmp_dir=tmp_dir)
 
         # Still needed to ensure the output is not in a sub-directory
         fix_study_root(dir_path)
-        # TODO: optimize this, we should not do it when not needed (when the layout was OK)
-        archive_path.unlink()
-        archive_dir(dir_path, archive_path, remove_source_dir=False, archive_format=ArchiveFormat.ZIP)
+        # The archive is then built once, from the fixed layout
+        with archive_path.open("wb") as f:
+            write_zip_archive(dir_path, f)
 
     except Exception:
-        shutil.rmtree(archive_path, ignore_errors=True)
+        archive_path.unlink(missing_ok=True)
         shutil.rmtree(dir_path, ignore_errors=True)
         raise
     return archive_path, dir_path
@@ -328,6 +324,11 @@ class V2OutputStorage(IOutputStorage):
         self._require_metadata(study_id, output_id)
         self._archive_storage.read_file(_archive_id(study_id, output_id), target)
 
+    @override
+    def iter_output_archive(self, study_id: str, output_id: str) -> Iterator[bytes]:
+        self._require_metadata(study_id, output_id)
+        return iter_chunks(self._archive_storage.open_file(_archive_id(study_id, output_id)))
+
     @override
     def output_exists(self, study_id: str, output_id: str) -> bool:
         return self._get_metadata(study_id, output_id) is not None
@@ -425,19 +426,47 @@ class V2OutputStorage(IOutputStorage):
         if not has_data:
             raise OutputAggregationError(output_id, "No output data matching the criteria were found")
 
+    @override
+    def get_output_statistics(
+        self,
+        study_id: str,
+        output_id: str,
+        query_file: MCIndAreasQueryFile | MCIndLinksQueryFile,
+        frequency: MatrixFrequency,
+        ids_to_consider: Sequence[str],
+        variables: Sequence[str],
+    ) -> list[OutputVariableStatistics]:
+        metadata = self._require_metadata(study_id, output_id)
+        if metadata.archived:
+            raise OutputAggregationError(output_id, "Statistics are not available for archived outputs")
+        target_dir = parquet_output_dir(self._variables_dir, study_id, output_id)
+        return read_output_statistics(target_dir, query_file, frequency, ids_to_consider, variables)
+
     @override
     def get_disk_usage(self, study_id: str, output_id: str) -> int:
         output_dir = parquet_output_dir(self._variables_dir, study_id, output_id)
         return get_disk_usage(output_dir)
 
     @override
-    def get_raw_content(self, study_id: str, output_id: str, url: list[str], formatted: bool) -> Any:
+    def get_raw_content(
+        self,
+        study_id: str,
+        output_id: str,
+        url: list[str],
+        formatted: bool,
+        matrix_slice: MatrixSlice | None = None,
+    ) -> Any:
         # todo: implement this
         raise NotImplementedError()
 
     @override
     def get_matrix_as_dataframe(
-        self, study_id: str, output_id: str, url: list[str], frequency: MatrixFrequency
+        self,
+        study_id: str,
+        output_id: str,
+        url: list[str],
+        frequency: MatrixFrequency,
+        matrix_slice: MatrixSlice | None = None,
     ) -> pd.DataFrame:
         # todo: implement this
         raise NotImplementedError()
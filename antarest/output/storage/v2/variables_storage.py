@@ -16,9 +16,13 @@ Conversion of Antares output TSV files to parquet format.
 Output structure: one parquet file per (mc_root, object_type, frequency) tuple.
 Naming convention: {mc_root}_{object_type}_{frequency}.parquet
 Example: mc-all_areas_hourly.parquet, mc-ind_thermal_clusters_daily.parquet
+
+Each mc-ind file of areas, links or clusters comes with a summary statistics sidecar,
+computed during the import right after the file is written: {mc_root}_{object_type}_{frequency}.stats.parquet
 """
 
 import logging
+import os
 import shutil
 import tempfile
 from collections.abc import Iterator, Sequence
@@ -49,6 +53,8 @@ from antarest.output.filestudy.utils import (
     normalize_df_column_names,
     parse_output_file,
 )
+from antarest.output.model import OutputVariableStatistics
+from antarest.output.statistics import compute_statistics, filter_statistics
 from antarest.output.utils import find_mode_dir
 from antarest.study.model import MatrixFrequency
 
@@ -63,6 +69,26 @@ def _parquet_file_name(mc_root: MCRoot, object_type: str, frequency: MatrixFrequ
     return f"{mc_root.value}_{object_type}_{frequency.value}.parquet"
 
 
+def _statistics_path(parquet_path: Path) -> Path:
+    return parquet_path.with_suffix(".stats.parquet")
+
+
+def _write_statistics(parquet_path: Path) -> None:
+    """
+    Writes the statistics sidecar of the given parquet file.
+    The sidecar is written to a temporary file first, so that readers never see a truncated file.
+    """
+    statistics_path = _statistics_path(parquet_path)
+    statistics = compute_statistics(pl.scan_parquet(parquet_path))
+    with tempfile.NamedTemporaryFile(dir=statistics_path.parent, suffix=".tmp", delete=False) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        statistics.write_parquet(tmp_path)
+        os.replace(tmp_path, statistics_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
 _SKIPPED_QUERY_FILES = {"id"}
 """Query file types that should not be converted to parquet (metadata files, not variable data)."""
 
@@ -129,6 +155,9 @@ def _aggregate_to_parquet(
             return
         _merge_intermediate_parquets(file_paths, new_index, target_path)
 
+    if _mc_root_for_query_file(query_file) == MCRoot.MC_IND:
+        _write_statistics(target_path)
+
 
 def _extract_areas(
     output_dir: Path,
@@ -401,3 +430,39 @@ def read_output_from_parquet(
     if district_ids:
         parquet_path = target_dir / _parquet_file_name(mc_root, "districts", frequency)
         yield from _read_filtered(parquet_path, id_col, district_ids, mc_root, mc_years, columns_names, is_details)
+
+
+def _read_statistics(
+    parquet_path: Path, ids: Sequence[str], variables: Sequence[str]
+) -> list[OutputVariableStatistics]:
+    if not parquet_path.exists():
+        return []
+    statistics_path = _statistics_path(parquet_path)
+    if statistics_path.exists():
+        statistics = pl.scan_parquet(statistics_path)
+    else:
+        # Outputs imported before statistics were introduced: computed on the fly, the sidecar is only written on import
+        statistics = compute_statistics(pl.scan_parquet(parquet_path)).lazy()
+    return filter_statistics(statistics, ids, variables)
+
+
+def read_output_statistics(
+    target_dir: Path,
+    query_file: MCIndAreasQueryFile | MCIndLinksQueryFile,
+    frequency: MatrixFrequency,
+    ids_to_consider: Sequence[str],
+    variables: Sequence[str],
+) -> list[OutputVariableStatistics]:
+    is_link = isinstance(query_file, MCIndLinksQueryFile)
+    obj_type = get_output_object_type(query_file, is_link)
+    area_ids = [i for i in ids_to_consider if is_link or not i.startswith("@")]
+    district_ids = [i for i in ids_to_consider if not is_link and i.startswith("@")]
+
+    statistics = []
+    if area_ids or not ids_to_consider:
+        parquet_path = target_dir / _parquet_file_name(MCRoot.MC_IND, obj_type, frequency)
+        statistics.extend(_read_statistics(parquet_path, area_ids, variables))
+    if district_ids and query_file == MCIndAreasQueryFile.VALUES:
+        parquet_path = target_dir / _parquet_file_name(MCRoot.MC_IND, "districts", frequency)
+        statistics.extend(_read_statistics(parquet_path, district_ids, variables))
+    return statistics
@@ -0,0 +1,108 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Materialization of output variables views.
+
+The data is read directly from the output storage, which only reads the requested columns
+(parquet scan for V2 outputs, column projection of TSV files for file outputs),
+and is then pivoted with polars to get one column per Monte Carlo year.
+Views sharing the same query file are all built from a single read.
+"""
+
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import polars as pl
+
+from antarest.output.filestudy.aggregator_management import AREA_COL, CLUSTER_ID_COL, LINK_COL
+from antarest.output.filestudy.utils import MCYEAR_COL, TIME_ID_COL, QueryFileType
+from antarest.output.storage.output_storage import IOutputStorage
+from antarest.output.variable_view.model import (
+    LinkOutputId,
+    OutputItemId,
+    get_ids_for_aggregation,
+    get_query_file,
+)
+from antarest.study.model import MatrixFrequency
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class VariablesViewDefinition:
+    """
+    Identifies a view: one variable of one output item, for all Monte Carlo years.
+    """
+
+    output_identifier: OutputItemId
+    variable_name: str
+
+
+def _pivot_view(data: pl.DataFrame, view: VariablesViewDefinition) -> pl.DataFrame:
+    item_id, subitem_id = get_ids_for_aggregation(view.output_identifier)
+    id_col = LINK_COL if isinstance(view.output_identifier, LinkOutputId) else AREA_COL
+
+    view_data = data.filter(pl.col(id_col) == item_id)
+    if subitem_id:
+        view_data = view_data.filter(pl.col(CLUSTER_ID_COL) == subitem_id)
+
+    return (
+        view_data.select(MCYEAR_COL, TIME_ID_COL, view.variable_name)
+        .sort(MCYEAR_COL, TIME_ID_COL)
+        .pivot(on=MCYEAR_COL, index=TIME_ID_COL, values=view.variable_name)
+        .drop(TIME_ID_COL)
+    )
+
+
+def materialize_variables_views(
+    storage: IOutputStorage,
+    study_id: str,
+    output_id: str,
+    frequency: MatrixFrequency,
+    views: Sequence[VariablesViewDefinition],
+) -> list[pl.DataFrame]:
+    """
+    Builds the data of the given views, with one column per Monte Carlo year.
+
+    Views are grouped by query file (values, details ...), each file type is read only once
+    for all the requested items and variables.
+
+    Returns:
+        the views data, in the same order as the given views.
+    """
+    # The query files of areas and links have the same values: the buckets are keyed by the enum class too
+    views_by_query_file: dict[tuple[type[QueryFileType], QueryFileType], list[int]] = {}
+    for k, view in enumerate(views):
+        query_file = get_query_file(view.output_identifier)
+        views_by_query_file.setdefault((type(query_file), query_file), []).append(k)
+
+    results: list[pl.DataFrame | None] = [None] * len(views)
+    for (_, query_file), indices in views_by_query_file.items():
+        ids_to_consider = sorted({get_ids_for_aggregation(views[k].output_identifier)[0] for k in indices})
+        variables = sorted({views[k].variable_name for k in indices})
+        logger.info(f"Reading {len(variables)} variables of {len(ids_to_consider)} items from '{query_file}' files")
+
+        batches = storage.aggregate_output_data(
+            study_id,
+            output_id,
+            query_file,
+            frequency,
+            ids_to_consider,
+            variables,
+            transform_columns_headers=True,
+        )
+        data = pl.concat(batches, how="diagonal_relaxed")
+        for k in indices:
+            results[k] = _pivot_view(data, views[k])
+
+    return [result for result in results if result is not None]
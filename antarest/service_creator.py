@@ -18,7 +18,10 @@ from typing import Any
 
 import redis
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.engine.url import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.pool import NullPool
 
 from antarest.blobstore.blob_garbage_collector import BlobGarbageCollector
@@ -74,6 +77,7 @@ from antarest.study.service import StudyService
 from antarest.study.storage.auto_archive_service import AutoArchiveService
 from antarest.study.storage.explorer_service import Explorer
 from antarest.study.storage.rawstudy.watcher import Watcher
+from antarest.study.storage.variantstudy.snapshot.snapshot_pregenerator import SnapshotPregenerator
 from antarest.tablemode.repository import TablemodeRepository
 from antarest.tablemode.service import TableModeService
 from antarest.worker.archive_worker import ArchiveWorker
@@ -103,6 +107,25 @@ class Module(StrEnum):
     AUTO_ARCHIVER = "auto_archiver"
     BLOB_GC = "blob_gc"
     VARIABLE_VIEW_GC = "variable_view_gc"
+    SNAPSHOT_PREGENERATOR = "snapshot_pregenerator"
+
+
+def _get_pool_args(config: Config) -> dict[str, Any]:
+    extra: dict[str, Any] = {}
+    if config.db.pool_use_null:
+        extra["poolclass"] = NullPool
+    elif not config.db.db_url.startswith("sqlite"):
+        if config.db.pool_pre_ping:
+            extra["pool_pre_ping"] = True
+        if config.db.pool_recycle:
+            extra["pool_recycle"] = config.db.pool_recycle
+        if config.db.pool_max_overflow:
+            extra["max_overflow"] = config.db.pool_max_overflow
+        if config.db.pool_size:
+            extra["pool_size"] = config.db.pool_size
+        if config.db.pool_use_lifo:
+            extra["pool_use_lifo"] = config.db.pool_use_lifo
+    return extra
 
 
 def init_db_engine(
@@ -120,20 +143,7 @@ def init_db_engine(
     else:
         connect_args["connect_timeout"] = config.db.db_connect_timeout
 
-    extra: dict[str, Any] = {}
-    if config.db.pool_use_null:
-        extra["poolclass"] = NullPool
-    elif not config.db.db_url.startswith("sqlite"):
-        if config.db.pool_pre_ping:
-            extra["pool_pre_ping"] = True
-        if config.db.pool_recycle:
-            extra["pool_recycle"] = config.db.pool_recycle
-        if config.db.pool_max_overflow:
-            extra["max_overflow"] = config.db.pool_max_overflow
-        if config.db.pool_size:
-            extra["pool_size"] = config.db.pool_size
-        if config.db.pool_use_lifo:
-            extra["pool_use_lifo"] = config.db.pool_use_lifo
+    extra = _get_pool_args(config)
 
     engine = create_engine(config.db.db_url, echo=config.debug, connect_args=connect_args, **extra)
 
@@ -142,6 +152,44 @@ def init_db_engine(
     return engine
 
 
+# Async drivers of the supported databases
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def get_async_db_url(db_url: str) -> URL:
+    """
+    Returns the URL of the database, with the async driver of its backend.
+
+    Raises:
+        ValueError: if there is no async driver for the database backend.
+    """
+    url = make_url(db_url)
+    backend = url.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver available for the '{backend}' database")
+    return url.set(drivername=_ASYNC_DRIVERS[backend])
+
+
+def init_async_db_engine(config: Config) -> AsyncEngine | None:
+    """
+    Creates the async engine used by the read-only routes, if enabled in the configuration.
+    """
+    if not config.db.async_reads:
+        return None
+    connect_args: dict[str, Any] = {}
+    if not config.db.db_url.startswith("sqlite"):
+        connect_args["timeout"] = config.db.db_connect_timeout
+
+    extra = _get_pool_args(config)
+
+    return create_async_engine(
+        get_async_db_url(config.db.db_url), echo=config.debug, connect_args=connect_args, **extra
+    )
+
+
 def new_redis_instance(config: RedisConfig) -> redis.Redis:  # type: ignore
     redis_client = redis.Redis(
         host=config.host,
@@ -362,6 +410,14 @@ def create_variable_view_gc(config: Config) -> VariableViewGarbageCollector:
     )
 
 
+def create_snapshot_pregenerator(config: Config, core_services: CoreServices) -> SnapshotPregenerator:
+    return SnapshotPregenerator(
+        variant_study_service=core_services.study_service.storage_service.variant_study_service,
+        event_bus=core_services.event_bus,
+        config=config,
+    )
+
+
 def create_watcher(
     config: Config,
     study_service: StudyService | None = None,
@@ -421,6 +477,7 @@ class Services:
     auto_archiver: AutoArchiveService | None = None
     blob_gc: BlobGarbageCollector | None = None
     variable_view_gc: VariableViewGarbageCollector | None = None
+    snapshot_pregenerator: SnapshotPregenerator | None = None
 
 
 def create_services(config: Config, create_all: bool = False) -> Services:
@@ -460,6 +517,10 @@ def create_services(config: Config, create_all: bool = False) -> Services:
     if config.server.services and Module.VARIABLE_VIEW_GC.value in config.server.services or create_all:
         variable_view_gc = create_variable_view_gc(config)
 
+    snapshot_pregenerator = None
+    if config.server.services and Module.SNAPSHOT_PREGENERATOR.value in config.server.services or create_all:
+        snapshot_pregenerator = create_snapshot_pregenerator(config, core_services)
+
     return Services(
         watcher=watcher,
         explorer=explorer_service,
@@ -482,4 +543,5 @@ def create_services(config: Config, create_all: bool = False) -> Services:
         auto_archiver=auto_archiver,
         blob_gc=blob_garbage_collector,
         variable_view_gc=variable_view_gc,
+        snapshot_pregenerator=snapshot_pregenerator,
     )
@@ -25,6 +25,7 @@ from antarest.service_creator import (
     create_blob_gc,
     create_core_services,
     create_matrix_gc,
+    create_snapshot_pregenerator,
     create_watcher,
     init_db_engine,
 )
@@ -58,6 +59,9 @@ def _init(config_file: Path, services_list: list[Module]) -> list[IService]:
         auto_archive_service = AutoArchiveService(core_services.study_service, core_services.output_service, config)
         services.append(auto_archive_service)
 
+    if Module.SNAPSHOT_PREGENERATOR in services_list:
+        services.append(create_snapshot_pregenerator(config, core_services))
+
     if Module.ARCHIVE_WORKER in services_list:
         worker = create_archive_worker(config, "test", event_bus=core_services.event_bus)
         services.append(worker)
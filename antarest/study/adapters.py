@@ -17,7 +17,7 @@ from typing_extensions import override
 
 from antarest.output.service import OutputService
 from antarest.output.storage.output_storage import OutputDetails, OutputMetadata
-from antarest.study.model import MatrixFrequency, MatrixIndex
+from antarest.study.model import MatrixFrequency, MatrixIndex, MatrixSlice
 from antarest.study.service import IOutputsAccess
 from antarest.study.storage.rawstudy.model.filesystem.inode import OriginalFile
 
@@ -65,14 +65,26 @@ def adapt_output_service_to_study_service(output_service: OutputService) -> IOut
             return output_service.get_output_time_index(study_id, output_id, frequency)
 
         @override
-        def get_output_raw_content(self, study_id: str, output_id: str, url: list[str], formatted: bool) -> Any:
-            return output_service.get_output_raw_content(study_id, output_id, url, formatted)
+        def get_output_raw_content(
+            self,
+            study_id: str,
+            output_id: str,
+            url: list[str],
+            formatted: bool,
+            matrix_slice: MatrixSlice | None = None,
+        ) -> Any:
+            return output_service.get_output_raw_content(study_id, output_id, url, formatted, matrix_slice)
 
         @override
         def get_output_matrix_as_dataframe(
-            self, study_id: str, output_id: str, url: list[str], frequency: MatrixFrequency
+            self,
+            study_id: str,
+            output_id: str,
+            url: list[str],
+            frequency: MatrixFrequency,
+            matrix_slice: MatrixSlice | None = None,
         ) -> pd.DataFrame:
-            return output_service.get_matrix_as_dataframe(study_id, output_id, url, frequency)
+            return output_service.get_matrix_as_dataframe(study_id, output_id, url, frequency, matrix_slice)
 
         @override
         def get_output_original_file(self, study_id: str, output_id: str, url: list[str]) -> OriginalFile:
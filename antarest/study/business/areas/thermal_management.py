@@ -12,6 +12,8 @@
 
 from collections.abc import Mapping, Sequence
 
+import polars as pl
+
 from antarest.core.exceptions import (
     DuplicateThermalCluster,
 )
@@ -103,6 +105,22 @@ class ThermalManager:
         """
         return study.get_study_dao().get_all_thermals()
 
+    def get_all_thermals_frame(self, study: StudyInterface, columns: Sequence[str] | None = None) -> pl.DataFrame:
+        """
+        Retrieve the properties of all thermal clusters from all areas within a study, as a frame.
+
+        Args:
+            study: Study from which to retrieve the clusters.
+            columns: The fields of the clusters to retrieve, all of them by default.
+
+        Returns:
+            A frame with one row per cluster, and the `area_id`, `id` and requested columns.
+
+        Raises:
+            ThermalClusterConfigNotFound: If no clusters are found in the specified area.
+        """
+        return study.get_study_dao().get_thermals_frame(columns)
+
     def update_thermals_props(
         self,
         study: StudyInterface,
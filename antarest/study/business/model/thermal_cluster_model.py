@@ -28,9 +28,10 @@ on those default values in other parts of the code: parsers, tests ...
 
 """
 
-from collections.abc import MutableMapping
+from collections.abc import MutableMapping, Sequence
 from typing import Annotated, Any, TypeAlias, cast
 
+import polars as pl
 from antares.study.version import StudyVersion
 from pydantic import ConfigDict, Field, PlainValidator, model_validator
 from pydantic.alias_generators import to_camel
@@ -344,6 +345,57 @@ class ThermalClusterUpdate(AntaresBaseModel):
 
 ThermalClusterUpdates = dict[LowerCaseId, dict[LowerCaseId, ThermalClusterUpdate]]
 
+_FIELDS_ADDED_IN_8_6 = ["nh3", "so2", "nox", "pm2_5", "pm5", "pm10", "nmvoc", "op1", "op2", "op3", "op4", "op5"]
+_FIELDS_ADDED_IN_8_7 = ["cost_generation", "efficiency", "variable_o_m_cost"]
+
+# Columns of the frames of thermal clusters: the area ID of the clusters, then the fields of `ThermalCluster`.
+# Enum fields are represented by their values.
+THERMAL_CLUSTER_FRAME_SCHEMA = pl.Schema(
+    {
+        "area_id": pl.String(),
+        "id": pl.String(),
+        "name": pl.String(),
+        "unit_count": pl.Int64(),
+        "nominal_capacity": pl.Float64(),
+        "enabled": pl.Boolean(),
+        "group": pl.String(),
+        "gen_ts": pl.String(),
+        "min_stable_power": pl.Float64(),
+        "min_up_time": pl.Int64(),
+        "min_down_time": pl.Int64(),
+        "must_run": pl.Boolean(),
+        "spinning": pl.Float64(),
+        "volatility_forced": pl.Float64(),
+        "volatility_planned": pl.Float64(),
+        "law_forced": pl.String(),
+        "law_planned": pl.String(),
+        "marginal_cost": pl.Float64(),
+        "spread_cost": pl.Float64(),
+        "fixed_cost": pl.Float64(),
+        "startup_cost": pl.Float64(),
+        "market_bid_cost": pl.Float64(),
+        "co2": pl.Float64(),
+        **{field: pl.Float64() for field in _FIELDS_ADDED_IN_8_6},
+        "cost_generation": pl.String(),
+        "efficiency": pl.Float64(),
+        "variable_o_m_cost": pl.Float64(),
+    }
+)
+
+
+def get_thermal_cluster_frame_schema(columns: Sequence[str] | None = None) -> pl.Schema:
+    """
+    Returns the schema of a frame of thermal clusters, restricted to the given columns.
+
+    The `area_id` and `id` columns are always included.
+    """
+    if columns is None:
+        return THERMAL_CLUSTER_FRAME_SCHEMA
+    if unknown := set(columns).difference(THERMAL_CLUSTER_FRAME_SCHEMA):
+        raise ValueError(f"Unknown thermal cluster columns: {sorted(unknown)}")
+    selected = {"area_id", "id", *columns}
+    return pl.Schema({name: dtype for name, dtype in THERMAL_CLUSTER_FRAME_SCHEMA.items() if name in selected})
+
 
 def _check_min_version(data: Any, field: str, version: StudyVersion) -> None:
     if getattr(data, field) is not None:
@@ -360,11 +412,11 @@ def validate_thermal_cluster_against_version(
     Will raise an InvalidFieldForVersionError if a field is not valid for the given study version.
     """
     if version < STUDY_VERSION_8_6:
-        for field in ["nh3", "so2", "nox", "pm2_5", "pm5", "pm10", "nmvoc", "op1", "op2", "op3", "op4", "op5"]:
+        for field in _FIELDS_ADDED_IN_8_6:
             _check_min_version(cluster_data, field, version)
 
     if version < STUDY_VERSION_8_7:
-        for field in ["cost_generation", "efficiency", "variable_o_m_cost"]:
+        for field in _FIELDS_ADDED_IN_8_7:
             _check_min_version(cluster_data, field, version)
 
     if cluster_data.group is not None and version < STUDY_VERSION_9_3:
@@ -383,7 +435,7 @@ def initialize_thermal_cluster(cluster: ThermalCluster, version: StudyVersion) -
     Set undefined version-specific fields to default values.
     """
     if version >= STUDY_VERSION_8_6:
-        for field in ["nh3", "so2", "nox", "pm2_5", "pm5", "pm10", "nmvoc", "op1", "op2", "op3", "op4", "op5"]:
+        for field in _FIELDS_ADDED_IN_8_6:
             _initialize_field_default(cluster, field, 0)
 
     if version >= STUDY_VERSION_8_7:
@@ -392,6 +444,45 @@ def initialize_thermal_cluster(cluster: ThermalCluster, version: StudyVersion) -
         _initialize_field_default(cluster, "variable_o_m_cost", 0.0)
 
 
+def validate_thermal_cluster_frame_against_version(version: StudyVersion, frame: pl.DataFrame) -> pl.DataFrame:
+    """
+    Validates a frame of thermal clusters against the provided study version, like
+    `validate_thermal_cluster_against_version` does for a single cluster.
+
+    Returns:
+        The frame, with the groups transformed according to the study version.
+    """
+    fields = []
+    if version < STUDY_VERSION_8_6:
+        fields.extend(_FIELDS_ADDED_IN_8_6)
+    if version < STUDY_VERSION_8_7:
+        fields.extend(_FIELDS_ADDED_IN_8_7)
+    for field in fields:
+        if field in frame.columns and frame[field].null_count() < frame.height:
+            raise InvalidFieldForVersionError(f"Field {field} is not a valid field for study version {version}")
+
+    if "group" in frame.columns and version < STUDY_VERSION_9_3:
+        groups = {group: ThermalClusterGroup(group).value for group in frame["group"].drop_nulls().unique()}
+        frame = frame.with_columns(pl.col("group").replace(groups))
+    return frame
+
+
+def initialize_thermal_cluster_frame(frame: pl.DataFrame, version: StudyVersion) -> pl.DataFrame:
+    """
+    Set undefined version-specific fields of a frame of thermal clusters to default values.
+    """
+    defaults: dict[str, Any] = {}
+    if version >= STUDY_VERSION_8_6:
+        defaults.update(dict.fromkeys(_FIELDS_ADDED_IN_8_6, 0.0))
+    if version >= STUDY_VERSION_8_7:
+        defaults.update(
+            cost_generation=ThermalCostGeneration.SET_MANUALLY.value, efficiency=100.0, variable_o_m_cost=0.0
+        )
+    return frame.with_columns(
+        pl.col(field).fill_null(value) for field, value in defaults.items() if field in frame.columns
+    )
+
+
 def check_thermal_cluster_complete(cluster: ThermalCluster, version: StudyVersion) -> None:
     """
     Raise ValueError if any version-required field on `cluster` is None.
@@ -400,9 +491,9 @@ def check_thermal_cluster_complete(cluster: ThermalCluster, version: StudyVersio
     """
     required: list[str] = []
     if version >= STUDY_VERSION_8_6:
-        required.extend(["nh3", "so2", "nox", "pm2_5", "pm5", "pm10", "nmvoc", "op1", "op2", "op3", "op4", "op5"])
+        required.extend(_FIELDS_ADDED_IN_8_6)
     if version >= STUDY_VERSION_8_7:
-        required.extend(["cost_generation", "efficiency", "variable_o_m_cost"])
+        required.extend(_FIELDS_ADDED_IN_8_7)
 
     missing = [f for f in required if getattr(cluster, f) is None]
     if missing:
@@ -16,6 +16,7 @@ from typing import Any, TypeAlias, cast
 
 import numpy as np
 import pandas as pd
+import polars as pl
 from typing_extensions import override
 
 from antarest.core.exceptions import ChildNotFoundError
@@ -37,7 +38,11 @@ from antarest.study.business.model.sts_model import (
     STStorageUpdate,
     STStorageUpdates,
 )
-from antarest.study.business.model.thermal_cluster_model import ThermalClusterUpdate, ThermalClusterUpdates
+from antarest.study.business.model.thermal_cluster_model import (
+    ThermalCluster,
+    ThermalClusterUpdate,
+    ThermalClusterUpdates,
+)
 from antarest.study.business.study_interface import StudyInterface
 
 _TableIndex = str  # row name
@@ -100,6 +105,13 @@ def _parse_area_properties_update(data: Mapping[_TableColumn, _CellValue]) -> Ar
     return AreaPropertiesUpdate.model_validate(values)
 
 
+# Columns of the thermal clusters table, and the corresponding fields of the thermal cluster model
+_THERMAL_FIELDS = {
+    info.alias or field: field for field, info in ThermalCluster.model_fields.items() if field not in {"id", "name"}
+}
+_THERMAL_COLUMNS = {field: column for column, field in _THERMAL_FIELDS.items()}
+
+
 class TableModeManager:
     def __init__(
         self,
@@ -129,13 +141,6 @@ class TableModeManager:
         elif table_type == TableModeType.LINK:
             links_map = self._link_manager.get_all_links(study)
             data = {f"{link.area1} / {link.area2}": link.model_dump(mode="json", by_alias=True) for link in links_map}
-        elif table_type == TableModeType.THERMAL:
-            thermals_by_areas = self._thermal_manager.get_all_thermals_props(study)
-            data = {
-                f"{area_id} / {cluster_id}": cluster.model_dump(by_alias=True, exclude={"id", "name"})
-                for area_id, thermals_by_ids in thermals_by_areas.items()
-                for cluster_id, cluster in thermals_by_ids.items()
-            }
         elif table_type == TableModeType.RENEWABLE:
             renewables_by_areas = self._renewable_manager.get_all_renewables_props(study)
             data = {
@@ -167,6 +172,24 @@ class TableModeManager:
             raise NotImplementedError(f"Table type {table_type} not implemented")
         return data
 
+    def _get_thermals_table_data(self, study: StudyInterface, columns: Sequence[_TableColumn]) -> TableDataDTO:
+        """
+        The table of the thermal clusters is built from a frame, which avoids creating a model per cluster.
+        """
+        if columns:
+            fields = list(dict.fromkeys(_THERMAL_FIELDS[column] for column in columns if column in _THERMAL_FIELDS))
+        else:
+            fields = list(_THERMAL_FIELDS.values())
+        frame = self._thermal_manager.get_all_thermals_frame(study, fields)
+        index = frame.select(pl.concat_str(pl.col("area_id"), pl.col("id").str.to_lowercase(), separator=" / "))
+        table = frame.select(fields).rename({field: _THERMAL_COLUMNS[field] for field in fields})
+
+        # According to the study version, some properties may not be present,
+        # so we need to drop columns that are all null.
+        table = table.select(column for column in table.columns if table[column].null_count() < table.height)
+
+        return dict(zip(index.to_series(), table.iter_rows(named=True)))
+
     def get_table_data(
         self,
         study: StudyInterface,
@@ -186,6 +209,8 @@ class TableModeManager:
             Where keys are the row names and values are dictionaries of column names and cell values.
         """
         try:
+            if table_type == TableModeType.THERMAL:
+                return self._get_thermals_table_data(study, columns)
             data = self._get_table_data_unsafe(study, table_type)
         except ChildNotFoundError:
             # It's better to return an empty table than raising an 404 error
@@ -11,7 +11,8 @@
 # This file is part of the Antares project.
 from abc import abstractmethod
 from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, ContextManager
 
 import polars as pl
 from antares.study.version import StudyVersion
@@ -229,6 +230,45 @@ class StudyDao(
     def update_cache(self) -> None:
         raise NotImplementedError()
 
+    def supports_concurrent_writes(self) -> bool:
+        """
+        Whether independent data (for instance, the clusters of two different areas)
+        can be written concurrently from several threads.
+        """
+        return False
+
+    def unit_of_work(self) -> ContextManager[None]:
+        """
+        Defers the persistence of the writes made in the context: they are persisted at once
+        when leaving it, including when an exception is raised.
+        Nested units of work are part of the outermost one.
+
+        By default, the writes are persisted immediately.
+        """
+        return nullcontext()
+
+    def operation(self) -> ContextManager["DaoOperation"]:
+        """
+        Delimits an operation (typically, the application of a command) inside a unit of work.
+
+        The writes of the operation are discarded if it raises an exception, or if `DaoOperation.discard`
+        is called, so that a failed operation leaves no partial writes.
+
+        By default, and outside a unit of work, the writes of a failed operation are kept.
+        """
+        return nullcontext(DaoOperation())
+
+
+class DaoOperation:
+    """
+    Operation of a unit of work, see `StudyDao.operation`.
+    """
+
+    def discard(self) -> None:
+        """
+        Discards the writes of the operation, if supported.
+        """
+
 
 class ReadOnlyAdapter(ReadOnlyStudyDao):
     """
@@ -304,6 +344,10 @@ class ReadOnlyAdapter(ReadOnlyStudyDao):
     def get_all_thermals(self) -> dict[str, dict[str, ThermalCluster]]:
         return self._adaptee.get_all_thermals()
 
+    @override
+    def get_thermals_frame(self, columns: Sequence[str] | None = None) -> pl.DataFrame:
+        return self._adaptee.get_thermals_frame(columns)
+
     @override
     def get_all_thermals_for_area(self, area_id: str) -> Sequence[ThermalCluster]:
         return self._adaptee.get_all_thermals_for_area(area_id)
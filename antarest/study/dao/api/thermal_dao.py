@@ -15,7 +15,7 @@ from collections.abc import Sequence
 
 import polars as pl
 
-from antarest.study.business.model.thermal_cluster_model import ThermalCluster
+from antarest.study.business.model.thermal_cluster_model import ThermalCluster, get_thermal_cluster_frame_schema
 from antarest.study.dao.common import AreaId, ThermalId, ThermalSeriesMapping
 
 
@@ -29,6 +29,24 @@ class ReadOnlyThermalDao(ABC):
         """
         raise NotImplementedError()
 
+    def get_thermals_frame(self, columns: Sequence[str] | None = None) -> pl.DataFrame:
+        """
+        Returns the properties of all thermal clusters as a frame, with one row per cluster.
+
+        The frame contains the `area_id` and `id` columns, and the given fields of `ThermalCluster`
+        (all of them by default). Enum fields are represented by their values.
+        See `THERMAL_CLUSTER_FRAME_SCHEMA` for the types of the columns.
+
+        The default implementation converts the clusters returned by `get_all_thermals`.
+        """
+        schema = get_thermal_cluster_frame_schema(columns)
+        rows = [
+            {"area_id": area_id, **cluster.model_dump(mode="json")}
+            for area_id, clusters in self.get_all_thermals().items()
+            for cluster in clusters.values()
+        ]
+        return pl.DataFrame(rows, schema=schema)
+
     @abstractmethod
     def get_all_thermals_for_area(self, area_id: str) -> Sequence[ThermalCluster]:
         raise NotImplementedError()
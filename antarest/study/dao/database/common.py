@@ -9,6 +9,7 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy import Row, Table, select
@@ -35,10 +36,31 @@ def area_exists(session: Session, study_id: str, area_id: str) -> bool:
     return session.execute(stmt).fetchone() is not None
 
 
+def validate_cached_area_exists(dao: "DatabaseStudyDao", area_id: str) -> None:
+    """
+    Same as `validate_area_exists`, using the row cache of the DAO.
+    """
+    if dao.row_cache.find_row(AREA_TABLE, area_id=area_id) is None:
+        raise AreaNotFound(area_id)
+
+
 def get_row_representation_as_dict(row: Row[Any]) -> dict[str, Any]:
     return row._asdict()
 
 
+def get_rows_representation_as_dicts(rows: Sequence[Row[Any]]) -> list[dict[str, Any]]:
+    """
+    Same as `get_row_representation_as_dict`, for rows of the same result.
+
+    The keys of the rows are only computed once: `Row._asdict` computes them for each row,
+    which is the main cost of the conversion of large results.
+    """
+    if not rows:
+        return []
+    keys = rows[0]._fields
+    return [dict(zip(keys, row)) for row in rows]
+
+
 def save_area_matrix(dao: "DatabaseStudyDao", series: AreaSeriesMapping, table: Table) -> None:
     session = dao.get_session()
     study_id = dao.get_study_id()
@@ -48,7 +70,8 @@ def save_area_matrix(dao: "DatabaseStudyDao", series: AreaSeriesMapping, table:
         for area_id, series_id in series.items():
             data = {"study_id": study_id, "area_id": area_id, "matrix_id": series_id}
             values.append(data)
-        upsert_multiple(session, table, values)
+        with dao.savepoint():
+            upsert_multiple(session, table, values)
 
     except IntegrityError as e:
         invalid_ids = set(series) - set(dao.get_all_area_ids())
@@ -58,7 +81,7 @@ def save_area_matrix(dao: "DatabaseStudyDao", series: AreaSeriesMapping, table:
             # All areas exist. It means that the DB table does not contain the information.
             raise ValueError("One of the area matrices table is not filled as it should") from e
 
-    session.commit()
+    dao.commit()
 
 
 def get_all_area_matrices(study_id: str, session: Session, table: Table) -> AreaSeriesMapping:
@@ -36,6 +36,7 @@ from antarest.study.dao.database.common import (
     save_area_matrix,
     serialize_frequency_filters,
     validate_area_exists,
+    validate_cached_area_exists,
 )
 from antarest.study.dao.database.models.area import (
     AREA_TABLE,
@@ -109,13 +110,8 @@ class DatabaseAreaDao(AreaDao):
         """
         Retrieve all physical areas of a study.
         """
-        study_id = self.get_study_id()
-        session = self.get_session()
-
-        stmt = select(AREA_TABLE.c.area_id).where(AREA_TABLE.c.study_id == study_id)
-        result = session.execute(stmt)
-
-        return [row.area_id for row in result]
+        rows = self.get_impl().row_cache.get_rows(AREA_TABLE)
+        return [row.area_id for row in rows]
 
     @override
     def get_all_areas_info(self) -> list[AreaInfo]:
@@ -125,11 +121,7 @@ class DatabaseAreaDao(AreaDao):
         Returns:
             The list of areas with their basic information.
         """
-        study_id = self.get_study_id()
-        session = self.get_session()
-
-        stmt = select(AREA_TABLE.c.area_id, AREA_TABLE.c.area_name).where(AREA_TABLE.c.study_id == study_id)
-        result = session.execute(stmt)
+        result = self.get_impl().row_cache.get_rows(AREA_TABLE)
 
         thermal_clusters = self.get_impl().get_all_thermals()
         areas_info = []
@@ -148,12 +140,7 @@ class DatabaseAreaDao(AreaDao):
         Returns:
             A dictionary mapping area IDs to their UI data.
         """
-        study_id = self.get_study_id()
-        session = self.get_session()
-
-        # Single query to get all areas and their UI info
-        stmt = select(AREA_UI_TABLE).where(AREA_UI_TABLE.c.study_id == study_id)
-        rows = session.execute(stmt)
+        rows = self.get_impl().row_cache.get_rows(AREA_UI_TABLE)
 
         # Group UI rows by area_id
         ui_by_area: dict[str, list[Any]] = {}
@@ -207,22 +194,14 @@ class DatabaseAreaDao(AreaDao):
         Raises:
             AreaNotFound: If the area does not exist.
         """
-        study_id = self.get_study_id()
-        session = self.get_session()
-
-        # Fetch both specified layer and default layer in one query
+        # Fetch both specified layer and default layer
         layers_to_fetch = [layer, DEFAULT_LAYER_ID] if layer != DEFAULT_LAYER_ID else [DEFAULT_LAYER_ID]
-
-        stmt = select(AREA_UI_TABLE).where(
-            (AREA_UI_TABLE.c.study_id == study_id)
-            & (AREA_UI_TABLE.c.area_id == area_id)
-            & (AREA_UI_TABLE.c.layer_id.in_(layers_to_fetch))
-        )
-        rows = {row.layer_id: row for row in session.execute(stmt)}
+        area_rows = self.get_impl().row_cache.find_rows(AREA_UI_TABLE, area_id=area_id)
+        rows = {row.layer_id: row for row in area_rows if row.layer_id in layers_to_fetch}
 
         # If no UI found, check if area exists (to raise proper error)
         if not rows:
-            validate_area_exists(session, study_id, area_id)
+            validate_cached_area_exists(self.get_impl(), area_id)
             return AreaUI()
 
         # Prefer specified layer, fall back to default
@@ -242,15 +221,15 @@ class DatabaseAreaDao(AreaDao):
 
         stmt = insert(AREA_TABLE).values(values)
         try:
-            session = self.get_session()
-            session.execute(stmt)
-            session.commit()
+            with self.get_impl().savepoint():
+                self.get_session().execute(stmt)
         except IntegrityError as e:
             # Means an area already existed
             existing_ids = set(self.get_all_area_ids())
             invalid_ids = {transform_name_to_id(area_name) for area_name in data} - existing_ids
             ids_formatted = ", ".join(f"'{a}'" for a in invalid_ids)
             raise ValueError(f"Areas '{ids_formatted}' already exist and could not be created") from e
+        self.get_impl().commit()
 
     @override
     def delete_area(self, area_id: str) -> None:
@@ -292,7 +271,7 @@ class DatabaseAreaDao(AreaDao):
         # Delete area
         delete_stmt = delete(AREA_TABLE).where((AREA_TABLE.c.study_id == study_id) & (AREA_TABLE.c.area_id == area_id))
         session.execute(delete_stmt)
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def save_area_ui(self, data: AreaUiMapping) -> None:
@@ -319,7 +298,8 @@ class DatabaseAreaDao(AreaDao):
 
         # Performs the DB request
         try:
-            upsert_multiple(session, AREA_UI_TABLE, values)
+            with self.get_impl().savepoint():
+                upsert_multiple(session, AREA_UI_TABLE, values)
         except IntegrityError as e:
             # Could raise for area not found or layer not found.
 
@@ -332,7 +312,7 @@ class DatabaseAreaDao(AreaDao):
                     if not self.get_impl().layer_exists(layer):
                         raise LayerNotFound(layer) from e
 
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def get_invalid_area_ids(self, areas: list[str]) -> list[str]:
@@ -436,7 +416,7 @@ class DatabaseAreaDao(AreaDao):
             # Execute batch insert
             if insert_values:
                 session.execute(insert(AREA_UI_TABLE), insert_values)
-        session.commit()
+        self.get_impl().commit()
 
     def _create_new_ui(self, area_id: str, layer: str, area_ui: AreaUI) -> None:
         r, g, b = area_ui.color_rgb
@@ -451,7 +431,7 @@ class DatabaseAreaDao(AreaDao):
             color_b=b,
         )
         self.get_session().execute(stmt_insert)
-        self.get_session().commit()
+        self.get_impl().commit()
 
     def _get_matrix(self, area_id: str, table: Table) -> SeriesId:
         row = self._get_matrix_row(area_id, table)
@@ -460,11 +440,7 @@ class DatabaseAreaDao(AreaDao):
         return str(row.matrix_id)
 
     def _get_matrix_row(self, area_id: str, table: Table) -> Row[Any] | None:
-        study_id = self.get_study_id()
-        session = self.get_session()
-        stmt = select(table).where((table.c.study_id == study_id) & (table.c.area_id == area_id))
-
-        return session.execute(stmt).fetchone()
+        return self.get_impl().row_cache.find_row(table, area_id=area_id)
 
     @override
     def get_load(self, area_id: str) -> pl.DataFrame:
@@ -118,4 +118,4 @@ class DatabaseAreaPropertiesDao(AreaPropertiesDao):
         if result.rowcount == 0:
             # Means the update had no effect so the area did not exist
             raise AreaNotFound(area_id)
-        session.commit()
+        self.get_impl().commit()
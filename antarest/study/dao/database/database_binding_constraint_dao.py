@@ -24,7 +24,6 @@ from antares.study.version import StudyVersion
 from sqlalchemy import Row, Table, delete, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import outerjoin
 from typing_extensions import override
 
 from antarest.core.exceptions import BindingConstraintNotFound, BindingConstraintsNotFound
@@ -151,83 +150,41 @@ class DatabaseBindingConstraintDao(ConstraintDao):
 
     def _fetch_constraints(self, constraint_ids: list[ConstraintId]) -> dict[ConstraintId, BindingConstraint]:
         """
-        Two steps in this function
-        Step 1 : BC LEFT JOIN link_terms builds the result dict: one entry per constraint, pre-populated with
-        its BC fields and link terms.
-        Step 2 : SELECT cluster_terms fetches cluster_terms and appends them.
+        Builds the given constraints (all of them if no ID is given), with their link terms first,
+        then their cluster terms.
 
-        Two round trips, but joining both term tables at once would produce a Cartesian product,
-        that would make us fetch more data and process more data also we'll need to handle de-duplication which would make the code less readable."""
-        db = self._db_session
-
-        # Query 1: BC left join link terms
-        link_join = outerjoin(
-            BC,
-            LT,
-            (BC.c.study_id == LT.c.study_id) & (BC.c.constraint_id == LT.c.constraint_id),
-        )
-        q1 = (
-            select(
-                BC.c.constraint_id,
-                BC.c.name,
-                BC.c.enabled,
-                BC.c.time_step,
-                BC.c.operator,
-                BC.c.comments,
-                BC.c.filter_year_by_year,
-                BC.c.filter_synthesis,
-                BC.c.group,
-                LT.c.area1,
-                LT.c.area2,
-                LT.c.weight.label("lt_weight"),
-                LT.c.offset.label("lt_offset"),
-            )
-            .select_from(link_join)
-            .where(BC.c.study_id == self._study_id)
-        )
-        if constraint_ids:
-            q1 = q1.where(BC.c.constraint_id.in_(constraint_ids))
-
-        bc_rows: dict[ConstraintId, Any] = {}
-        terms: dict[ConstraintId, list[ConstraintTerm]] = {}
-
-        for row in db.execute(q1).fetchall():
-            cid = row.constraint_id
-            if cid not in bc_rows:
-                bc_rows[cid] = row
-                terms[cid] = []
-            if row.area1 is not None:
-                terms[cid].append(
-                    ConstraintTerm(
-                        weight=row.lt_weight, offset=row.lt_offset, data=LinkTerm(area1=row.area1, area2=row.area2)
-                    )
-                )
-
-        if not bc_rows:
-            return {}
-
-        # Query 2: cluster terms only (BC already fetched above)
-        ct_filter = CT.c.study_id == self._study_id
+        The rows of the constraints and of their terms are read from the row cache of the study,
+        which loads each table once instead of querying the terms of each constraint.
+        """
+        cache = self.get_impl().row_cache
         if constraint_ids:
-            ct_filter = ct_filter & (CT.c.constraint_id.in_(constraint_ids))
-
-        for row in db.execute(select(CT).where(ct_filter)).fetchall():
-            terms[row.constraint_id].append(
+            bc_rows = [row for cid in constraint_ids for row in cache.find_rows(BC, constraint_id=cid)]
+        else:
+            bc_rows = list(cache.get_rows(BC))
+
+        constraints: dict[ConstraintId, BindingConstraint] = {}
+        for bc_row in bc_rows:
+            cid = bc_row.constraint_id
+            terms = [
+                ConstraintTerm(weight=row.weight, offset=row.offset, data=LinkTerm(area1=row.area1, area2=row.area2))
+                for row in cache.find_rows(LT, constraint_id=cid)
+            ]
+            terms.extend(
                 ConstraintTerm(
                     weight=row.weight, offset=row.offset, data=ClusterTerm(area=row.area, cluster=row.cluster)
                 )
+                for row in cache.find_rows(CT, constraint_id=cid)
             )
-
-        return {ConstraintId(cid): self._row_to_bc(bc_rows[cid], terms[cid]) for cid in bc_rows}
+            constraints[ConstraintId(cid)] = self._row_to_bc(bc_row, terms)
+        return constraints
 
     @staticmethod
     def _row_to_bc(row: Row[Any], terms: list[ConstraintTerm]) -> BindingConstraint:
         d = get_row_representation_as_dict(row)
+        del d["study_id"]
         d["id"] = d.pop("constraint_id")
         d["terms"] = terms
-        # extra="allow" is required because the join query returns columns that are
-        # not fields of BindingConstraint (such as `area1` or `lt_weight`).
-        return BindingConstraint.model_validate(d, extra="allow")
+        return BindingConstraint.model_validate(d)
 
     @override
     def get_all_constraints(self) -> dict[ConstraintId, BindingConstraint]:
@@ -245,19 +202,14 @@ class DatabaseBindingConstraintDao(ConstraintDao):
     ) -> tuple[SeriesId, BindingConstraintFrequency]:
         """
         We need to fetch a constraint frequency to know the default matrix to use.
-        We want to avoid fetching terms as we do not need them.
-        That's why we use a specific DB request
+        We want to avoid building the terms as we do not need them.
         """
-        join_query = BC.join(table, (BC.c.study_id == table.c.study_id) & (BC.c.constraint_id == table.c.constraint_id))
-        q = (
-            select(BC.c.time_step, table.c.matrix_id)
-            .where((BC.c.study_id == self._study_id) & (BC.c.constraint_id == constraint_id))
-            .select_from(join_query)
-        )
-        row = self._db_session.execute(q).fetchone()
-        if row is None:
+        cache = self.get_impl().row_cache
+        bc_row = cache.find_row(BC, constraint_id=constraint_id)
+        matrix_row = cache.find_row(table, constraint_id=constraint_id)
+        if bc_row is None or matrix_row is None:
             raise BindingConstraintNotFound(f"Matrix for constraint {constraint_id} not found")
-        return str(row.matrix_id), row.time_step
+        return str(matrix_row.matrix_id), bc_row.time_step
 
     def _raise_the_right_binding_constraint_exception(
         self, bc_ids: set[str], exc: IntegrityError | None = None
@@ -276,7 +228,8 @@ class DatabaseBindingConstraintDao(ConstraintDao):
         rows = [{"study_id": self._study_id, "constraint_id": cid, "matrix_id": mid} for cid, mid in series.items()]
 
         try:
-            upsert_multiple(self._db_session, table, rows)
+            with self.get_impl().savepoint():
+                upsert_multiple(self._db_session, table, rows)
         except IntegrityError as e:
             self._raise_the_right_binding_constraint_exception(set(series), e)
 
@@ -317,10 +270,7 @@ class DatabaseBindingConstraintDao(ConstraintDao):
         return self.get_all_bc_matrices(BINDING_CONSTRAINT_EQ_MATRIX_TABLE)
 
     def get_all_bc_matrices(self, table: Table) -> BindingConstraintSeriesMapping:
-        study_id = self._study_id
-        session = self._db_session
-        stmt = select(table).where((table.c.study_id == study_id))
-        rows = session.execute(stmt).fetchall()
+        rows = self.get_impl().row_cache.get_rows(table)
         return {row.constraint_id: row.matrix_id for row in rows}
 
     @override
@@ -334,7 +284,7 @@ class DatabaseBindingConstraintDao(ConstraintDao):
         self._apply_matrix_changes(changes)
         self._cleanup_scenario_builder_groups()
 
-        self._db_session.commit()
+        self.get_impl().commit()
 
     def _save_constraint_rows(self, constraints: Sequence[BindingConstraint]) -> None:
         upsert_multiple(
@@ -637,22 +587,22 @@ class DatabaseBindingConstraintDao(ConstraintDao):
     @override
     def save_constraint_values_matrix(self, series: BindingConstraintSeriesMapping) -> None:
         self._save_bc_matrices(BINDING_CONSTRAINT_VALUES_MATRIX_TABLE, series)
-        self._db_session.commit()
+        self.get_impl().commit()
 
     @override
     def save_constraint_less_term_matrix(self, series: BindingConstraintSeriesMapping) -> None:
         self._save_bc_matrices(BINDING_CONSTRAINT_LT_MATRIX_TABLE, series)
-        self._db_session.commit()
+        self.get_impl().commit()
 
     @override
     def save_constraint_greater_term_matrix(self, series: BindingConstraintSeriesMapping) -> None:
         self._save_bc_matrices(BINDING_CONSTRAINT_GT_MATRIX_TABLE, series)
-        self._db_session.commit()
+        self.get_impl().commit()
 
     @override
     def save_constraint_equal_term_matrix(self, series: BindingConstraintSeriesMapping) -> None:
         self._save_bc_matrices(BINDING_CONSTRAINT_EQ_MATRIX_TABLE, series)
-        self._db_session.commit()
+        self.get_impl().commit()
 
     @override
     def delete_constraints(self, constraints: list[BindingConstraint]) -> None:
@@ -669,4 +619,4 @@ class DatabaseBindingConstraintDao(ConstraintDao):
         db.execute(delete(BC).where((BC.c.study_id == self._study_id) & (BC.c.constraint_id.in_(constraint_ids))))
         self._cleanup_scenario_builder_groups()
 
-        db.commit()
+        self.get_impl().commit()
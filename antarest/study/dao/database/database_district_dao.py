@@ -101,7 +101,7 @@ class DatabaseDistrictDao(DistrictDao):
             "subtract_areas": json.dumps(district.subtract_areas),
         }
         upsert_one(session, DISTRICT_TABLE, values)
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def remove_district(self, district_id: str) -> None:
@@ -120,7 +120,7 @@ class DatabaseDistrictDao(DistrictDao):
         if result.rowcount == 0:
             # Means the DELETE had no effect so the district did not exist
             raise DistrictConfigNotFound(f"District '{district_id}' does not exist in study '{study_id}'")
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def get_districts(self) -> Sequence[District]:
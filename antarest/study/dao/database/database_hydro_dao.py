@@ -180,10 +180,10 @@ class DatabaseHydroDao(HydroDao):
             values.append({"study_id": study_id, "area_id": area_id, **management.model_dump()})
 
         try:
-            upsert_multiple(session, HYDRO_MANAGEMENT_TABLE, values)
-            session.commit()
+            with self.get_impl().savepoint():
+                upsert_multiple(session, HYDRO_MANAGEMENT_TABLE, values)
+            self.get_impl().commit()
         except IntegrityError as e:
-            session.rollback()
             # IntegrityError occurred can only mean that an area_id is invalid
             self._raise_the_right_area_exception(set(hydro_management), e)
 
@@ -233,10 +233,10 @@ class DatabaseHydroDao(HydroDao):
             )
 
         try:
-            upsert_multiple(session, HYDRO_INFLOW_STRUCTURE_TABLE, values)
-            session.commit()
+            with self.get_impl().savepoint():
+                upsert_multiple(session, HYDRO_INFLOW_STRUCTURE_TABLE, values)
+            self.get_impl().commit()
         except IntegrityError as e:
-            session.rollback()
             # IntegrityError occurred can only mean that an area_id is invalid
             self._raise_the_right_area_exception(set(inflow_structure), e)
 
@@ -371,11 +371,11 @@ class DatabaseHydroDao(HydroDao):
                 )
 
         try:
-            session.execute(insert(HYDRO_ALLOCATION_TABLE), insert_values)
-            session.commit()
+            with self.get_impl().savepoint():
+                session.execute(insert(HYDRO_ALLOCATION_TABLE), insert_values)
+            self.get_impl().commit()
         except IntegrityError as e:
             # IntegrityError occurred can only mean that an area_id is invalid
-            session.rollback()
             # Build the `all_area_ids` set to raise the proper exception
             all_area_ids = set()
             for area_id, allocation in allocation_dict.items():
@@ -490,11 +490,11 @@ class DatabaseHydroDao(HydroDao):
 
         try:
             if insert_values:
-                session.execute(insert(HYDRO_CORRELATION_TABLE), insert_values)
-            session.commit()
+                with self.get_impl().savepoint():
+                    session.execute(insert(HYDRO_CORRELATION_TABLE), insert_values)
+            self.get_impl().commit()
         except IntegrityError as e:
             # IntegrityError occurred can only mean that an area_id is invalid
-            session.rollback()
             # Build the `all_area_ids` set to raise the proper exception
             all_area_ids = set()
             for area_id, correlation in correlation_dict.items():
@@ -521,10 +521,10 @@ class DatabaseHydroDao(HydroDao):
         study_id = self.get_study_id()
         values = {"study_id": study_id, "area_id": area_id, "matrix_id": matrix_id}
         try:
-            upsert_one(session, table, values)
-            session.commit()
+            with self.get_impl().savepoint():
+                upsert_one(session, table, values)
+            self.get_impl().commit()
         except IntegrityError as e:
-            session.rollback()
             raise AreaNotFound(area_id) from e
 
     @override
@@ -720,13 +720,13 @@ class DatabaseHydroDao(HydroDao):
                 {"study_id": study_id, "area_id": area_id, "matrix_id": daily_matrix_id} for area_id in area_ids
             ]
             try:
-                upsert_multiple(session, HYDRO_MAX_HOURLY_GEN_POWER_TABLE, hourly_rows)
-                upsert_multiple(session, HYDRO_MAX_HOURLY_PUMP_POWER_TABLE, hourly_rows)
-                upsert_multiple(session, HYDRO_MAX_DAILY_GEN_ENERGY_TABLE, daily_rows)
-                upsert_multiple(session, HYDRO_MAX_DAILY_PUMP_ENERGY_TABLE, daily_rows)
-                session.commit()
+                with self.get_impl().savepoint():
+                    upsert_multiple(session, HYDRO_MAX_HOURLY_GEN_POWER_TABLE, hourly_rows)
+                    upsert_multiple(session, HYDRO_MAX_HOURLY_PUMP_POWER_TABLE, hourly_rows)
+                    upsert_multiple(session, HYDRO_MAX_DAILY_GEN_ENERGY_TABLE, daily_rows)
+                    upsert_multiple(session, HYDRO_MAX_DAILY_PUMP_ENERGY_TABLE, daily_rows)
+                self.get_impl().commit()
             except IntegrityError as e:
-                session.rollback()
                 invalid = self.get_impl().get_invalid_area_ids(area_ids)
                 raise AreaNotFound(*invalid) from e
         else:
@@ -737,7 +737,7 @@ class DatabaseHydroDao(HydroDao):
                 HYDRO_MAX_DAILY_PUMP_ENERGY_TABLE,
             ]:
                 session.execute(delete(table).where(table.c.study_id == study_id))
-            session.commit()
+            self.get_impl().commit()
 
         compatibility_data.hydro_pmax = hydro_pmax
         self.get_impl().save_compatibility_parameters(compatibility_data)
@@ -116,7 +116,7 @@ class DatabaseLayerDao(LayerDao):
 
         values = {"study_id": study_id, "layer_id": layer.id, "name": layer.name}
         upsert_one(session, LAYER_TABLE, values)
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def delete_layer(self, layer_id: str) -> None:
@@ -140,7 +140,7 @@ class DatabaseLayerDao(LayerDao):
             # Means the DELETE had no effect so the layer did not exist
             raise LayerNotFound(layer_id)
 
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def layer_exists(self, layer_id: str) -> bool:
@@ -101,11 +101,12 @@ class DatabaseLinkDao(LinkDao):
             values.append({"study_id": self.get_study_id(), **link.model_dump()})
 
         try:
-            upsert_multiple(session, LINK_TABLE, values)
+            with self.get_impl().savepoint():
+                upsert_multiple(session, LINK_TABLE, values)
         except IntegrityError as e:
             self._raise_the_right_link_exception(links, e)
 
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def delete_link(self, link: Link) -> None:
@@ -121,7 +122,7 @@ class DatabaseLinkDao(LinkDao):
         if result.rowcount == 0:
             # Means the DELETE had no effect so the link did not exist
             raise LinkNotFound(f"The link {link.area1} -> {link.area2} is not present in the study")
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def get_links(self) -> Sequence[Link]:
@@ -165,11 +166,12 @@ class DatabaseLinkDao(LinkDao):
             area1, area2 = sorted(key)
             values.append({"study_id": study_id, "area1": area1, "area2": area2, "matrix_id": series_id})
         try:
-            upsert_multiple(session, table, values)
+            with self.get_impl().savepoint():
+                upsert_multiple(session, table, values)
         except IntegrityError as e:
             links = [Link(area1=area1, area2=area2) for area1, area2 in series.keys()]
             self._raise_the_right_link_exception(links, e)
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def save_link_indirect_capacities(self, series: LinkSeriesMapping) -> None:
@@ -19,7 +19,7 @@ from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, NoReturn
 
 import polars as pl
-from sqlalchemy import CursorResult, Select, delete, select
+from sqlalchemy import CursorResult, Row, delete, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing_extensions import override
@@ -35,7 +35,7 @@ from antarest.study.business.model.renewable_cluster_model import (
 )
 from antarest.study.dao.api.renewable_dao import RenewableDao
 from antarest.study.dao.common import AreaId, RenewableId, RenewableSeriesMapping
-from antarest.study.dao.database.common import get_row_representation_as_dict, validate_area_exists
+from antarest.study.dao.database.common import get_rows_representation_as_dicts, validate_cached_area_exists
 from antarest.study.dao.database.models.renewable import RENEWABLE_CLUSTER_TABLE, RENEWABLE_SERIES_TABLE
 from antarest.study.dao.database.sql_utils import upsert_multiple, upsert_one
 from antarest.study.storage.rawstudy.model.filesystem.matrix.simulator_default import default_scenario_hourly
@@ -63,14 +63,22 @@ class DatabaseRenewableDao(RenewableDao):
         pass
 
     def _convert_db_row_to_renewable(self, row: Any) -> RenewableCluster:
-        data = get_row_representation_as_dict(row)
-        del data["study_id"]
-        del data["area_id"]
-        data["id"] = data.pop("renewable_id")
-        cluster = RenewableCluster(**data)
+        return self._convert_db_rows_to_renewables([row])[0]
+
+    def _convert_db_rows_to_renewables(self, rows: Sequence[Row[Any]]) -> list[RenewableCluster]:
+        return self.get_impl().row_cache.convert_rows(RENEWABLE_CLUSTER_TABLE, rows, self._decode_renewables)
+
+    def _decode_renewables(self, rows: Sequence[Row[Any]]) -> list[RenewableCluster]:
         version = self.get_impl().get_version()
-        validate_renewable_cluster_against_version(version, cluster)
-        return cluster
+        clusters = []
+        for data in get_rows_representation_as_dicts(rows):
+            del data["study_id"]
+            del data["area_id"]
+            data["id"] = data.pop("renewable_id")
+            cluster = RenewableCluster(**data)
+            validate_renewable_cluster_against_version(version, cluster)
+            clusters.append(cluster)
+        return clusters
 
     def _convert_renewable_cluster_to_row(self, area_id: str, cluster: RenewableCluster) -> dict[str, Any]:
         values = dict(study_id=self._study_id, area_id=area_id, **cluster.model_dump())
@@ -110,11 +118,12 @@ class DatabaseRenewableDao(RenewableDao):
 
         values = self._convert_renewable_cluster_to_row(area_id, renewable)
         try:
-            upsert_one(session, RENEWABLE_CLUSTER_TABLE, values)
+            with self.get_impl().savepoint():
+                upsert_one(session, RENEWABLE_CLUSTER_TABLE, values)
         except IntegrityError as e:
             self._raise_the_right_renewable_exception({area_id: [renewable.id]}, e)
 
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def save_renewables(self, data: dict[AreaId, list[RenewableCluster]]) -> None:
@@ -128,12 +137,13 @@ class DatabaseRenewableDao(RenewableDao):
                 values.append(self._convert_renewable_cluster_to_row(area_id, renewable))
 
         try:
-            upsert_multiple(session=session, table=RENEWABLE_CLUSTER_TABLE, values=values)
+            with self.get_impl().savepoint():
+                upsert_multiple(session=session, table=RENEWABLE_CLUSTER_TABLE, values=values)
         except IntegrityError as e:
             invalid_data = {area_id: [renew.id.lower() for renew in renewables] for area_id, renewables in data.items()}
             self._raise_the_right_renewable_exception(invalid_data, e)
 
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def save_renewable_series(self, series: RenewableSeriesMapping) -> None:
@@ -151,12 +161,13 @@ class DatabaseRenewableDao(RenewableDao):
                         "matrix_id": matrix_id,
                     }
                     values.append(data)
-            upsert_multiple(session, RENEWABLE_SERIES_TABLE, values)
+            with self.get_impl().savepoint():
+                upsert_multiple(session, RENEWABLE_SERIES_TABLE, values)
         except IntegrityError as e:
             invalid_data = {area_id: list(renewable_dict) for area_id, renewable_dict in series.items()}
             self._raise_the_right_renewable_exception(invalid_data, e)
 
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def delete_renewable(self, area_id: str, renewable: RenewableCluster) -> None:
@@ -176,47 +187,29 @@ class DatabaseRenewableDao(RenewableDao):
             # Means the DELETE had no effect so the renewable did not exist
             self._raise_the_right_renewable_exception({area_id: [renewable.id]})
 
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def get_all_renewables(self) -> dict[str, dict[str, RenewableCluster]]:
-        study_id = self._study_id
-        session = self._db_session
-
-        stmt = select(RENEWABLE_CLUSTER_TABLE).where(RENEWABLE_CLUSTER_TABLE.c.study_id == study_id)
-        rows = session.execute(stmt).fetchall()
+        rows = self.get_impl().row_cache.get_rows(RENEWABLE_CLUSTER_TABLE)
 
         renewables_by_areas: dict[str, dict[str, RenewableCluster]] = {}
-        for row in rows:
-            renewable = self._convert_db_row_to_renewable(row)
+        for row, renewable in zip(rows, self._convert_db_rows_to_renewables(rows)):
             renewables_by_areas.setdefault(row.area_id, {})[renewable.id.lower()] = renewable
         return renewables_by_areas
 
     @override
     def get_all_renewables_for_area(self, area_id: str) -> Sequence[RenewableCluster]:
-        study_id = self._study_id
-        session = self._db_session
-        validate_area_exists(session, study_id, area_id)
+        validate_cached_area_exists(self.get_impl(), area_id)
+        rows = self.get_impl().row_cache.find_rows(RENEWABLE_CLUSTER_TABLE, area_id=area_id)
+        return self._convert_db_rows_to_renewables(rows)
 
-        stmt = select(RENEWABLE_CLUSTER_TABLE).where(
-            (RENEWABLE_CLUSTER_TABLE.c.study_id == study_id) & (RENEWABLE_CLUSTER_TABLE.c.area_id == area_id)
-        )
-        rows = session.execute(stmt).fetchall()
-        return [self._convert_db_row_to_renewable(row) for row in rows]
-
-    def _select_renewable_cluster(self, area_id: str, renewable_id: str) -> Select[Any]:
-        study_id = self._study_id
-        return select(RENEWABLE_CLUSTER_TABLE).where(
-            (RENEWABLE_CLUSTER_TABLE.c.study_id == study_id)
-            & (RENEWABLE_CLUSTER_TABLE.c.area_id == area_id)
-            & (RENEWABLE_CLUSTER_TABLE.c.renewable_id == renewable_id)
-        )
+    def _get_renewable_cluster_row(self, area_id: str, renewable_id: str) -> Row[Any] | None:
+        return self.get_impl().row_cache.find_row(RENEWABLE_CLUSTER_TABLE, area_id=area_id, renewable_id=renewable_id)
 
     @override
     def get_renewable(self, area_id: str, renewable_id: str) -> RenewableCluster:
-        session = self._db_session
-        stmt = self._select_renewable_cluster(area_id, renewable_id)
-        row = session.execute(stmt).fetchone()
+        row = self._get_renewable_cluster_row(area_id, renewable_id)
         if not row:
             self._raise_the_right_renewable_exception({area_id: [renewable_id]})
 
@@ -224,9 +217,7 @@ class DatabaseRenewableDao(RenewableDao):
 
     @override
     def renewable_exists(self, area_id: str, renewable_id: str) -> bool:
-        session = self._db_session
-        stmt = self._select_renewable_cluster(area_id, renewable_id)
-        return session.execute(stmt).fetchone() is not None
+        return self._get_renewable_cluster_row(area_id, renewable_id) is not None
 
     @override
     def get_renewable_series(self, area_id: str, renewable_id: str) -> pl.DataFrame:
@@ -109,13 +109,14 @@ class DatabaseReserveDefinitionDao(ReserveDefinitionDao):
             for reserve in reserves:
                 values.append(_convert_model_to_row(self._study_id, area_id, reserve))
         try:
-            upsert_multiple(session=self._db_session, table=_TABLE, values=values)
+            with self.get_impl().savepoint():
+                upsert_multiple(session=self._db_session, table=_TABLE, values=values)
         except IntegrityError as e:
             for area_id in data:
                 if not area_exists(self._db_session, self._study_id, area_id):
                     raise AreaNotFound(area_id) from e
             raise
-        self._db_session.commit()
+        self.get_impl().commit()
 
     @override
     def delete_reserve_definitions(self, area_id: AreaId, reserve_ids: Sequence[ReserveDefinitionId]) -> None:
@@ -141,7 +142,7 @@ class DatabaseReserveDefinitionDao(ReserveDefinitionDao):
             for rid in reserve_ids:
                 if rid not in existing:
                     raise ReserveDefinitionNotFound(area_id, rid)
-        self._db_session.commit()
+        self.get_impl().commit()
 
     @override
     def get_reserve_need(self, area_id: str, reserve_id: str) -> pl.DataFrame:
@@ -180,7 +181,8 @@ class DatabaseReserveDefinitionDao(ReserveDefinitionDao):
                     }
                 )
         try:
-            upsert_multiple(session=self._db_session, table=_NEED_TABLE, values=values)
+            with self.get_impl().savepoint():
+                upsert_multiple(session=self._db_session, table=_NEED_TABLE, values=values)
         except IntegrityError as e:
             for area_id in mapping:
                 if not area_exists(self._db_session, self._study_id, area_id):
@@ -190,4 +192,4 @@ class DatabaseReserveDefinitionDao(ReserveDefinitionDao):
                     if not self.reserve_definition_exists(area_id, reserve_id):
                         raise ReserveDefinitionNotFound(area_id, reserve_id) from e
             raise ValueError(f"Reserve need mapping is invalid for study {self._study_id}") from e
-        self._db_session.commit()
+        self.get_impl().commit()
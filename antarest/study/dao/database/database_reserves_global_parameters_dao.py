@@ -14,7 +14,8 @@
 Database implementation of ReservesGlobalParametersDao using SQLAlchemy Core.
 """
 
-from typing import Any
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import Row, select
 from sqlalchemy.orm import Session
@@ -27,6 +28,9 @@ from antarest.study.dao.database.common import validate_area_exists
 from antarest.study.dao.database.models.area import RESERVES_GLOBAL_PARAMETERS_TABLE
 from antarest.study.dao.database.sql_utils import upsert_multiple
 
+if TYPE_CHECKING:
+    from antarest.study.dao.database.database_study_dao import DatabaseStudyDao
+
 _TABLE = RESERVES_GLOBAL_PARAMETERS_TABLE
 
 
@@ -52,6 +56,10 @@ class DatabaseReservesGlobalParametersDao(ReservesGlobalParametersDao):
     def get_session(self) -> Session:
         return self._db_session
 
+    @abstractmethod
+    def get_impl(self) -> "DatabaseStudyDao":
+        pass
+
     @override
     def get_reserves_global_parameters(self, area_id: str) -> ReservesGlobalParameters:
         study_id = self.get_study_id()
@@ -87,4 +95,4 @@ class DatabaseReservesGlobalParametersDao(ReservesGlobalParametersDao):
             for area_id, params in mapping.items()
         ]
         upsert_multiple(session, _TABLE, values)
-        session.commit()
+        self.get_impl().commit()
@@ -151,7 +151,7 @@ class DatabaseScenarioBuilderDao(ScenarioBuilderDao):
             if rows:
                 session.execute(insert(SCENARIO_STORAGE_CONSTRAINTS_TABLE), rows)
 
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def get_ruleset(self) -> Ruleset:
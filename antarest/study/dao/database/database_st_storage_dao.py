@@ -45,7 +45,11 @@ from antarest.study.dao.common import (
     StStorageId,
     StStorageSeriesMapping,
 )
-from antarest.study.dao.database.common import get_row_representation_as_dict, validate_area_exists
+from antarest.study.dao.database.common import (
+    get_row_representation_as_dict,
+    get_rows_representation_as_dicts,
+    validate_cached_area_exists,
+)
 from antarest.study.dao.database.models.st_storage import (
     COST_INJECTION_TABLE,
     COST_LEVEL_TABLE,
@@ -98,14 +102,22 @@ class DatabaseStStorageDao(STStorageDao):
         return values
 
     def _convert_db_row_to_st_storage(self, row: Row[Any]) -> STStorage:
-        data = get_row_representation_as_dict(row)
-        del data["study_id"]
-        del data["area_id"]
-        data["id"] = data.pop("st_storage_id")
-        storage = STStorage(**data)
+        return self._convert_db_rows_to_st_storages([row])[0]
+
+    def _convert_db_rows_to_st_storages(self, rows: Sequence[Row[Any]]) -> list[STStorage]:
+        return self.get_impl().row_cache.convert_rows(ST_STORAGE_TABLE, rows, self._decode_st_storages)
+
+    def _decode_st_storages(self, rows: Sequence[Row[Any]]) -> list[STStorage]:
         version = self.get_impl().get_version()
-        validate_st_storage_against_version(version, storage)
-        return storage
+        storages = []
+        for data in get_rows_representation_as_dicts(rows):
+            del data["study_id"]
+            del data["area_id"]
+            data["id"] = data.pop("st_storage_id")
+            storage = STStorage(**data)
+            validate_st_storage_against_version(version, storage)
+            storages.append(storage)
+        return storages
 
     def _convert_constraint_to_row(
         self, area_id: str, storage_id: str, constraint: STStorageAdditionalConstraint
@@ -183,53 +195,39 @@ class DatabaseStStorageDao(STStorageDao):
 
         session = self._db_session
         try:
-            upsert_multiple(session, ST_STORAGE_TABLE, values)
+            with self.get_impl().savepoint():
+                upsert_multiple(session, ST_STORAGE_TABLE, values)
         except IntegrityError as e:
             # Means an area does not exist
             invalid_areas = self.get_impl().get_invalid_area_ids(list(data))
             raise AreaNotFound(*invalid_areas) from e
 
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def get_all_st_storages(self) -> dict[str, dict[str, STStorage]]:
-        session, study_id = self._db_session, self._study_id
-
-        stmt = select(ST_STORAGE_TABLE).where(ST_STORAGE_TABLE.c.study_id == study_id)
-        rows = session.execute(stmt).fetchall()
+        rows = self.get_impl().row_cache.get_rows(ST_STORAGE_TABLE)
 
         st_storages_by_areas: dict[str, dict[str, STStorage]] = {}
-        for row in rows:
-            st_storage = self._convert_db_row_to_st_storage(row)
+        for row, st_storage in zip(rows, self._convert_db_rows_to_st_storages(rows)):
             st_storages_by_areas.setdefault(row.area_id, {})[st_storage.id] = st_storage
         return st_storages_by_areas
 
     @override
     def get_all_st_storages_for_area(self, area_id: str) -> Sequence[STStorage]:
-        session, study_id = self._db_session, self._study_id
-
-        stmt = select(ST_STORAGE_TABLE).where(
-            (ST_STORAGE_TABLE.c.study_id == study_id) & (ST_STORAGE_TABLE.c.area_id == area_id)
-        )
-
-        rows = session.execute(stmt).fetchall()
+        rows = self.get_impl().row_cache.find_rows(ST_STORAGE_TABLE, area_id=area_id)
 
         if not rows:
-            validate_area_exists(session, study_id, area_id)
+            validate_cached_area_exists(self.get_impl(), area_id)
 
-        return [self._convert_db_row_to_st_storage(row) for row in rows]
+        return self._convert_db_rows_to_st_storages(rows)
+
+    def _get_st_storage_row(self, area_id: str, storage_id: str) -> Row[Any] | None:
+        return self.get_impl().row_cache.find_row(ST_STORAGE_TABLE, area_id=area_id, st_storage_id=storage_id)
 
     @override
     def get_st_storage(self, area_id: str, storage_id: str) -> STStorage:
-        session, study_id = self._db_session, self._study_id
-
-        stmt = select(ST_STORAGE_TABLE).where(
-            (ST_STORAGE_TABLE.c.study_id == study_id)
-            & (ST_STORAGE_TABLE.c.area_id == area_id)
-            & (ST_STORAGE_TABLE.c.st_storage_id == storage_id)
-        )
-
-        row = session.execute(stmt).fetchone()
+        row = self._get_st_storage_row(area_id, storage_id)
 
         if not row:
             self._raise_the_right_storage_exception({area_id: [storage_id]})
@@ -238,15 +236,7 @@ class DatabaseStStorageDao(STStorageDao):
 
     @override
     def st_storage_exists(self, area_id: str, storage_id: str) -> bool:
-        session, study_id = self._db_session, self._study_id
-
-        stmt = select(ST_STORAGE_TABLE).where(
-            (ST_STORAGE_TABLE.c.study_id == study_id)
-            & (ST_STORAGE_TABLE.c.area_id == area_id)
-            & (ST_STORAGE_TABLE.c.st_storage_id == storage_id)
-        )
-
-        return session.execute(stmt).fetchone() is not None
+        return self._get_st_storage_row(area_id, storage_id) is not None
 
     @override
     def delete_st_storage(self, area_id: str, storage: STStorage) -> None:
@@ -264,7 +254,7 @@ class DatabaseStStorageDao(STStorageDao):
         if result.rowcount == 0:
             self._raise_the_right_storage_exception({area_id: [storage.id]})
 
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def save_st_storage_additional_constraints(
@@ -279,7 +269,8 @@ class DatabaseStStorageDao(STStorageDao):
                     values.append(self._convert_constraint_to_row(area_id, storage_id, constraint))
 
         try:
-            upsert_multiple(session, ST_STORAGE_ADDITIONAL_CONSTRAINT_TABLE, values)
+            with self.get_impl().savepoint():
+                upsert_multiple(session, ST_STORAGE_ADDITIONAL_CONSTRAINT_TABLE, values)
         except IntegrityError as e:
             invalid_data = {
                 area_id: {sts_id: constraint.id for sts_id, constraints in v.items() for constraint in constraints}
@@ -287,7 +278,7 @@ class DatabaseStStorageDao(STStorageDao):
             }
             self._raise_the_right_constraint_exception(invalid_data, e)
 
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def get_all_st_storage_additional_constraints(self) -> STStorageAdditionalConstraintsMap:
@@ -336,7 +327,7 @@ class DatabaseStStorageDao(STStorageDao):
         if result.rowcount == 0:
             self._raise_the_right_storage_exception({area_id: [storage_id]})
 
-        session.commit()
+        self.get_impl().commit()
 
     def _save_st_storage_matrix(self, series: StStorageSeriesMapping, table: Table) -> None:
         study_id = self._study_id
@@ -348,12 +339,13 @@ class DatabaseStStorageDao(STStorageDao):
                 for sts_id, matrix_id in value.items():
                     data = {"study_id": study_id, "area_id": area_id, "st_storage_id": sts_id, "matrix_id": matrix_id}
                     values.append(data)
-            upsert_multiple(session, table, values)
+            with self.get_impl().savepoint():
+                upsert_multiple(session, table, values)
         except IntegrityError as e:
             invalid_data = {area_id: list(st_storage_dict) for area_id, st_storage_dict in series.items()}
             self._raise_the_right_storage_exception(invalid_data, e)
 
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def save_st_storage_pmax_injection(self, series: StStorageSeriesMapping) -> None:
@@ -540,7 +532,8 @@ class DatabaseStStorageDao(STStorageDao):
                     values.append(data)
 
         try:
-            upsert_multiple(session, ST_STORAGE_ADDITIONAL_CONSTRAINT_MATRIX_TABLE, values)
+            with self.get_impl().savepoint():
+                upsert_multiple(session, ST_STORAGE_ADDITIONAL_CONSTRAINT_MATRIX_TABLE, values)
         except IntegrityError as e:
             invalid_data = {
                 area_id: {sts_id: constraint_id for sts_id, constraints in v.items() for constraint_id in constraints}
@@ -548,7 +541,7 @@ class DatabaseStStorageDao(STStorageDao):
             }
             self._raise_the_right_constraint_exception(invalid_data, e)
 
-        session.commit()
+        self.get_impl().commit()
 
     def _get_st_storage_matrix_row(self, area_id: str, storage_id: str, table: Table) -> Row[Any] | None:
         stmt = select(table).where(
@@ -17,18 +17,20 @@ This DAO provides database-backed storage for studies when storage_mode=DATABASE
 Uses multiple inheritance to combine specialized DAOs (like FileStudyTreeDao).
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Self
 
 import polars as pl
 from antares.study.version import StudyVersion
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, SessionTransaction
 from typing_extensions import override
 
 from antarest.core.utils.polars import create_polars_dataframe
 from antarest.matrixstore.service import ISimpleMatrixService
 from antarest.study.business.model.area_properties_model import AreaProperties, sort_filter_options
-from antarest.study.dao.api.study_dao import StudyDao
+from antarest.study.dao.api.study_dao import DaoOperation, StudyDao
 from antarest.study.dao.database.database_area_dao import DatabaseAreaDao
 from antarest.study.dao.database.database_area_properties_dao import DatabaseAreaPropertiesDao
 from antarest.study.dao.database.database_binding_constraint_dao import DatabaseBindingConstraintDao
@@ -47,9 +49,10 @@ from antarest.study.dao.database.database_thermal_dao import DatabaseThermalDao
 from antarest.study.dao.database.database_user_resources import DatabaseUserResourcesDao
 from antarest.study.dao.database.database_xpansion_dao import DatabaseXpansionDao
 from antarest.study.dao.database.models.comments import COMMENTS_TABLE
-from antarest.study.dao.database.sql_utils import upsert_one
+from antarest.study.dao.database.row_cache import StudyRowCache, get_study_row_cache
+from antarest.study.dao.database.sql_utils import begin_nested, upsert_one
 from antarest.study.dtos import StudyDataSynthesis
-from antarest.study.model import Study, StudyMetadataUpdate
+from antarest.study.model import StudyMetadataUpdate
 from antarest.study.storage.rawstudy.model.filesystem.config.model import AreaConfig, EnrModelling, LinkConfig
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
 from antarest.study.storage.rawstudy.model.filesystem.matrix.input_series_matrix import MatrixSupplier
@@ -60,6 +63,29 @@ if TYPE_CHECKING:
     from antarest.study.storage.variantstudy.business.matrix_constants_generator import GeneratorMatrixConstants
 
 
+class _DatabaseOperation(DaoOperation):
+    def __init__(self, transaction: SessionTransaction) -> None:
+        self._transaction = transaction
+        self._discarded = False
+
+    def _check_active(self) -> None:
+        if not self._transaction.is_active:
+            # The SAVEPOINT was ended by a commit or a rollback of the whole session
+            raise RuntimeError("The operation is not isolated anymore: its writes cannot be discarded")
+
+    @override
+    def discard(self) -> None:
+        if not self._discarded:
+            self._check_active()
+            self._transaction.rollback()
+            self._discarded = True
+
+    def release(self) -> None:
+        if not self._discarded:
+            self._check_active()
+            self._transaction.commit()
+
+
 class DatabaseStudyDao(
     StudyDao,
     DatabaseAreaDao,
@@ -119,6 +145,9 @@ class DatabaseStudyDao(
         DatabaseReserveDefinitionDao.__init__(self, study_id, db_session)
         self._matrix_service = matrix_service
         self._generator_matrix_constants = generator_matrix_constants
+        self._row_cache = get_study_row_cache(db_session, study_id)
+        self._unit_of_work_depth = 0
+        self._operation: _DatabaseOperation | None = None
 
     @override
     @property
@@ -130,6 +159,13 @@ class DatabaseStudyDao(
     def generator_matrix_constants(self) -> "GeneratorMatrixConstants":
         return self._generator_matrix_constants
 
+    @property
+    def row_cache(self) -> StudyRowCache:
+        """
+        Read-through cache of the rows of the study, shared by the DAOs of the study using the same session.
+        """
+        return self._row_cache
+
     # Implementation of abstract methods required by StudyDao
     @override
     def get_study_id(self) -> str:
@@ -195,14 +231,61 @@ class DatabaseStudyDao(
         Returns:
             The study version.
         """
-        stmt = select(Study.version).where(Study.id == self._study_id)
-        version_str = self._db_session.execute(stmt).scalar_one()
-        return StudyVersion.parse(version_str)
+        return self._row_cache.get_version()
 
     @override
     def get_impl(self) -> Self:
         return self
 
+    def commit(self) -> None:
+        """
+        Commits the writes of the DAO, unless they are deferred by a unit of work.
+        """
+        if self._unit_of_work_depth:
+            self._db_session.flush()
+        else:
+            self._db_session.commit()
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """
+        Groups the writes of a DAO call in a SAVEPOINT: if the call fails, only its own writes are rolled back,
+        and the session remains usable, inside a unit of work as well as outside.
+        """
+        with begin_nested(self._db_session):
+            yield
+
+    @override
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        self._unit_of_work_depth += 1
+        try:
+            yield
+        finally:
+            self._unit_of_work_depth -= 1
+            if not self._unit_of_work_depth:
+                self._db_session.commit()
+
+    @override
+    @contextmanager
+    def operation(self) -> Iterator[DaoOperation]:
+        if not self._unit_of_work_depth or self._operation is not None:
+            # Outside a unit of work, the writes are already committed. Nested operations are part of the outer one.
+            yield DaoOperation()
+            return
+        # The writes of each operation are done in a SAVEPOINT, released if the operation succeeds
+        operation = _DatabaseOperation(begin_nested(self._db_session))
+        self._operation = operation
+        try:
+            yield operation
+        except BaseException:
+            operation.discard()
+            raise
+        else:
+            operation.release()
+        finally:
+            self._operation = None
+
     @override
     def get_comments(self) -> str:
         stmt = select(COMMENTS_TABLE.c.comments).where(COMMENTS_TABLE.c.study_id == self._study_id)
@@ -212,7 +295,7 @@ class DatabaseStudyDao(
     @override
     def save_comments(self, comments: str) -> None:
         upsert_one(self._db_session, COMMENTS_TABLE, {"study_id": self._study_id, "comments": comments})
-        self._db_session.commit()
+        self.commit()
 
     @override
     def update_antares_file(self, metadata: StudyMetadataUpdate) -> None:
@@ -115,6 +115,10 @@ class DatabaseStudyDaoFactory(StudyFactoryDao):
             return db.session
         return self._session
 
+    def with_session(self, session: Session) -> "DatabaseStudyDaoFactory":
+        """Returns a factory creating DAOs bound to the given session, for instance on another database."""
+        return DatabaseStudyDaoFactory(self._matrix_service, self._generator_matrix_constants, session=session)
+
     def _initialize_study_data_table(self, study_id: str) -> None:
         """
         Initialize the study data table as every DB DAO table is linked to it via foreign keys.
@@ -94,7 +94,7 @@ class DatabaseStudySettingsDao(
         values = dict(study_id=self.get_study_id(), **config.model_dump())
         session = self.get_session()
         upsert_one(session, GENERAL_CONFIG_TABLE, values)
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def get_general_config(self) -> GeneralConfig:
@@ -119,7 +119,7 @@ class DatabaseStudySettingsDao(
 
         session = self.get_session()
         upsert_one(session, OPTIMIZATION_PREFERENCES_TABLE, values)
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def get_optimization_preferences(self) -> OptimizationPreferences:
@@ -148,7 +148,7 @@ class DatabaseStudySettingsDao(
         values = dict(study_id=self.get_study_id(), **parameters.model_dump())
         session = self.get_session()
         upsert_one(session, ADVANCED_PARAMETERS_TABLE, values)
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def get_advanced_parameters(self) -> AdvancedParameters:
@@ -176,14 +176,14 @@ class DatabaseStudySettingsDao(
         values = dict(study_id=self.get_study_id(), hydro_pmax=parameters.hydro_pmax)
         session = self.get_session()
         upsert_one(session, COMPATIBILITY_PARAMETERS_TABLE, values)
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def save_adequacy_patch_parameters(self, parameters: AdequacyPatchParameters) -> None:
         values = dict(study_id=self.get_study_id(), **parameters.model_dump())
         session = self.get_session()
         upsert_one(session, ADEQUACY_PATCH_PARAMETERS_TABLE, values)
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def get_adequacy_patch_parameters(self) -> AdequacyPatchParameters:
@@ -202,7 +202,7 @@ class DatabaseStudySettingsDao(
         values = dict(study_id=self.get_study_id(), thermal_number=config.thermal.number)
         session = self.get_session()
         upsert_one(session, TIMESERIES_CONFIG_TABLE, values)
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def get_timeseries_config(self) -> TimeSeriesConfiguration:
@@ -228,7 +228,7 @@ class DatabaseStudySettingsDao(
         values = dict(study_id=self.get_study_id(), years=to_json_string(years))
         session = self.get_session()
         upsert_one(session, PLAYLIST_TABLE, values)
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def get_playlist_config(self) -> Playlist:
@@ -61,9 +61,10 @@ class DatabaseThematicTrimmingDao(ThematicTrimmingDao):
         values = {"study_id": study_id, "thematic_trimming": trimming.model_dump(exclude_none=True)}
 
         try:
-            upsert_one(session, THEMATIC_TRIMMING_TABLE, values)
+            with self.get_impl().savepoint():
+                upsert_one(session, THEMATIC_TRIMMING_TABLE, values)
         except IntegrityError as e:
             # Happens if the study does not exist -> ForeignKey constraint fails
             raise StudyNotFoundError(study_id) from e
 
-        session.commit()
+        self.get_impl().commit()
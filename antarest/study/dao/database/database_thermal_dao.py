@@ -19,7 +19,7 @@ from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, NoReturn
 
 import polars as pl
-from sqlalchemy import CursorResult, Row, Select, Table, delete, select
+from sqlalchemy import CursorResult, Enum, Row, String, Table, delete, select, type_coerce
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing_extensions import override
@@ -28,11 +28,13 @@ from antarest.core.exceptions import AreaNotFound, ThermalClusterNotFound, Therm
 from antarest.study.business.model.thermal_cluster_model import (
     ThermalCluster,
     check_thermal_cluster_complete,
+    get_thermal_cluster_frame_schema,
     validate_thermal_cluster_against_version,
+    validate_thermal_cluster_frame_against_version,
 )
 from antarest.study.dao.api.thermal_dao import ThermalDao
 from antarest.study.dao.common import AreaId, SeriesId, ThermalId, ThermalSeriesMapping
-from antarest.study.dao.database.common import get_row_representation_as_dict, validate_area_exists
+from antarest.study.dao.database.common import get_rows_representation_as_dicts, validate_cached_area_exists
 from antarest.study.dao.database.models.thermal import (
     THERMAL_CLUSTER_TABLE,
     THERMAL_CO2_COST_TABLE,
@@ -76,14 +78,22 @@ class DatabaseThermalDao(ThermalDao):
         pass
 
     def _convert_db_row_to_thermal(self, row: Any) -> ThermalCluster:
-        data = get_row_representation_as_dict(row)
-        del data["study_id"]
-        del data["area_id"]
-        data["id"] = data.pop("thermal_id")
-        cluster = ThermalCluster(**data)
+        return self._convert_db_rows_to_thermals([row])[0]
+
+    def _convert_db_rows_to_thermals(self, rows: Sequence[Row[Any]]) -> list[ThermalCluster]:
+        return self.get_impl().row_cache.convert_rows(THERMAL_CLUSTER_TABLE, rows, self._decode_thermals)
+
+    def _decode_thermals(self, rows: Sequence[Row[Any]]) -> list[ThermalCluster]:
         version = self.get_impl().get_version()
-        validate_thermal_cluster_against_version(version, cluster)
-        return cluster
+        clusters = []
+        for data in get_rows_representation_as_dicts(rows):
+            del data["study_id"]
+            del data["area_id"]
+            data["id"] = data.pop("thermal_id")
+            cluster = ThermalCluster(**data)
+            validate_thermal_cluster_against_version(version, cluster)
+            clusters.append(cluster)
+        return clusters
 
     def _convert_thermal_cluster_to_row(self, area_id: str, cluster: ThermalCluster) -> dict[str, Any]:
         values = dict(study_id=self._study_id, area_id=area_id, **cluster.model_dump())
@@ -91,12 +101,7 @@ class DatabaseThermalDao(ThermalDao):
         return values
 
     def _get_thermal_matrix_row(self, area_id: str, thermal_id: str, table: Table) -> Row[Any] | None:
-        study_id = self._study_id
-        session = self._db_session
-        stmt = select(table).where(
-            (table.c.study_id == study_id) & (table.c.area_id == area_id) & (table.c.thermal_id == thermal_id)
-        )
-        return session.execute(stmt).fetchone()
+        return self.get_impl().row_cache.find_row(table, area_id=area_id, thermal_id=thermal_id)
 
     def _get_thermal_matrix(self, area_id: str, thermal_id: str, table: Table) -> SeriesId:
         row = self._get_thermal_matrix_row(area_id, thermal_id, table)
@@ -114,12 +119,13 @@ class DatabaseThermalDao(ThermalDao):
                 for thermal_id, matrix_id in value.items():
                     data = {"study_id": study_id, "area_id": area_id, "thermal_id": thermal_id, "matrix_id": matrix_id}
                     values.append(data)
-            upsert_multiple(session, table, values)
+            with self.get_impl().savepoint():
+                upsert_multiple(session, table, values)
         except IntegrityError as e:
             invalid_data = {area_id: list(thermal_dict) for area_id, thermal_dict in series.items()}
             self._raise_the_right_exception(invalid_data, e)
 
-        session.commit()
+        self.get_impl().commit()
 
     def _raise_the_right_exception(
         self, data: dict[AreaId, list[ThermalId]], exc: IntegrityError | None = None
@@ -162,12 +168,13 @@ class DatabaseThermalDao(ThermalDao):
                 values.append(self._convert_thermal_cluster_to_row(area_id, thermal))
 
         try:
-            upsert_multiple(session=session, table=THERMAL_CLUSTER_TABLE, values=values)
+            with self.get_impl().savepoint():
+                upsert_multiple(session=session, table=THERMAL_CLUSTER_TABLE, values=values)
         except IntegrityError as e:
             invalid_data = {area_id: [thermal.id.lower() for thermal in thermals] for area_id, thermals in data.items()}
             self._raise_the_right_exception(invalid_data, e)
 
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def save_thermal_prepro(self, series: ThermalSeriesMapping) -> None:
@@ -206,51 +213,46 @@ class DatabaseThermalDao(ThermalDao):
             # Means the DELETE had no effect so the thermal did not exist
             self._raise_the_right_exception({area_id: [thermal_id]})
 
-        session.commit()
+        self.get_impl().commit()
 
     @override
     def get_all_thermals(self) -> dict[str, dict[str, ThermalCluster]]:
-        study_id = self._study_id
-        session = self._db_session
-
-        stmt = select(THERMAL_CLUSTER_TABLE).where(THERMAL_CLUSTER_TABLE.c.study_id == study_id)
-        rows = session.execute(stmt).fetchall()
+        rows = self.get_impl().row_cache.get_rows(THERMAL_CLUSTER_TABLE)
 
         thermals_by_areas: dict[str, dict[str, ThermalCluster]] = {}
-        for row in rows:
-            thermal = self._convert_db_row_to_thermal(row)
+        for row, thermal in zip(rows, self._convert_db_rows_to_thermals(rows)):
             thermals_by_areas.setdefault(row.area_id, {})[thermal.id.lower()] = thermal
         return thermals_by_areas
 
     @override
-    def get_all_thermals_for_area(self, area_id: str) -> Sequence[ThermalCluster]:
-        study_id = self._study_id
-        session = self._db_session
+    def get_thermals_frame(self, columns: Sequence[str] | None = None) -> pl.DataFrame:
+        schema = get_thermal_cluster_frame_schema(columns)
+        selected = []
+        for name in schema:
+            column = THERMAL_CLUSTER_TABLE.c["thermal_id" if name == "id" else name]
+            # Enums are read as their values
+            selected.append(type_coerce(column, String) if isinstance(column.type, Enum) else column)
+        stmt = select(*selected).where(THERMAL_CLUSTER_TABLE.c.study_id == self._study_id)
+        rows = self._db_session.execute(stmt).fetchall()
+        frame = pl.DataFrame(rows, schema=schema, orient="row")
+        return validate_thermal_cluster_frame_against_version(self.get_impl().get_version(), frame)
 
-        stmt = select(THERMAL_CLUSTER_TABLE).where(
-            (THERMAL_CLUSTER_TABLE.c.study_id == study_id) & (THERMAL_CLUSTER_TABLE.c.area_id == area_id)
-        )
-        rows = session.execute(stmt).fetchall()
+    @override
+    def get_all_thermals_for_area(self, area_id: str) -> Sequence[ThermalCluster]:
+        rows = self.get_impl().row_cache.find_rows(THERMAL_CLUSTER_TABLE, area_id=area_id)
 
         if not rows:
             # Ensures the area exists
-            validate_area_exists(session, study_id, area_id)
+            validate_cached_area_exists(self.get_impl(), area_id)
 
-        return [self._convert_db_row_to_thermal(row) for row in rows]
+        return self._convert_db_rows_to_thermals(rows)
 
-    def _select_thermal_cluster(self, area_id: str, thermal_id: str) -> Select[Any]:
-        study_id = self._study_id
-        return select(THERMAL_CLUSTER_TABLE).where(
-            (THERMAL_CLUSTER_TABLE.c.study_id == study_id)
-            & (THERMAL_CLUSTER_TABLE.c.area_id == area_id)
-            & (THERMAL_CLUSTER_TABLE.c.thermal_id == thermal_id)
-        )
+    def _get_thermal_cluster_row(self, area_id: str, thermal_id: str) -> Row[Any] | None:
+        return self.get_impl().row_cache.find_row(THERMAL_CLUSTER_TABLE, area_id=area_id, thermal_id=thermal_id)
 
     @override
     def get_thermal(self, area_id: str, thermal_id: str) -> ThermalCluster:
-        session = self._db_session
-        stmt = self._select_thermal_cluster(area_id, thermal_id)
-        row = session.execute(stmt).fetchone()
+        row = self._get_thermal_cluster_row(area_id, thermal_id)
         if not row:
             self._raise_the_right_exception({area_id: [thermal_id]})
 
@@ -258,9 +260,7 @@ class DatabaseThermalDao(ThermalDao):
 
     @override
     def thermal_exists(self, area_id: str, thermal_id: str) -> bool:
-        session = self._db_session
-        stmt = self._select_thermal_cluster(area_id, thermal_id)
-        return session.execute(stmt).fetchone() is not None
+        return self._get_thermal_cluster_row(area_id, thermal_id) is not None
 
     @override
     def get_thermal_prepro(self, area_id: str, thermal_id: str) -> pl.DataFrame:
@@ -288,10 +288,7 @@ class DatabaseThermalDao(ThermalDao):
         return self.get_impl().get_matrix(matrix_id, default_empty_supplier=default_scenario_hourly)
 
     def _get_all_thermal_matrix(self, table: Table) -> ThermalSeriesMapping:
-        study_id = self._study_id
-        session = self._db_session
-        stmt = select(table).where(table.c.study_id == study_id)
-        rows = session.execute(stmt).fetchall()
+        rows = self.get_impl().row_cache.get_rows(table)
         result: ThermalSeriesMapping = {}
         for row in rows:
             result.setdefault(row.area_id, {})[row.thermal_id] = row.matrix_id
@@ -14,7 +14,9 @@
 Database implementation of UserResourcesDao.
 """
 
+from abc import abstractmethod
 from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
 
 from sqlalchemy import CursorResult, delete, select
 from sqlalchemy.orm import Session
@@ -26,6 +28,9 @@ from antarest.study.dao.api.user_resources_dao import UserResourcesDao
 from antarest.study.dao.database.models.user_resources import USER_RESOURCES_TABLE
 from antarest.study.dao.database.sql_utils import upsert_multiple
 
+if TYPE_CHECKING:
+    from antarest.study.dao.database.database_study_dao import DatabaseStudyDao
+
 
 class DatabaseUserResourcesDao(UserResourcesDao):
     """Database implementation of UserResourcesDao"""
@@ -41,6 +46,10 @@ class DatabaseUserResourcesDao(UserResourcesDao):
         self._study_id = study_id
         self._db_session = db_session
 
+    @abstractmethod
+    def get_impl(self) -> "DatabaseStudyDao":
+        pass
+
     @override
     def save_user_resources(self, resource_data: list[UserResourceDataCreation]) -> None:
         values = []
@@ -55,7 +64,7 @@ class DatabaseUserResourcesDao(UserResourcesDao):
             )
         upsert_multiple(self._db_session, USER_RESOURCES_TABLE, values)
 
-        self._db_session.commit()
+        self.get_impl().commit()
 
     @override
     def delete_user_resource(self, resource_path: PurePosixPath) -> None:
@@ -69,7 +78,7 @@ class DatabaseUserResourcesDao(UserResourcesDao):
         if result.rowcount == 0:
             raise UserResourcesNotFound(str(resource_path))
 
-        self._db_session.commit()
+        self.get_impl().commit()
 
     @override
     def get_all_user_resources(self) -> list[UserResourceDataCreation]:
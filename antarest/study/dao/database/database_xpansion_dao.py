@@ -121,7 +121,7 @@ class DatabaseXpansionDao(XpansionDao):
         if result.rowcount == 0:
             raise XpansionConfigurationDoesNotExist(self._study_id)
         # Cascade on xpansion_candidate and xpansion_adequacy_criterion handles the rest.
-        self._db_session.commit()
+        self.get_impl().commit()
 
     # ------------------------------------------------------------------
     # XpansionDao — settings
@@ -161,23 +161,23 @@ class DatabaseXpansionDao(XpansionDao):
             "sensitivity_epsilon": sensitivity["epsilon"],
             "sensitivity_capex": sensitivity["capex"],
         }
-        upsert_one(self._db_session, XPANSION_SETTINGS_TABLE, values)
-        # Replace projection rows: delete existing, then insert the new list.
-        self._db_session.execute(
-            delete(XPANSION_SENSITIVITY_PROJECTION_TABLE).where(
-                XPANSION_SENSITIVITY_PROJECTION_TABLE.c.study_id == self._study_id
-            )
-        )
-        if sensitivity["projection"]:
-            try:
+        try:
+            with self.get_impl().savepoint():
+                upsert_one(self._db_session, XPANSION_SETTINGS_TABLE, values)
+                # Replace projection rows: delete existing, then insert the new list.
                 self._db_session.execute(
-                    insert(XPANSION_SENSITIVITY_PROJECTION_TABLE),
-                    [{"study_id": self._study_id, "candidate_name": name} for name in sensitivity["projection"]],
+                    delete(XPANSION_SENSITIVITY_PROJECTION_TABLE).where(
+                        XPANSION_SENSITIVITY_PROJECTION_TABLE.c.study_id == self._study_id
+                    )
                 )
-            except IntegrityError:
-                self._db_session.rollback()
-                raise CandidateNotFoundError("One or more candidates in the projection do not exist")
-        self._db_session.commit()
+                if sensitivity["projection"]:
+                    self._db_session.execute(
+                        insert(XPANSION_SENSITIVITY_PROJECTION_TABLE),
+                        [{"study_id": self._study_id, "candidate_name": name} for name in sensitivity["projection"]],
+                    )
+        except IntegrityError:
+            raise CandidateNotFoundError("One or more candidates in the projection do not exist")
+        self.get_impl().commit()
 
     @override
     def checks_xpansion_settings_are_correct(self, settings: XpansionSettingsUpdate) -> None:
@@ -230,27 +230,27 @@ class DatabaseXpansionDao(XpansionDao):
         Note : projections are updated because ON UPDATE CASCADE is used.
         """
         if old_id and old_id != candidate.name:
-            self._db_session.execute(
-                delete(XPANSION_CANDIDATE_TABLE).where(
-                    (XPANSION_CANDIDATE_TABLE.c.study_id == self._study_id)
-                    & (XPANSION_CANDIDATE_TABLE.c.name == candidate.name)
+            with self.get_impl().savepoint():
+                self._db_session.execute(
+                    delete(XPANSION_CANDIDATE_TABLE).where(
+                        (XPANSION_CANDIDATE_TABLE.c.study_id == self._study_id)
+                        & (XPANSION_CANDIDATE_TABLE.c.name == candidate.name)
+                    )
                 )
-            )
-            result = self._db_session.execute(
-                update(XPANSION_CANDIDATE_TABLE)
-                .where(
-                    (XPANSION_CANDIDATE_TABLE.c.study_id == self._study_id)
-                    & (XPANSION_CANDIDATE_TABLE.c.name == old_id)
+                result = self._db_session.execute(
+                    update(XPANSION_CANDIDATE_TABLE)
+                    .where(
+                        (XPANSION_CANDIDATE_TABLE.c.study_id == self._study_id)
+                        & (XPANSION_CANDIDATE_TABLE.c.name == old_id)
+                    )
+                    .values(self._candidate_to_row(candidate))
                 )
-                .values(self._candidate_to_row(candidate))
-            )
-            assert isinstance(result, CursorResult)
-            if result.rowcount == 0:
-                self._db_session.rollback()
-                raise CandidateNotFoundError(f"The candidate '{old_id}' does not exist")
+                assert isinstance(result, CursorResult)
+                if result.rowcount == 0:
+                    raise CandidateNotFoundError(f"The candidate '{old_id}' does not exist")
         else:
             upsert_one(self._db_session, XPANSION_CANDIDATE_TABLE, self._candidate_to_row(candidate))
-        self._db_session.commit()
+        self.get_impl().commit()
 
     @override
     def save_xpansion_candidates(self, candidates: list[XpansionCandidate]) -> None:
@@ -268,7 +268,7 @@ class DatabaseXpansionDao(XpansionDao):
         assert isinstance(result, CursorResult)
         if result.rowcount == 0:
             raise CandidateNotFoundError(f"The candidate '{candidate_name}' does not exist")
-        self._db_session.commit()
+        self.get_impl().commit()
 
     @override
     def checks_xpansion_candidate_coherence(self, candidate: XpansionCandidate) -> None:
@@ -368,7 +368,7 @@ class DatabaseXpansionDao(XpansionDao):
                 insert(XPANSION_ADEQUACY_PATTERN_TABLE),
                 [{"study_id": self._study_id, "area": p.area, "criterion": p.criterion} for p in criterion.patterns],
             )
-        self._db_session.commit()
+        self.get_impl().commit()
 
     # ------------------------------------------------------------------
     # XpansionDao — resources
@@ -484,7 +484,7 @@ class DatabaseXpansionDao(XpansionDao):
         assert isinstance(result, CursorResult)
         if result.rowcount == 0:
             raise XpansionFileNotFoundError(f"Resource '{filename}' not found")
-        self._db_session.commit()
+        self.get_impl().commit()
 
     @override
     def save_xpansion_constraint(self, data: XpansionConstraintsMapping) -> None:
@@ -493,7 +493,7 @@ class DatabaseXpansionDao(XpansionDao):
             values.append({"study_id": self._study_id, "filename": filename, "content": content})
 
         upsert_multiple(self._db_session, XPANSION_CONSTRAINT_TABLE, values)
-        self._db_session.commit()
+        self.get_impl().commit()
 
     @override
     def save_xpansion_capacity(self, data: XpansionCapacitiesMapping) -> None:
@@ -502,7 +502,7 @@ class DatabaseXpansionDao(XpansionDao):
             values.append({"study_id": self._study_id, "filename": filename, "matrix_id": series_id})
 
         upsert_multiple(self._db_session, XPANSION_CAPACITY_TABLE, values)
-        self._db_session.commit()
+        self.get_impl().commit()
 
     @override
     def save_xpansion_weight(self, data: XpansionWeightsMapping) -> None:
@@ -511,4 +511,4 @@ class DatabaseXpansionDao(XpansionDao):
             values.append({"study_id": self._study_id, "filename": filename, "matrix_id": series_id})
 
         upsert_multiple(self._db_session, XPANSION_WEIGHT_TABLE, values)
-        self._db_session.commit()
+        self.get_impl().commit()
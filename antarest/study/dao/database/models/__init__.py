@@ -20,3 +20,21 @@ STUDY_DATA_TABLE = Table(
     metadata,
     Column("study_id", String(36), ForeignKey("study.id", ondelete="CASCADE"), nullable=False, primary_key=True),
 )
+
+
+def get_study_data_tables() -> list[Table]:
+    """
+    Returns the tables containing the data of DB-stored studies, ordered by dependency.
+
+    These are the `study_data` table and all the tables depending on it through foreign keys:
+    all of them have a `study_id` column, which is part of their primary key.
+    Only the tables whose model module has been imported are returned.
+    """
+    tables = [STUDY_DATA_TABLE]
+    table_names = {STUDY_DATA_TABLE.name}
+    # `sorted_tables` lists the referenced tables before the tables referencing them
+    for table in STUDY_DATA_TABLE.metadata.sorted_tables:
+        if table.name not in table_names and any(fk.column.table.name in table_names for fk in table.foreign_keys):
+            tables.append(table)
+            table_names.add(table.name)
+    return tables
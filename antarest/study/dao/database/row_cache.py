@@ -0,0 +1,215 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Read-through cache of the rows of the study data tables.
+
+The commands of a variant look up the same entities many times during a generation, which would issue
+one `SELECT` per lookup. Instead, the rows found by a lookup are kept, indexed by the looked up columns.
+The rows of a whole table are only loaded by the bulk reads, and then serve all the lookups.
+
+The rows can also be converted to models through the cache: the converted models are kept along with
+the rows, since their validation is the main cost of the reads of large tables.
+
+The cache of a study is shared by all the DAOs of the study using the same session, see `get_study_row_cache`.
+The cache of a table is invalidated by any write to this table through this session. Since deletions
+cascade to the dependent tables, deletions and rollbacks invalidate the cache of all tables. The writes
+of the other sessions are not seen: the cache lives as long as the session, i.e. one request or task.
+"""
+
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence, TypeVar
+
+from antares.study.version import StudyVersion
+from pydantic import BaseModel
+from sqlalchemy import Row, Table, event, select
+from sqlalchemy.orm import Session, SessionTransaction, UOWTransaction
+from sqlalchemy.orm.session import ORMExecuteState
+
+from antarest.study.model import Study
+
+# Key of the write counters in `Session.info`
+_WRITE_COUNTERS_KEY = "study_data_write_counters"
+
+# Key of the caches of the studies in `Session.info`
+_STUDY_CACHES_KEY = "study_row_caches"
+
+# Counter of the writes invalidating all the tables
+_ALL_TABLES = ""
+
+_Key = tuple[Any, ...]
+
+_M = TypeVar("_M", bound=BaseModel)
+
+
+def _get_write_counters(session: Session) -> dict[str, int]:
+    counters: dict[str, int] = session.info.setdefault(_WRITE_COUNTERS_KEY, {})
+    return counters
+
+
+def _count_write(session: Session, table_name: str) -> None:
+    counters = _get_write_counters(session)
+    counters[table_name] = counters.get(table_name, 0) + 1
+
+
+def _on_execute(state: ORMExecuteState) -> None:
+    if state.is_delete:
+        _count_write(state.session, _ALL_TABLES)
+    elif state.is_insert or state.is_update:
+        table = getattr(state.statement, "table", None)
+        _count_write(state.session, table.name if isinstance(table, Table) else _ALL_TABLES)
+
+
+def _on_flush(session: Session, flush_context: UOWTransaction) -> None:
+    # The version of the studies is updated through the ORM
+    if any(isinstance(obj, Study) for obj in itertools.chain(session.new, session.dirty, session.deleted)):
+        _count_write(session, _ALL_TABLES)
+
+
+def _on_rollback(session: Session, previous_transaction: SessionTransaction) -> None:
+    _count_write(session, _ALL_TABLES)
+
+
+def _track_writes(session: Session) -> None:
+    """
+    Counts the writes made through the given session, once per session.
+    The listeners are attached to the session itself, so that the other sessions are not slowed down.
+    """
+    if _WRITE_COUNTERS_KEY in session.info:
+        return
+    session.info[_WRITE_COUNTERS_KEY] = {}
+    event.listen(session, "do_orm_execute", _on_execute)
+    event.listen(session, "after_flush", _on_flush)
+    event.listen(session, "after_soft_rollback", _on_rollback)
+
+
+@dataclass
+class _TableEntry:
+    generation: tuple[int, int]
+    rows: Sequence[Row[Any]] | None = None
+    indexes: dict[tuple[str, ...], dict[_Key, list[Row[Any]]]] = field(default_factory=dict)
+    models: dict[Row[Any], Any] = field(default_factory=dict)
+
+
+class StudyRowCache:
+    """
+    Read-through cache of the rows of the study data tables, for one study.
+
+    Args:
+        study_id: The ID of the study.
+        session: The database session, whose writes invalidate the cache.
+    """
+
+    def __init__(self, study_id: str, session: Session) -> None:
+        self._study_id = study_id
+        self._session = session
+        self._entries: dict[str, _TableEntry] = {}
+        self._version: tuple[int, StudyVersion] | None = None
+        _track_writes(session)
+
+    def _get_generation(self, table_name: str) -> tuple[int, int]:
+        counters = _get_write_counters(self._session)
+        return counters.get(_ALL_TABLES, 0), counters.get(table_name, 0)
+
+    def _get_entry(self, table: Table) -> _TableEntry:
+        generation = self._get_generation(table.name)
+        entry = self._entries.get(table.name)
+        if entry is None or entry.generation != generation:
+            previous = entry
+            entry = _TableEntry(generation)
+            if previous is not None and previous.models and previous.generation[0] == generation[0]:
+                # Only this table was written: the models of the unchanged rows are kept.
+                # The conversion may depend on the other tables, like the study version.
+                entry.models = previous.models
+            self._entries[table.name] = entry
+        return entry
+
+    def get_rows(self, table: Table) -> Sequence[Row[Any]]:
+        """
+        Returns all the rows of a table for the study.
+        """
+        entry = self._get_entry(table)
+        if entry.rows is None:
+            stmt = select(table).where(table.c.study_id == self._study_id)
+            entry.rows = self._session.execute(stmt).fetchall()
+            entry.indexes.clear()
+            entry.models = {row: entry.models[row] for row in entry.rows if row in entry.models}
+        return entry.rows
+
+    def find_rows(self, table: Table, **criteria: Any) -> Sequence[Row[Any]]:
+        """
+        Returns the rows of a table for the study, whose columns are equal to the given values.
+
+        Only the matching rows are selected, unless all the rows of the table are already loaded.
+        """
+        entry = self._get_entry(table)
+        columns = tuple(sorted(criteria))
+        key = tuple(criteria[column] for column in columns)
+        index = entry.indexes.setdefault(columns, {})
+        if entry.rows is not None and not index:
+            for row in entry.rows:
+                index.setdefault(tuple(getattr(row, column) for column in columns), []).append(row)
+        if entry.rows is None and key not in index:
+            stmt = select(table).where(table.c.study_id == self._study_id)
+            for column, value in zip(columns, key):
+                stmt = stmt.where(table.c[column] == value)
+            index[key] = list(self._session.execute(stmt).fetchall())
+        return index.get(key, [])
+
+    def find_row(self, table: Table, **criteria: Any) -> Row[Any] | None:
+        """
+        Returns the first row of a table for the study, whose columns are equal to the given values.
+        """
+        rows = self.find_rows(table, **criteria)
+        return rows[0] if rows else None
+
+    def convert_rows(
+        self,
+        table: Table,
+        rows: Sequence[Row[Any]],
+        convert: Callable[[Sequence[Row[Any]]], Sequence[_M]],
+    ) -> list[_M]:
+        """
+        Converts rows of a table for the study to models, with the given function.
+
+        The models are cached along with the rows, and only the rows not converted yet are given to the
+        function. Copies of the models are returned, so that the callers can modify them.
+        """
+        models = self._get_entry(table).models
+        if missing := [row for row in rows if row not in models]:
+            models.update(zip(missing, convert(missing)))
+        return [models[row].model_copy() for row in rows]
+
+    def get_version(self) -> StudyVersion:
+        """
+        Returns the version of the study.
+        """
+        generation = self._get_generation(_ALL_TABLES)[0]
+        if self._version is None or self._version[0] != generation:
+            stmt = select(Study.version).where(Study.id == self._study_id)
+            version = StudyVersion.parse(self._session.execute(stmt).scalar_one())
+            self._version = (generation, version)
+        return self._version[1]
+
+
+def get_study_row_cache(session: Session, study_id: str) -> StudyRowCache:
+    """
+    Returns the row cache of a study for the given session, created on first use.
+
+    The DAOs of a study are created on demand by the services, so the cache is kept in the session
+    rather than in the DAO, for all the DAOs of the study to share it.
+    """
+    caches: dict[str, StudyRowCache] = session.info.setdefault(_STUDY_CACHES_KEY, {})
+    cache = caches.get(study_id)
+    if cache is None:
+        cache = caches[study_id] = StudyRowCache(study_id, session)
+    return cache
@@ -22,7 +22,7 @@ from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.dialects.postgresql.dml import Insert as PgInsert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.dialects.sqlite.dml import Insert as SqliteInsert
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, SessionTransaction
 
 
 def enum_col(enum_class: Type[PyEnum], **kwargs: Any) -> Enum:
@@ -36,6 +36,35 @@ def enum_col(enum_class: Type[PyEnum], **kwargs: Any) -> Enum:
     return Enum(enum_class, values_callable=lambda x: [e.value for e in x], **kwargs)
 
 
+def begin_nested(session: Session) -> SessionTransaction:
+    """
+    Begins a SAVEPOINT, inside the transaction of the session.
+
+    The SQLite driver only begins the database transaction before a data modification statement:
+    a SAVEPOINT begun before would be the outermost one, and its release would commit the writes.
+    In this case, the database transaction is explicitly begun first.
+    """
+    if session.get_bind().dialect.name == "sqlite":
+        dbapi_connection = session.connection().connection.dbapi_connection
+        if dbapi_connection is not None and not dbapi_connection.in_transaction:
+            dbapi_connection.execute("BEGIN")
+    return session.begin_nested()
+
+
+def begin_write(session: Session) -> None:
+    """
+    Ensures that the transaction of the session holds the write lock of a SQLite database.
+
+    SQLite ignores `SELECT ... FOR UPDATE`: a single write lock covers the whole database,
+    and the driver only takes it at the first data modification statement. Taking it first
+    serializes the transactions reading data they are about to update, as row locks do on PostgreSQL.
+    """
+    if session.get_bind().dialect.name == "sqlite":
+        dbapi_connection = session.connection().connection.dbapi_connection
+        if dbapi_connection is not None and not dbapi_connection.in_transaction:
+            session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+
+
 def _key_columns(table: Table) -> list[Column[Any]]:
     """
     Returns columns that are part of the primary key.
@@ -17,6 +17,7 @@ from typing_extensions import override
 
 from antarest.core.exceptions import NotAMatrixError
 from antarest.core.interfaces.cache import ICache, update_cache
+from antarest.matrixstore.model import MatrixFileFingerprint
 from antarest.study.dao.api.study_dao import StudyDao
 from antarest.study.dao.file.file_study_adequacy_patch_parameters_dao import FileStudyAdequacyPatchParametersDao
 from antarest.study.dao.file.file_study_advanced_parameters import FileStudyAdvancedParametersDao
@@ -46,6 +47,7 @@ from antarest.study.model import StudyMetadataUpdate
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfigDTO
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
 from antarest.study.storage.rawstudy.model.filesystem.matrix.input_series_matrix import InputSeriesMatrix
+from antarest.study.storage.rawstudy.model.filesystem.matrix.matrix_parsing import parse_matrices
 
 if TYPE_CHECKING:
     from antarest.blobstore.service import IBlobService
@@ -161,6 +163,11 @@ class FileStudyTreeDao(
         data = FileStudyTreeConfigDTO.from_build_config(self._file_study.config).model_dump()
         update_cache(self._cache, self._file_study.config.study_id, data)
 
+    @override
+    def supports_concurrent_writes(self) -> bool:
+        # Each file is written by a single command, see `ICommand.get_footprint`
+        return True
+
     def get_matrix(self, url: list[str]) -> pl.DataFrame:
         """
         Given a url pointing towards an input matrix, parses it and returns it as a pandas dataframe.
@@ -174,11 +181,11 @@ class FileStudyTreeDao(
     def get_matrices_ids(self, nodes: list[InputSeriesMatrix]) -> dict[InputSeriesMatrix, str]:
         """
         Get multiple matrices ids efficiently.
-        It performs at most 1 DB query for the whole list.
+        It performs a constant number of DB queries for the whole list.
         """
         result = {}
 
-        denormalized_nodes = []
+        denormalized_nodes = {}
 
         for matrix_node in nodes:
             if matrix_node.is_normalized:
@@ -187,14 +194,25 @@ class FileStudyTreeDao(
                 assert isinstance(matrix_id, str)
                 result[matrix_node] = matrix_id
             elif matrix_node.config.path.exists():
-                denormalized_nodes.append(matrix_node)
+                denormalized_nodes[matrix_node] = MatrixFileFingerprint.from_path(matrix_node.config.path)
 
         ########## Denormalized nodes ##########
-        # The `create_batch` allows us to perform only 1 DB insert for all our matrix ids.
+        # The files unchanged since they were last parsed are not read again.
         matrix_service = self._generator_matrix_constants.matrix_service
-        matrix_ids = matrix_service.create_batch(node.parse_content() for node in denormalized_nodes)
-        for k, node in enumerate(denormalized_nodes):
+        known_ids = matrix_service.get_file_matrix_ids(list(denormalized_nodes.values()))
+        nodes_to_parse = []
+        for node, fingerprint in denormalized_nodes.items():
+            if fingerprint in known_ids:
+                result[node] = known_ids[fingerprint]
+            else:
+                nodes_to_parse.append(node)
+
+        # The matrices are parsed by a pool of threads while they are hashed and stored.
+        # The `create_batch` allows us to perform only 1 DB insert for all our matrix ids.
+        matrix_ids = matrix_service.create_batch(parse_matrices(nodes_to_parse))
+        for k, node in enumerate(nodes_to_parse):
             result[node] = matrix_ids[k]
+        matrix_service.save_file_matrix_ids({denormalized_nodes[node]: result[node] for node in nodes_to_parse})
 
         return result
 
@@ -30,6 +30,7 @@ from antarest.study.dao.file.common import check_area_exists
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig
 from antarest.study.storage.rawstudy.model.filesystem.config.thermal import (
     parse_thermal_cluster,
+    parse_thermal_clusters_frame,
     serialize_thermal_cluster,
 )
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
@@ -72,22 +73,28 @@ class FileStudyThermalDao(ThermalDao, ABC):
     def get_impl(self) -> "FileStudyTreeDao":
         pass
 
-    @override
-    def get_all_thermals(self) -> dict[str, dict[str, ThermalCluster]]:
+    def _get_all_cluster_sections(self) -> dict[str, dict[str, Any]]:
         """
-        Returns for each area id, a mapping of a cluster id (in lower case) towards the corresponding cluster object.
+        Returns for each area id, the sections of the INI file of its thermal clusters.
         """
         file_study = self.get_file_study()
-        version = file_study.config.version
         path = _ALL_CLUSTERS_PATH
         try:
             # may raise KeyError if the path is missing
             clusters = file_study.tree.get(path.split("/"), depth=5)
             # may raise KeyError if "list" is missing
-            clusters = {area_id: cluster_list["list"] for area_id, cluster_list in clusters.items()}
+            return {area_id: cluster_list["list"] for area_id, cluster_list in clusters.items()}
         except KeyError:
             raise ThermalClusterConfigNotFound(path) from None
 
+    @override
+    def get_all_thermals(self) -> dict[str, dict[str, ThermalCluster]]:
+        """
+        Returns for each area id, a mapping of a cluster id (in lower case) towards the corresponding cluster object.
+        """
+        version = self.get_file_study().config.version
+        clusters = self._get_all_cluster_sections()
+
         thermals_by_areas: dict[str, dict[str, ThermalCluster]] = {}
         for area_id, cluster_obj in clusters.items():
             for cluster_id, cluster in cluster_obj.items():
@@ -95,6 +102,11 @@ class FileStudyThermalDao(ThermalDao, ABC):
                 thermals_by_areas.setdefault(area_id, {})[thermal.id.lower()] = thermal
         return thermals_by_areas
 
+    @override
+    def get_thermals_frame(self, columns: Sequence[str] | None = None) -> pl.DataFrame:
+        version = self.get_file_study().config.version
+        return parse_thermal_clusters_frame(version, self._get_all_cluster_sections(), columns)
+
     @override
     def get_all_thermals_for_area(self, area_id: str) -> Sequence[ThermalCluster]:
         file_study = self.get_file_study()
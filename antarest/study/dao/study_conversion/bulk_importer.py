@@ -0,0 +1,204 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Bulk import of filesystem studies into the database.
+
+Converting a study with `StudyConverter` directly into the database commits each `save_*` call separately,
+which is slow for large studies and leaves partial data behind if the conversion fails. The import is done
+in three steps instead:
+
+1. the matrices of the study are parsed by a pool of threads and normalized in the matrix store;
+2. the study is converted into a scratch in-memory SQLite database, where commits are cheap;
+3. the rows of the scratch database are transferred table by table, in a single transaction:
+   with `COPY` statements on PostgreSQL, and with bulk `INSERT` statements otherwise.
+"""
+
+import io
+import logging
+from collections.abc import Iterable, Sequence
+from typing import Any, Callable, cast
+
+from sqlalchemy import LargeBinary, Table, create_engine, delete, insert, select
+from sqlalchemy.engine import Dialect
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from antarest.matrixstore.service import ISimpleMatrixService
+from antarest.study.dao.database.database_study_factory_dao import DatabaseStudyDaoFactory
+from antarest.study.dao.database.models import STUDY_DATA_TABLE, get_study_data_tables
+from antarest.study.dao.file.file_study_dao import FileStudyTreeDao
+from antarest.study.dao.study_conversion.study_converter import StudyConverter
+from antarest.study.model import Study, StudyMetadataCreation
+from antarest.study.storage.rawstudy.model.filesystem.matrix.matrix_parsing import parse_matrices
+
+logger = logging.getLogger(__name__)
+
+# Number of rows transferred at once
+CHUNK_SIZE = 5000
+
+
+def format_copy_value(value: Any) -> str:
+    """
+    Formats a value for the text format of the PostgreSQL `COPY` statement.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # The backslash is escaped: `\\x` is the prefix of the hexadecimal format of `bytea`
+        return "\\\\x" + bytes(value).hex()
+    text = str(value)
+    return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _get_bind_processors(table: Table, dialect: Dialect) -> list[Callable[[Any], Any] | None]:
+    # The binary values are formatted by `format_copy_value`, not by the DBAPI
+    return [None if isinstance(column.type, LargeBinary) else column.type.bind_processor(dialect) for column in table.c]
+
+
+def format_copy_rows(table: Table, rows: Iterable[Sequence[Any]], dialect: Dialect) -> str:
+    """
+    Formats rows of a table for the text format of the PostgreSQL `COPY` statement.
+
+    The values are first converted by the column types (for instance, enums and JSON values).
+    """
+    processors = _get_bind_processors(table, dialect)
+    lines = []
+    for row in rows:
+        values = (process(value) if process else value for process, value in zip(processors, row))
+        lines.append("\t".join(format_copy_value(value) for value in values) + "\n")
+    return "".join(lines)
+
+
+def _copy_rows(session: Session, table: Table, rows: Sequence[Sequence[Any]]) -> None:
+    dialect = session.get_bind().dialect
+    preparer = dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(column.name) for column in table.c)
+    statement = f"COPY {preparer.format_table(table)} ({columns}) FROM STDIN"
+    buffer = io.StringIO(format_copy_rows(table, rows, dialect))
+    # `COPY` is not supported by SQLAlchemy: the DBAPI connection of the current transaction is used
+    dbapi_connection = session.connection().connection.dbapi_connection
+    assert dbapi_connection is not None
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(statement, buffer)
+    finally:
+        cursor.close()
+
+
+class BulkStudyImporter:
+    """
+    Imports filesystem studies into the database, in a single transaction.
+
+    Args:
+        dao_factory: The factory of the database DAOs.
+        matrix_service: The service used to store the matrices of the studies.
+        max_workers: The number of threads used to parse the matrices.
+        chunk_size: The number of rows transferred at once.
+    """
+
+    def __init__(
+        self,
+        dao_factory: DatabaseStudyDaoFactory,
+        matrix_service: ISimpleMatrixService,
+        max_workers: int = 1,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self.dao_factory = dao_factory
+        self.matrix_service = matrix_service
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+
+    def _normalize_matrices(self, source_dao: FileStudyTreeDao) -> None:
+        """
+        Stores the matrices of a managed study in the matrix store, and replaces them with links.
+
+        The converter then only reads the links. The study must be a disposable copy, since it is modified.
+        """
+        file_study = source_dao.get_file_study()
+        nodes = file_study.tree.get_matrix_nodes_to_normalize()
+        if not nodes:
+            return
+        matrix_ids = self.matrix_service.create_batch(parse_matrices(nodes, self.max_workers))
+        for node, matrix_id in zip(nodes, matrix_ids):
+            node.save_matrix(matrix_id)
+        logger.info(f"{len(nodes)} matrices of study {file_study.config.study_id} normalized")
+
+    def _convert(self, source_dao: FileStudyTreeDao, study_id: str, scratch_session: Session) -> None:
+        factory = self.dao_factory.with_session(scratch_session)
+        metadata = StudyMetadataCreation(id=study_id, version=source_dao.get_version(), managed=True)
+        new_dao = factory.create_study_dao(metadata)
+        converter = StudyConverter(
+            source_dao=source_dao,
+            new_dao=new_dao,
+            study_version=source_dao.get_version(),
+            matrix_service=self.matrix_service,
+        )
+        converter.convert_study_inputs()
+
+    def _transfer(self, scratch_session: Session, session: Session, tables: Sequence[Table]) -> int:
+        """
+        Copies all the rows of the scratch database into the target database.
+
+        Returns:
+            The number of transferred rows.
+        """
+        use_copy = session.get_bind().dialect.name == "postgresql"
+        count = 0
+        for table in tables:
+            result = scratch_session.execute(select(table))
+            for chunk in result.partitions(self.chunk_size):
+                if use_copy:
+                    _copy_rows(session, table, chunk)
+                else:
+                    session.execute(insert(table), [row._asdict() for row in chunk])
+                count += len(chunk)
+        return count
+
+    def import_study(self, source_dao: FileStudyTreeDao, study_id: str, session: Session, managed: bool) -> None:
+        """
+        Imports the inputs of a filesystem study into the database.
+
+        The previous data of the study, if any, is replaced. Nothing is changed if the import fails.
+
+        Args:
+            source_dao: The DAO of the filesystem study.
+            study_id: The ID of the study in the database, which must already exist.
+            session: The database session, committed once all the data is inserted.
+            managed: Whether the filesystem study is managed. Its matrices are then normalized beforehand:
+                it must be a disposable copy.
+        """
+        tables = get_study_data_tables()
+        if managed:
+            self._normalize_matrices(source_dao)
+
+        scratch_engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
+        try:
+            # The DAOs read the version of the study from the `study` table: its row is copied.
+            # The foreign keys to the other tables are not enforced by SQLite by default.
+            study_table = cast(Table, Study.__table__)
+            STUDY_DATA_TABLE.metadata.create_all(scratch_engine, tables=[study_table, *tables])
+            study_row = session.execute(select(study_table).where(study_table.c.id == study_id)).one()
+            with Session(scratch_engine) as scratch_session:
+                scratch_session.execute(insert(study_table).values(study_row._asdict()))
+                self._convert(source_dao, study_id, scratch_session)
+                try:
+                    session.execute(delete(STUDY_DATA_TABLE).where(STUDY_DATA_TABLE.c.study_id == study_id))
+                    count = self._transfer(scratch_session, session, tables)
+                    session.commit()
+                except Exception:
+                    session.rollback()
+                    raise
+        finally:
+            scratch_engine.dispose()
+        logger.info(f"{count} rows of study {study_id} imported into the database")
@@ -11,6 +11,8 @@
 # This file is part of the Antares project.
 
 
+import prometheus_client
+
 from antarest.blobstore.service import IBlobService
 from antarest.core.config import Config
 from antarest.core.filetransfer.service import FileTransferManager
@@ -27,6 +29,7 @@ from antarest.study.storage.rawstudy.model.filesystem.factory import StudyFactor
 from antarest.study.storage.rawstudy.raw_study_service import RawStudyService
 from antarest.study.storage.variantstudy.business.matrix_constants_generator import GeneratorMatrixConstants
 from antarest.study.storage.variantstudy.command_factory import CommandFactory
+from antarest.study.storage.variantstudy.command_metrics import CommandMetricsRecorder
 from antarest.study.storage.variantstudy.repository import VariantStudyRepository
 from antarest.study.storage.variantstudy.variant_study_service import VariantStudyService
 
@@ -98,6 +101,7 @@ def build_study_service(
         event_bus=event_bus,
         config=config,
         matrix_service=matrix_service,
+        command_metrics=CommandMetricsRecorder(prometheus_client.REGISTRY) if config.metrics.prometheus else None,
     )
 
     directory_service = DirectoryService(directory_repository=DirectoryRepository())
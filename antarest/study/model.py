@@ -20,6 +20,7 @@ from pathlib import Path, PurePath, PurePosixPath
 from typing import TYPE_CHECKING, Annotated, Any, TypeAlias
 
 import numpy as np
+import polars as pl
 from antares.study.version import StudyVersion
 from pydantic import (
     BeforeValidator,
@@ -37,14 +38,17 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     PrimaryKeyConstraint,
     String,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from sqlalchemy.sql.sqltypes import BigInteger
 from typing_extensions import override
 
+from antarest.core.exceptions import InvalidMatrixSliceError
 from antarest.core.model import PublicMode
 from antarest.core.persistence import Base
 from antarest.core.serde import AntaresBaseModel
@@ -265,6 +269,13 @@ class CommentsDto(AntaresBaseModel):
     comments: str
 
 
+# Sort keys of the studies without a name or a creation date: the sort keys are never NULL, so that
+# all the studies can be compared for the keyset pagination. The constants are written inline in the
+# queries, for the database to match them with the expressions of the indexes.
+NO_NAME_SORT_KEY = "''"
+NO_DATE_SORT_KEY = "'0001-01-01 00:00:00'"
+
+
 class Study(Base):
     """
     Base study entity to save main metadata, common for any type of study (raw, variant, managed or not)
@@ -298,6 +309,12 @@ class Study(Base):
     """
 
     __tablename__ = "study"
+    # Sort keys of the search of studies, for the keyset pagination (see `StudyMetadataRepository.get_all`)
+    __table_args__ = (
+        Index("ix_study_name_id", text(f"coalesce(name, {NO_NAME_SORT_KEY})"), "id"),
+        Index("ix_study_upper_name_id", text(f"upper(coalesce(name, {NO_NAME_SORT_KEY}))"), "id"),
+        Index("ix_study_created_at_id", text(f"coalesce(created_at, {NO_DATE_SORT_KEY})"), "id"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36),
@@ -687,6 +704,44 @@ class MatrixIndex(AntaresBaseModel):
     level: MatrixFrequency = MatrixFrequency.HOURLY
 
 
+@dataclasses.dataclass(frozen=True)
+class MatrixSlice:
+    """
+    Projection of a matrix on some of its columns and on a range of its rows.
+
+    Attributes:
+        columns:  indices of the columns to keep, in increasing order. All columns are kept if `None`.
+        row_from: index of the first row to keep.
+        row_to:   index following the last row to keep. Rows are kept up to the end of the matrix if `None`.
+    """
+
+    columns: tuple[int, ...] | None = None
+    row_from: int = 0
+    row_to: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.columns is not None and (not self.columns or any(c < 0 for c in self.columns)):
+            raise InvalidMatrixSliceError(f"Invalid column indices: {list(self.columns)}")
+        if self.row_from < 0 or (self.row_to is not None and self.row_to < self.row_from):
+            raise InvalidMatrixSliceError(f"Invalid rows range: [{self.row_from}, {self.row_to})")
+        if self.columns is not None:
+            object.__setattr__(self, "columns", tuple(sorted(set(self.columns))))
+
+    @property
+    def row_count(self) -> int | None:
+        return None if self.row_to is None else self.row_to - self.row_from
+
+    def apply(self, dataframe: pl.DataFrame) -> pl.DataFrame:
+        """
+        Slices an already loaded dataframe.
+        """
+        if self.columns is not None:
+            if self.columns and self.columns[-1] >= dataframe.width:
+                raise InvalidMatrixSliceError(f"Column index {self.columns[-1]} is out of the matrix bounds")
+            dataframe = dataframe.select(dataframe.columns[c] for c in self.columns)
+        return dataframe.slice(self.row_from, self.row_count)
+
+
 class TimeSerie(AntaresBaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True, ser_json_inf_nan="constants")
 
@@ -11,12 +11,28 @@
 # This file is part of the Antares project.
 
 import enum
-from typing import Optional, Sequence, cast
+from typing import Any, Optional, Sequence, cast
 
 from pydantic import NonNegativeInt
-from sqlalchemy import TEXT, and_, delete, exists, func, literal, not_, or_, select, sql, update
+from sqlalchemy import (
+    TEXT,
+    ColumnElement,
+    SQLColumnExpression,
+    delete,
+    exists,
+    func,
+    literal,
+    literal_column,
+    not_,
+    or_,
+    select,
+    sql,
+    tuple_,
+    update,
+)
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import Query, Session, joinedload, with_polymorphic
+from sqlalchemy.orm import Query, Session, aliased, joinedload, with_polymorphic
+from sqlalchemy.orm.util import AliasedClass
 
 from antarest.core.interfaces.cache import ICache
 from antarest.core.jwt import JWTUser
@@ -24,9 +40,18 @@ from antarest.core.model import PublicMode
 from antarest.core.serde import AntaresBaseModel
 from antarest.core.utils.fastapi_sqlalchemy import db
 from antarest.core.utils.utils import current_time
-from antarest.login.model import Group
 from antarest.login.utils import get_current_user
-from antarest.study.model import DEFAULT_WORKSPACE_NAME, Directory, RawStudy, Study, StudyDiskSpaceAnalysis, Tag
+from antarest.study.model import (
+    DEFAULT_WORKSPACE_NAME,
+    NO_DATE_SORT_KEY,
+    NO_NAME_SORT_KEY,
+    Directory,
+    RawStudy,
+    Study,
+    StudyDiskSpaceAnalysis,
+    StudyGroup,
+    Tag,
+)
 
 
 def escape_like(string: str, escape_char: str = "\\") -> str:
@@ -141,10 +166,36 @@ class StudyPagination(AntaresBaseModel, frozen=True, extra="forbid"):
     Attributes:
         page_nb: offset
         page_size: SQL limit
+        after: optional ID of the last study of the previous page, for keyset pagination:
+            the page starts after this study, and `page_nb` is ignored.
     """
 
     page_nb: NonNegativeInt = 0
     page_size: NonNegativeInt = 0
+    after: str = ""
+
+
+def _get_sort_key(
+    entity: type[Study] | AliasedClass[Study], sort_by: StudySortBy | None
+) -> tuple[SQLColumnExpression[Any], bool]:
+    """
+    Returns the sort key of the studies, and whether the order is descending.
+
+    The sort keys are the expressions of the `ix_study_*_id` indexes, and are never NULL.
+    """
+    name = func.coalesce(entity.name, literal_column(NO_NAME_SORT_KEY))
+    if sort_by is None:
+        return name, False
+    elif sort_by in (StudySortBy.DATE_ASC, StudySortBy.DATE_DESC):
+        return func.coalesce(entity.created_at, literal_column(NO_DATE_SORT_KEY)), sort_by == StudySortBy.DATE_DESC
+    elif sort_by in (StudySortBy.NAME_ASC, StudySortBy.NAME_DESC):
+        return func.upper(name), sort_by == StudySortBy.NAME_DESC
+    raise NotImplementedError(sort_by)
+
+
+def _in_groups(entity: AliasedClass[Study], group_ids: Sequence[str]) -> ColumnElement[bool]:
+    # The association table is enough: a join with the groups would duplicate the studies
+    return exists().where(StudyGroup.study_id == entity.id, StudyGroup.group_id.in_(group_ids))
 
 
 class StudyMetadataRepository:
@@ -244,30 +295,31 @@ class StudyMetadataRepository:
 
         q = self._search_studies(study_filter)
 
-        # sorting
-        if sort_by:
-            if sort_by == StudySortBy.DATE_DESC:
-                q = q.order_by(entity.created_at.desc())
-            elif sort_by == StudySortBy.DATE_ASC:
-                q = q.order_by(entity.created_at.asc())
-            elif sort_by == StudySortBy.NAME_DESC:
-                q = q.order_by(func.upper(entity.name).desc())
-            elif sort_by == StudySortBy.NAME_ASC:
-                q = q.order_by(func.upper(entity.name).asc())
+        # sorting: the ID breaks the ties, so that the order of the pages is stable
+        if sort_by or pagination.page_nb or pagination.page_size or pagination.after:
+            key, descending = _get_sort_key(entity, sort_by)
+            if pagination.after:
+                # keyset pagination: the sort key of the previous study is read in the same query
+                previous = aliased(Study)
+                previous_key, _ = _get_sort_key(previous, sort_by)
+                previous_key_subquery = select(previous_key).where(previous.id == pagination.after).scalar_subquery()
+                keys = tuple_(key, entity.id)
+                previous_keys = tuple_(previous_key_subquery, literal(pagination.after))
+                # The bound on the sort key alone lets the database seek the index of the sort keys
+                if descending:
+                    q = q.filter(key <= previous_key_subquery, keys < previous_keys)
+                else:
+                    q = q.filter(key >= previous_key_subquery, keys > previous_keys)
+            if descending:
+                q = q.order_by(key.desc(), entity.id.desc())
             else:
-                raise NotImplementedError(sort_by)
-
-        # pagination
-        if pagination.page_nb or pagination.page_size:
-            limit = pagination.page_size
-            offset = pagination.page_nb * pagination.page_size
-            end = offset + limit
-            if sort_by is None:
-                q = q.order_by(entity.name.asc())
-            if study_filter.groups or study_filter.tags:
-                studies: Sequence[Study] = list(q.all())[offset:end]
-                return studies
-            q = q.offset(offset).limit(limit)
+                q = q.order_by(key.asc(), entity.id.asc())
+
+        # pagination: the filters don't duplicate the studies, so the limit is applied by the database
+        if pagination.page_size:
+            q = q.limit(pagination.page_size)
+            if pagination.page_nb and not pagination.after:
+                q = q.offset(pagination.page_nb * pagination.page_size)
 
         studies = list(q.all())
         return studies
@@ -330,7 +382,7 @@ class StudyMetadataRepository:
             q = q.filter(entity.owner_id.in_(study_filter.users))
         if study_filter.tags:
             upper_tags = [tag.upper() for tag in study_filter.tags]
-            q = q.join(entity.tags).filter(func.upper(Tag.label).in_(upper_tags))
+            q = q.filter(entity.tags.any(func.upper(Tag.label).in_(upper_tags)))
         if study_filter.archived is not None:
             q = q.filter(entity.archived == study_filter.archived)
         if study_filter.name:
@@ -351,25 +403,21 @@ class StudyMetadataRepository:
         if study_filter.versions:
             q = q.filter(entity.version.in_(study_filter.versions))
 
-        # permissions + groups filtering
-        if not study_filter.access_permissions.is_admin and study_filter.access_permissions.user_id is not None:
-            condition_1 = entity.public_mode != PublicMode.NONE
-            condition_2 = entity.owner_id == study_filter.access_permissions.user_id
-            q1 = q.join(entity.groups).filter(Group.id.in_(study_filter.access_permissions.user_groups))
-            if study_filter.groups:
-                q2 = q.join(entity.groups).filter(Group.id.in_(study_filter.groups))
-                q2 = q1.intersect(q2)
-                q = q2.union(
-                    q.join(entity.groups).filter(and_(or_(condition_1, condition_2), Group.id.in_(study_filter.groups)))
+        # permissions + groups filtering, with subqueries, so that the studies are not duplicated
+        permissions = study_filter.access_permissions
+        if not permissions.is_admin:
+            if permissions.user_id is None:
+                # return empty result
+                return q.filter(sql.false())
+            q = q.filter(
+                or_(
+                    entity.public_mode != PublicMode.NONE,
+                    entity.owner_id == permissions.user_id,
+                    _in_groups(entity, permissions.user_groups),
                 )
-            else:
-                q = q1.union(q.filter(or_(condition_1, condition_2)))
-        elif not study_filter.access_permissions.is_admin and study_filter.access_permissions.user_id is None:
-            # return empty result
-            # noinspection PyTypeChecker
-            q = self.session.query(entity).filter(sql.false())
-        elif study_filter.groups:
-            q = q.join(entity.groups).filter(Group.id.in_(study_filter.groups))
+            )
+        if study_filter.groups:
+            q = q.filter(_in_groups(entity, study_filter.groups))
 
         return q
 
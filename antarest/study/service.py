@@ -44,6 +44,7 @@ from antarest.core.exceptions import (
     ReferencedObjectDeletionNotAllowed,
     ResourceCreationNotAllowed,
     ResourceDeletionNotAllowed,
+    StudyCursorNotFound,
     StudyDeletionNotAllowed,
     StudyImportFailed,
     StudyNotFoundError,
@@ -123,6 +124,7 @@ from antarest.study.model import (
     STUDY_REFERENCE_TEMPLATES,
     MatrixFrequency,
     MatrixIndex,
+    MatrixSlice,
     RawStudy,
     StorageMode,
     Study,
@@ -481,14 +483,16 @@ class RawStudyInterface(StudyInterface):
         # Build DAO based on storage mode
         dao = self._get_dao()
 
-        # Apply all commands
+        # Apply all commands in a single transaction: the commands preceding a failing command are kept
         should_invalidate_cache = False
-        for command in commands:
-            result = command.apply(dao, listener)
-            if result.should_invalidate_cache:
-                should_invalidate_cache = True
-            if not result.status:
-                raise CommandApplicationError(result.message)
+        with dao.unit_of_work():
+            for command in commands:
+                with dao.operation():
+                    result = command.apply(dao, listener)
+                    if result.should_invalidate_cache:
+                        should_invalidate_cache = True
+                    if not result.status:
+                        raise CommandApplicationError(result.message)
 
         # Handle cache invalidation
         if should_invalidate_cache:
@@ -612,12 +616,24 @@ class IOutputsAccess(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def get_output_raw_content(self, study_id: str, output_id: str, url: list[str], formatted: bool) -> Any:
+    def get_output_raw_content(
+        self,
+        study_id: str,
+        output_id: str,
+        url: list[str],
+        formatted: bool,
+        matrix_slice: MatrixSlice | None = None,
+    ) -> Any:
         raise NotImplementedError()
 
     @abstractmethod
     def get_output_matrix_as_dataframe(
-        self, study_id: str, output_id: str, url: list[str], frequency: MatrixFrequency
+        self,
+        study_id: str,
+        output_id: str,
+        url: list[str],
+        frequency: MatrixFrequency,
+        matrix_slice: MatrixSlice | None = None,
     ) -> pd.DataFrame:
         raise NotImplementedError()
 
@@ -647,6 +663,7 @@ class StudyService:
         config: Config,
     ):
         self.storage_service = StudyStorageService(raw_study_service, variant_study_service)
+        self.matrix_service = command_context.matrix_service
         self.user_service = user_service
         self.directory_service = directory_service
         self.repository = repository
@@ -837,6 +854,9 @@ class StudyService:
         logger.info("Retrieving matching studies")
         matching_studies = self.repository.get_all(study_filter=study_filter, sort_by=sort_by, pagination=pagination)
         logger.info("Studies retrieved")
+        # The page after an unknown study is empty
+        if not matching_studies and pagination.after and self.repository.get(pagination.after) is None:
+            raise StudyCursorNotFound(pagination.after)
 
         return self._build_studies_information(matching_studies, should_raise=False)
 
@@ -1578,6 +1598,7 @@ class StudyService:
         for study in studies_to_delete.values():
             for output in self._get_outputs_access().list_outputs(study.id):
                 self._get_outputs_access().delete_output(study.id, output.id)
+            self.matrix_service.delete_file_matrix_ids(Path(study.path))
         self.repository.delete(*studies_to_delete.keys())
 
         for study in studies_to_delete.values():
@@ -1627,6 +1648,7 @@ class StudyService:
 
                 # Imports the inputs
                 study = self.storage_service.raw_study_service.import_study(study, dst_path)
+                self.matrix_service.delete_file_matrix_ids(dst_path)
 
                 # Save the Study in DB (needed to import the outputs)
                 study.directory_id = self.directory_service.get_directory_by_path(directory)
@@ -2827,7 +2849,9 @@ class StudyService:
 
         self.storage_service.raw_study_service.normalize_study(study)
 
-    def get_raw_content(self, uuid: str, path: str, depth: int, formatted: bool) -> Any:
+    def get_raw_content(
+        self, uuid: str, path: str, depth: int, formatted: bool, matrix_slice: MatrixSlice | None = None
+    ) -> Any:
         """
         Returns the content of a file based on the provided arguments.
 
@@ -2844,6 +2868,9 @@ class StudyService:
           - raw file content (arbitrary user files ...)
 
         This allows callers to handle the result as most appropriate.
+
+        When a matrix slice is given, the path must point to a matrix and only the requested part of it is returned.
+        For output matrices, the other columns and the rows after the slice are not even parsed.
         """
         study = self.get_study(uuid)
         assert_permission(study, StudyPermissionType.READ)
@@ -2853,13 +2880,14 @@ class StudyService:
         ######## Outputs ########
 
         if url and url[0] == "output":
-            return self._get_outputs_access().get_output_raw_content(study.id, url[1], url[2:], formatted)
+            return self._get_outputs_access().get_output_raw_content(study.id, url[1], url[2:], formatted, matrix_slice)
 
         ######## Inputs ########
 
         # We need to handle matrices differently if our study is stored in DB
         if study.storage_mode == StorageMode.DATABASE:
-            return _get_matrix_from_path(self.get_study_interface(study), PurePosixPath(path))
+            matrix = _get_matrix_from_path(self.get_study_interface(study), PurePosixPath(path))
+            return matrix_slice.apply(matrix) if matrix_slice else matrix
 
         else:
             file_study = self.get_file_study(study)
@@ -2867,10 +2895,37 @@ class StudyService:
 
             # Return a dataframe when possible instead of less memory & computation - efficient python objects
             if isinstance(node, InputSeriesMatrix):
-                return node.parse_as_dataframe()
+                matrix = node.parse_as_dataframe()
+                return matrix_slice.apply(matrix) if matrix_slice else matrix
 
+            if matrix_slice:
+                raise IncorrectPathError(f"The provided path does not point to a valid matrix: '{path}'")
             return node.get(url=relative_url, depth=depth, formatted=formatted)
 
+    def get_output_matrix(self, uuid: str, path: str, matrix_slice: MatrixSlice | None = None) -> pl.DataFrame:
+        """
+        Returns an output matrix as a dataframe, with the multi-level headers of the simulator
+        (variable, unit, statistic) flattened as column names separated by " % ".
+
+        Only the requested columns and rows are parsed if a matrix slice is given.
+        """
+        study = self.get_study(uuid)
+        assert_permission(study, StudyPermissionType.READ)
+        self.assert_study_unarchived(study)
+        url = [item for item in path.split("/") if item]
+        if len(url) <= 2 or url[0] != "output":
+            raise IncorrectPathError(f"The provided path does not point to a valid output matrix: '{path}'")
+
+        try:
+            frequency = _infer_output_matrix_frequency(url[-1])
+        except ValueError:
+            raise IncorrectPathError(f"The provided path does not point to a valid output matrix: '{path}'") from None
+        pandas_df = self._get_outputs_access().get_output_matrix_as_dataframe(
+            study.id, url[1], url[2:], frequency, matrix_slice
+        )
+        pandas_df.columns = pd.Index([" % ".join(col) for col in pandas_df.columns])
+        return pl.from_pandas(pandas_df)
+
     def get_study_data(self, uuid: str) -> StudyDataDTO:
         study = self.get_study(uuid)
         assert_permission(study, StudyPermissionType.READ)
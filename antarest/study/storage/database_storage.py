@@ -16,7 +16,7 @@ from pathlib import Path
 from typing import Iterator
 
 from antares.study.version import StudyVersion
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, literal, select
 from typing_extensions import override
 
 from antarest.core.config import Config
@@ -24,7 +24,7 @@ from antarest.core.utils.fastapi_sqlalchemy import db
 from antarest.matrixstore.model import MatrixReference
 from antarest.matrixstore.service import ISimpleMatrixService
 from antarest.study.dao.database.database_study_factory_dao import DatabaseStudyDaoFactory
-from antarest.study.dao.database.models import STUDY_DATA_TABLE
+from antarest.study.dao.database.models import STUDY_DATA_TABLE, get_study_data_tables
 from antarest.study.dao.database.models.area import LOAD_TABLE, MISC_GEN_TABLE, RESERVES_TABLE, SOLAR_TABLE, WIND_TABLE
 from antarest.study.dao.database.models.binding_constraint import (
     BINDING_CONSTRAINT_EQ_MATRIX_TABLE,
@@ -76,6 +76,7 @@ from antarest.study.dao.database.models.thermal import (
 )
 from antarest.study.dao.database.models.xpansion import XPANSION_CAPACITY_TABLE, XPANSION_WEIGHT_TABLE
 from antarest.study.dao.file.file_study_factory_dao import FileStudyDaoFactory
+from antarest.study.dao.study_conversion.bulk_importer import BulkStudyImporter
 from antarest.study.dao.study_conversion.study_converter import StudyConverter
 from antarest.study.model import RawStudy, Study, StudyMetadataCopy, StudyMetadataCreation
 from antarest.study.repository import StudyMetadataRepository
@@ -154,6 +155,9 @@ class DatabaseStudyStorage(IStudyStorage):
         self._matrix_service = matrix_service
         self._db_dao_factory = db_dao_factory
         self._fs_dao_factory = fs_dao_factory
+        self._bulk_importer = BulkStudyImporter(
+            db_dao_factory, matrix_service, max_workers=config.storage.db_import_workers
+        )
 
     @override
     def copy(self, src_study: Study, metadata: StudyMetadataCopy) -> RawStudy:
@@ -174,18 +178,21 @@ class DatabaseStudyStorage(IStudyStorage):
             raise e
 
     def copy_study_data(self, src_study: Study, new_study_id: str) -> None:
-        source_dao = self._db_dao_factory.get_study_dao(src_study.id, True)
-        study_version = StudyVersion.parse(src_study.version)
-
-        # Build the new DB DAO
-        creation_metadata = StudyMetadataCreation(id=new_study_id, version=study_version, managed=True)
-        new_dao = self._db_dao_factory.create_study_dao(creation_metadata)
+        """
+        Copies the data of a study to a new study, in a single transaction.
 
-        # Copies the inputs
-        converter = StudyConverter(
-            source_dao=source_dao, new_dao=new_dao, study_version=study_version, matrix_service=self._matrix_service
-        )
-        converter.convert_study_inputs()
+        The rows of the study are copied by the database itself, with `INSERT ... SELECT` statements
+        rewriting the study ID: no entity is loaded in memory. The matrices are shared by both studies.
+        """
+        session = db.session
+        for table in get_study_data_tables():
+            columns = [
+                literal(new_study_id, table.c.study_id.type).label("study_id") if column.name == "study_id" else column
+                for column in table.c
+            ]
+            source = select(*columns).where(table.c.study_id == src_study.id)
+            session.execute(insert(table).from_select([column.name for column in table.c], source))
+        session.commit()
 
     @override
     def write_study_for_archive(self, study: RawStudy, dst_path: Path) -> None:
@@ -212,6 +219,7 @@ class DatabaseStudyStorage(IStudyStorage):
         finally:
             # Clean up the temporary directory
             shutil.rmtree(dst_path, ignore_errors=True)
+            self._matrix_service.delete_file_matrix_ids(dst_path)
 
     @override
     def export_study(self, study: Study, dst_path: Path) -> None:
@@ -292,20 +300,18 @@ class DatabaseStudyStorage(IStudyStorage):
 
         # If the upgrader raised above, it's not a problem the study isn't affected
         # But now, we have to replace the study data with new data generated by the upgrader.
-        # If this operation fails, we'll have a semi-filled study inside the database.
-        # And as the study converter uses multiple commits, we cannot simply rollback the database session.
+        # The obsolete study data is replaced in the same transaction as the import of the new data.
 
         try:
             # First, update the study version
             study.version = f"{version:2d}"
             self._repository.save(study)
-            # Then clean the obsolete study data in DB
-            self.remove_study_data(study)
-            # Finally, converts the data from the filesystem to the database
+            # Then converts the data from the filesystem to the database
             self._extract_study(study, dst_path, create_study_in_db=False, managed=False)
 
         finally:
             shutil.rmtree(dst_path, ignore_errors=True)
+            self._matrix_service.delete_file_matrix_ids(dst_path)
 
     def _extract_study(self, study: Study, study_dir: Path, create_study_in_db: bool, managed: bool = True) -> None:
         # Build the FS DAO from the extracted data
@@ -318,15 +324,5 @@ class DatabaseStudyStorage(IStudyStorage):
             # Create the new study inside DB to avoid ForeignKey and StudyNotFound errors
             self._repository.save(study)
 
-        # Build the DB DAO
-        metadata = StudyMetadataCreation(id=study.id, version=source_dao.get_version(), managed=True)
-        new_dao = self._db_dao_factory.create_study_dao(metadata)
-
-        # Convert the FS DAO into a DB one
-        converter = StudyConverter(
-            source_dao=source_dao,
-            new_dao=new_dao,
-            study_version=source_dao.get_version(),
-            matrix_service=self._matrix_service,
-        )
-        converter.convert_study_inputs()
+        # Convert the FS DAO into a DB one, in a single transaction
+        self._bulk_importer.import_study(source_dao, study.id, db.session, managed=managed)
@@ -28,6 +28,7 @@ from antarest.study.storage.rawstudy.model.filesystem.matrix.input_series_matrix
     InputSeriesMatrix,
     extract_matrix_id,
 )
+from antarest.study.storage.rawstudy.model.filesystem.matrix.matrix_parsing import parse_matrices
 from antarest.study.storage.study_storage_interface import IStudyStorage
 from antarest.study.storage.study_upgrader import StudyUpgrader
 from antarest.study.storage.utils import (
@@ -137,7 +138,7 @@ class FileStudyStorage(IStudyStorage):
         if not matrix_nodes:
             return
 
-        matrix_ids = self._matrix_service.create_batch(node.parse_content() for node in matrix_nodes)
+        matrix_ids = self._matrix_service.create_batch(parse_matrices(matrix_nodes))
         for k, node in enumerate(matrix_nodes):
             node.save_matrix(matrix_ids[k])
 
@@ -15,6 +15,7 @@ import time
 from pathlib import Path
 from typing import Sequence
 
+from antarest.core.utils.files import CopyMode, get_copy_function
 from antarest.study.model import Study, StudyMetadataCreation
 from antarest.study.storage.rawstudy.model.filesystem.root.filestudytree import FileStudyTree
 from antarest.study.storage.utils import format_timestamp
@@ -33,17 +34,23 @@ def get_snapshot_dir(study: VariantStudy) -> Path:
     return Path(study.path) / "snapshot"
 
 
-def export_study_to_flat_directory(study_dir: Path, dest: Path) -> None:
+def export_study_to_flat_directory(study_dir: Path, dest: Path, copy_mode: CopyMode = CopyMode.COPY) -> None:
+    """
+    Copies a study directory, without its outputs.
+
+    With the `reflink` or `hardlink` copy modes, files are shared with the source study
+    until they are modified (see `CopyMode`).
+    """
     start_time = time.time()
 
     def ignore_outputs(directory: str, _: Sequence[str]) -> Sequence[str]:
         return ["output"] if str(directory) == str(study_dir) else []
 
-    shutil.copytree(src=study_dir, dst=dest, ignore=ignore_outputs)
+    shutil.copytree(src=study_dir, dst=dest, ignore=ignore_outputs, copy_function=get_copy_function(copy_mode))
 
     stop_time = time.time()
     duration = f"{stop_time - start_time:.3f}"
-    logger.info(f"Study '{study_dir}' exported (flat mode) in {duration}s")
+    logger.info(f"Study '{study_dir}' exported (flat mode, {copy_mode} files) in {duration}s")
 
 
 def update_antares_info(
@@ -16,6 +16,7 @@ from typing import Any
 from typing_extensions import override
 
 from antarest.core.model import SUB_JSON
+from antarest.core.utils.files import record_dir_created
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig
 from antarest.study.storage.rawstudy.model.filesystem.folder_node import FolderNode
 from antarest.study.storage.rawstudy.model.filesystem.inode import TREE, INode
@@ -67,6 +68,7 @@ class BucketNode(FolderNode):
         self._assert_not_in_zipped_file()
         if not self.config.path.exists():
             self.config.path.mkdir()
+            record_dir_created(self.config.path)
 
         if not url:
             assert isinstance(data, dict)
@@ -9,11 +9,15 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
-from typing import Any
+import enum
+from collections.abc import Mapping, Sequence
+from typing import Any, get_args
 
+import polars as pl
 from antares.study.version import StudyVersion
 from pydantic import ConfigDict, Field
 
+from antarest.core.calendar import HOURS_IN_WEEK
 from antarest.core.serde import AntaresBaseModel
 from antarest.core.utils.string import to_kebab_case
 from antarest.study.business.model.thermal_cluster_model import (
@@ -21,9 +25,13 @@ from antarest.study.business.model.thermal_cluster_model import (
     LocalTSGenerationBehavior,
     ThermalCluster,
     ThermalCostGeneration,
+    get_thermal_cluster_frame_schema,
     initialize_thermal_cluster,
+    initialize_thermal_cluster_frame,
     validate_thermal_cluster_against_version,
+    validate_thermal_cluster_frame_against_version,
 )
+from antarest.study.storage.rawstudy.model.filesystem.config.identifier import transform_name_to_id
 
 
 class ThermalClusterFileData(AntaresBaseModel):
@@ -92,3 +100,94 @@ def parse_thermal_cluster(study_version: StudyVersion, data: Any) -> ThermalClus
 def serialize_thermal_cluster(study_version: StudyVersion, cluster: ThermalCluster) -> dict[str, Any]:
     validate_thermal_cluster_against_version(study_version, cluster)
     return ThermalClusterFileData.from_model(cluster).model_dump(mode="json", by_alias=True, exclude_none=True)
+
+
+# Keys of the thermal cluster properties in the INI file
+_FILE_KEYS = {field: info.alias or field for field, info in ThermalClusterFileData.model_fields.items()}
+
+
+def _get_enum_type(annotation: Any) -> type[enum.Enum] | None:
+    # Optional fields are annotated with a union with `None`
+    for type_ in (annotation, *get_args(annotation)):
+        if isinstance(type_, type) and issubclass(type_, enum.Enum):
+            return type_
+    return None
+
+
+# Enum types of the fields of the thermal clusters
+_ENUM_FIELDS = {
+    field: enum_type
+    for field, info in ThermalCluster.model_fields.items()
+    if (enum_type := _get_enum_type(info.annotation)) is not None
+}
+
+# Default values of the fields of the thermal clusters, enums being represented by their values
+_FRAME_DEFAULTS = {
+    field: info.default.value if isinstance(info.default, enum.Enum) else info.default
+    for field, info in ThermalCluster.model_fields.items()
+    if not info.is_required() and info.default is not None
+}
+
+
+def _parse_column(field: str, dtype: pl.DataType, values: list[Any]) -> pl.Series:
+    if dtype == pl.Int64():
+        # Integers may be written as floats
+        series = pl.Series(field, values, dtype=pl.Float64()).cast(dtype)
+    elif dtype == pl.String():
+        # Numbers are accepted as strings, like in the models
+        series = pl.Series(field, [None if value is None else str(value) for value in values], dtype=dtype)
+    else:
+        series = pl.Series(field, values, dtype=dtype)
+    if enum_type := _ENUM_FIELDS.get(field):
+        # The enums ignore case: the values are normalized
+        series = series.replace({value: enum_type(value).value for value in series.drop_nulls().unique()})
+    if (default := _FRAME_DEFAULTS.get(field)) is not None:
+        series = series.fill_null(default)
+    if field == "group":
+        series = series.str.to_lowercase()
+    elif field in {"min_up_time", "min_down_time"}:
+        series = series.clip(1, HOURS_IN_WEEK)
+    return series
+
+
+def parse_thermal_clusters_frame(
+    study_version: StudyVersion,
+    sections_by_area: Mapping[str, Mapping[str, Mapping[str, Any]]],
+    columns: Sequence[str] | None = None,
+) -> pl.DataFrame:
+    """
+    Parses the thermal clusters of all areas into a frame, like `parse_thermal_cluster` does for a single cluster.
+
+    The properties are parsed column by column, without creating a model for each cluster:
+    unlike `parse_thermal_cluster`, the bounds of the numeric values are not checked.
+
+    Args:
+        study_version: The version of the study.
+        sections_by_area: For each area ID, the sections of the INI file of its thermal clusters.
+        columns: The fields of the thermal clusters to parse, all of them by default.
+
+    Returns:
+        A frame of thermal clusters, see `THERMAL_CLUSTER_FRAME_SCHEMA`.
+    """
+    schema = get_thermal_cluster_frame_schema(columns)
+    area_ids = [area_id for area_id, sections in sections_by_area.items() for _ in sections]
+    sections = [section for sections in sections_by_area.values() for section in sections.values()]
+
+    if unknown_keys := {key for section in sections for key in section}.difference(_FILE_KEYS.values()):
+        raise ValueError(f"Unknown thermal cluster properties: {sorted(unknown_keys)}")
+    names = [section.get("name") for section in sections]
+    if None in names:
+        raise ValueError("Missing thermal cluster name")
+
+    series = []
+    for field, dtype in schema.items():
+        if field == "area_id":
+            series.append(pl.Series(field, area_ids, dtype=dtype))
+        elif field == "id":
+            series.append(pl.Series(field, [transform_name_to_id(str(name), lower=False) for name in names]))
+        else:
+            key = _FILE_KEYS[field]
+            series.append(_parse_column(field, dtype, [section.get(key) for section in sections]))
+
+    frame = validate_thermal_cluster_frame_against_version(study_version, pl.DataFrame(series))
+    return initialize_thermal_cluster_frame(frame, study_version)
@@ -17,6 +17,7 @@ from typing_extensions import override
 
 from antarest.core.exceptions import ChildNotFoundError, PathIsAFolderError
 from antarest.core.model import JSON, SUB_JSON
+from antarest.core.utils.files import record_dir_created, record_file_removed
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig
 from antarest.study.storage.rawstudy.model.filesystem.inode import TREE, INode, OriginalFile
 from antarest.study.storage.rawstudy.model.filesystem.matrix.input_series_matrix import InputSeriesMatrix
@@ -126,6 +127,7 @@ class FolderNode(INode[JSON, SUB_JSON, JSON], ABC):
         children = self.build()
         if not self.config.path.exists():
             self.config.path.mkdir()
+            record_dir_created(self.config.path)
 
         if url := url or []:
             (name,), sub_url = self._extract_child(children, url)
@@ -144,6 +146,7 @@ class FolderNode(INode[JSON, SUB_JSON, JSON], ABC):
                 children[key].delete(sub_url)
         elif self.config.path.exists():
             shutil.rmtree(self.config.path)
+            record_file_removed(self.config.path)
 
     @override
     def get_matrix_nodes_to_normalize(self) -> list[InputSeriesMatrix]:
@@ -34,6 +34,8 @@ from antarest.core.serde.ini_reader import (
 )
 from antarest.core.serde.ini_writer import IniWriter
 from antarest.core.serde.json import from_json
+from antarest.core.utils.files import record_file_removed
+from antarest.core.utils.io_profile import record_ini_file
 from antarest.study.storage.rawstudy.model.filesystem.config.model import (
     FileStudyTreeConfig,
 )
@@ -287,6 +289,7 @@ class IniFileNode(INode[SUB_JSON, SUB_JSON, JSON]):
             else:
                 raise ShouldNotHappenException(f"Unsupported archived study format: {self.config.archive_path.suffix}")
         else:
+            record_ini_file(self.path)
             data = self.reader.read(self.path, **kwargs)
 
         return _match_url(data, url, depth).get_part()
@@ -316,6 +319,7 @@ class IniFileNode(INode[SUB_JSON, SUB_JSON, JSON]):
 
             updated_data = _match_url(existing_data, url).replace_part(new_data)
 
+            record_ini_file(self.path)
             self.writer.write(updated_data, self.path)
 
     @override
@@ -336,8 +340,10 @@ class IniFileNode(INode[SUB_JSON, SUB_JSON, JSON]):
             if not self.path.exists():
                 raise IniFileNodeWarning(f"Cannot delete item {url!r}: Config file not found")
 
+            record_ini_file(self.path)
             if not url:
                 self.config.path.unlink()
+                record_file_removed(self.config.path)
                 return
 
             url_len = len(url)
@@ -14,6 +14,7 @@ from typing import Generic
 
 from typing_extensions import override
 
+from antarest.core.utils.files import record_file_removed
 from antarest.study.storage.rawstudy.model.filesystem.inode import G, INode, S, V
 
 
@@ -49,6 +50,7 @@ class LazyNode(INode, ABC, Generic[G, S, V]):  # type: ignore
         self._assert_url_end(url)
         if self.config.path.exists():
             self.config.path.unlink()
+            record_file_removed(self.config.path)
 
     @override
     def save(self, data: S, url: list[str] | None = None) -> None:
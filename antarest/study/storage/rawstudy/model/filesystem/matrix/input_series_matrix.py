@@ -25,6 +25,8 @@ from antarest.core.exceptions import ChildNotFoundError
 from antarest.core.model import JSON
 from antarest.core.serde.matrix_export import write_dataframe_in_tsv_format
 from antarest.core.utils.archives import read_original_file_in_archive
+from antarest.core.utils.files import break_hardlink, record_file_removed, record_file_written
+from antarest.core.utils.io_profile import record_matrix_read, record_matrix_written
 from antarest.core.utils.polars import create_polars_dataframe, read_input_dataframe
 from antarest.core.utils.utils import StopWatch
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig
@@ -113,6 +115,7 @@ class InputSeriesMatrix(LazyNode[bytes | JSON, MatrixId | MatrixContent, JSON]):
         link_path = self._get_link_path()
         if link_path.exists():
             link_path.unlink()
+            record_file_removed(link_path)
 
     def save_matrix(self, matrix_id: str) -> None:
         """
@@ -127,9 +130,11 @@ class InputSeriesMatrix(LazyNode[bytes | JSON, MatrixId | MatrixContent, JSON]):
             link_path = self._get_link_path()
             if not link_path.parent.exists():
                 link_path.parent.mkdir(parents=True)
+            break_hardlink(link_path)
             link_path.write_text(matrix_id)
             if self.config.path.exists():
                 self.config.path.unlink()
+                record_file_removed(self.config.path)
         else:
             matrix = self._matrix_storage_context.matrix_service.get(matrix_id)
             self.dump(matrix)
@@ -197,7 +202,9 @@ class InputSeriesMatrix(LazyNode[bytes | JSON, MatrixId | MatrixContent, JSON]):
 
         self.config.path.parent.mkdir(exist_ok=True, parents=True)
         if isinstance(data, bytes):
+            break_hardlink(self.config.path)
             self.config.path.write_bytes(data)
+            record_matrix_written()
             self._remove_link()
         else:
             if isinstance(data, dict):
@@ -228,6 +235,7 @@ class InputSeriesMatrix(LazyNode[bytes | JSON, MatrixId | MatrixContent, JSON]):
         else:
             try:
                 matrix = read_input_dataframe(file_path, has_headers=False)
+                record_matrix_read()
                 matrix.columns = [str(i) for i in range(len(matrix.columns))]
             except FileNotFoundError as e:
                 # Some matrices are optional and not required by the Simulator. If so, we shouldn't raise.
@@ -256,10 +264,12 @@ class InputSeriesMatrix(LazyNode[bytes | JSON, MatrixId | MatrixContent, JSON]):
 
         # If the DataFrame content corresponds to the `default_empty` attribute, we should just create an empty file.
         # This way, we can write the content quicker, and the file takes less place on the fs.
+        break_hardlink(self.config.path)
         if df.is_empty() or (self.default_empty is not None and np.array_equal(df.to_numpy(), self.default_empty())):
             self.config.path.write_text("")
         else:
             write_dataframe_in_tsv_format(df, self.config.path)
+        record_matrix_written()
 
         self._remove_link()
 
@@ -277,9 +287,12 @@ class InputSeriesMatrix(LazyNode[bytes | JSON, MatrixId | MatrixContent, JSON]):
 
         Conserves normalized status.
         """
-        target_path = self.config.path.parent.joinpath(f"{target}{''.join(self._infer_path().suffixes)}")
+        source_path = self._infer_path()
+        target_path = self.config.path.parent.joinpath(f"{target}{''.join(source_path.suffixes)}")
         target_path.unlink(missing_ok=True)
-        self._infer_path().rename(target_path)
+        source_path.rename(target_path)
+        record_file_removed(source_path)
+        record_file_written(target_path)
 
     def copy_file(self, target: str) -> None:
         """
@@ -290,6 +303,7 @@ class InputSeriesMatrix(LazyNode[bytes | JSON, MatrixId | MatrixContent, JSON]):
         target_path = self.config.path.parent.joinpath(f"{target}{''.join(self._infer_path().suffixes)}")
         target_path.unlink(missing_ok=True)
         shutil.copy(self._infer_path(), target_path)
+        record_file_written(target_path)
 
     @override
     def get_file_content(self) -> OriginalFile:
@@ -0,0 +1,53 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Parallel parsing of the matrices of a study.
+
+Parsing the TSV files of the matrices is the main cost of their normalization: the matrices are parsed
+by a pool of threads (the parsing releases the GIL), while the caller hashes and stores the matrices
+already parsed.
+"""
+
+import contextvars
+import os
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import polars as pl
+
+from antarest.study.storage.rawstudy.model.filesystem.matrix.input_series_matrix import InputSeriesMatrix
+
+# Default number of threads used to parse matrices
+PARSING_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def parse_matrices(nodes: Sequence[InputSeriesMatrix], max_workers: int = PARSING_WORKERS) -> Iterator[pl.DataFrame]:
+    """
+    Parses the content of matrix nodes with a pool of threads.
+
+    The matrices are yielded in the order of the nodes, and at most `2 * max_workers`
+    matrices are held in memory at once. The matrices are parsed in the context of the caller
+    (for instance, to profile their reading).
+    """
+    if max_workers <= 1 or len(nodes) <= 1:
+        yield from (node.parse_content() for node in nodes)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="MatrixParser") as executor:
+        pending: deque[Future[pl.DataFrame]] = deque()
+        for node in nodes:
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+            context = contextvars.copy_context()
+            pending.append(executor.submit(context.run, node.parse_content))
+        while pending:
+            yield pending.popleft().result()
@@ -18,7 +18,7 @@ from typing_extensions import override
 from antarest.core.exceptions import ChildNotFoundError, MustNotModifyOutputException
 from antarest.core.model import JSON
 from antarest.output.filestudy.utils import get_start_column, parse_output_file_as_pandas_dataframe
-from antarest.study.model import MatrixFrequency
+from antarest.study.model import MatrixFrequency, MatrixSlice
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig
 from antarest.study.storage.rawstudy.model.filesystem.lazy_node import LazyNode
 
@@ -39,11 +39,14 @@ class OutputSeriesMatrix(LazyNode[bytes | JSON, bytes | JSON, JSON]):
     def get_lazy_content(self, url: list[str] | None = None, depth: int = -1, expanded: bool = False) -> str:
         return f"matrix://{self.config.path.name}"
 
-    def parse_dataframe(self) -> pd.DataFrame:
+    def parse_dataframe(self, matrix_slice: MatrixSlice | None = None) -> pd.DataFrame:
+        """
+        Parses the matrix, or only the requested part of it when a slice is given.
+        """
         output_first_column = get_start_column(self.freq)
         file_path = self.config.path
         try:
-            return parse_output_file_as_pandas_dataframe(file_path, output_first_column)
+            return parse_output_file_as_pandas_dataframe(file_path, output_first_column, matrix_slice)
         except FileNotFoundError as e:
             # Raise 404 'Not Found' if the TSV file is not found
             logger.warning(f"Matrix file'{file_path}' not found")
@@ -14,6 +14,7 @@ import logging
 
 from typing_extensions import override
 
+from antarest.core.utils.files import break_hardlink
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig
 from antarest.study.storage.rawstudy.model.filesystem.lazy_node import LazyNode
 
@@ -53,4 +54,5 @@ class RawFileNode(LazyNode[bytes, bytes, str]):
     @override
     def dump(self, data: bytes, url: list[str] | None = None) -> None:
         self.config.path.parent.mkdir(exist_ok=True, parents=True)
+        break_hardlink(self.config.path)
         self.config.path.write_bytes(data)
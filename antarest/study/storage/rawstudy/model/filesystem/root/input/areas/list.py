@@ -14,6 +14,7 @@
 from typing_extensions import override
 
 from antarest.core.utils.archives import extract_lines_from_archive
+from antarest.core.utils.files import break_hardlink, record_file_removed
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig
 from antarest.study.storage.rawstudy.model.filesystem.inode import INode
 from antarest.study.storage.rawstudy.model.filesystem.matrix.matrix_storage_context import MatrixStorageContext
@@ -53,9 +54,11 @@ class InputAreasList(INode[list[str], list[str], list[str]]):
     @override
     def save(self, data: list[str], url: list[str] | None = None) -> None:
         self._assert_not_in_zipped_file()
+        break_hardlink(self.config.path)
         self.config.path.write_text("\n".join(data))
 
     @override
     def delete(self, url: list[str] | None = None) -> None:
         if self.config.path.exists():
             self.config.path.unlink()
+            record_file_removed(self.config.path)
@@ -20,6 +20,7 @@ from typing_extensions import override
 from antarest.core.model import JSON
 from antarest.core.serde.ini_reader import IReader
 from antarest.core.serde.ini_writer import IniWriter
+from antarest.core.utils.files import break_hardlink
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig
 from antarest.study.storage.rawstudy.model.filesystem.ini_file_node import IniFileNode
 
@@ -63,6 +64,7 @@ class YAMLWriter(IniWriter):
 
     @override
     def write(self, data: JSON, path: Path) -> None:
+        break_hardlink(path)
         with open(path, "wb") as fh:
             fh.write(yaml.safe_dump(data).encode("utf-8"))
 
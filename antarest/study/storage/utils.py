@@ -53,6 +53,7 @@ from antarest.core.serde.ini_reader import IniReader
 from antarest.core.serde.ini_writer import IniWriter
 from antarest.core.utils.archives import extract_archive_from_path, extract_archive_from_stream
 from antarest.core.utils.fastapi_sqlalchemy import db
+from antarest.core.utils.files import break_hardlink
 from antarest.core.utils.utils import current_time
 from antarest.login.model import Group, Identity
 from antarest.login.utils import get_user_impersonator, require_current_user
@@ -691,6 +692,8 @@ def update_study_from_raw_metadata(study: Study, file_study: "FileStudy") -> Non
 
 
 def dump_dataframe(df: pl.DataFrame, path_or_buf: Path | io.BytesIO) -> None:
+    if isinstance(path_or_buf, Path):
+        break_hardlink(path_or_buf)
     if df.is_empty() and isinstance(path_or_buf, Path):
         path_or_buf.write_bytes(b"")
     else:
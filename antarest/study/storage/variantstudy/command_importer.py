@@ -0,0 +1,254 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Bulk import of variant study commands.
+
+The commands are read from a file in the NDJSON format (one JSON command per line),
+so that large batches of commands can be appended to a variant without holding them all in memory:
+
+1. the commands are validated by chunks, and the resulting command blocks are spooled to a temporary file;
+2. the command blocks are then inserted with bulk `INSERT` statements, in a single transaction.
+
+Nothing is appended if one of the commands is not valid.
+"""
+
+import logging
+import tempfile
+import uuid
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+from antares.study.version import StudyVersion
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from antarest.core.exceptions import CommandNotValid
+from antarest.core.serde.json import from_json, to_json_string
+from antarest.core.tasks.service import ITaskNotifier
+from antarest.core.utils.utils import current_time
+from antarest.study.dao.database.sql_utils import begin_write
+from antarest.study.model import Study
+from antarest.study.storage.variantstudy.business.utils import transform_command_to_dto
+from antarest.study.storage.variantstudy.command_factory import CommandFactory
+from antarest.study.storage.variantstudy.command_matrix_usage_provider import index_command_block_matrices
+from antarest.study.storage.variantstudy.model.command.icommand import ICommand
+from antarest.study.storage.variantstudy.model.dbmodel import CommandBlock, CommandBlockMatrix
+from antarest.study.storage.variantstudy.model.model import CommandDTO, CommandDTOAPI
+
+logger = logging.getLogger(__name__)
+
+# Number of commands validated and inserted at once
+CHUNK_SIZE = 1000
+
+
+def lock_next_command_index(session: Session, study_id: str) -> int:
+    """
+    Locks the commands of a variant study until the end of the transaction, and returns the index of the next one.
+
+    The row of the study is locked (`SELECT ... FOR UPDATE`), so that concurrent appends get distinct indexes.
+    On SQLite, which has no row locks, the transaction takes the write lock of the database instead.
+    """
+    begin_write(session)
+    session.execute(select(Study.id).where(Study.id == study_id).with_for_update())
+    last_index = session.execute(
+        select(func.max(CommandBlock.index)).where(CommandBlock.study_id == study_id)
+    ).scalar_one()
+    return 0 if last_index is None else last_index + 1
+
+
+def build_command_blocks(
+    command_objs: Sequence[ICommand],
+    validated_commands: Sequence[CommandDTO],
+    first_index: int,
+    user_id: int | str | None,
+) -> list[CommandBlock]:
+    """
+    Builds the command blocks storing validated commands, with the matrices they use.
+
+    Args:
+        command_objs: The commands, as returned by the command factory.
+        validated_commands: The DTOs of these commands, one per command block.
+        first_index: The index of the first command block in the variant study.
+        user_id: The ID of the author of the commands.
+
+    Returns:
+        The command blocks, in the same order as the DTOs.
+    """
+    command_blocks = []
+    updated_at = current_time()
+    start = 0
+    for i, command in enumerate(validated_commands):
+        # Each argument of a command DTO is converted to a single command
+        end = start + len(command.get_args_list())
+        # noinspection PyArgumentList
+        command_block = CommandBlock(
+            id=str(uuid.uuid4()),
+            command=command.action,
+            args=to_json_string(command.args),
+            index=(first_index + i),
+            version=command.version,
+            study_version=str(command.study_version),
+            user_id=user_id,
+            updated_at=updated_at,
+        )
+        index_command_block_matrices(command_block, command_objs[start:end])
+        command_blocks.append(command_block)
+        start = end
+    return command_blocks
+
+
+class CommandImporter:
+    """
+    Appends the commands of an NDJSON file to a variant study.
+
+    Args:
+        command_factory: The factory used to validate the commands.
+        study_id: The ID of the variant study.
+        study_version: The version of the variant study.
+        user_id: The ID of the author of the commands.
+        chunk_size: The number of commands validated and inserted at once.
+    """
+
+    def __init__(
+        self,
+        command_factory: CommandFactory,
+        study_id: str,
+        study_version: StudyVersion,
+        user_id: int | None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self.command_factory = command_factory
+        self.study_id = study_id
+        self.study_version = study_version
+        self.user_id = user_id
+        self.chunk_size = chunk_size
+
+    def _read_chunks(self, commands_file: Path) -> Iterator[tuple[list[tuple[int, bytes]], float]]:
+        """
+        Reads the non-empty lines of the file by chunks.
+
+        Yields:
+            The numbered lines of the chunk, and the proportion of the file read so far.
+        """
+        total_size = max(1, commands_file.stat().st_size)
+        read_size = 0
+        chunk: list[tuple[int, bytes]] = []
+        with commands_file.open("rb") as f:
+            for line_number, line in enumerate(f, start=1):
+                read_size += len(line)
+                if line.strip():
+                    chunk.append((line_number, line))
+                if len(chunk) >= self.chunk_size:
+                    yield chunk, read_size / total_size
+                    chunk = []
+        if chunk:
+            yield chunk, 1.0
+
+    def _validate_chunk(self, chunk: list[tuple[int, bytes]]) -> list[CommandBlock]:
+        commands: list[CommandDTO] = []
+        command_objs: list[ICommand] = []
+        for line_number, line in chunk:
+            try:
+                api_command = CommandDTOAPI.model_validate_json(line)
+                command = CommandDTO(
+                    action=api_command.action,
+                    args=api_command.args,
+                    version=api_command.version,
+                    study_version=self.study_version,
+                )
+                command_objs.extend(self.command_factory.to_command(command))
+            except Exception as e:
+                logger.error(f"Command at line {line_number} for study {self.study_id}", exc_info=e)
+                raise CommandNotValid(f"Command at line {line_number} for study {self.study_id}") from None
+            commands.append(command)
+        validated_commands = transform_command_to_dto(command_objs, commands)
+        # The indexes are set when the command blocks are inserted
+        return build_command_blocks(command_objs, validated_commands, 0, self.user_id)
+
+    @staticmethod
+    def _to_spool_line(command_block: CommandBlock) -> str:
+        return to_json_string(
+            {
+                "id": command_block.id,
+                "command": command_block.command,
+                "version": command_block.version,
+                "args": command_block.args,
+                "study_version": command_block.study_version,
+                "generates_matrices": command_block.generates_matrices,
+                "matrices": [matrix.matrix_id for matrix in command_block.matrices],
+            }
+        )
+
+    def _insert(self, spool_file: Path, session: Session) -> int:
+        """
+        Inserts the spooled command blocks at the end of the commands of the variant.
+
+        Returns:
+            The number of inserted command blocks.
+        """
+        first_index = lock_next_command_index(session, self.study_id)
+        updated_at = current_time()
+        count = 0
+        with spool_file.open("rb") as f:
+            while lines := [line for _, line in zip(range(self.chunk_size), f)]:
+                block_rows: list[dict[str, Any]] = []
+                matrix_rows: list[dict[str, Any]] = []
+                for line in lines:
+                    row = from_json(line)
+                    matrix_rows.extend({"block_id": row["id"], "matrix_id": matrix_id} for matrix_id in row["matrices"])
+                    del row["matrices"]
+                    row.update(
+                        study_id=self.study_id,
+                        index=first_index + count,
+                        user_id=self.user_id,
+                        updated_at=updated_at,
+                        matrices_indexed=True,
+                    )
+                    block_rows.append(row)
+                    count += 1
+                session.execute(insert(CommandBlock), block_rows)
+                if matrix_rows:
+                    session.execute(insert(CommandBlockMatrix), matrix_rows)
+        return count
+
+    def import_file(self, commands_file: Path, session: Session, notifier: ITaskNotifier | None = None) -> int:
+        """
+        Validates the commands of the file, and appends them to the variant study.
+
+        Args:
+            commands_file: The NDJSON file containing the commands.
+            session: The database session, committed once all commands are inserted.
+            notifier: Notified of the progress of the validation.
+
+        Returns:
+            The number of appended command blocks.
+
+        Raises:
+            CommandNotValid: If a command is not valid. No command is appended.
+        """
+        progress = 0
+        with tempfile.TemporaryDirectory(dir=commands_file.parent) as tmp_dir:
+            spool_file = Path(tmp_dir) / "command_blocks.ndjson"
+            with spool_file.open("w") as spool:
+                for chunk, read_ratio in self._read_chunks(commands_file):
+                    for command_block in self._validate_chunk(chunk):
+                        spool.write(self._to_spool_line(command_block) + "\n")
+                    # The insertion is short compared to the validation
+                    new_progress = min(99, int(read_ratio * 100))
+                    if notifier and new_progress > progress:
+                        progress = new_progress
+                        notifier.notify_progress(progress)
+            count = self._insert(spool_file, session)
+        session.commit()
+        logger.info(f"{count} command blocks appended to variant study {self.study_id}")
+        return count
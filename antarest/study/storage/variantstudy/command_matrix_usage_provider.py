@@ -9,8 +9,9 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+import hashlib
 import logging
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 
 from typing_extensions import override
 
@@ -21,14 +22,48 @@ from antarest.study.repository import AccessPermissions, StudyFilter
 from antarest.study.storage.study_storage_interface import IStudyStorage
 from antarest.study.storage.variantstudy.command_factory import CommandFactory
 from antarest.study.storage.variantstudy.model.command.icommand import ICommand
-from antarest.study.storage.variantstudy.model.dbmodel import CommandBlock
-from antarest.study.storage.variantstudy.model.model import CommandDTO
+from antarest.study.storage.variantstudy.model.dbmodel import CommandBlock, CommandBlockMatrix
 from antarest.study.storage.variantstudy.repository import VariantStudyRepository
 
 logger = logging.getLogger(__name__)
 
 
+def index_command_block_matrices(command_block: CommandBlock, commands: Sequence[ICommand]) -> None:
+    """
+    Records in a command block the matrices used by its commands.
+
+    Args:
+        command_block: The command block to index.
+        commands: The commands stored in this block.
+    """
+    matrix_ids: set[str] = set()
+    generates_matrices = False
+    for command in commands:
+        inner_matrices = command.get_inner_matrices()
+        matrix_ids.update(inner_matrices.matrices)
+        generates_matrices = generates_matrices or inner_matrices.generates_matrices_at_run_time
+    command_block.matrices = [CommandBlockMatrix(matrix_id=matrix_id) for matrix_id in sorted(matrix_ids)]
+    command_block.generates_matrices = generates_matrices
+    command_block.matrices_indexed = True
+    command_block.matrices_index_failure = None
+
+
+def _get_content_digest(command_block: CommandBlock) -> str:
+    content = "\n".join(
+        [command_block.command, str(command_block.version), command_block.study_version, command_block.args]
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
 class CommandMatrixUsageProvider(IMatrixUsageProvider):
+    """
+    Provides the matrices used by the commands of the variant studies.
+
+    The matrices used by a command block are indexed when the block is written, so that they are
+    listed with a single query. The blocks written by older versions of the application are indexed
+    the first time the matrix usage is requested.
+    """
+
     def __init__(
         self,
         variant_study_repo: VariantStudyRepository,
@@ -41,40 +76,46 @@ class CommandMatrixUsageProvider(IMatrixUsageProvider):
         self.matrix_service.register_usage_provider(self)
         self.storage_mapping = storage_mapping
 
-    @override
-    def get_matrix_usage(self) -> Iterable[MatrixReference]:
-        logger.info("Getting all matrices used in variant studies")
-        # First gets all matrices used in commands
-        command_blocks: list[CommandBlock] = self.variant_study_repo.get_all_command_blocks()
-
-        def transform_to_command(command_dto: CommandDTO, study_ref: str) -> list[ICommand]:
+    def _index_command_blocks(self) -> None:
+        # The blocks which already failed to be parsed are skipped, unless their content changed since
+        command_blocks = [
+            (command_block, digest)
+            for command_block in self.variant_study_repo.get_unindexed_command_blocks()
+            if command_block.matrices_index_failure != (digest := _get_content_digest(command_block))
+        ]
+        if not command_blocks:
+            return
+        logger.info(f"Indexing the matrices used by {len(command_blocks)} command blocks")
+        for command_block, digest in command_blocks:
             try:
-                return self.command_factory.to_command(command_dto)
+                commands = self.command_factory.to_command(command_block.to_dto())
             except Exception as e:
+                # The block stays unindexed: its matrices cannot be known
                 logger.warning(
-                    f"Failed to parse command {command_dto} (from study {study_ref}) !",
+                    f"Failed to parse command {command_block.id} (from study {command_block.study_id}) !",
                     exc_info=e,
                 )
-            return []
+                command_block.matrices_index_failure = digest
+                continue
+            index_command_block_matrices(command_block, commands)
+        self.variant_study_repo.session.commit()
 
-        variant_study_commands = [
-            (cmd, c.study_id) for c in command_blocks for cmd in transform_to_command(c.to_dto(), c.study_id)
-        ]
-        snapshots_to_check = set()
-        for command, study_id in variant_study_commands:
-            inner_matrices = command.get_inner_matrices()
-            if inner_matrices.generates_matrices_at_run_time:
-                snapshots_to_check.add(study_id)
-            for matrix_id in inner_matrices.matrices:
-                mat_reference = MatrixReference(
-                    matrix_id=matrix_id,
-                    use_description=f"Used by command {command.command_id} from variant study {study_id}",
-                )
-                yield mat_reference
+    @override
+    def get_matrix_usage(self) -> Iterable[MatrixReference]:
+        logger.info("Getting all matrices used in variant studies")
+        self._index_command_blocks()
+
+        # First gets all matrices used in commands
+        for matrix_id, block_id, study_id in self.variant_study_repo.get_command_block_matrices():
+            yield MatrixReference(
+                matrix_id=matrix_id,
+                use_description=f"Used by command {block_id} from variant study {study_id}",
+            )
 
         # For variants with a command that generated matrices at the runtime, yield all matrices in the snapshot.
         study_filter = StudyFilter(
-            study_ids=list(snapshots_to_check), access_permissions=AccessPermissions(is_admin=True)
+            study_ids=self.variant_study_repo.get_study_ids_generating_matrices(),
+            access_permissions=AccessPermissions(is_admin=True),
         )
         for study in self.variant_study_repo.get_all(study_filter):
             yield from self.storage_mapping[study.storage_mode].yield_matrix_references(study)
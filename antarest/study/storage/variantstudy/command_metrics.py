@@ -0,0 +1,113 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Metrics of the commands applied during variant generations.
+"""
+
+from collections.abc import Iterable
+
+from prometheus_client import CollectorRegistry, Counter, Histogram
+
+from antarest.core.metrics import WORKER_ID
+from antarest.study.storage.variantstudy.model.model import DetailsDTO, NewDetailsDTO
+
+_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+_BYTES_BUCKETS = tuple(1024 * 4**k for k in range(11))  # from 1 KiB to 1 GiB
+
+
+def _profiled_details(details: Iterable[DetailsDTO]) -> list[NewDetailsDTO]:
+    return [detail for detail in details if isinstance(detail, dict) and "metrics" in detail]
+
+
+def get_slowest_commands(details: Iterable[DetailsDTO], limit: int) -> list[NewDetailsDTO]:
+    """
+    Returns the details of the slowest commands, by decreasing duration.
+
+    The details without metrics (generated by older versions) are ignored.
+    """
+    profiled = _profiled_details(details)
+    profiled.sort(key=lambda detail: detail["metrics"]["duration"], reverse=True)
+    return profiled[:limit]
+
+
+class CommandMetricsRecorder:
+    """
+    Exports the metrics of the applied commands, by command name.
+    """
+
+    def __init__(self, registry: CollectorRegistry) -> None:
+        labels = ["worker_id", "command"]
+        self._duration_histo = Histogram(
+            "variant_commands_duration_seconds",
+            "Duration of the application of commands in seconds",
+            labels,
+            registry=registry,
+        )
+        self._matrices_read_histo = Histogram(
+            "variant_commands_matrices_read",
+            "Number of matrices read by commands",
+            labels,
+            buckets=_COUNT_BUCKETS,
+            registry=registry,
+        )
+        self._matrices_written_histo = Histogram(
+            "variant_commands_matrices_written",
+            "Number of matrices written by commands",
+            labels,
+            buckets=_COUNT_BUCKETS,
+            registry=registry,
+        )
+        self._bytes_read_histo = Histogram(
+            "variant_commands_read_bytes",
+            "Number of bytes read by commands",
+            labels,
+            buckets=_BYTES_BUCKETS,
+            registry=registry,
+        )
+        self._bytes_written_histo = Histogram(
+            "variant_commands_written_bytes",
+            "Number of bytes written by commands",
+            labels,
+            buckets=_BYTES_BUCKETS,
+            registry=registry,
+        )
+        self._ini_files_histo = Histogram(
+            "variant_commands_ini_files_touched",
+            "Number of INI files touched by commands",
+            labels,
+            buckets=_COUNT_BUCKETS,
+            registry=registry,
+        )
+        self._cache_invalidations_counter = Counter(
+            "variant_commands_cache_invalidations",
+            "Number of commands invalidating the study cache",
+            labels,
+            registry=registry,
+        )
+
+    def record(self, details: Iterable[DetailsDTO]) -> None:
+        """
+        Records the metrics of the commands applied during a generation.
+        """
+        for detail in _profiled_details(details):
+            metrics = detail["metrics"]
+            labels = (WORKER_ID, detail["name"])
+            self._duration_histo.labels(*labels).observe(metrics["duration"])
+            self._matrices_read_histo.labels(*labels).observe(metrics["matrices_read"])
+            self._matrices_written_histo.labels(*labels).observe(metrics["matrices_written"])
+            if metrics["bytes_read"] is not None:
+                self._bytes_read_histo.labels(*labels).observe(metrics["bytes_read"])
+            if metrics["bytes_written"] is not None:
+                self._bytes_written_histo.labels(*labels).observe(metrics["bytes_written"])
+            self._ini_files_histo.labels(*labels).observe(metrics["ini_files_touched"])
+            if metrics["cache_invalidated"]:
+                self._cache_invalidations_counter.labels(*labels).inc()
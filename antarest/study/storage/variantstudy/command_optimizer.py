@@ -0,0 +1,108 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Optimization of the list of commands applied to generate a variant.
+
+Commands are removed when they have no effect on the generated study:
+
+- a command superseded by a later one (for instance, the same `UpdateConfig` target updated twice),
+  provided that no command in between conflicts with it;
+- a command reverted by a later one (for instance, a thermal cluster created then removed),
+  provided that no command in between depends on them, and that the reverted command is known to succeed.
+
+Removing a command must not hide its failure: the generation of a variant stops at the first failing command.
+A superseded command fails only if the command superseding it fails too, since nothing in between changes
+what it checks. A reverted command is removed only when an earlier command guarantees its success
+(see `ICommand.ensures_success`), otherwise both commands are kept.
+
+The commands whose footprint is unknown (see `ICommand.get_footprint`) are never removed,
+and no optimization is done across them.
+"""
+
+import logging
+from collections.abc import Sequence
+
+from antarest.study.storage.variantstudy.model.command.common import CommandFootprint
+from antarest.study.storage.variantstudy.model.command.icommand import ICommand
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of commands looked back for each command, to bound the optimization time.
+_MAX_LOOKBACK = 1000
+
+
+def _succeeds(
+    commands: Sequence[ICommand], footprints: Sequence[CommandFootprint | None], removed: Sequence[bool], index: int
+) -> bool:
+    """
+    Checks whether an earlier command guarantees the success of the command at the given index.
+    """
+    command, footprint = commands[index], footprints[index]
+    assert footprint is not None
+    for k in range(index - 1, max(index - _MAX_LOOKBACK, 0) - 1, -1):
+        if removed[k]:
+            continue
+        if commands[k].ensures_success(command):
+            return True
+        previous_footprint = footprints[k]
+        if previous_footprint is None or previous_footprint.conflicts_with(footprint):
+            return False
+    return False
+
+
+def optimize_commands(commands: Sequence[ICommand]) -> list[ICommand]:
+    """
+    Removes the commands which have no effect on the generated study.
+
+    Args:
+        commands: The commands to apply, in order.
+
+    Returns:
+        The commands to apply, in the same order, without the useless ones.
+    """
+    footprints = [command.get_footprint() for command in commands]
+    removed = [False] * len(commands)
+
+    for j, command in enumerate(commands):
+        footprint = footprints[j]
+        # Resources read and written by the commands kept between the candidate and the current command
+        between = CommandFootprint()
+        for i in range(j - 1, max(j - _MAX_LOOKBACK, 0) - 1, -1):
+            if removed[i]:
+                continue
+            previous, previous_footprint = commands[i], footprints[i]
+            if previous_footprint is None:
+                break
+
+            if command.supersedes(previous):
+                if not previous_footprint.conflicts_with(between):
+                    removed[i] = True
+                    continue
+
+            elif footprint is not None and command.cancels(previous):
+                both = CommandFootprint(
+                    reads=previous_footprint.reads | footprint.reads,
+                    writes=previous_footprint.writes | footprint.writes,
+                )
+                if not both.conflicts_with(between) and _succeeds(commands, footprints, removed, i):
+                    removed[i] = removed[j] = True
+                    break
+
+            between = CommandFootprint(
+                reads=between.reads | previous_footprint.reads,
+                writes=between.writes | previous_footprint.writes,
+            )
+
+    optimized = [command for command, is_removed in zip(commands, removed, strict=True) if not is_removed]
+    if len(optimized) < len(commands):
+        logger.info(f"{len(commands) - len(optimized)} commands out of {len(commands)} are useless and skipped")
+    return optimized
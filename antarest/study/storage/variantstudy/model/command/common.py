@@ -9,9 +9,10 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+from collections.abc import Set
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Generic, TypeVar
+from typing import Generic, TypeAlias, TypeVar
 
 T = TypeVar("T")
 
@@ -115,3 +116,84 @@ class InnerMatrices:
     matrices: list[str] = field(default_factory=list)
     # If the command generates matrices at the runtime, it cannot return them in the `matrices` attribute. If so, we should check the variant snapshot.
     generates_matrices_at_run_time: bool = False
+
+
+StudyResource: TypeAlias = tuple[str, ...]
+"""
+Part of a study read or written by a command, for instance `("area", "fr", "thermal")`.
+
+Resources are hierarchical: `("area", "fr")` contains `("area", "fr", "thermal")`.
+"""
+
+
+def resources_overlap(first: StudyResource, second: StudyResource) -> bool:
+    """
+    Checks whether two resources overlap, i.e. if one of them contains the other.
+    """
+    size = min(len(first), len(second))
+    return first[:size] == second[:size]
+
+
+def _any_overlap(first: Set[StudyResource], second: Set[StudyResource]) -> bool:
+    return any(resources_overlap(a, b) for a in first for b in second)
+
+
+@dataclass(frozen=True)
+class CommandFootprint:
+    """
+    Study resources read and written by a command.
+
+    Attributes:
+        reads: Resources on which the result of the command depends.
+        writes: Resources modified by the command.
+    """
+
+    reads: frozenset[StudyResource] = frozenset()
+    writes: frozenset[StudyResource] = frozenset()
+
+    def conflicts_with(self, other: "CommandFootprint") -> bool:
+        """
+        Checks whether the order in which the two commands are applied matters.
+        """
+        return _any_overlap(self.writes, other.reads | other.writes) or _any_overlap(other.writes, self.reads)
+
+
+# Folders of the `input` directory containing one sub-folder per area, after one level of sub-folders
+_AREA_FOLDERS: dict[str, set[str]] = {
+    "thermal": {"clusters", "series", "prepro"},
+    "renewables": {"clusters", "series"},
+    "st-storage": {"clusters", "series"},
+    "hydro": {"series", "allocation"},
+}
+
+
+def get_resource_from_path(path: str) -> StudyResource | None:
+    """
+    Returns the resource corresponding to a path of the study tree,
+    or `None` if the path cannot be associated with a resource.
+
+    For instance, `input/thermal/series/fr/gas/series` corresponds to `("area", "fr", "thermal")`.
+    """
+    parts = path.strip("/").split("/")
+    if parts[0] == "settings":
+        # For instance: `settings/generaldata/general/nbyears`
+        return tuple(parts)
+    if len(parts) < 3 or parts[0] != "input":
+        return None
+    folder = parts[1]
+    if folder == "bindingconstraints":
+        return ("constraints",)
+    if folder == "areas" and parts[2] not in ("list", "sets"):
+        # For instance: `input/areas/fr/optimization`
+        return "area", parts[2]
+    if folder == "links":
+        # For instance: `input/links/fr/properties`
+        return "area", parts[2], folder
+    if folder in ("load", "solar", "wind") and parts[2] == "series" and len(parts) > 3:
+        # For instance: `input/load/series/load_fr`
+        prefix = f"{folder}_"
+        return ("area", parts[3].removeprefix(prefix), folder) if parts[3].startswith(prefix) else None
+    if parts[2] in _AREA_FOLDERS.get(folder, ()) and len(parts) > 3:
+        # For instance: `input/thermal/clusters/fr/list`
+        return "area", parts[3], folder
+    return None
@@ -39,6 +39,7 @@ from antarest.study.storage.variantstudy.model.command.common import (
     CommandOutput,
     command_succeeded,
 )
+from antarest.study.storage.variantstudy.model.command.create_cluster import CreateCluster
 from antarest.study.storage.variantstudy.model.command.icommand import ICommand
 from antarest.study.storage.variantstudy.model.command_listener.command_listener import ICommandListener
 from antarest.study.storage.variantstudy.model.model import CommandDTO
@@ -128,3 +129,8 @@ class CreateArea(ICommand):
             study_version=self.study_version,
             version=self._SERIALIZATION_VERSION,
         )
+
+    @override
+    def ensures_success(self, command: ICommand) -> bool:
+        # A new area has no thermal cluster yet
+        return isinstance(command, CreateCluster) and command.area_id == transform_name_to_id(self.area_name)
@@ -32,6 +32,7 @@ from antarest.study.storage.rawstudy.model.filesystem.config.thermal import (
 from antarest.study.storage.rawstudy.model.filesystem.config.validation import AreaId
 from antarest.study.storage.variantstudy.business.utils import validate_matrix
 from antarest.study.storage.variantstudy.model.command.common import (
+    CommandFootprint,
     CommandName,
     CommandOutput,
     InnerMatrices,
@@ -149,3 +150,7 @@ class CreateCluster(ICommand):
             assert isinstance(self.modulation, str)
             matrices.append(self.modulation)
         return InnerMatrices(matrices=matrices)
+
+    @override
+    def get_footprint(self) -> CommandFootprint:
+        return CommandFootprint(writes=frozenset({("area", self.area_id, "thermal")}))
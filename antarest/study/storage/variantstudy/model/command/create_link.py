@@ -24,6 +24,7 @@ from antarest.study.model import STUDY_VERSION_8_2, StudyVersionStr
 from antarest.study.storage.rawstudy.model.filesystem.config.link import parse_link
 from antarest.study.storage.variantstudy.business.utils import validate_matrix
 from antarest.study.storage.variantstudy.model.command.common import (
+    CommandFootprint,
     CommandName,
     CommandOutput,
     InnerMatrices,
@@ -154,3 +155,9 @@ class CreateLink(AbstractLinkCommand, ICommand):
     @override
     def to_dto(self) -> CommandDTO:
         return super().command_to_dto(self.parameters, self.command_name)
+
+    @override
+    def get_footprint(self) -> CommandFootprint:
+        # The link is stored in the folder of the first area, in alphabetical order
+        area_from = min(self.area1, self.area2)
+        return CommandFootprint(writes=frozenset({("area", area_from, "links")}))
@@ -25,6 +25,7 @@ from antarest.study.dao.api.study_dao import StudyDao
 from antarest.study.storage.rawstudy.model.filesystem.config.renewable import parse_renewable_cluster
 from antarest.study.storage.rawstudy.model.filesystem.config.validation import AreaId
 from antarest.study.storage.variantstudy.model.command.common import (
+    CommandFootprint,
     CommandName,
     CommandOutput,
     command_failed,
@@ -107,3 +108,10 @@ class CreateRenewablesCluster(ICommand):
             },
             study_version=self.study_version,
         )
+
+    @override
+    def get_footprint(self) -> CommandFootprint:
+        # The renewable generation modelling is defined in the settings
+        return CommandFootprint(
+            reads=frozenset({("settings",)}), writes=frozenset({("area", self.area_id, "renewables")})
+        )
@@ -27,6 +27,7 @@ from antarest.study.storage.rawstudy.model.filesystem.config.validation import A
 from antarest.study.storage.variantstudy.business.matrix_constants_generator import GeneratorMatrixConstants
 from antarest.study.storage.variantstudy.business.utils import validate_matrix
 from antarest.study.storage.variantstudy.model.command.common import (
+    CommandFootprint,
     CommandName,
     CommandOutput,
     InnerMatrices,
@@ -275,3 +276,7 @@ class CreateSTStorage(ICommand):
                     matrices[matrix_name] = v_8_6_matrices[matrix_name]()
 
         return cast(dict[str, str], matrices)
+
+    @override
+    def get_footprint(self) -> CommandFootprint:
+        return CommandFootprint(writes=frozenset({("area", self.area_id, "st-storage")}))
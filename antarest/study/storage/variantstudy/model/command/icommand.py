@@ -20,6 +20,7 @@ from antarest.study.dao.api.study_dao import StudyDao
 from antarest.study.model import StudyVersionStr
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
 from antarest.study.storage.variantstudy.model.command.common import (
+    CommandFootprint,
     CommandName,
     CommandOutput,
     InnerMatrices,
@@ -114,3 +115,38 @@ class ICommand(ABC, AntaresBaseModel, extra="forbid", arbitrary_types_allowed=Tr
         Retrieves the list of blob IDs.
         """
         return []
+
+    def get_footprint(self) -> CommandFootprint | None:
+        """
+        Method used to optimize the variant generation.
+        It retrieves the study resources read and written by the command.
+        If they are unknown, `None` is returned: the command cannot be moved, nor removed.
+        """
+        return None
+
+    def supersedes(self, previous: "ICommand") -> bool:
+        """
+        Checks whether this command overwrites everything written by a previous command,
+        which is then useless if no command in between conflicts with it.
+
+        The previous command must check nothing more than this command:
+        if it fails, this command must fail too.
+        """
+        return False
+
+    def cancels(self, previous: "ICommand") -> bool:
+        """
+        Checks whether this command reverts a previous command,
+        both are then useless if no command in between depends on them.
+
+        The previous command may fail though: both are only removed if its success is guaranteed
+        by an earlier command (see `ensures_success`).
+        """
+        return False
+
+    def ensures_success(self, command: "ICommand") -> bool:
+        """
+        Checks whether a later command cannot fail once this command succeeded,
+        provided that no command in between conflicts with it.
+        """
+        return False
@@ -15,13 +15,16 @@ from typing_extensions import override
 
 from antarest.core.exceptions import ReferencedObjectDeletionNotAllowed
 from antarest.study.business.model.binding_constraint_model import ClusterTerm
+from antarest.study.business.model.thermal_cluster_model import create_thermal_cluster
 from antarest.study.dao.api.study_dao import StudyDao
 from antarest.study.storage.variantstudy.model.command.common import (
+    CommandFootprint,
     CommandName,
     CommandOutput,
     command_failed,
     command_succeeded,
 )
+from antarest.study.storage.variantstudy.model.command.create_cluster import CreateCluster
 from antarest.study.storage.variantstudy.model.command.icommand import ICommand
 from antarest.study.storage.variantstudy.model.command_listener.command_listener import ICommandListener
 from antarest.study.storage.variantstudy.model.model import CommandDTO
@@ -75,3 +78,23 @@ class RemoveCluster(ICommand):
             args={"area_id": self.area_id, "cluster_id": self.cluster_id},
             study_version=self.study_version,
         )
+
+    @override
+    def get_footprint(self) -> CommandFootprint:
+        # The scenario builder (in the settings) and the generated time series (in the user folder) are updated
+        return CommandFootprint(
+            reads=frozenset({("constraints",)}),
+            writes=frozenset({("area", self.area_id, "thermal"), ("settings",), ("user",)}),
+        )
+
+    @override
+    def cancels(self, previous: ICommand) -> bool:
+        if not isinstance(previous, CreateCluster) or previous.area_id != self.area_id:
+            return False
+        created_id = create_thermal_cluster(previous.parameters, previous.study_version).id
+        return created_id.lower() == self.cluster_id.lower()
+
+    @override
+    def ensures_success(self, command: ICommand) -> bool:
+        # The removed cluster can be created again
+        return self.cancels(command)
@@ -19,10 +19,12 @@ from antarest.study.dao.api.study_dao import StudyDao
 from antarest.study.storage.rawstudy.raw_path_to_matrix_mapper import RawPathToMatrixMapper
 from antarest.study.storage.variantstudy.business.utils import AliasDecoder, validate_matrix
 from antarest.study.storage.variantstudy.model.command.common import (
+    CommandFootprint,
     CommandName,
     CommandOutput,
     InnerMatrices,
     command_succeeded,
+    get_resource_from_path,
 )
 from antarest.study.storage.variantstudy.model.command.icommand import ICommand
 from antarest.study.storage.variantstudy.model.command_listener.command_listener import ICommandListener
@@ -71,3 +73,13 @@ class ReplaceMatrix(ICommand):
     def get_inner_matrices(self) -> InnerMatrices:
         assert isinstance(self.matrix, str)
         return InnerMatrices(matrices=[self.matrix])
+
+    @override
+    def get_footprint(self) -> CommandFootprint | None:
+        # Aliases (starting with "@") are not resolved
+        resource = get_resource_from_path(self.target)
+        return None if resource is None else CommandFootprint(writes=frozenset({resource}))
+
+    @override
+    def supersedes(self, previous: ICommand) -> bool:
+        return isinstance(previous, ReplaceMatrix) and previous.target == self.target
@@ -21,10 +21,12 @@ from antarest.study.storage.rawstudy.model.filesystem.config.model import FileSt
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
 from antarest.study.storage.rawstudy.model.filesystem.ini_file_node import IniFileNode
 from antarest.study.storage.variantstudy.model.command.common import (
+    CommandFootprint,
     CommandName,
     CommandOutput,
     command_failed,
     command_succeeded,
+    get_resource_from_path,
 )
 from antarest.study.storage.variantstudy.model.command.icommand import ICommand
 from antarest.study.storage.variantstudy.model.command_listener.command_listener import ICommandListener
@@ -60,6 +62,11 @@ class UpdateConfig(ICommand):
     target: str
     data: _Data
 
+    def _updates_enr_modelling(self) -> bool:
+        return self.target.startswith("settings") and any(
+            key == _ENR_MODELLING_KEY for key, _ in _iter_dict(self.data, root_key=self.target)
+        )
+
     def update_in_config(self, study_data: FileStudyTreeConfig) -> None:
         # The renewable-generation-modelling parameter must be reflected in the config
         if self.target.startswith("settings"):
@@ -90,3 +97,16 @@ class UpdateConfig(ICommand):
             },
             study_version=self.study_version,
         )
+
+    @override
+    def get_footprint(self) -> CommandFootprint | None:
+        resource = get_resource_from_path(self.target)
+        return None if resource is None else CommandFootprint(writes=frozenset({resource}))
+
+    @override
+    def supersedes(self, previous: ICommand) -> bool:
+        # The previous value is replaced, unless it was also reported in the study configuration
+        if not isinstance(previous, UpdateConfig) or previous._updates_enr_modelling():
+            return False
+        url = self.target.split("/")
+        return previous.target.split("/")[: len(url)] == url
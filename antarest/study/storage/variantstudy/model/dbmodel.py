@@ -13,7 +13,7 @@
 import datetime
 import uuid
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, false
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing_extensions import override
 
@@ -55,6 +55,30 @@ class VariantStudySnapshot(Base):
         return f"[Snapshot] id={self.id}, created_at={self.created_at}"
 
 
+class CommandBlockMatrix(Base):
+    """
+    Matrix referenced by a command block.
+
+    The references are extracted when the command block is written, so that the matrices used
+    by the variant studies can be listed without parsing all their commands.
+
+    Attributes:
+        block_id: The ID of the command block.
+        matrix_id: The ID of a matrix used by the command(s) of the block.
+    """
+
+    __tablename__ = "commandblock_matrix"
+
+    block_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("commandblock.id", ondelete="CASCADE"), primary_key=True
+    )
+    matrix_id: Mapped[str] = mapped_column(String(64), primary_key=True, index=True)
+
+    @override
+    def __str__(self) -> str:
+        return f"CommandBlockMatrix(block_id={self.block_id!r}, matrix_id={self.matrix_id!r})"
+
+
 class CommandBlock(Base):
     """
     Storage of commands in database.
@@ -73,6 +97,12 @@ class CommandBlock(Base):
                        Having that information here allows to carry out some validation checks.
         user_id: Who created this command.
         updated_at: When this command was last updated.
+        matrices_indexed: Whether the matrices used by the command(s) are listed in `matrices`.
+                          Blocks written by older versions of the application are indexed lazily.
+        generates_matrices: Whether the command(s) generate matrices when applied (for instance, time series).
+        matrices_index_failure: Digest of the content of the block when its matrices could not be indexed,
+                                so that it is indexed again only once its content changes.
+        matrices: The matrices used by the command(s).
     """
 
     __tablename__ = "commandblock"
@@ -93,6 +123,14 @@ class CommandBlock(Base):
         Integer, ForeignKey("identities.id", ondelete="SET NULL"), nullable=True
     )
     updated_at: Mapped[datetime.datetime | None] = mapped_column(DateTime, nullable=True)
+    matrices_indexed: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+    generates_matrices: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+    matrices_index_failure: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    matrices: Mapped[list[CommandBlockMatrix]] = relationship(
+        CommandBlockMatrix,
+        cascade="all, delete, delete-orphan",
+        passive_deletes=True,
+    )
 
     def to_dto(self) -> CommandDTO:
         # Database may lack a version number, defaulting to 1 if so.
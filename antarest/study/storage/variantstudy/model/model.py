@@ -26,21 +26,46 @@ Legacy details DTO: triplet of name, output status and output message.
 """
 
 
+class CommandMetricsDTO(te.TypedDict):
+    """
+    Metrics recorded while applying a command.
+
+    Attributes:
+        duration: wall time of the application, in seconds.
+        matrices_read: number of matrices read.
+        matrices_written: number of matrices written.
+        bytes_read: number of bytes read, `None` if it could not be measured.
+        bytes_written: number of bytes written, `None` if it could not be measured.
+        ini_files_touched: number of distinct INI files read, written or deleted.
+        cache_invalidated: whether the command invalidated the study cache.
+    """
+
+    duration: float
+    matrices_read: int
+    matrices_written: int
+    bytes_read: int | None
+    bytes_written: int | None
+    ini_files_touched: int
+    cache_invalidated: bool
+
+
 class NewDetailsDTO(te.TypedDict):
     """
-    New details DTO: dictionary with keys 'id', 'name', 'status' and 'msg'.
+    New details DTO: dictionary with keys 'id', 'name', 'status', 'msg' and 'metrics'.
 
     Attributes:
         id: command identifier (UUID) if it exists.
         name: command name.
         status: command status (true or false).
         msg: command generation message or error message (if the status is false).
+        metrics: metrics recorded while applying the command, if they were recorded.
     """
 
     id: uuid.UUID
     name: str
     status: bool
     msg: str
+    metrics: te.NotRequired[CommandMetricsDTO]
 
 
 DetailsDTO: TypeAlias = LegacyDetailsDTO | NewDetailsDTO
@@ -21,7 +21,7 @@ from antarest.core.interfaces.cache import ICache
 from antarest.core.utils.fastapi_sqlalchemy import db
 from antarest.study.model import Study
 from antarest.study.repository import StudyMetadataRepository
-from antarest.study.storage.variantstudy.model.dbmodel import CommandBlock, VariantStudy
+from antarest.study.storage.variantstudy.model.dbmodel import CommandBlock, CommandBlockMatrix, VariantStudy
 
 
 class VariantStudyRepository(StudyMetadataRepository):
@@ -132,6 +132,40 @@ class VariantStudyRepository(StudyMetadataRepository):
         stmt = select(CommandBlock)
         return list(self.session.execute(stmt).scalars().all())
 
+    def get_unindexed_command_blocks(self) -> list[CommandBlock]:
+        """
+        Get the command blocks whose used matrices are not indexed yet.
+
+        Returns:
+            List of `CommandBlock` objects.
+        """
+        stmt = select(CommandBlock).where(CommandBlock.matrices_indexed.is_(False))
+        return list(self.session.execute(stmt).scalars().all())
+
+    def get_command_block_matrices(self) -> Sequence[tuple[str, str, str]]:
+        """
+        Get the matrices used by the indexed command blocks.
+
+        Returns:
+            List of tuples `(matrix_id, block_id, study_id)`, ordered by study and command index.
+        """
+        stmt = (
+            select(CommandBlockMatrix.matrix_id, CommandBlock.id, CommandBlock.study_id)
+            .join(CommandBlock, CommandBlock.id == CommandBlockMatrix.block_id)
+            .order_by(CommandBlock.study_id, CommandBlock.index, CommandBlockMatrix.matrix_id)
+        )
+        return [(matrix_id, block_id, study_id) for matrix_id, block_id, study_id in self.session.execute(stmt)]
+
+    def get_study_ids_generating_matrices(self) -> list[str]:
+        """
+        Get the IDs of the variant studies with commands generating matrices when they are applied.
+
+        Returns:
+            List of variant study IDs.
+        """
+        stmt = select(CommandBlock.study_id).where(CommandBlock.generates_matrices.is_(True)).distinct()
+        return list(self.session.execute(stmt).scalars().all())
+
     def find_variants(self, variant_ids: Sequence[str]) -> Sequence[VariantStudy]:
         """
         Find a list of variants by IDs
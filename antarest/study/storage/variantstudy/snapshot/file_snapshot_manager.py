@@ -11,23 +11,61 @@
 # This file is part of the Antares project.
 import logging
 import shutil
+from collections.abc import Collection
 from pathlib import Path
 
 from typing_extensions import override
 
 from antarest.core.interfaces.cache import ICache
+from antarest.core.utils.files import CopyMode, FileChanges, discard_file_changes
 from antarest.study.model import RawStudy, Study
 from antarest.study.storage.file_study_utils import export_study_to_flat_directory, get_snapshot_dir
 from antarest.study.storage.utils import remove_from_cache
 from antarest.study.storage.variantstudy.model.dbmodel import VariantStudy
+from antarest.study.storage.variantstudy.snapshot.snapshot_checkpoint import (
+    SnapshotCheckpoint,
+    list_checkpoints,
+    remove_checkpoints,
+    restore_checkpoint,
+    write_checkpoint,
+)
+from antarest.study.storage.variantstudy.snapshot.snapshot_layer import (
+    SnapshotLayer,
+    SnapshotLayerError,
+    export_snapshot_layers,
+    read_snapshot_layer,
+    remove_snapshot_layer,
+    update_snapshot_layer,
+    write_snapshot_layer,
+)
 from antarest.study.storage.variantstudy.snapshot.snapshot_manager_interface import ISnapshotManager
 
 logger = logging.getLogger(__name__)
 
 
+def _get_study_dir(study: Study) -> Path:
+    if isinstance(study, VariantStudy):
+        return get_snapshot_dir(study)
+    elif isinstance(study, RawStudy):
+        return Path(study.path)
+    else:  # pragma: no cover
+        raise TypeError(repr(type(study)))
+
+
 class FileSnapshotManager(ISnapshotManager):
-    def __init__(self, cache: ICache):
+    """
+    Manages the snapshots of variant studies stored on the file system.
+
+    Unless the copy mode is `copy`, snapshots are layered: they share the files of their
+    reference study (see `snapshot_layer`). Once a chain exceeds `max_layers` layers,
+    the snapshot is flattened, i.e. fully copied from the layers owning its files.
+    Snapshots can be checkpointed while they are generated (see `snapshot_checkpoint`).
+    """
+
+    def __init__(self, cache: ICache, copy_mode: CopyMode = CopyMode.COPY, max_layers: int = 10):
         self._cache = cache
+        self._copy_mode = copy_mode
+        self._max_layers = max_layers
 
     @override
     def is_snapshot_up_to_date(self, study: VariantStudy) -> bool:
@@ -43,14 +81,83 @@ class FileSnapshotManager(ISnapshotManager):
         snapshot_dir = get_snapshot_dir(variant_study)
         logger.info(f"Exporting the reference study '{ref_study.id}' to '{snapshot_dir.name}'...")
         shutil.rmtree(snapshot_dir, ignore_errors=True)
+        remove_snapshot_layer(snapshot_dir)
+        # The snapshot is rebuilt from its reference study: the changes recorded so far are void
+        discard_file_changes()
 
+        base_dir = _get_study_dir(ref_study)
+        ref_layer = None
         if isinstance(ref_study, VariantStudy):
             snapshot_dir.parent.mkdir(parents=True, exist_ok=True)
-            export_study_to_flat_directory(get_snapshot_dir(ref_study), snapshot_dir)
-        elif isinstance(ref_study, RawStudy):
-            export_study_to_flat_directory(Path(ref_study.path), snapshot_dir)
+            ref_layer = read_snapshot_layer(base_dir)
+        depth = ref_layer.depth + 1 if ref_layer else 1
+
+        if self._copy_mode == CopyMode.COPY:
+            export_study_to_flat_directory(base_dir, snapshot_dir, CopyMode.COPY)
+            return
+
+        flatten = depth > self._max_layers
+        copy_mode = CopyMode.COPY if flatten else self._copy_mode
+        if flatten:
+            logger.info(f"Flattening the snapshot of '{variant_study.id}' ({depth} layers)")
+        if ref_layer is None:
+            export_study_to_flat_directory(base_dir, snapshot_dir, copy_mode)
+        else:
+            try:
+                export_snapshot_layers(base_dir, snapshot_dir, copy_mode)
+            except SnapshotLayerError as e:
+                # The reference snapshot is still a consistent copy of the study: it is exported as a whole
+                logger.warning(f"Exporting the reference snapshot '{base_dir}' as a whole: {e}")
+                shutil.rmtree(snapshot_dir, ignore_errors=True)
+                export_study_to_flat_directory(base_dir, snapshot_dir, copy_mode)
+        if not flatten:
+            layer = SnapshotLayer(
+                base_path=str(base_dir),
+                base_revision=ref_layer.revision if ref_layer else None,
+                depth=depth,
+            )
+            write_snapshot_layer(snapshot_dir, layer)
+
+    @override
+    def commit_snapshot(self, variant_study: VariantStudy, changes: FileChanges) -> None:
+        snapshot_dir = get_snapshot_dir(variant_study)
+        layer = read_snapshot_layer(snapshot_dir)
+        if layer is not None:
+            layer = update_snapshot_layer(snapshot_dir, layer, changes)
+            write_snapshot_layer(snapshot_dir, layer)
+            logger.info(
+                f"Snapshot of '{variant_study.id}' owns {len(layer.files)} files"
+                f" and {len(layer.tombstones)} tombstones (layer {layer.depth})"
+            )
 
     @override
     def clear_snapshot(self, variant_study: VariantStudy) -> None:
         logger.info(f"Clearing snapshot for study {variant_study.id}")
-        shutil.rmtree(get_snapshot_dir(variant_study), ignore_errors=True)
+        snapshot_dir = get_snapshot_dir(variant_study)
+        shutil.rmtree(snapshot_dir, ignore_errors=True)
+        remove_snapshot_layer(snapshot_dir)
+        remove_checkpoints(snapshot_dir)
+
+    @override
+    def supports_checkpoints(self) -> bool:
+        return True
+
+    @override
+    def list_checkpoints(self, variant_study: VariantStudy) -> list[SnapshotCheckpoint]:
+        return list_checkpoints(get_snapshot_dir(variant_study))
+
+    @override
+    def save_checkpoint(self, ref_study: Study, variant_study: VariantStudy, checkpoint: SnapshotCheckpoint) -> None:
+        write_checkpoint(get_snapshot_dir(variant_study), _get_study_dir(ref_study), checkpoint)
+
+    @override
+    def restore_checkpoint(
+        self, variant_study: VariantStudy, checkpoint: SnapshotCheckpoint, source: VariantStudy | None = None
+    ) -> None:
+        remove_from_cache(self._cache, variant_study.id)
+        source_dir = get_snapshot_dir(source) if source is not None else None
+        restore_checkpoint(get_snapshot_dir(variant_study), checkpoint, source_dir)
+
+    @override
+    def remove_checkpoints(self, variant_study: VariantStudy, keep: Collection[int] = ()) -> None:
+        remove_checkpoints(get_snapshot_dir(variant_study), keep)
@@ -0,0 +1,157 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Checkpoints of variant snapshots.
+
+While the commands of a variant are applied on the snapshot of its parent, the state of
+the snapshot is periodically saved as a checkpoint, so that a later generation can restart
+from the last checkpoint whose commands are unchanged, instead of replaying all the commands
+(for instance, when a command near the end of a long list of commands is updated or removed).
+Since checkpoints are identified by the content of the commands, sibling variants starting with
+the same commands can also start from the checkpoints of each other.
+
+A checkpoint is stored as a delta from the parent study: a compressed archive of the files
+added or modified by the commands, and the lists of the files and directories they removed
+or of the empty directories they created.
+"""
+
+import logging
+import shutil
+import zipfile
+from collections.abc import Collection
+from pathlib import Path
+
+from antarest.core.serde import AntaresBaseModel
+from antarest.core.utils.files import record_dir_created, record_file_removed, record_file_written
+from antarest.study.storage.variantstudy.snapshot.snapshot_layer import diff_directories, list_dirs
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINTS_DIR_NAME = "checkpoints"
+
+
+class SnapshotCheckpoint(AntaresBaseModel):
+    """
+    Description of a snapshot checkpoint.
+
+    Attributes:
+        index: Number of command blocks of the variant applied in this checkpoint.
+        commands_digest: Digest of these command blocks.
+        base_digest: Digest identifying the state of the parent study on which the commands were applied.
+        tombstones: Relative paths of the files of the parent study removed by the commands.
+        removed_dirs: Relative paths of the directories of the parent study removed by the commands.
+        new_dirs: Relative paths of the directories created by the commands.
+    """
+
+    index: int
+    commands_digest: str
+    base_digest: str
+    tombstones: list[str] = []
+    removed_dirs: list[str] = []
+    new_dirs: list[str] = []
+
+
+def _get_checkpoints_dir(snapshot_dir: Path) -> Path:
+    return snapshot_dir.parent / CHECKPOINTS_DIR_NAME
+
+
+def _get_checkpoint_paths(snapshot_dir: Path, index: int) -> tuple[Path, Path]:
+    checkpoints_dir = _get_checkpoints_dir(snapshot_dir)
+    return checkpoints_dir / f"{index:06d}.json", checkpoints_dir / f"{index:06d}.zip"
+
+
+def list_checkpoints(snapshot_dir: Path) -> list[SnapshotCheckpoint]:
+    """
+    Lists the checkpoints of a snapshot, by increasing index.
+    """
+    checkpoints_dir = _get_checkpoints_dir(snapshot_dir)
+    if not checkpoints_dir.is_dir():
+        return []
+    checkpoints = []
+    for manifest_path in checkpoints_dir.glob("*.json"):
+        try:
+            checkpoints.append(SnapshotCheckpoint.model_validate_json(manifest_path.read_bytes()))
+        except ValueError:
+            logger.warning(f"Ignoring invalid snapshot checkpoint '{manifest_path}'")
+    return sorted(checkpoints, key=lambda checkpoint: checkpoint.index)
+
+
+def write_checkpoint(snapshot_dir: Path, base_dir: Path, checkpoint: SnapshotCheckpoint) -> SnapshotCheckpoint:
+    """
+    Saves the current state of a snapshot as a checkpoint, by comparing it with the directory of the parent study.
+
+    Returns:
+        The checkpoint, with its tombstones.
+    """
+    own_files, tombstones = diff_directories(snapshot_dir, base_dir)
+    dirs = list_dirs(snapshot_dir, excluded=set())
+    base_dirs = list_dirs(base_dir, excluded={"output"})
+    checkpoint = checkpoint.model_copy(
+        update={
+            "tombstones": tombstones,
+            "removed_dirs": sorted(base_dirs - dirs),
+            "new_dirs": sorted(dirs - base_dirs),
+        }
+    )
+    manifest_path, archive_path = _get_checkpoint_paths(snapshot_dir, checkpoint.index)
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(archive_path, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for rel_path in own_files:
+            archive.write(snapshot_dir / rel_path, arcname=rel_path)
+    # The manifest is written last: a checkpoint without manifest is ignored
+    manifest_path.write_text(checkpoint.model_dump_json(indent=2))
+    logger.info(
+        f"Checkpoint {checkpoint.index} of '{snapshot_dir}' saved"
+        f" ({len(own_files)} files, {len(tombstones)} tombstones)"
+    )
+    return checkpoint
+
+
+def restore_checkpoint(snapshot_dir: Path, checkpoint: SnapshotCheckpoint, source_dir: Path | None = None) -> None:
+    """
+    Applies a checkpoint on a fresh copy of the parent study.
+
+    The checkpoint may belong to the snapshot of a sibling variant, located in `source_dir`:
+    checkpoints only depend on the parent study and on the content of the commands.
+    """
+    _, archive_path = _get_checkpoint_paths(source_dir or snapshot_dir, checkpoint.index)
+    for rel_path in checkpoint.tombstones:
+        (snapshot_dir / rel_path).unlink(missing_ok=True)
+        record_file_removed(snapshot_dir / rel_path)
+    with zipfile.ZipFile(archive_path) as archive:
+        for member in archive.infolist():
+            target = snapshot_dir / member.filename
+            # The file may be shared with the parent study (see `CopyMode`): it must not be written through
+            target.unlink(missing_ok=True)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with archive.open(member) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            record_file_written(target)
+    for rel_path in checkpoint.removed_dirs:
+        shutil.rmtree(snapshot_dir / rel_path, ignore_errors=True)
+        record_file_removed(snapshot_dir / rel_path)
+    for rel_path in checkpoint.new_dirs:
+        (snapshot_dir / rel_path).mkdir(parents=True, exist_ok=True)
+        record_dir_created(snapshot_dir / rel_path)
+    logger.info(f"Checkpoint {checkpoint.index} restored in '{snapshot_dir}'")
+
+
+def remove_checkpoints(snapshot_dir: Path, keep: Collection[int] = ()) -> None:
+    """
+    Removes the checkpoints of a snapshot, except the ones whose index is in `keep`.
+    """
+    checkpoints_dir = _get_checkpoints_dir(snapshot_dir)
+    if not checkpoints_dir.is_dir():
+        return
+    for path in checkpoints_dir.iterdir():
+        if not path.stem.isdigit() or int(path.stem) not in keep:
+            path.unlink(missing_ok=True)
@@ -14,6 +14,8 @@
 This module dedicated to variant snapshot generation.
 """
 
+import hashlib
+import itertools
 import logging
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, NamedTuple
@@ -21,7 +23,8 @@ from typing import TYPE_CHECKING, NamedTuple
 from antarest.core.exceptions import UnsupportedOperationOnArchivedStudy, VariantGenerationError
 from antarest.core.model import StudyPermissionType
 from antarest.core.tasks.service import ITaskNotifier, NoopNotifier
-from antarest.core.utils.utils import current_time
+from antarest.core.utils.files import track_file_changes
+from antarest.core.utils.utils import StopWatch, current_time
 from antarest.study.dao.api.study_dao import StudyDao
 from antarest.study.dao.api.study_factory_dao import StudyFactoryDao
 from antarest.study.model import Study, StudyMetadataUpdate
@@ -30,9 +33,12 @@ from antarest.study.storage.utils import (
     format_timestamp,
     remove_from_cache,
 )
+from antarest.study.storage.variantstudy.command_optimizer import optimize_commands
 from antarest.study.storage.variantstudy.model.command_listener.command_listener import ICommandListener
 from antarest.study.storage.variantstudy.model.dbmodel import CommandBlock, VariantStudy, VariantStudySnapshot
 from antarest.study.storage.variantstudy.model.model import GenerationResultInfoDTO
+from antarest.study.storage.variantstudy.snapshot.snapshot_checkpoint import SnapshotCheckpoint
+from antarest.study.storage.variantstudy.snapshot.snapshot_manager_interface import ISnapshotManager
 from antarest.study.storage.variantstudy.variant_command_generator import apply_commands_to_variant
 
 if TYPE_CHECKING:
@@ -41,6 +47,129 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _digest_command_blocks(cmd_blocks: Sequence[CommandBlock]) -> list[str]:
+    """
+    Computes the digests of the prefixes of a list of command blocks: the k-th digest identifies the k first blocks.
+    """
+    hasher = hashlib.sha256()
+    digests = [hasher.hexdigest()]
+    for cmd_block in cmd_blocks:
+        for value in (cmd_block.command, str(cmd_block.version), cmd_block.study_version, cmd_block.args):
+            hasher.update(value.encode())
+            hasher.update(b"\0")
+        digests.append(hasher.hexdigest())
+    return digests
+
+
+def _get_base_digest(ref_study: Study) -> str:
+    if isinstance(ref_study, VariantStudy):
+        return f"{ref_study.id}@{ref_study.snapshot.created_at}"
+    return f"{ref_study.id}@{ref_study.updated_at}"
+
+
+class SnapshotCheckpointer:
+    """
+    Saves and restores the checkpoints of a variant snapshot generated from the study of its parent.
+
+    Checkpoints are identified by the state of the parent study and by the content of the commands applied
+    on it: the generation can also start from a checkpoint of a sibling variant sharing the same first commands.
+    """
+
+    def __init__(
+        self,
+        snapshot_manager: ISnapshotManager,
+        ref_study: Study,
+        variant_study: VariantStudy,
+        *,
+        interval: int,
+        min_seconds: float,
+        siblings: Sequence[VariantStudy] = (),
+    ):
+        self.snapshot_manager = snapshot_manager
+        self.ref_study = ref_study
+        self.variant_study = variant_study
+        self.interval = interval
+        self.min_seconds = min_seconds
+        self.siblings = siblings
+        self._digests = _digest_command_blocks(variant_study.commands)
+        self._base_digest = _get_base_digest(ref_study)
+        # Number of command blocks applied in the restored checkpoint
+        self._offset = 0
+        # Time spent applying the commands since the last checkpoint
+        self._elapsed = 0.0
+
+    def _find_checkpoints(self, variant_study: VariantStudy) -> list[SnapshotCheckpoint]:
+        """
+        Lists the checkpoints of a variant matching the first commands of the generated variant, by increasing index.
+        """
+        return [
+            checkpoint
+            for checkpoint in self.snapshot_manager.list_checkpoints(variant_study)
+            if checkpoint.base_digest == self._base_digest
+            and checkpoint.index < len(self._digests)
+            and checkpoint.commands_digest == self._digests[checkpoint.index]
+        ]
+
+    def restore(self, *, from_scratch: bool = False) -> Sequence[CommandBlock]:
+        """
+        Restores the last checkpoint matching the commands of the variant, and removes the outdated ones.
+
+        Args:
+            from_scratch: Whether all the commands must be applied again (all the checkpoints are removed).
+
+        Returns:
+            The command blocks remaining to apply.
+        """
+        checkpoints = [] if from_scratch else self._find_checkpoints(self.variant_study)
+        self.snapshot_manager.remove_checkpoints(self.variant_study, keep={c.index for c in checkpoints})
+        # Best checkpoint found so far, with the sibling it belongs to (if any)
+        best: tuple[SnapshotCheckpoint, VariantStudy | None] | None = (checkpoints[-1], None) if checkpoints else None
+        for sibling in [] if from_scratch else self.siblings:
+            sibling_checkpoints = self._find_checkpoints(sibling)
+            if sibling_checkpoints and (best is None or sibling_checkpoints[-1].index > best[0].index):
+                best = (sibling_checkpoints[-1], sibling)
+
+        if best is not None:
+            checkpoint, source = best
+            source_name = f" of '{source.id}'" if source else ""
+            try:
+                self.snapshot_manager.restore_checkpoint(self.variant_study, checkpoint, source)
+            except Exception as e:
+                # For instance, the checkpoint of the sibling was removed in the meantime
+                logger.warning(f"Failed to restore checkpoint {checkpoint.index}{source_name}", exc_info=e)
+                self.snapshot_manager.create_snapshot(self.ref_study, self.variant_study)
+            else:
+                self._offset = checkpoint.index
+                logger.info(
+                    f"Generation of '{self.variant_study.id}' resumed from checkpoint"
+                    f" {checkpoint.index}/{len(self.variant_study.commands)}{source_name}"
+                )
+        cmd_blocks: Sequence[CommandBlock] = self.variant_study.commands[self._offset :]
+        return cmd_blocks
+
+    def split(self, cmd_blocks: Sequence[CommandBlock]) -> list[Sequence[CommandBlock]]:
+        return [cmd_blocks[start : start + self.interval] for start in range(0, len(cmd_blocks), self.interval)]
+
+    def save(self, applied_count: int, elapsed: float) -> None:
+        """
+        Saves a checkpoint once `applied_count` command blocks have been applied since the restoration,
+        if applying them again would take long enough.
+        """
+        self._elapsed += elapsed
+        if self._elapsed < self.min_seconds:
+            return
+        index = self._offset + applied_count
+        checkpoint = SnapshotCheckpoint(
+            index=index, commands_digest=self._digests[index], base_digest=self._base_digest
+        )
+        try:
+            self.snapshot_manager.save_checkpoint(self.ref_study, self.variant_study, checkpoint)
+        except Exception as e:
+            # The generation can go on without checkpoint
+            logger.warning(f"Failed to save checkpoint {index} of '{self.variant_study.id}'", exc_info=e)
+        self._elapsed = 0.0
+
+
 class RefStudySearchResult(NamedTuple):
     """
     Result of the search for the reference study.
@@ -95,14 +224,21 @@ class SnapshotGenerator:
         variant_study = descendants[-1]
 
         try:
-            if search_result.force_regenerate or not self.variant_study_service.has_snapshot(variant_study):
-                self.variant_study_service.create_snapshot(ref_study, variant_study)
+            # The files written and removed in the snapshot are recorded for its layer (see `snapshot_layer`)
+            with track_file_changes() as changes:
+                if search_result.force_regenerate or not self.variant_study_service.has_snapshot(variant_study):
+                    self.variant_study_service.create_snapshot(ref_study, variant_study)
+
+                checkpointer = self._get_checkpointer(ref_study, variant_study, cmd_blocks)
+                if checkpointer is not None:
+                    cmd_blocks = checkpointer.restore(from_scratch=from_scratch)
 
-            # The snapshot is generated, we also need to de-normalize the matrices.
-            study_dao = dao_factory.get_study_dao(variant_study.id, True)
+                # The snapshot is generated, we also need to de-normalize the matrices.
+                study_dao = dao_factory.get_study_dao(variant_study.id, True)
 
-            logger.info(f"Applying commands to the reference study '{ref_study.id}'...")
-            results = self._apply_commands(study_dao, variant_study, cmd_blocks, listener)
+                logger.info(f"Applying commands to the reference study '{ref_study.id}'...")
+                results = self._apply_commands(study_dao, variant_study, cmd_blocks, listener, checkpointer)
+            self.variant_study_service.commit_snapshot(variant_study, changes)
 
             # Finally, we can update the database.
             logger.info(f"Saving new snapshot for study {variant_study_id}")
@@ -142,15 +278,68 @@ class SnapshotGenerator:
         root_study = self.repository.one(descendant_ids[0])
         return root_study, descendants
 
+    def _get_checkpointer(
+        self, ref_study: Study, variant_study: VariantStudy, cmd_blocks: Sequence[CommandBlock]
+    ) -> SnapshotCheckpointer | None:
+        storage_config = self.variant_study_service.config.storage
+        snapshot_manager = self.variant_study_service.get_snapshot_manager(variant_study)
+        if storage_config.snapshot_checkpoint_interval <= 0 or not snapshot_manager.supports_checkpoints():
+            return None
+        # Checkpoints are deltas from the parent study: they are only used when all the commands
+        # of the variant are applied on the parent study.
+        if ref_study.id != variant_study.parent_id or [c.id for c in cmd_blocks] != [
+            c.id for c in variant_study.commands
+        ]:
+            return None
+        siblings = []
+        if storage_config.snapshot_checkpoint_sharing:
+            siblings = [
+                sibling
+                for sibling in self.repository.get_children(ref_study.id)
+                if sibling.id != variant_study.id and sibling.storage_mode == variant_study.storage_mode
+            ]
+        return SnapshotCheckpointer(
+            snapshot_manager,
+            ref_study,
+            variant_study,
+            interval=storage_config.snapshot_checkpoint_interval,
+            min_seconds=storage_config.snapshot_checkpoint_min_seconds,
+            siblings=siblings,
+        )
+
     def _apply_commands(
         self,
         study_dao: StudyDao,
         variant_study: VariantStudy,
         cmd_blocks: Sequence[CommandBlock],
         listener: ICommandListener | None = None,
+        checkpointer: SnapshotCheckpointer | None = None,
     ) -> GenerationResultInfoDTO:
-        commands = [self.command_factory.to_command(cb.to_dto()) for cb in cmd_blocks]
-        results = apply_commands_to_variant(commands, study=study_dao, metadata=variant_study, listener=listener)
+        results = GenerationResultInfoDTO(success=True, details=[], should_invalidate_cache=False)
+        # With checkpoints, the commands are applied (and optimized) by segments
+        segments = [cmd_blocks] if checkpointer is None else checkpointer.split(cmd_blocks)
+        applied_count = 0
+        # The commands are applied in a single transaction, up to the first failing command
+        with study_dao.unit_of_work():
+            for segment in segments:
+                stopwatch = StopWatch()
+                commands = [self.command_factory.to_command(cb.to_dto()) for cb in segment]
+                segment_results = apply_commands_to_variant(
+                    [optimize_commands(list(itertools.chain.from_iterable(commands)))],
+                    study=study_dao,
+                    metadata=variant_study,
+                    listener=listener,
+                    max_workers=self.variant_study_service.config.storage.variant_generation_workers,
+                )
+                results.details.extend(segment_results.details)
+                results.should_invalidate_cache |= segment_results.should_invalidate_cache
+                results.success = segment_results.success
+                if not results.success:
+                    break
+                applied_count += len(segment)
+                if checkpointer is not None and applied_count < len(cmd_blocks):
+                    checkpointer.save(applied_count, stopwatch.since_start)
+
         if not results.success:
             message = f"Failed to generate variant study {variant_study.id}"
             if results.details:
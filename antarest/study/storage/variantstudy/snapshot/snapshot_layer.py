@@ -0,0 +1,256 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Layered description of file snapshots.
+
+When snapshots share their files with the reference study (`reflink` or `hardlink` copy modes),
+a variant snapshot is an overlay of its reference study: it only owns the files written
+by its commands, the other files being shared with the lower layer, and the files and directories
+removed by its commands are recorded as tombstones. The changes are recorded while the commands
+are applied (see `track_file_changes`), the directories are never compared.
+
+The layer manifest is stored next to the snapshot directory. The files of a snapshot are resolved
+by reading through the manifests of the chain of layers, down to the root study: the snapshot
+of a child variant is built from the owners of its files, and the snapshot is flattened (fully copied)
+once the chain exceeds the maximum number of layers.
+"""
+
+import logging
+import os
+import time
+import uuid
+from pathlib import Path, PurePosixPath
+
+from pydantic import Field
+
+from antarest.core.serde import AntaresBaseModel
+from antarest.core.utils.files import CopyMode, FileChanges, get_copy_function
+
+logger = logging.getLogger(__name__)
+
+LAYER_MANIFEST_NAME = "snapshot_layer.json"
+
+
+class SnapshotLayerError(Exception):
+    """
+    Raised when the files of a snapshot cannot be resolved through its chain of layers,
+    for instance when a lower layer was regenerated since this layer was built on top of it.
+    """
+
+
+def _new_revision() -> str:
+    return uuid.uuid4().hex
+
+
+class SnapshotLayer(AntaresBaseModel):
+    """
+    Description of a snapshot layer.
+
+    Attributes:
+        base_path: Path of the lower layer (snapshot of the reference variant or root study directory).
+        base_revision: Revision of the lower layer when this layer was built, `None` if it is flat.
+        revision: Identifier of the content of this layer, renewed each time the layer is modified.
+        depth: Number of layers of the chain, this one included.
+        files: Relative paths of the files owned by this layer.
+        dirs: Relative paths of the directories created in this layer.
+        tombstones: Relative paths of the files and directories of the lower layer removed in this layer.
+    """
+
+    base_path: str
+    base_revision: str | None = None
+    revision: str = Field(default_factory=_new_revision)
+    depth: int = 1
+    files: list[str] = []
+    dirs: list[str] = []
+    tombstones: list[str] = []
+
+
+def _get_manifest_path(snapshot_dir: Path) -> Path:
+    return snapshot_dir.parent / LAYER_MANIFEST_NAME
+
+
+def read_snapshot_layer(snapshot_dir: Path) -> SnapshotLayer | None:
+    """
+    Reads the layer manifest of a snapshot, returns `None` if the snapshot is flat.
+    """
+    manifest_path = _get_manifest_path(snapshot_dir)
+    try:
+        return SnapshotLayer.model_validate_json(manifest_path.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def write_snapshot_layer(snapshot_dir: Path, layer: SnapshotLayer) -> None:
+    _get_manifest_path(snapshot_dir).write_text(layer.model_dump_json(indent=2))
+
+
+def remove_snapshot_layer(snapshot_dir: Path) -> None:
+    _get_manifest_path(snapshot_dir).unlink(missing_ok=True)
+
+
+def _list_files(root_dir: Path, excluded: set[str]) -> dict[str, os.stat_result]:
+    files: dict[str, os.stat_result] = {}
+    for dir_path, dir_names, file_names in os.walk(root_dir):
+        if dir_path == str(root_dir):
+            dir_names[:] = [name for name in dir_names if name not in excluded]
+        rel_dir = Path(dir_path).relative_to(root_dir)
+        for file_name in file_names:
+            files[(rel_dir / file_name).as_posix()] = os.stat(os.path.join(dir_path, file_name))
+    return files
+
+
+def list_dirs(root_dir: Path, excluded: set[str]) -> set[str]:
+    dirs: set[str] = set()
+    for dir_path, dir_names, _ in os.walk(root_dir):
+        if dir_path == str(root_dir):
+            dir_names[:] = [name for name in dir_names if name not in excluded]
+        rel_dir = Path(dir_path).relative_to(root_dir)
+        dirs.update((rel_dir / name).as_posix() for name in dir_names)
+    return dirs
+
+
+def _is_shared(stat: os.stat_result, base_stat: os.stat_result) -> bool:
+    # Hard links share the same inode, clones and copies keep the size and modification time.
+    return os.path.samestat(stat, base_stat) or (
+        stat.st_size == base_stat.st_size and stat.st_mtime_ns == base_stat.st_mtime_ns
+    )
+
+
+def diff_directories(directory: Path, base_dir: Path) -> tuple[list[str], list[str]]:
+    """
+    Compares a study directory with the directory it was copied from (outputs excluded).
+
+    Returns:
+        The relative paths of the files added or modified in the directory,
+        and of the files of the base directory removed from it.
+    """
+    files = _list_files(directory, excluded=set())
+    base_files = _list_files(base_dir, excluded={"output"})
+    own_files = [
+        rel_path
+        for rel_path, stat in files.items()
+        if rel_path not in base_files or not _is_shared(stat, base_files[rel_path])
+    ]
+    removed_files = [rel_path for rel_path in base_files if rel_path not in files]
+    return sorted(own_files), sorted(removed_files)
+
+
+def _relative_paths(paths: set[Path], snapshot_dir: Path) -> set[str]:
+    rel_paths = set()
+    for path in paths:
+        try:
+            rel_paths.add(path.relative_to(snapshot_dir).as_posix())
+        except ValueError:
+            # Written outside the snapshot (matrix store, other study...)
+            continue
+    return rel_paths
+
+
+def update_snapshot_layer(snapshot_dir: Path, layer: SnapshotLayer, changes: FileChanges) -> SnapshotLayer:
+    """
+    Adds the changes recorded while the commands were applied to a snapshot layer.
+
+    The files and directories which do not exist anymore are no longer owned, their tombstones hide the lower layer.
+    """
+    written = set(layer.files) | _relative_paths(changes.written, snapshot_dir)
+    created_dirs = set(layer.dirs) | _relative_paths(changes.created_dirs, snapshot_dir)
+    removed = set(layer.tombstones) | _relative_paths(changes.removed, snapshot_dir)
+    return layer.model_copy(
+        update={
+            "revision": _new_revision(),
+            "files": sorted(rel_path for rel_path in written if (snapshot_dir / rel_path).is_file()),
+            "dirs": sorted(rel_path for rel_path in created_dirs if (snapshot_dir / rel_path).is_dir()),
+            "tombstones": sorted(removed),
+        }
+    )
+
+
+def _read_chain(snapshot_dir: Path) -> tuple[list[tuple[Path, SnapshotLayer]], Path]:
+    """
+    Reads the manifests of a chain of layers.
+
+    Returns:
+        The layers of the chain from top to bottom, with their directories,
+        and the flat directory at the bottom of the chain (root study or flattened snapshot).
+    """
+    chain: list[tuple[Path, SnapshotLayer]] = []
+    layer_dir, layer = snapshot_dir, read_snapshot_layer(snapshot_dir)
+    while layer is not None:
+        chain.append((layer_dir, layer))
+        base_dir = Path(layer.base_path)
+        base_layer = read_snapshot_layer(base_dir) if layer.base_revision else None
+        if not base_dir.is_dir() or layer.base_revision != (base_layer.revision if base_layer else None):
+            raise SnapshotLayerError(f"The lower layer '{base_dir}' of '{layer_dir}' has changed")
+        layer_dir, layer = base_dir, base_layer
+    return chain, layer_dir
+
+
+def _is_removed(rel_path: str, tombstones: set[str]) -> bool:
+    path = PurePosixPath(rel_path)
+    return rel_path in tombstones or any(parent.as_posix() in tombstones for parent in path.parents)
+
+
+def resolve_snapshot_layers(snapshot_dir: Path) -> tuple[dict[str, Path], set[str]]:
+    """
+    Resolves the content of a snapshot by reading through the manifests of its chain of layers.
+
+    The files which are not owned by any layer of the chain must still be shared between
+    the root study and the bottom layer: otherwise, the root study was modified since the chain was built.
+
+    Returns:
+        The paths of the files of the snapshot in the layers owning them, by relative path,
+        and the relative paths of its directories.
+
+    Raises:
+        SnapshotLayerError: If the chain of layers is not consistent anymore.
+    """
+    chain, root_dir = _read_chain(snapshot_dir)
+    files = _list_files(root_dir, excluded={"output"})
+    resolved = {rel_path: root_dir / rel_path for rel_path in files}
+    dirs = list_dirs(root_dir, excluded={"output"})
+    for position, (layer_dir, layer) in enumerate(reversed(chain)):
+        tombstones = set(layer.tombstones)
+        resolved = {rel_path: path for rel_path, path in resolved.items() if not _is_removed(rel_path, tombstones)}
+        dirs = {rel_path for rel_path in dirs if not _is_removed(rel_path, tombstones)}
+        if position == 0:
+            owned = set(layer.files)
+            for rel_path in resolved.keys() - owned:
+                try:
+                    shared = _is_shared(os.stat(layer_dir / rel_path), files[rel_path])
+                except FileNotFoundError:
+                    shared = False
+                if not shared:
+                    raise SnapshotLayerError(f"The file '{rel_path}' of '{root_dir}' has changed")
+        for rel_path in layer.files:
+            resolved[rel_path] = layer_dir / rel_path
+            dirs.update(parent.as_posix() for parent in PurePosixPath(rel_path).parents if parent.name)
+        dirs.update(layer.dirs)
+    return resolved, dirs
+
+
+def export_snapshot_layers(snapshot_dir: Path, dest: Path, copy_mode: CopyMode) -> None:
+    """
+    Copies the content of a layered snapshot, from the layers owning its files.
+
+    Raises:
+        SnapshotLayerError: If the chain of layers is not consistent anymore (nothing is copied).
+    """
+    start_time = time.time()
+    files, dirs = resolve_snapshot_layers(snapshot_dir)
+    copy_function = get_copy_function(copy_mode)
+    dest.mkdir(parents=True)
+    for rel_path in sorted(dirs):
+        (dest / rel_path).mkdir(parents=True, exist_ok=True)
+    for rel_path, path in files.items():
+        copy_function(str(path), str(dest / rel_path))
+    duration = f"{time.time() - start_time:.3f}"
+    logger.info(f"Snapshot '{snapshot_dir}' exported ({len(files)} {copy_mode} files) in {duration}s")
@@ -11,9 +11,12 @@
 # This file is part of the Antares project.
 
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 
+from antarest.core.utils.files import FileChanges
 from antarest.study.model import Study
 from antarest.study.storage.variantstudy.model.dbmodel import VariantStudy
+from antarest.study.storage.variantstudy.snapshot.snapshot_checkpoint import SnapshotCheckpoint
 
 
 class ISnapshotManager(ABC):
@@ -32,3 +35,31 @@ class ISnapshotManager(ABC):
     @abstractmethod
     def clear_snapshot(self, variant_study: VariantStudy) -> None:
         raise NotImplementedError()
+
+    def commit_snapshot(self, variant_study: VariantStudy, changes: FileChanges) -> None:
+        """
+        Called once the commands have been applied to the snapshot, with the file changes they made.
+        """
+
+    def supports_checkpoints(self) -> bool:
+        """
+        Whether the snapshots can be checkpointed while they are generated (see `snapshot_checkpoint`).
+        """
+        return False
+
+    def list_checkpoints(self, variant_study: VariantStudy) -> list[SnapshotCheckpoint]:
+        return []
+
+    def save_checkpoint(self, ref_study: Study, variant_study: VariantStudy, checkpoint: SnapshotCheckpoint) -> None:
+        raise NotImplementedError()
+
+    def restore_checkpoint(
+        self, variant_study: VariantStudy, checkpoint: SnapshotCheckpoint, source: VariantStudy | None = None
+    ) -> None:
+        """
+        Restores a checkpoint of the variant, or of its sibling `source`, in the snapshot of the variant.
+        """
+        raise NotImplementedError()
+
+    def remove_checkpoints(self, variant_study: VariantStudy, keep: Collection[int] = ()) -> None:
+        pass
@@ -0,0 +1,180 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Background pre-generation of variant snapshots.
+
+This service runs as a background thread: it listens to the study edition events,
+and regenerates the outdated snapshots of the recently accessed variants before
+users open them, instead of making them wait for the generation.
+"""
+
+import heapq
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from datetime import timedelta
+
+from typing_extensions import override
+
+from antarest.core.config import Config
+from antarest.core.interfaces.eventbus import Event, EventType, IEventBus
+from antarest.core.interfaces.service import IService
+from antarest.core.jwt import DEFAULT_ADMIN_USER
+from antarest.core.tasks.service import TaskNotFoundError
+from antarest.core.utils.fastapi_sqlalchemy import db
+from antarest.core.utils.utils import current_time
+from antarest.login.utils import current_user_context
+from antarest.study.storage.variantstudy.model.dbmodel import VariantStudy
+from antarest.study.storage.variantstudy.variant_study_service import VariantStudyService
+
+logger = logging.getLogger(__name__)
+
+# Time in seconds to sleep between two processing cycles
+_LOOP_SLEEP = 1
+
+
+class SnapshotPregenerator(IService):
+    """
+    Service regenerating the outdated variant snapshots in the background.
+
+    Edition events are debounced: a study is only processed once it has not been edited
+    for `snapshot_pregeneration_delay` seconds. The outdated snapshots of this study and
+    of its descendants are then queued if they were accessed recently (or if their parent was).
+    Parents are generated first, since their snapshot is reused to generate their children,
+    then the most recently accessed variants first. At most `snapshot_pregeneration_workers`
+    generation tasks run at the same time.
+    """
+
+    def __init__(self, variant_study_service: VariantStudyService, event_bus: IEventBus, config: Config) -> None:
+        super().__init__()
+        self.variant_study_service = variant_study_service
+        self.delay = config.storage.snapshot_pregeneration_delay
+        self.max_workers = max(1, config.storage.snapshot_pregeneration_workers)
+        self.access_retention = timedelta(days=config.storage.snapshot_pregeneration_access_days)
+        self._lock = threading.Lock()
+        # Time of the last edition event received for each study (monotonic clock)
+        self._edited: dict[str, float] = {}
+        # Variants to generate: heap of (depth, -last access timestamp, study ID)
+        self._queue: list[tuple[int, float, str]] = []
+        self._queued: set[str] = set()
+        # Generation tasks in progress, by study ID
+        self._running: dict[str, str] = {}
+        event_bus.add_listener(self._on_event, [EventType.STUDY_DATA_EDITED, EventType.STUDY_SNAPSHOT_OUTDATED])
+
+    async def _on_event(self, event: Event) -> None:
+        study_id = event.payload.get("id") if isinstance(event.payload, dict) else None
+        if study_id:
+            self.notify_edition(study_id)
+
+    def notify_edition(self, study_id: str) -> None:
+        """
+        Records that a study has been edited: its snapshot and the ones of its descendants may be outdated.
+        """
+        with self._lock:
+            self._edited[study_id] = time.monotonic()
+
+    def _pop_settled_editions(self) -> list[str]:
+        deadline = time.monotonic() - self.delay
+        with self._lock:
+            settled = [study_id for study_id, edited_at in self._edited.items() if edited_at <= deadline]
+            for study_id in settled:
+                del self._edited[study_id]
+        return settled
+
+    def _enqueue(self, study_ids: Iterable[str]) -> None:
+        """
+        Queues the outdated snapshots of the given studies and of their descendants.
+        """
+        repository = self.variant_study_service.repository
+        min_access = current_time() - self.access_retention
+        # Studies to visit: (study, depth, whether the parent is queued)
+        to_visit = []
+        for study_id in study_ids:
+            study = repository.get(study_id)
+            if study is not None:
+                to_visit.append((study, len(repository.get_ancestor_or_self_ids(study_id)) - 1, False))
+
+        visited: set[str] = set()
+        while to_visit:
+            study, depth, parent_queued = to_visit.pop()
+            if study.id in visited:
+                continue
+            visited.add(study.id)
+            is_candidate = isinstance(study, VariantStudy) and (
+                parent_queued or (study.last_access is not None and study.last_access >= min_access)
+            )
+            if is_candidate and study.id in self._running:
+                # The study may have been edited after the beginning of its generation: check it again later
+                self.notify_edition(study.id)
+            elif is_candidate and study.id not in self._queued:
+                assert isinstance(study, VariantStudy)
+                if not self.variant_study_service.is_snapshot_up_to_date(study):
+                    last_access = study.last_access.timestamp() if study.last_access else 0
+                    heapq.heappush(self._queue, (depth, -last_access, study.id))
+                    self._queued.add(study.id)
+            to_visit.extend((child, depth + 1, is_candidate) for child in repository.get_children(study.id))
+
+    def _check_running_tasks(self) -> None:
+        task_service = self.variant_study_service.task_service
+        for study_id, task_id in list(self._running.items()):
+            try:
+                is_final = task_service.status_task(task_id).status.is_final()
+            except TaskNotFoundError:
+                is_final = True
+            if is_final:
+                del self._running[study_id]
+
+    def _dispatch(self) -> None:
+        """
+        Launches the generation of the queued variants, within the concurrency limit.
+        """
+        repository = self.variant_study_service.repository
+        blocked: list[tuple[int, float, str]] = []
+        while self._queue and len(self._running) < self.max_workers:
+            item = heapq.heappop(self._queue)
+            study_id = item[2]
+            ancestor_ids = repository.get_ancestor_or_self_ids(study_id)
+            if any(ancestor_id in self._running for ancestor_id in ancestor_ids):
+                # Wait for the snapshot of the ancestor, which will be reused
+                blocked.append(item)
+                continue
+            self._queued.discard(study_id)
+            study = repository.get(study_id)
+            if not isinstance(study, VariantStudy) or self.variant_study_service.is_snapshot_up_to_date(study):
+                continue
+            logger.info(f"Pre-generating the snapshot of variant study {study_id}")
+            self._running[study_id] = self.variant_study_service.generate_task(study)
+        for item in blocked:
+            heapq.heappush(self._queue, item)
+
+    def process(self) -> None:
+        """
+        Runs a processing cycle: queues the studies which are no longer edited, and launches the generations.
+        """
+        with db():
+            self._check_running_tasks()
+            settled = self._pop_settled_editions()
+            if settled:
+                self._enqueue(settled)
+            self._dispatch()
+
+    @override
+    def _loop(self) -> None:
+        with current_user_context(DEFAULT_ADMIN_USER):
+            while True:
+                try:
+                    self.process()
+                except Exception as e:
+                    logger.error("Unexpected error happened when pre-generating variant snapshots", exc_info=e)
+                finally:
+                    time.sleep(_LOOP_SLEEP)
@@ -9,24 +9,43 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+import heapq
 import itertools
 import logging
 import uuid
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from contextvars import copy_context
+from typing import Any, ContextManager
 
+from antarest.core.utils.fastapi_sqlalchemy import db
+from antarest.core.utils.fastapi_sqlalchemy.exceptions import MissingSessionError, SessionNotInitialisedError
+from antarest.core.utils.io_profile import io_profile
 from antarest.core.utils.utils import StopWatch
 from antarest.study.dao.api.study_dao import StudyDao
-from antarest.study.storage.variantstudy.model.command.common import CommandOutput, command_failed
+from antarest.study.storage.variantstudy.model.command.common import (
+    CommandFootprint,
+    CommandOutput,
+    StudyResource,
+    command_failed,
+)
 from antarest.study.storage.variantstudy.model.command.icommand import ICommand
 from antarest.study.storage.variantstudy.model.command_listener.command_listener import ICommandListener
 from antarest.study.storage.variantstudy.model.dbmodel import VariantStudy
-from antarest.study.storage.variantstudy.model.model import GenerationResultInfoDTO, NewDetailsDTO
+from antarest.study.storage.variantstudy.model.model import (
+    CommandMetricsDTO,
+    GenerationResultInfoDTO,
+    NewDetailsDTO,
+)
 
 logger = logging.getLogger(__name__)
 
 APPLY_CALLBACK = Callable[[ICommand, StudyDao, ICommandListener | None], CommandOutput[Any]]
 
+# Output of an applied command, with the metrics recorded during its application
+_AppliedCommand = tuple[CommandOutput[Any], CommandMetricsDTO]
+
 
 class CmdNotifier:
     def __init__(self, study_id: str, total_count: int) -> None:
@@ -38,12 +57,189 @@ class CmdNotifier:
         logger.info(f"Command {self.index}/{self.total_count} [{self.study_id}] applied in {elapsed}s")
 
 
+def _apply_command(
+    cmd: ICommand, data: StudyDao, applier: APPLY_CALLBACK, listener: ICommandListener | None
+) -> CommandOutput[Any]:
+    try:
+        return applier(cmd, data, listener)
+    except Exception as e:
+        # Unhandled exception
+        output: CommandOutput[Any] = command_failed(message=f"Error while applying command {cmd.command_name}")
+        logger.error(output.message, exc_info=e)
+        return output
+
+
+def _apply_profiled_command(
+    cmd: ICommand, data: StudyDao, applier: APPLY_CALLBACK, listener: ICommandListener | None
+) -> _AppliedCommand:
+    """
+    Applies the command, recording its duration and the I/O it performs in the current thread.
+    """
+    stopwatch = StopWatch()
+    with io_profile() as profile:
+        output = _apply_command(cmd, data, applier, listener)
+    metrics: CommandMetricsDTO = {
+        "duration": stopwatch.since_start,
+        "matrices_read": profile.matrices_read,
+        "matrices_written": profile.matrices_written,
+        "bytes_read": profile.bytes_read,
+        "bytes_written": profile.bytes_written,
+        "ini_files_touched": len(profile.ini_files),
+        "cache_invalidated": output.should_invalidate_cache,
+    }
+    return output, metrics
+
+
+def _covers(resources: Iterable[StudyResource], other: Iterable[StudyResource]) -> bool:
+    return all(any(resource[: len(prefix)] == prefix for prefix in resources) for resource in other)
+
+
+def _includes(footprint: CommandFootprint, other: CommandFootprint) -> bool:
+    # Any command conflicting with `other` also conflicts with `footprint`
+    return _covers(footprint.writes, other.writes) and _covers(footprint.reads | footprint.writes, other.reads)
+
+
+def build_dependencies(footprints: Sequence[CommandFootprint | None]) -> list[list[int]]:
+    """
+    Builds the dependency graph of commands from their footprints.
+
+    A command depends on the previous commands it conflicts with, and commands with an unknown footprint
+    depend on all the previous commands (and all the next commands depend on them).
+    Dependencies which can be deduced by transitivity are mostly omitted.
+
+    Returns:
+        For each command, the indices of the commands which must be applied before it.
+    """
+    dependencies: list[list[int]] = []
+    last_barrier: int | None = None
+    # Commands applied since the last barrier, which are not a dependency of a command including their footprint.
+    pending: list[int] = []
+    for index, footprint in enumerate(footprints):
+        if footprint is None:
+            deps = pending or ([] if last_barrier is None else [last_barrier])
+            last_barrier, pending = index, []
+        else:
+            deps = []
+            kept = []
+            for previous in pending:
+                previous_footprint = footprints[previous]
+                assert previous_footprint is not None
+                if footprint.conflicts_with(previous_footprint):
+                    deps.append(previous)
+                    if _includes(footprint, previous_footprint):
+                        # The next commands conflicting with the previous one also conflict with this one
+                        continue
+                kept.append(previous)
+            if last_barrier is not None:
+                deps.append(last_barrier)
+            pending = kept + [index]
+        dependencies.append(deps)
+    return dependencies
+
+
+def _has_db_session() -> bool:
+    try:
+        return db.session is not None
+    except (MissingSessionError, SessionNotInitialisedError):
+        return False
+
+
+def _apply_concurrently(
+    commands: Sequence[ICommand],
+    data: StudyDao,
+    applier: APPLY_CALLBACK,
+    listener: ICommandListener | None,
+    max_workers: int,
+    cmd_notifier: CmdNotifier,
+) -> list[_AppliedCommand | None]:
+    """
+    Applies the commands on a thread pool, following the dependency graph built from their footprints.
+
+    As for a sequential application, the commands following the first failing command are not applied
+    (except the ones already running).
+
+    Returns:
+        The output and metrics of each command, `None` for the commands which were not applied.
+    """
+    dependencies = build_dependencies([cmd.get_footprint() for cmd in commands])
+    dependents: list[list[int]] = [[] for _ in commands]
+    for index, deps in enumerate(dependencies):
+        for dep in deps:
+            dependents[dep].append(index)
+    remaining = [len(deps) for deps in dependencies]
+
+    # The commands run in a copy of the current context (with the current user),
+    # but each thread needs its own database session.
+    parent_context = copy_context()
+    with_db_session = _has_db_session()
+
+    def apply(index: int) -> _AppliedCommand:
+        session: ContextManager[Any] = db() if with_db_session else nullcontext()
+        with session:
+            return _apply_profiled_command(commands[index], data, applier, listener)
+
+    outputs: list[_AppliedCommand | None] = [None] * len(commands)
+    first_failure = len(commands)
+    # Commands ready to be applied, the first ones in order are applied first
+    ready = [index for index, count in enumerate(remaining) if count == 0]
+    running: dict[Future[_AppliedCommand], int] = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="variant_generation_") as executor:
+        while ready or running:
+            while ready and len(running) < max_workers:
+                index = heapq.heappop(ready)
+                if index < first_failure:
+                    running[executor.submit(parent_context.copy().run, apply, index)] = index
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                output, metrics = future.result()
+                outputs[index] = output, metrics
+                cmd_notifier.index += 1
+                cmd_notifier.log(metrics["duration"])
+                if not output.status:
+                    first_failure = min(first_failure, index)
+                    continue
+                for dependent in dependents[index]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        heapq.heappush(ready, dependent)
+    return outputs
+
+
+def _apply_sequentially(
+    commands: Sequence[ICommand],
+    data: StudyDao,
+    applier: APPLY_CALLBACK,
+    listener: ICommandListener | None,
+    cmd_notifier: CmdNotifier,
+) -> list[_AppliedCommand | None]:
+    outputs: list[_AppliedCommand | None] = [None] * len(commands)
+    for index, cmd in enumerate(commands):
+        with data.operation() as operation:
+            output, metrics = _apply_profiled_command(cmd, data, applier, listener)
+            if not output.status:
+                # Inside a unit of work, the failed command leaves no partial writes
+                operation.discard()
+        outputs[index] = output, metrics
+
+        cmd_notifier.index = index + 1
+        cmd_notifier.log(metrics["duration"])
+
+        # stop variant generation as soon as a command fails
+        if not output.status:
+            break
+    return outputs
+
+
 def _generate(
     commands: list[list[ICommand]],
     data: StudyDao,
     applier: APPLY_CALLBACK,
     metadata: VariantStudy,
     listener: ICommandListener | None = None,
+    max_workers: int = 1,
 ) -> GenerationResultInfoDTO:
     stopwatch = StopWatch()
     # Apply commands
@@ -56,14 +252,19 @@ def _generate(
 
     # Prepare the stopwatch
     cmd_notifier = CmdNotifier(metadata.id, len(all_commands))
+
+    outputs: Sequence[_AppliedCommand | None]
+    if max_workers > 1 and len(all_commands) > 1 and data.supports_concurrent_writes():
+        logger.info(f"Applying {len(all_commands)} commands with {max_workers} workers")
+        outputs = _apply_concurrently(all_commands, data, applier, listener, max_workers, cmd_notifier)
+    else:
+        outputs = _apply_sequentially(all_commands, data, applier, listener, cmd_notifier)
+
     # Store all the outputs
-    for index, cmd in enumerate(all_commands, 1):
-        try:
-            output = applier(cmd, data, listener)
-        except Exception as e:
-            # Unhandled exception
-            output = command_failed(message=f"Error while applying command {cmd.command_name}")
-            logger.error(output.message, exc_info=e)
+    for cmd, applied in zip(all_commands, outputs, strict=True):
+        if applied is None:
+            break
+        output, metrics = applied
 
         # noinspection PyTypeChecker
         detail: NewDetailsDTO = {
@@ -71,12 +272,10 @@ def _generate(
             "name": cmd.command_name.value,
             "status": output.status,
             "msg": output.message,
+            "metrics": metrics,
         }
         results.details.append(detail)
 
-        cmd_notifier.index = index
-        cmd_notifier.log(stopwatch.lap())
-
         # stop variant generation as soon as a command fails
         if not output.status:
             logger.error(f"Command {cmd.command_name} failed: {output.message}")
@@ -97,7 +296,14 @@ def apply_commands_to_variant(
     metadata: VariantStudy,
     study: StudyDao,
     listener: ICommandListener | None = None,
+    max_workers: int = 1,
 ) -> GenerationResultInfoDTO:
+    """
+    Applies the commands to the study.
+
+    With several workers, and if the study supports it, independent commands (see `ICommand.get_footprint`)
+    are applied concurrently. The result is the same as with a sequential application.
+    """
     # Build file study
     logger.info("Building study tree")
 
@@ -107,4 +313,5 @@ def apply_commands_to_variant(
         lambda command, data, _listener: command.apply(study, _listener),
         metadata,
         listener,
+        max_workers,
     )
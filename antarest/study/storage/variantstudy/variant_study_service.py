@@ -20,6 +20,7 @@ from typing import cast
 from uuid import uuid4
 
 import humanize
+from antares.study.version import StudyVersion
 from filelock import FileLock
 from markupsafe import escape
 from typing_extensions import override
@@ -46,6 +47,7 @@ from antarest.core.serde.json import to_json_string
 from antarest.core.tasks.model import CustomTaskEventMessages, TaskDTO, TaskResult, TaskType
 from antarest.core.tasks.service import DEFAULT_AWAIT_MAX_TIMEOUT, ITaskNotifier, ITaskService, TaskNotFoundError
 from antarest.core.utils.fastapi_sqlalchemy import db
+from antarest.core.utils.files import FileChanges
 from antarest.core.utils.utils import assert_this, current_time, suppress_exception
 from antarest.login.utils import get_user_id, get_user_impersonator, require_current_user
 from antarest.matrixstore.service import ISimpleMatrixService, MatrixService
@@ -74,19 +76,31 @@ from antarest.study.storage.utils import (
 from antarest.study.storage.variantstudy.business.utils import transform_command_to_dto
 from antarest.study.storage.variantstudy.command_blob_usage_provider import CommandBlobUsageProvider
 from antarest.study.storage.variantstudy.command_factory import CommandFactory
-from antarest.study.storage.variantstudy.command_matrix_usage_provider import CommandMatrixUsageProvider
+from antarest.study.storage.variantstudy.command_importer import (
+    CommandImporter,
+    build_command_blocks,
+    lock_next_command_index,
+)
+from antarest.study.storage.variantstudy.command_matrix_usage_provider import (
+    CommandMatrixUsageProvider,
+    index_command_block_matrices,
+)
+from antarest.study.storage.variantstudy.command_metrics import CommandMetricsRecorder, get_slowest_commands
 from antarest.study.storage.variantstudy.model.command.icommand import ICommand
 from antarest.study.storage.variantstudy.model.command_listener.command_listener import ICommandListener
 from antarest.study.storage.variantstudy.model.dbmodel import CommandBlock, VariantStudy
 from antarest.study.storage.variantstudy.model.model import (
     CommandDTO,
     CommandDTOAPI,
+    GenerationResultInfoDTO,
+    NewDetailsDTO,
     VariantTreeDTO,
 )
 from antarest.study.storage.variantstudy.repository import VariantStudyRepository
 from antarest.study.storage.variantstudy.snapshot.database_snapshot_manager import DatabaseSnapshotManager
 from antarest.study.storage.variantstudy.snapshot.file_snapshot_manager import FileSnapshotManager
 from antarest.study.storage.variantstudy.snapshot.snapshot_generator import SnapshotGenerator
+from antarest.study.storage.variantstudy.snapshot.snapshot_manager_interface import ISnapshotManager
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +123,7 @@ class VariantStudyService(AbstractStudyService):
         event_bus: IEventBus,
         config: Config,
         matrix_service: ISimpleMatrixService,
+        command_metrics: CommandMetricsRecorder | None = None,
     ):
         super().__init__(cache, config)
         self.cache = cache
@@ -120,6 +135,7 @@ class VariantStudyService(AbstractStudyService):
         self.command_factory = command_factory
         self.study_factory = study_factory
         self._matrix_service = matrix_service
+        self.command_metrics = command_metrics
         CommandMatrixUsageProvider(repository, command_factory, raw_study_service._storage_mapping)
         CommandBlobUsageProvider(variant_study_repo=repository, command_factory=command_factory)
         ctx = command_factory.command_context
@@ -133,7 +149,9 @@ class VariantStudyService(AbstractStudyService):
             config, repository, matrix_service, db_dao_factory, fs_dao_factory
         )
         self._snapshot_manager_mapping = {
-            StorageMode.FILESYSTEM: FileSnapshotManager(cache),
+            StorageMode.FILESYSTEM: FileSnapshotManager(
+                cache, config.storage.snapshot_copy_mode, config.storage.snapshot_max_layers
+            ),
             StorageMode.DATABASE: DatabaseSnapshotManager(database_study_storage),
         }
 
@@ -281,21 +299,9 @@ class VariantStudyService(AbstractStudyService):
         self._check_update_authorization(study)
         command_objs = self._check_commands_validity(study_id, commands)
         validated_commands = transform_command_to_dto(command_objs, commands)
-        first_index = len(study.commands)
-
-        # noinspection PyArgumentList
-        new_commands = [
-            CommandBlock(
-                command=command.action,
-                args=to_json_string(command.args),
-                index=(first_index + i),
-                version=command.version,
-                study_version=str(command.study_version),
-                user_id=get_user_impersonator(),
-                updated_at=current_time(),
-            )
-            for i, command in enumerate(validated_commands)
-        ]
+        first_index = lock_next_command_index(self.repository.session, study_id)
+
+        new_commands = build_command_blocks(command_objs, validated_commands, first_index, get_user_impersonator())
         study.commands.extend(new_commands)
         self._update_editor(study)
         self.on_variant_advance(study)
@@ -308,6 +314,68 @@ class VariantStudyService(AbstractStudyService):
         )
         return [c.id for c in new_commands]
 
+    def check_commands_import(self, study_id: str) -> VariantStudy:
+        """
+        Checks that the current user can append commands to a variant study.
+
+        Args:
+            study_id: study id
+        Returns: the variant study
+        """
+        study = self._get_variant_study(study_id)
+        assert_permission(study, StudyPermissionType.WRITE)
+        self._check_update_authorization(study)
+        return study
+
+    def import_commands(self, study_id: str, commands_file: Path) -> str:
+        """
+        Appends the commands of an NDJSON file (one JSON command per line) to a variant study.
+
+        The commands are validated and inserted by chunks in a background task, which takes
+        the ownership of the file. Nothing is appended if one of the commands is not valid.
+
+        Args:
+            study_id: study id
+            commands_file: path of the NDJSON file, removed once the commands are imported
+        Returns: the ID of the import task
+        """
+        study = self.check_commands_import(study_id)
+        importer = CommandImporter(
+            self.command_factory,
+            study_id,
+            StudyVersion.parse(study.version),
+            user_id=get_user_impersonator(),
+        )
+
+        def callback(notifier: ITaskNotifier) -> TaskResult:
+            try:
+                count = importer.import_file(commands_file, self.repository.session, notifier)
+            except CommandNotValid as e:
+                return TaskResult(success=False, message=e.detail)
+            finally:
+                commands_file.unlink(missing_ok=True)
+
+            variant_study = self._get_variant_study(study_id)
+            self._update_editor(variant_study)
+            self.on_variant_advance(variant_study)
+            self.event_bus.push(
+                Event(
+                    type=EventType.STUDY_DATA_EDITED,
+                    payload=variant_study.to_json_summary(),
+                    permissions=PermissionInfo.from_study(variant_study),
+                )
+            )
+            return TaskResult(success=True, message=f"{count} commands appended to variant study {study_id}")
+
+        return self.task_service.add_task(
+            action=callback,
+            name=f"Import of commands in {study_id} study",
+            task_type=TaskType.VARIANT_COMMANDS_IMPORT,
+            ref_id=study_id,
+            progress=0,
+            custom_event_messages=None,
+        )
+
     def replace_commands(self, study_id: str, commands: list[CommandDTO]) -> str:
         """
         Add command to list of commands (at the end)
@@ -320,19 +388,7 @@ class VariantStudyService(AbstractStudyService):
         self._check_update_authorization(study)
         command_objs = self._check_commands_validity(study_id, commands)
         validated_commands = transform_command_to_dto(command_objs, commands)
-        # noinspection PyArgumentList
-        study.commands = [
-            CommandBlock(
-                command=command.action,
-                args=to_json_string(command.args),
-                index=i,
-                version=command.version,
-                study_version=str(command.study_version),
-                user_id=get_user_id(),
-                updated_at=current_time(),
-            )
-            for i, command in enumerate(validated_commands)
-        ]
+        study.commands = build_command_blocks(command_objs, validated_commands, 0, get_user_id())
         self._update_editor(study)
         self.on_variant_rebase(study)
         return str(study.id)
@@ -410,6 +466,7 @@ class VariantStudyService(AbstractStudyService):
         if index >= 0:
             study.commands[index].command = validated_commands[0].action
             study.commands[index].args = to_json_string(validated_commands[0].args)
+            index_command_block_matrices(study.commands[index], command_objs)
             self._update_editor(study)
             self.on_variant_rebase(study)
 
@@ -486,6 +543,7 @@ class VariantStudyService(AbstractStudyService):
         """
         study.updated_at = current_time()
         self.repository.save(metadata=study)
+        self._notify_snapshot_outdated(study)
         self.on_parent_change(study.id)
 
     def get_children(self, parent_id: str) -> list[VariantStudy]:
@@ -501,8 +559,18 @@ class VariantStudyService(AbstractStudyService):
         to be rebased too.
         """
         self.invalidate_snapshot(study)
+        self._notify_snapshot_outdated(study)
         self.on_parent_change(study.id)
 
+    def _notify_snapshot_outdated(self, study: VariantStudy) -> None:
+        self.event_bus.push(
+            Event(
+                type=EventType.STUDY_SNAPSHOT_OUTDATED,
+                payload=study.to_json_summary(),
+                permissions=PermissionInfo.from_study(study),
+            )
+        )
+
     def on_parent_change(self, study_id: str) -> None:
         """
         Takes all necessary actions on children when a study history has changed.
@@ -707,6 +775,8 @@ class VariantStudyService(AbstractStudyService):
                     notifier=notifier,
                     listener=listener,
                 )
+                if self.command_metrics:
+                    self.command_metrics.record(generate_result.details)
                 return TaskResult(
                     success=generate_result.success,
                     message=(
@@ -758,9 +828,37 @@ class VariantStudyService(AbstractStudyService):
             return self.task_service.status_task(task_id=task_id, with_logs=True)
         raise StudyValidationError(f"Variant study '{study_id}' has no generation task")
 
+    def get_slowest_commands(self, study_id: str, limit: int) -> list[NewDetailsDTO]:
+        """
+        Get the slowest commands of the last generation of a variant study.
+
+        Args:
+            study_id: The ID of the variant study.
+            limit: The maximum number of commands to return.
+
+        Returns:
+            The details of the commands applied during the last generation, by decreasing duration.
+            Only the commands replayed by this generation are returned (not the ones restored from a snapshot).
+
+        Raises:
+            StudyNotFoundError: If the study does not exist (HTTP status 404).
+            StudyValidationError: If the study has no generation task (HTTP status 422).
+        """
+        task = self.get_study_task(study_id)
+        if task.result is None or task.result.return_value is None:
+            return []
+        result = GenerationResultInfoDTO.model_validate_json(task.result.return_value)
+        return get_slowest_commands(result.details, limit)
+
     def create_snapshot(self, ref_study: Study, variant_study: VariantStudy) -> None:
         self._snapshot_manager_mapping[ref_study.storage_mode].create_snapshot(ref_study, variant_study)
 
+    def commit_snapshot(self, variant_study: VariantStudy, changes: FileChanges) -> None:
+        self._snapshot_manager_mapping[variant_study.storage_mode].commit_snapshot(variant_study, changes)
+
+    def get_snapshot_manager(self, variant_study: VariantStudy) -> ISnapshotManager:
+        return self._snapshot_manager_mapping[variant_study.storage_mode]
+
     def clear_all_snapshots(self, retention_time: timedelta) -> str:
         """
         Admin command that clear all variant snapshots older than `retention_hours` (in hours).
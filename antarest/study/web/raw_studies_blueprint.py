@@ -23,7 +23,7 @@ from fastapi.params import Query
 from starlette.responses import FileResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
 
 from antarest.core.api_types import SanitizedStr, UuidStr
-from antarest.core.exceptions import IncorrectPathError
+from antarest.core.exceptions import IncorrectPathError, InvalidMatrixSliceError
 from antarest.core.model import SUB_JSON
 from antarest.core.serde.json import from_json, to_json
 from antarest.core.serde.matrix_export import TableExportFormat, simplify_dataframe
@@ -32,6 +32,7 @@ from antarest.core.utils.web import APITag
 from antarest.dependencies import StudyServiceDep, auth_required
 from antarest.study.business.enum_ignore_case import EnumIgnoreCase
 from antarest.study.business.model.user_model import ResourceType
+from antarest.study.model import MatrixSlice
 from antarest.study.storage.df_download import export_file
 
 logger = logging.getLogger(__name__)
@@ -142,6 +143,16 @@ class MatrixFormat(EnumIgnoreCase):
             return Response(content=buffer.getvalue(), media_type="application/vnd.apache.arrow.file")
 
 
+def _parse_matrix_slice(columns: str, row_from: int, row_to: int | None) -> MatrixSlice | None:
+    if not columns and row_from == 0 and row_to is None:
+        return None
+    try:
+        column_indices = tuple(int(c) for c in columns.split(",")) if columns else None
+    except ValueError:
+        raise InvalidMatrixSliceError(f"Invalid column indices: '{columns}'") from None
+    return MatrixSlice(columns=column_indices, row_from=row_from, row_to=row_to)
+
+
 def create_raw_study_routes() -> APIRouter:
     """
     Endpoint implementation for studies management
@@ -159,6 +170,9 @@ def create_raw_study_routes() -> APIRouter:
         depth: int = 3,
         formatted: bool = True,
         matrix_format: MatrixFormat | None = None,
+        columns: str = "",
+        row_from: Annotated[int, Query(ge=0)] = 0,
+        row_to: Annotated[int | None, Query(ge=0)] = None,
     ) -> Response:
         """
         Fetches raw data from a study, and returns the data
@@ -170,20 +184,30 @@ def create_raw_study_routes() -> APIRouter:
         - `depth`: The depth of the data to retrieve.
         - `formatted`: Flag used to retrieve data from files which aren't matrices.
         - `matrix_format`: An enum specifying the format in which the matrix should be returned.
+        - `columns`: Comma-separated indices of the matrix columns to return (all columns by default).
+        - `row_from`: Index of the first matrix row to return.
+        - `row_to`: Index following the last matrix row to return (up to the last row by default).
 
         Returns the fetched data: a JSON object (in most cases), a plain text file
         or a file attachment (Microsoft Office document, TSV/TSV file...).
         """
         logger.info(f"📘 Fetching data at {path} (depth={depth}) from study {uuid}")
 
-        output = study_service.get_raw_content(uuid, path, depth, formatted)
+        matrix_slice = _parse_matrix_slice(columns, row_from, row_to)
+        is_arrow = matrix_format in {MatrixFormat.ARROW_COMPRESSED, MatrixFormat.ARROW_UNCOMPRESSED}
+        if is_arrow and PurePosixPath(path.strip("/")).parts[:1] == ("output",):
+            # Output matrices have multi-level headers, which need to be flattened for the arrow format
+            assert matrix_format is not None
+            return matrix_format.serialize_dataframe(study_service.get_output_matrix(uuid, path, matrix_slice))
+
+        output = study_service.get_raw_content(uuid, path, depth, formatted, matrix_slice=matrix_slice)
 
         if isinstance(output, pl.DataFrame):
             if matrix_format is None:
                 matrix_format = MatrixFormat.JSON if formatted else MatrixFormat.PLAIN
             return matrix_format.serialize_dataframe(output)
 
-        if matrix_format in {MatrixFormat.ARROW_COMPRESSED, MatrixFormat.ARROW_UNCOMPRESSED}:
+        if is_arrow:
             # The user asked for a format only supported for matrices.
             raise IncorrectPathError(f"The provided path does not point to a valid matrix: '{path}'")
 
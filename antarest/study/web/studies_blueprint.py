@@ -115,6 +115,10 @@ def create_study_routes() -> APIRouter:
         page_size: Annotated[
             NonNegativeInt, Query(description="Number of studies per page (0 = no limit).", alias="pageSize")
         ] = 0,
+        after: Annotated[
+            SanitizedStr,
+            Query(description="ID of the last study of the previous page: the page starts after this study."),
+        ] = "",
     ) -> dict[str, StudyMetadataDTO]:
         """
         Get the list of studies matching the specified criteria.
@@ -136,6 +140,8 @@ def create_study_routes() -> APIRouter:
         - `sortBy`: Sort studies based on their name (case-insensitive) or date.
         - `pageNb`: Page number (starting from 0).
         - `pageSize`: Number of studies per page (0 = no limit).
+        - `after`: ID of the last study of the previous page: the page starts after this study,
+          and `pageNb` is ignored. This is faster than `pageNb` for deep pages.
 
         Returns:
         - A dictionary of studies matching the specified criteria,
@@ -165,7 +171,7 @@ def create_study_routes() -> APIRouter:
         matching_studies = study_service.get_studies_information(
             study_filter=study_filter,
             sort_by=sort_by,
-            pagination=StudyPagination(page_nb=page_nb, page_size=page_size),
+            pagination=StudyPagination(page_nb=page_nb, page_size=page_size, after=after),
         )
 
         return matching_studies
@@ -11,10 +11,13 @@
 # This file is part of the Antares project.
 import datetime
 import logging
+import tempfile
+from pathlib import Path
 from typing import Annotated
 
 import humanize
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Query, Request
+from starlette.concurrency import run_in_threadpool
 
 from antarest.core.api_types import SanitizedStr, UuidStr
 from antarest.core.filetransfer.model import FileDownloadTaskDTO
@@ -23,7 +26,7 @@ from antarest.core.utils.utils import sanitize_string
 from antarest.core.utils.web import APITag
 from antarest.dependencies import StudyServiceDep, auth_required
 from antarest.study.model import StudyMetadataDTO
-from antarest.study.storage.variantstudy.model.model import CommandDTOAPI, VariantTreeDTO
+from antarest.study.storage.variantstudy.model.model import CommandDTOAPI, NewDetailsDTO, VariantTreeDTO
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +123,29 @@ def create_study_variant_routes() -> APIRouter:
         variant_study_service = study_service.storage_service.variant_study_service
         return variant_study_service.export_commands_matrices(uuid)
 
+    @bp.get(
+        "/studies/{uuid}/commands/_slowest",
+        summary="Get the slowest commands of the last generation of a variant",
+    )
+    def get_slowest_commands(
+        study_service: StudyServiceDep,
+        uuid: UuidStr,
+        limit: Annotated[int, Query(ge=1, le=1000)] = 10,
+    ) -> list[NewDetailsDTO]:
+        """
+        Get the slowest commands applied during the last generation of a variant study,
+        with the metrics recorded during their application (duration, matrices and bytes read and written, etc.).
+
+        Parameters:
+        - `uuid`: the study id
+        - `limit`: the maximum number of commands to return
+
+        Returns:
+        - The details of the commands, by decreasing duration.
+        """
+        variant_study_service = study_service.storage_service.variant_study_service
+        return variant_study_service.get_slowest_commands(uuid, limit)
+
     @bp.post(
         "/studies/{uuid}/commands",
         summary="Append a command to variant",
@@ -149,6 +175,49 @@ def create_study_variant_routes() -> APIRouter:
         internal_commands = variant_study_service.convert_commands(uuid, commands)
         return study_service.apply_commands(uuid, internal_commands)
 
+    @bp.post(
+        "/studies/{uuid}/commands/_import",
+        summary="Append a stream of commands to variant",
+        responses={
+            200: {
+                "description": "The id of the import task",
+            }
+        },
+    )
+    async def import_commands(study_service: StudyServiceDep, uuid: UuidStr, request: Request) -> str:
+        """
+        Append a large number of commands to a variant study, in a background task.
+
+        The request body is streamed in the NDJSON format: one JSON command per line,
+        with the same fields as the commands of the `POST /studies/{uuid}/commands` endpoint.
+        The commands are validated and inserted by chunks, and the progress is reported by the task.
+        Nothing is appended if one of the commands is not valid.
+
+        Parameters:
+        - `uuid`: the study id
+
+        Returns:
+        - The id of the import task.
+        """
+        logger.info(f"Importing commands in variant study {uuid}")
+        variant_study_service = study_service.storage_service.variant_study_service
+        # The permissions are checked before receiving the commands
+        await run_in_threadpool(variant_study_service.check_commands_import, uuid)
+        tmp_dir = variant_study_service.config.storage.tmp_dir
+        with tempfile.NamedTemporaryFile(dir=tmp_dir, prefix="commands_", suffix=".ndjson", delete=False) as f:
+            commands_file = Path(f.name)
+            try:
+                async for chunk in request.stream():
+                    await run_in_threadpool(f.write, chunk)
+            except BaseException:
+                commands_file.unlink(missing_ok=True)
+                raise
+        try:
+            return await run_in_threadpool(variant_study_service.import_commands, uuid, commands_file)
+        except Exception:
+            commands_file.unlink(missing_ok=True)
+            raise
+
     @bp.put(
         "/studies/{uuid}/commands",
         summary="Replace all commands from variant",
@@ -9,6 +9,7 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+import os
 import uuid
 from collections.abc import Callable
 from pathlib import Path
@@ -66,6 +67,21 @@ def project_path() -> Path:
     return PROJECT_DIR
 
 
+BENCHMARK_ENV_VAR = "ANTAREST_BENCHMARK"
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """
+    Skips the benchmarks (tests marked with `benchmark`) unless the `ANTAREST_BENCHMARK` environment variable is set.
+    """
+    if os.environ.get(BENCHMARK_ENV_VAR):
+        return
+    skip_benchmark = pytest.mark.skip(reason=f"benchmark: set {BENCHMARK_ENV_VAR}=1 to run it")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 @pytest.fixture
 def ini_cleaner() -> Callable[[str], str]:
     def cleaner(txt: str) -> str:
@@ -0,0 +1,136 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import asyncio
+import time
+import typing as t
+from pathlib import Path
+from unittest.mock import Mock
+
+import httpx
+import pytest
+from anyio import to_thread
+from fastapi import FastAPI
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import Session
+
+from antarest.core.config import Config, SecurityConfig
+from antarest.core.persistence import Base
+from antarest.core.tasks.model import TaskJob
+from antarest.core.tasks.repository import TaskJobRepository
+from antarest.core.tasks.service import TaskJobService
+from antarest.core.tasks.web import create_tasks_api
+from antarest.core.utils.fastapi_sqlalchemy import DBSessionMiddleware
+from antarest.core.utils.fastapi_sqlalchemy.middleware import init_async_db_singleton, init_db_singleton
+from antarest.dependencies import AppState
+from antarest.service_creator import get_async_db_url
+
+# Simulated latency of the database, for each call of `lower()`
+LATENCY = 0.05
+
+CONCURRENT_REQUESTS = 8
+
+
+def _slow_lower(value: t.Any) -> t.Any:
+    time.sleep(LATENCY)
+    return value.lower() if isinstance(value, str) else value
+
+
+def _add_latency(dbapi_connection: t.Any, connection_record: t.Any) -> None:
+    # The filter on the name of the tasks calls `lower()` twice for a single task
+    dbapi_connection.create_function("lower", 1, _slow_lower)
+
+
+@pytest.fixture(name="db_url")
+def db_url_fixture(tmp_path: Path) -> t.Iterator[str]:
+    db_url = f"sqlite:///{tmp_path / 'db.sqlite'}"
+    engine = create_engine(db_url, connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", _add_latency)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(TaskJob(name="my task"))
+        session.commit()
+    init_db_singleton(custom_engine=engine)
+    yield db_url
+    init_async_db_singleton(None)
+    engine.dispose()
+
+
+def _create_app() -> FastAPI:
+    config = Config(security=SecurityConfig(disabled=True))
+    services = Mock()
+    services.task_service = TaskJobService(config=config, repository=TaskJobRepository(), event_bus=Mock())
+    app = FastAPI(title=__name__)
+    app.add_middleware(DBSessionMiddleware)
+    app.state.app_state = AppState(config=config, services=services, ws_manager=Mock())
+    app.include_router(create_tasks_api())
+    return app
+
+
+async def _list_tasks_concurrently(app: FastAPI, db_url: str, async_reads: bool) -> tuple[float, list[httpx.Response]]:
+    async_engine = create_async_engine(get_async_db_url(db_url)) if async_reads else None
+    if async_engine is not None:
+        event.listen(async_engine.sync_engine, "connect", _add_latency)
+    init_async_db_singleton(async_engine)
+    # A single thread serves the sync dependencies and database accesses
+    to_thread.current_default_thread_limiter().total_tokens = 1
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            start = time.perf_counter()
+            requests = [client.get("/v1/tasks", params={"name": "TASK"}) for _ in range(CONCURRENT_REQUESTS)]
+            responses = await asyncio.gather(*requests)
+            elapsed = time.perf_counter() - start
+    finally:
+        init_async_db_singleton(None)
+        if async_engine is not None:
+            await async_engine.dispose()
+    return elapsed, responses
+
+
+def test_get_async_db_url() -> None:
+    assert str(get_async_db_url("sqlite:///db.sqlite")) == "sqlite+aiosqlite:///db.sqlite"
+    assert str(get_async_db_url("postgresql://host/db")) == "postgresql+asyncpg://host/db"
+    assert str(get_async_db_url("postgresql+psycopg2://host/db")) == "postgresql+asyncpg://host/db"
+    with pytest.raises(ValueError, match="mysql"):
+        get_async_db_url("mysql://host/db")
+
+
+def _list_tasks(db_url: str) -> dict[bool, tuple[float, list[httpx.Response]]]:
+    """
+    Lists the tasks concurrently with the sync sessions, then with the async sessions.
+    """
+    app = _create_app()
+    results = {
+        async_reads: asyncio.run(_list_tasks_concurrently(app, db_url, async_reads)) for async_reads in (False, True)
+    }
+    for _, responses in results.values():
+        assert [res.status_code for res in responses] == [200] * CONCURRENT_REQUESTS
+        assert all([task["name"] for task in res.json()] == ["my task"] for res in responses)
+    return results
+
+
+def test_tasks_listing(db_url: str) -> None:
+    _list_tasks(db_url)
+
+
+@pytest.mark.benchmark
+def test_tasks_listing_load(db_url: str, record_property: t.Callable[[str, object], None]) -> None:
+    results = _list_tasks(db_url)
+    sync_elapsed = results[False][0]
+    async_elapsed = results[True][0]
+    record_property("sync_elapsed", sync_elapsed)
+    record_property("async_elapsed", async_elapsed)
+    # With the sync sessions, the requests wait on the database one at a time
+    assert sync_elapsed >= CONCURRENT_REQUESTS * 2 * LATENCY
+    # With the async sessions, they wait concurrently
+    assert async_elapsed < sync_elapsed / 2
@@ -104,6 +104,7 @@ class TestConfig:
                 "pool_max_overflow": 13,
                 "pool_size": 20,
                 "pool_use_lifo": True,
+                "async_reads": True,
             },
             "logging": {"logfile": "/tmp/logfile", "json": True, "level": "DEBUG"},
             "debug": False,
@@ -255,6 +256,7 @@ class TestConfig:
         assert db_config.pool_max_overflow == 13
         assert db_config.pool_size == 20
         assert db_config.pool_use_lifo
+        assert db_config.async_reads
 
     def check_logging_config(self, logging_config: LoggingConfig) -> None:
         assert logging_config.logfile == Path("/tmp/logfile")
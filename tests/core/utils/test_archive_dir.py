@@ -10,6 +10,8 @@
 #
 # This file is part of the Antares project.
 
+import io
+import os
 import shutil
 import zipfile
 from pathlib import Path
@@ -19,7 +21,17 @@ import pytest
 
 from antarest.core.exceptions import BadArchiveContent, ShouldNotHappenException
 from antarest.core.utils import archives
-from antarest.core.utils.archives import ArchiveFormat, archive_dir, extract_archive_from_path, unzip
+from antarest.core.utils.archives import (
+    ArchiveFormat,
+    archive_dir,
+    clear_zip_indexes,
+    extract_archive_from_path,
+    get_zip_index,
+    iter_zip_archive,
+    open_file_in_zip,
+    unzip,
+    write_zip_archive,
+)
 
 
 def _create_sample_dir(base: Path) -> Path:
@@ -98,6 +110,44 @@ class TestArchiveDir:
             archive_dir(src, archive_path)
 
 
+class _UnseekableStream(io.RawIOBase):
+    def __init__(self) -> None:
+        self.content = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:  # type: ignore[no-untyped-def]
+        self.content.extend(b)
+        return len(b)
+
+
+class TestWriteZipArchive:
+    def test_writes_to_unseekable_stream(self, tmp_path: Path) -> None:
+        src = _create_sample_dir(tmp_path)
+        stream = _UnseekableStream()
+
+        write_zip_archive(src, stream)  # type: ignore[arg-type]
+
+        with zipfile.ZipFile(io.BytesIO(stream.content)) as zf:
+            assert set(zf.namelist()) == {"input/data.txt", "settings.ini"}
+            assert zf.read("input/data.txt") == b"hello"
+
+    def test_archive_is_produced_incrementally(self, tmp_path: Path) -> None:
+        src = _create_sample_dir(tmp_path)
+        # Random data cannot be compressed: the file is written in several chunks
+        content = os.urandom(3 * 1024 * 1024)
+        (src / "input" / "series.bin").write_bytes(content)
+
+        chunks = list(iter_zip_archive(src))
+
+        assert len(chunks) > 3
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zf:
+            assert set(zf.namelist()) == {"input/data.txt", "input/series.bin", "settings.ini"}
+            assert zf.read("input/series.bin") == content
+            assert zf.getinfo("input/series.bin").compress_type == zipfile.ZIP_DEFLATED
+
+
 def _create_sample_archive_7z(base: Path) -> Path:
     """Create a sample .7z archive using py7zr for testing."""
     src = _create_sample_dir(base)
@@ -216,3 +266,41 @@ class TestUnzip:
 
         _assert_extracted_sample_files(target_dir)
         assert not archive_path.exists()
+
+
+class TestOpenFileInZip:
+    def test_reads_members_from_cached_index(self, tmp_path: Path) -> None:
+        archive_path = _create_sample_archive_zip(tmp_path)
+
+        with open_file_in_zip(archive_path, "input/data.txt") as f:
+            assert f.read() == b"hello"
+        with open_file_in_zip(archive_path, "settings.ini") as f:
+            assert f.read() == b"key=value"
+        assert get_zip_index(archive_path) is get_zip_index(archive_path)
+
+        with pytest.raises(KeyError):
+            open_file_in_zip(archive_path, "missing.txt")
+
+    def test_index_is_refreshed_when_archive_changes(self, tmp_path: Path) -> None:
+        archive_path = _create_sample_archive_zip(tmp_path)
+        assert "new.txt" not in get_zip_index(archive_path)
+
+        with zipfile.ZipFile(archive_path, mode="a", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("new.txt", "new content" * 100)
+
+        with open_file_in_zip(archive_path, "new.txt") as f:
+            assert f.read() == b"new content" * 100
+
+    def test_corrupted_member(self, tmp_path: Path) -> None:
+        archive_path = _create_sample_archive_zip(tmp_path)
+        # Corrupts the local file header of the first member
+        info = get_zip_index(archive_path)["input/data.txt"]
+        with archive_path.open("r+b") as f:
+            f.seek(info.header_offset)
+            f.write(b"XXXX")
+        clear_zip_indexes()
+
+        with pytest.raises(BadArchiveContent):
+            open_file_in_zip(archive_path, "input/data.txt")
+        with open_file_in_zip(archive_path, "settings.ini") as f:
+            assert f.read() == b"key=value"
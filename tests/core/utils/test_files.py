@@ -9,9 +9,21 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+import shutil
 from pathlib import Path
 
-from antarest.core.utils.files import temp_file_path
+import pytest
+
+from antarest.core.serde.ini_writer import IniWriter
+from antarest.core.utils.files import (
+    CopyMode,
+    break_hardlink,
+    get_copy_function,
+    record_dir_created,
+    record_file_removed,
+    temp_file_path,
+    track_file_changes,
+)
 
 
 def test_temp_path_creation_does_not_create_file(tmp_path: Path) -> None:
@@ -30,3 +42,52 @@ def test_temp_file_is_removed_on_exit(tmp_path: Path) -> None:
         assert tmp_file.exists()
 
     assert not tmp_file.exists()
+
+
+@pytest.mark.parametrize("copy_mode", list(CopyMode))
+def test_copied_tree_is_independent_of_source(tmp_path: Path, copy_mode: CopyMode) -> None:
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    (src_dir / "generaldata.ini").write_text("[general]\nnbyears = 1\n")
+    (src_dir / "series.txt").write_text("1\t2\n")
+
+    dst_dir = tmp_path / "dst"
+    shutil.copytree(src_dir, dst_dir, copy_function=get_copy_function(copy_mode))
+    assert (dst_dir / "series.txt").read_text() == "1\t2\n"
+
+    IniWriter().write({"general": {"nbyears": 5}}, dst_dir / "generaldata.ini")
+    assert (src_dir / "generaldata.ini").read_text() == "[general]\nnbyears = 1\n"
+    assert "nbyears = 5" in (dst_dir / "generaldata.ini").read_text()
+
+
+def test_break_hardlink(tmp_path: Path) -> None:
+    src = tmp_path / "src.txt"
+    src.write_text("original")
+    dst = tmp_path / "dst.txt"
+    dst.hardlink_to(src)
+
+    break_hardlink(dst)
+    assert not dst.exists()
+    dst.write_text("modified")
+    assert src.read_text() == "original"
+    assert src.stat().st_nlink == 1
+
+    # not linked or missing files are left untouched
+    break_hardlink(src)
+    assert src.read_text() == "original"
+    break_hardlink(tmp_path / "missing.txt")
+
+
+def test_track_file_changes(tmp_path: Path) -> None:
+    # Nothing is recorded outside a tracking context
+    IniWriter().write({"general": {"nbyears": 1}}, tmp_path / "outside.ini")
+
+    with track_file_changes() as changes:
+        IniWriter().write({"general": {"nbyears": 5}}, tmp_path / "generaldata.ini")
+        record_file_removed(tmp_path / "removed.txt")
+        record_dir_created(tmp_path / "new_dir")
+
+    IniWriter().write({"general": {"nbyears": 1}}, tmp_path / "after.ini")
+    assert changes.written == {tmp_path / "generaldata.ini"}
+    assert changes.removed == {tmp_path / "removed.txt"}
+    assert changes.created_dirs == {tmp_path / "new_dir"}
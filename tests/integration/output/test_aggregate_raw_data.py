@@ -620,6 +620,49 @@ class TestRawDataAggregationMCInd:
         assert "economy/mc-ind" in res.json()["description"]
 
 
+class TestOutputStatistics:
+    def test_statistics(
+        self,
+        client: TestClient,
+        user_access_token: str,
+        internal_study_id: str,
+        storage_type: tuple[str, dict[str, str]],
+    ) -> None:
+        _, name_map = storage_type
+        client.headers = {"Authorization": f"Bearer {user_access_token}"}
+        output_id = name_map.get("20201014-1425eco-goodbye", "20201014-1425eco-goodbye")
+        url = f"/v1/studies/{internal_study_id}/outputs/{output_id}/statistics"
+
+        params = {"query_file": "values", "frequency": "weekly", "areas_ids": "de", "variables": "OP. COST"}
+        res = client.get(f"{url}/areas/mc-ind", params=params)
+        assert res.status_code == 200, res.json()
+        assert res.json() == [
+            {
+                "itemId": "de",
+                "clusterId": None,
+                "variable": "OP. COST",
+                "min": 46452000.0,
+                "max": 46452000.0,
+                "mean": 46452000.0,
+                "q10": 46452000.0,
+                "q50": 46452000.0,
+                "q90": 46452000.0,
+                "yearTotals": [92904000.0, 92904000.0],
+            }
+        ]
+
+        params = {"query_file": "details", "frequency": "weekly", "areas_ids": "de", "variables": "NODU"}
+        res = client.get(f"{url}/areas/mc-ind", params=params)
+        assert res.status_code == 200, res.json()
+        nodu = {s["clusterId"]: s["yearTotals"] for s in res.json()}
+        assert nodu["01_solar"] == [334.0, 334.0]
+
+        params = {"query_file": "values", "frequency": "hourly", "variables": "FLOW LIN."}
+        res = client.get(f"{url}/links/mc-ind", params=params)
+        assert res.status_code == 200, res.json()
+        assert [s["itemId"] for s in res.json()] == ["de - fr", "es - fr", "fr - it"]
+
+
 class TestRawDataAggregationMCAll:
     """
     Check the aggregation of Raw Data from studies outputs in `economy/mc-all`
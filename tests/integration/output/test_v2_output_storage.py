@@ -277,6 +277,19 @@ def test_export_output(admin_client: TestClient, study_id: str, output_name: str
         assert len(f.namelist()) == 79
 
 
+def test_stream_output_archive(admin_client: TestClient, study_id: str, output_name: str) -> None:
+    """Test streaming a V2 output as a zip archive."""
+    res = admin_client.get(f"/v1/studies/{study_id}/outputs/{output_name}/archive")
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/zip"
+
+    with zipfile.ZipFile(io.BytesIO(res.content), "r") as f:
+        assert len(f.namelist()) == 79
+
+    res = admin_client.get(f"/v1/studies/{study_id}/outputs/{FAKE_OUTPUT}/archive")
+    assert res.status_code == 404
+
+
 def test_get_variables_information(admin_client: TestClient, study_id: str, output_name: str) -> None:
     """Test retrieving the variables information endpoint for a V2 output."""
     client = admin_client
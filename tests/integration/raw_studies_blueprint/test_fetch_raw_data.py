@@ -20,6 +20,7 @@ from unittest.mock import ANY
 
 import numpy as np
 import pandas as pd
+import polars as pl
 import pytest
 from starlette.testclient import TestClient
 
@@ -31,6 +32,7 @@ from antarest.study.storage.rawstudy.model.filesystem.root.input.thermal.prepro.
 )
 from tests.integration.assets import ASSETS_DIR as INTEGRATION_ASSETS_DIR
 from tests.integration.raw_studies_blueprint.assets import ASSETS_DIR
+from tests.integration.utils import wait_task_completion
 from tests.test_helpers.dates import utc_to_local
 
 
@@ -745,6 +747,70 @@ def test_retrieve_output_data(client: TestClient, user_access_token: str, storag
         assert res.status_code == 200
 
 
+@pytest.mark.parametrize("storage_mode", ["filesystem", "database"])
+def test_retrieve_output_matrix_slice(client: TestClient, user_access_token: str, storage_mode: str) -> None:
+    client.headers = {"Authorization": f"Bearer {user_access_token}"}
+
+    res = client.post(f"/v1/studies?name=MyStudy&storage_mode={storage_mode}")
+    assert res.status_code == 201
+    study_id = res.json()
+    output_id = _import_output(client, study_id)
+    raw_url = f"/v1/studies/{study_id}/raw"
+    path = f"output/{output_id}/adequacy/mc-all/areas/es/values-daily"
+
+    whole = client.get(raw_url, params={"path": path}).json()
+    res = client.get(raw_url, params={"path": path, "columns": "2,0", "row_from": 1, "row_to": 3})
+    assert res.status_code == 200, res.json()
+    assert res.json() == {
+        "columns": [whole["columns"][0], whole["columns"][2]],
+        "data": [[row[0], row[2]] for row in whole["data"][1:3]],
+    }
+
+    # Output matrices can also be retrieved in arrow format, with flattened headers
+    res = client.get(raw_url, params={"path": path, "columns": "0", "matrix_format": "arrow uncompressed"})
+    assert res.status_code == 200
+    dataframe = pl.read_ipc(io.BytesIO(res.content))
+    assert dataframe.columns == [" % ".join(whole["columns"][0])]
+    assert dataframe.to_series().to_list() == [row[0] for row in whole["data"]]
+
+    # Slicing is only possible on matrices, inside their bounds
+    res = client.get(raw_url, params={"path": path, "columns": "10000"})
+    assert res.status_code == 400
+    assert res.json()["exception"] == "InvalidMatrixSliceError"
+    res = client.get(raw_url, params={"path": path, "row_from": 3, "row_to": 1})
+    assert res.status_code == 400
+    res = client.get(raw_url, params={"path": f"output/{output_id}/about-the-study/parameters", "row_to": 1})
+    assert res.status_code == 404
+    assert res.json()["exception"] == "IncorrectPathError"
+
+
+def test_retrieve_archived_output_matrix(client: TestClient, user_access_token: str) -> None:
+    client.headers = {"Authorization": f"Bearer {user_access_token}"}
+
+    res = client.post("/v1/studies?name=MyStudy")
+    assert res.status_code == 201
+    study_id = res.json()
+    output_id = _import_output(client, study_id)
+    raw_url = f"/v1/studies/{study_id}/raw"
+    path = f"output/{output_id}/adequacy/mc-all/areas/es/values-daily"
+    links_path = f"output/{output_id}/adequacy/mc-ind/00001/links/de/fr/values-hourly"
+
+    expected = [client.get(raw_url, params={"path": p}).json() for p in (path, links_path)]
+    expected_slice = client.get(raw_url, params={"path": path, "columns": "1", "row_to": 2}).json()
+
+    res = client.post(f"/v1/studies/{study_id}/outputs/{output_id}/_archive")
+    assert res.status_code == 200, res.json()
+    task = wait_task_completion(client, user_access_token, res.json())
+    assert task.status == TaskStatus.COMPLETED
+    assert client.get(f"/v1/studies/{study_id}/outputs").json()[0]["archived"]
+
+    # Matrices are read directly inside the archive
+    assert [client.get(raw_url, params={"path": p}).json() for p in (path, links_path)] == expected
+    assert client.get(raw_url, params={"path": path, "columns": "1", "row_to": 2}).json() == expected_slice
+    res = client.get(raw_url, params={"path": f"output/{output_id}/adequacy/mc-all/areas/es/values-weekly"})
+    assert res.status_code == 404
+
+
 def _import_output(client: TestClient, study_id: str) -> str:
     # Imports an output inside the study
     output_path_seven_zip = INTEGRATION_ASSETS_DIR / "output_adq.7z"
@@ -517,6 +517,36 @@ class TestStudiesListing:
             number_of_pages += 1
         assert paginated_studies == study_map
         assert number_of_pages == len(study_map) // 2 + len(study_map) % 2
+        # test keyset pagination concatenation
+        paginated_studies = {}
+        after = ""
+        while len(paginated_studies) < len(study_map):
+            res = client.get(
+                STUDIES_URL,
+                headers={"Authorization": f"Bearer {admin_access_token}"},
+                params={"pageSize": 2, "after": after},
+            )
+            assert res.status_code == LIST_STATUS_CODE, res.json()
+            page_studies = res.json()
+            assert page_studies
+            paginated_studies.update(page_studies)
+            after = list(page_studies)[-1]
+        assert paginated_studies == study_map
+        # the page after the last study is empty, but the cursor must be a known study
+        res = client.get(
+            STUDIES_URL,
+            headers={"Authorization": f"Bearer {admin_access_token}"},
+            params={"pageSize": 2, "after": after},
+        )
+        assert res.status_code == LIST_STATUS_CODE, res.json()
+        assert res.json() == {}
+        res = client.get(
+            STUDIES_URL,
+            headers={"Authorization": f"Bearer {admin_access_token}"},
+            params={"pageSize": 2, "after": "unknown"},
+        )
+        assert res.status_code == 422, res.json()
+        assert res.json()["exception"] == "StudyCursorNotFound"
 
         # test 1.c for a user with access to select studies
         res = client.get(
@@ -15,11 +15,13 @@ import io
 import logging
 import time
 import typing as t
+import uuid
 from pathlib import Path
 
 import pytest
 from starlette.testclient import TestClient
 
+from antarest.core.serde.json import to_json_string
 from antarest.core.tasks.model import TaskDTO, TaskStatus
 from antarest.core.utils.fastapi_sqlalchemy import db
 from antarest.core.utils.utils import current_time
@@ -533,3 +535,77 @@ def test_lifecycle_for_both_storage_modes(
     download_id = res.json()["file"]["id"]
 
     check_exported_study_integrity(client, tmp_path, download_id, "VariantStudy")
+
+
+def test_import_commands(client: TestClient, admin_access_token: str, variant_id: str) -> None:
+    client.headers = {"Authorization": f"Bearer {admin_access_token}"}
+    # The study is checked before the commands are received
+    res = client.post(f"/v1/studies/{uuid.uuid4()}/commands/_import", content="{}")
+    assert res.status_code == 404, res.json()
+
+    res = client.post(
+        f"/v1/studies/{variant_id}/commands",
+        json=[{"action": "create_area", "args": {"area_name": "fr"}}],
+    )
+    assert res.status_code == 200, res.json()
+
+    area_names = [f"area {k}" for k in range(25)]
+    lines = [to_json_string({"action": "create_area", "args": {"area_name": name}}) for name in area_names]
+    lines.insert(10, "")
+    lines.append(to_json_string({"action": "create_area", "args": [{"area_name": "de"}, {"area_name": "it"}]}))
+    res = client.post(f"/v1/studies/{variant_id}/commands/_import", content="\n".join(lines))
+    assert res.status_code == 200, res.json()
+    task = wait_task_completion(client, admin_access_token, res.json())
+    assert task.status == TaskStatus.COMPLETED, task
+    assert task.result is not None and task.result.success, task.result
+
+    res = client.get(f"/v1/studies/{variant_id}/commands")
+    commands = res.json()
+    assert len(commands) == len(area_names) + 2
+    imported_args = [command["args"] for command in commands[1:]]
+    imported_names = [
+        args["area_name"] for batch in imported_args for args in (batch if isinstance(batch, list) else [batch])
+    ]
+    assert imported_names == [*area_names, "de", "it"]
+
+    # A single invalid command prevents the import of all the commands
+    lines = [to_json_string({"action": "create_area", "args": {"area_name": "be"}}), '{"action": "unknown_action"}']
+    res = client.post(f"/v1/studies/{variant_id}/commands/_import", content="\n".join(lines))
+    task = wait_task_completion(client, admin_access_token, res.json())
+    assert task.status == TaskStatus.FAILED
+    assert task.result is not None
+    assert task.result.message == f"Command at line 2 for study {variant_id}"
+    res = client.get(f"/v1/studies/{variant_id}/commands")
+    assert len(res.json()) == len(commands)
+
+    res = client.put(f"/v1/studies/{variant_id}/generate")
+    task = wait_task_completion(client, admin_access_token, res.json())
+    assert task.status == TaskStatus.COMPLETED, task
+    res = client.get(f"/v1/studies/{variant_id}/areas", params={"type": "AREA"})
+    assert len(res.json()) == len(area_names) + 3
+
+
+def test_slowest_commands(client: TestClient, admin_access_token: str, variant_id: str) -> None:
+    client.headers = {"Authorization": f"Bearer {admin_access_token}"}
+    # The variant has not been generated yet
+    res = client.get(f"/v1/studies/{variant_id}/commands/_slowest")
+    assert res.status_code == 422, res.json()
+
+    area_names = ["fr", "de", "it"]
+    res = client.post(
+        f"/v1/studies/{variant_id}/commands",
+        json=[{"action": "create_area", "args": {"area_name": name}} for name in area_names],
+    )
+    assert res.status_code == 200, res.json()
+    res = client.put(f"/v1/studies/{variant_id}/generate")
+    task = wait_task_completion(client, admin_access_token, res.json())
+    assert task.status == TaskStatus.COMPLETED, task
+
+    res = client.get(f"/v1/studies/{variant_id}/commands/_slowest", params={"limit": 2})
+    assert res.status_code == 200, res.json()
+    slowest = res.json()
+    assert len(slowest) == 2
+    assert {detail["name"] for detail in slowest} == {"create_area"}
+    durations = [detail["metrics"]["duration"] for detail in slowest]
+    assert durations == sorted(durations, reverse=True)
+    assert all(detail["metrics"]["ini_files_touched"] > 0 for detail in slowest)
@@ -14,7 +14,7 @@ import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import polars as pl
 import pytest
@@ -55,6 +55,7 @@ from antarest.study.storage.variantstudy.model.command.generate_thermal_cluster_
 )
 from antarest.study.storage.variantstudy.model.command_context import CommandContext
 from antarest.study.storage.variantstudy.model.dbmodel import CommandBlock, VariantStudy
+from antarest.study.storage.variantstudy.model.model import CommandDTO
 from antarest.study.storage.variantstudy.repository import VariantStudyRepository
 from antarest.study.storage.variantstudy.variant_study_service import VariantStudyService
 from tests.conftest import empty_study_fixture
@@ -211,6 +212,87 @@ def test_command_matrix_usage_provider(
             MatrixReference(matrix_id=matrices_id, use_description=description2),
         ]
 
+        # The blocks written without their matrices have been indexed
+        assert variant_study_repository.get_unindexed_command_blocks() == []
+        assert list(command_matrix_usage_provider.get_matrix_usage()) == matrices_references
+
+
+def test_command_matrix_usage_provider_skips_unparsable_blocks(
+    command_matrix_usage_provider: CommandMatrixUsageProvider,
+    variant_study_repository: VariantStudyRepository,
+    tmp_path: Path,
+) -> None:
+    with db():
+        study_id = "study_id"
+        variant_study_repository.save(VariantStudy(id=study_id, version="880", path=tmp_path.as_posix()))
+        command_block = CommandBlock(
+            study_id=study_id,
+            command=CommandName.CREATE_LINK.value,
+            args='{"area1": "area1"}',
+            index=0,
+            version=7,
+            study_version="880",
+        )
+        db.session.add(command_block)
+        db.session.commit()
+
+        command_factory = command_matrix_usage_provider.command_factory
+        with patch.object(command_factory, "to_command", wraps=command_factory.to_command) as to_command:
+            assert list(command_matrix_usage_provider.get_matrix_usage()) == []
+            assert to_command.call_count == 1
+
+            # The block is not parsed again, as long as it is not modified
+            assert list(command_matrix_usage_provider.get_matrix_usage()) == []
+            assert to_command.call_count == 1
+
+            command_block.args = '{"area1": "area1", "area2": "area2", "series": [[1,2,3]]}'
+            db.session.commit()
+            assert len(list(command_matrix_usage_provider.get_matrix_usage())) == 1
+            assert to_command.call_count == 2
+            assert variant_study_repository.get_unindexed_command_blocks() == []
+
+
+@with_db_context
+@with_admin_user
+def test_command_matrix_usage_provider_indexes_written_commands(
+    tmp_path: Path, variant_study_service: VariantStudyService
+) -> None:
+    parent = create_raw_study(id=str(uuid.uuid4()), path=str(tmp_path), version="880")
+    db.session.add(parent)
+    db.session.commit()
+    variant_study = variant_study_service.create_variant_study(parent.id, "variant_study")
+    matrix_service = variant_study_service.command_factory.command_context.matrix_service
+    matrix_1 = matrix_service.create(pl.DataFrame([[1.0]]))
+    matrix_2 = matrix_service.create(pl.DataFrame([[2.0]]))
+
+    def replace_matrix(*matrix_ids: str) -> CommandDTO:
+        args = [
+            {"target": f"input/load/series/load_{k}", "matrix": matrix_id} for k, matrix_id in enumerate(matrix_ids)
+        ]
+        return CommandDTO(action=CommandName.REPLACE_MATRIX.value, args=args, study_version="880")
+
+    def get_used_matrices() -> set[str]:
+        return {matrix_id for matrix_id, _, _ in variant_study_service.repository.get_command_block_matrices()}
+
+    command_ids = variant_study_service.append_commands(
+        variant_study.id,
+        [
+            replace_matrix(matrix_1, matrix_2),
+            CommandDTO(action="create_area", args={"area_name": "fr"}, study_version="880"),
+        ],
+    )
+    assert variant_study_service.repository.get_unindexed_command_blocks() == []
+    assert get_used_matrices() == {matrix_1, matrix_2}
+
+    variant_study_service.update_command(variant_study.id, command_ids[0], replace_matrix(matrix_2))
+    assert get_used_matrices() == {matrix_2}
+
+    variant_study_service.remove_command(variant_study.id, command_ids[0])
+    assert get_used_matrices() == set()
+
+    variant_study_service.replace_commands(variant_study.id, [replace_matrix(matrix_1)])
+    assert get_used_matrices() == {matrix_1}
+
 
 @with_db_context
 @with_admin_user
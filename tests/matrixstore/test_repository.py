@@ -25,6 +25,8 @@ from polars.testing import assert_frame_equal
 from sqlalchemy.orm import Session
 
 from antarest.core.config import InternalMatrixFormat
+from antarest.core.utils.fastapi_sqlalchemy import db
+from antarest.core.utils.io_profile import io_profile
 from antarest.core.utils.polars import create_polars_dataframe
 from antarest.core.utils.utils import current_time
 from antarest.login.model import Group, Password, User
@@ -35,11 +37,13 @@ from antarest.matrixstore.model import (
     Matrix,
     MatrixDataSet,
     MatrixDataSetRelation,
+    MatrixFileFingerprint,
 )
 from antarest.matrixstore.parsing import load_matrix, save_matrix
 from antarest.matrixstore.repository import (
     MatrixContentRepository,
     MatrixDataSetRepository,
+    MatrixFileRepository,
     MatrixRepository,
     compute_hash,
 )
@@ -210,6 +214,61 @@ def matrix_repository(
         shutil.rmtree(temp_path / "matrix-store")
 
 
+class TestMatrixFileRepository:
+    def test_lifecycle(self, db_session: Session, tmp_path: Path) -> None:
+        matrix_repo = MatrixRepository(db_session)
+        for matrix_id in ["m1", "m2"]:
+            matrix_repo.save(Matrix(id=matrix_id, width=1, height=1, created_at=current_time(), version=2))
+        file_repo = MatrixFileRepository(db_session)
+
+        paths = [tmp_path / "a.txt", tmp_path / "b.txt"]
+        for path in paths:
+            path.write_text("1\n")
+        fingerprint_a, fingerprint_b = [MatrixFileFingerprint.from_path(path) for path in paths]
+        assert file_repo.get_matrix_ids([fingerprint_a, fingerprint_b]) == {}
+
+        file_repo.save_matrix_ids({fingerprint_a: "m1", fingerprint_b: "m2"})
+        assert file_repo.get_matrix_ids([fingerprint_a, fingerprint_b]) == {fingerprint_a: "m1", fingerprint_b: "m2"}
+
+        # A modified file is not resolved anymore, until it is saved again
+        paths[0].write_text("1\n2\n")
+        new_fingerprint_a = MatrixFileFingerprint.from_path(paths[0])
+        assert file_repo.get_matrix_ids([new_fingerprint_a]) == {}
+        file_repo.save_matrix_ids({new_fingerprint_a: "m2"})
+        assert file_repo.get_matrix_ids([new_fingerprint_a]) == {new_fingerprint_a: "m2"}
+        assert file_repo.get_matrix_ids([fingerprint_a]) == {}
+
+        # The fingerprints of a deleted matrix are deleted with it
+        matrix_repo.delete("m2")
+        assert file_repo.get_matrix_ids([new_fingerprint_a, fingerprint_b]) == {}
+
+        # The fingerprints of unknown matrices are not saved
+        file_repo.save_matrix_ids({fingerprint_a: "m1", fingerprint_b: "unknown"})
+        assert file_repo.get_matrix_ids([fingerprint_a, fingerprint_b]) == {}
+
+        # The fingerprints of the files of a removed directory are deleted
+        file_repo.save_matrix_ids({fingerprint_a: "m1"})
+        file_repo.delete_matrix_ids(tmp_path.parent / f"{tmp_path.name}-other")
+        assert file_repo.get_matrix_ids([fingerprint_a]) == {fingerprint_a: "m1"}
+        file_repo.delete_matrix_ids(tmp_path)
+        assert file_repo.get_matrix_ids([fingerprint_a]) == {}
+
+    def test_saved_ids_survive_the_rollback_of_the_caller(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.txt"
+        path.write_text("1\n")
+        fingerprint = MatrixFileFingerprint.from_path(path)
+        with db(commit_on_exit=True):
+            MatrixRepository().save(Matrix(id="m1", width=1, height=1, created_at=current_time(), version=2))
+
+        # Read requests do not commit their session
+        with db():
+            MatrixFileRepository().save_matrix_ids({fingerprint: "m1"})
+            db.session.add(Matrix(id="m2", width=1, height=1, created_at=current_time(), version=2))
+        with db():
+            assert MatrixFileRepository().get_matrix_ids([fingerprint]) == {fingerprint: "m1"}
+            assert MatrixRepository().get("m2") is None
+
+
 class TestMatrixContentRepository:
     @pytest.mark.parametrize("matrix_format", ["tsv", "hdf", "parquet", "feather"])
     def test_save(self, tmp_path: str, matrix_format: str) -> None:
@@ -274,6 +333,15 @@ class TestMatrixContentRepository:
                     assert matrix_content_repo.exists(results[0].hash), f"Failed on try {i}"
                     matrix_content_repo.delete(results[0].hash)
 
+    def test_save_records_written_matrices(self, tmp_path: Path) -> None:
+        matrix_content_repo: MatrixContentRepository
+        with matrix_repository(tmp_path, matrix_format=InternalMatrixFormat.TSV) as matrix_content_repo:
+            with io_profile() as profile:
+                matrix_content_repo.save(pl.DataFrame([[1, 2, 3]]))
+                # The matrix already exists: nothing is written
+                matrix_content_repo.save(pl.DataFrame([[1, 2, 3]]))
+            assert profile.matrices_written == 1
+
     @pytest.mark.parametrize("matrix_format", ["tsv", "hdf", "parquet", "feather"])
     def test_get_exists_and_delete(self, tmp_path: str, matrix_format: str) -> None:
         """
@@ -9,6 +9,7 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+import io
 import os
 import shutil
 import zipfile
@@ -451,6 +452,24 @@ def test_export_output(output_storage: IOutputStorage, tmp_path: Path) -> None:
         output_storage.export_output("STA-mini", "non-existent", zip_path)
 
 
+def test_iter_output_archive(output_storage: IOutputStorage) -> None:
+    expected_count = 79
+
+    archive = b"".join(output_storage.iter_output_archive("STA-mini", "20201014-1427eco"))
+    with zipfile.ZipFile(io.BytesIO(archive), "r") as zf:
+        assert len(zf.namelist()) == expected_count
+
+    # Check on archived study
+    output_storage.archive_study_output("STA-mini", "20201014-1427eco")
+    archive = b"".join(output_storage.iter_output_archive("STA-mini", "20201014-1427eco"))
+    with zipfile.ZipFile(io.BytesIO(archive), "r") as zf:
+        assert len(zf.namelist()) == expected_count
+
+    # The output is checked before the archive is streamed
+    with pytest.raises(OutputNotFound):
+        output_storage.iter_output_archive("STA-mini", "non-existent")
+
+
 def test_write_output_to_dir(output_storage: IOutputStorage, tmp_path: Path) -> None:
     # We just checking the count of files is correct as a proxy of a full content check
     expected_count = 79
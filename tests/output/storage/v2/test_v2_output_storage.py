@@ -26,7 +26,7 @@ from antarest.launcher.adapters.abstractlauncher import SimulationLogs
 from antarest.launcher.model import LogType
 from antarest.lfs.dir_lfs import DirLargeFileStorage
 from antarest.lfs.lfs import ILargeFileStorage
-from antarest.output.filestudy.utils import MCAllAreasQueryFile
+from antarest.output.filestudy.utils import MCAllAreasQueryFile, MCIndAreasQueryFile
 from antarest.output.storage.v2.repository import OutputV2Repository
 from antarest.output.storage.v2.storage import V2OutputStorage
 from antarest.output.storage.v2.variables_storage import parquet_output_dir
@@ -135,6 +135,10 @@ def test_storage(
         assert export_path.exists()
         assert zipfile.is_zipfile(export_path)
 
+        # Check the archive can be streamed
+        chunks = storage.iter_output_archive(study_id="my-study", output_id=f"{EXPECTED_DATE}eco")
+        assert b"".join(chunks) == export_path.read_bytes()
+
         # Delete output
         storage.delete_output(study_id="my-study", output_id=f"{EXPECTED_DATE}eco")
         assert not storage.output_exists(study_id="my-study", output_id=f"{EXPECTED_DATE}eco")
@@ -866,3 +870,77 @@ def test_aggregate_thermal_clusters(
         assert "cluster" in df.columns
         assert "timeId" in df.columns
         assert "01_solar" in df["cluster"]
+
+
+def test_import_computes_mc_ind_statistics(
+    storage: V2OutputStorage,
+    study_id: str,
+    output_path: Path,
+    tmp_path: Path,
+):
+    mc_ind_output_path = output_path.parent / "20201014-1425eco-goodbye"
+    with db():
+        output_name = storage.import_output(study_id, mc_ind_output_path)
+
+    parquet_dir = parquet_output_dir(tmp_path / "variables", study_id, output_name)
+    assert (parquet_dir / "mc-ind_areas_weekly.stats.parquet").exists()
+    assert (parquet_dir / "mc-ind_thermal_clusters_weekly.stats.parquet").exists()
+    assert not any(f.name.startswith("mc-all") and "stats" in f.name for f in parquet_dir.iterdir())
+
+    with db():
+        statistics = storage.get_output_statistics(
+            study_id, output_name, MCIndAreasQueryFile.VALUES, MatrixFrequency.HOURLY, ["de"], ["load", "op. cost"]
+        )
+        raw_data = pl.concat(
+            storage.aggregate_output_data(
+                study_id,
+                output_name,
+                MCIndAreasQueryFile.VALUES,
+                MatrixFrequency.HOURLY,
+                ["de"],
+                ["LOAD"],
+                transform_columns_headers=True,
+            )
+        )
+
+    assert [(s.item_id, s.variable) for s in statistics] == [("de", "LOAD"), ("de", "OP. COST")]
+    load = statistics[0]
+    assert load.min == raw_data["LOAD"].min()
+    assert load.max == raw_data["LOAD"].max()
+    assert load.mean == pytest.approx(raw_data["LOAD"].mean())
+    assert load.year_totals == raw_data.group_by("mcYear").agg(pl.col("LOAD").sum()).sort("mcYear")["LOAD"].to_list()
+
+    with db():
+        clusters = storage.get_output_statistics(
+            study_id, output_name, MCIndAreasQueryFile.DETAILS, MatrixFrequency.WEEKLY, ["de"], ["NODU"]
+        )
+    assert {s.cluster_id for s in clusters} >= {"01_solar", "02_wind_on"}
+    assert len(clusters[0].year_totals) == 2
+
+
+def test_statistics_without_sidecar_are_not_written_on_read(
+    storage: V2OutputStorage,
+    study_id: str,
+    output_path: Path,
+    tmp_path: Path,
+):
+    mc_ind_output_path = output_path.parent / "20201014-1425eco-goodbye"
+    with db():
+        output_name = storage.import_output(study_id, mc_ind_output_path)
+
+    parquet_dir = parquet_output_dir(tmp_path / "variables", study_id, output_name)
+    assert not any(f.suffix == ".tmp" for f in parquet_dir.iterdir())
+    statistics_path = parquet_dir / "mc-ind_areas_hourly.stats.parquet"
+
+    with db():
+        expected = storage.get_output_statistics(
+            study_id, output_name, MCIndAreasQueryFile.VALUES, MatrixFrequency.HOURLY, ["de"], ["load"]
+        )
+        # Outputs imported before the sidecars existed
+        statistics_path.unlink()
+        statistics = storage.get_output_statistics(
+            study_id, output_name, MCIndAreasQueryFile.VALUES, MatrixFrequency.HOURLY, ["de"], ["load"]
+        )
+
+    assert statistics == expected
+    assert not statistics_path.exists()
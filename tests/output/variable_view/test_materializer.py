@@ -0,0 +1,108 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import zipfile
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from unittest.mock import Mock
+
+import polars as pl
+import pytest
+
+from antarest.output.filestudy.aggregator_management import AggregatorManager
+from antarest.output.filestudy.utils import MCIndAreasQueryFile, MCIndLinksQueryFile, QueryFileType
+from antarest.output.storage.output_storage import IOutputStorage
+from antarest.output.variable_view.materializer import VariablesViewDefinition, materialize_variables_views
+from antarest.output.variable_view.model import AreaOutputId, LinkOutputId, ThermalClusterOutputId
+from antarest.study.model import MatrixFrequency
+
+OUTPUT_NAME = "20201014-1425eco-goodbye"
+
+
+@pytest.fixture(scope="module")
+def output_path(tmp_path_factory: pytest.TempPathFactory, project_path: Path) -> Path:
+    tmp_dir = tmp_path_factory.mktemp("materializer")
+    with zipfile.ZipFile(project_path / "examples/studies/STA-mini.zip") as zf:
+        zf.extractall(tmp_dir)
+    return tmp_dir / "STA-mini" / "output" / OUTPUT_NAME
+
+
+@pytest.fixture
+def storage(output_path: Path) -> Mock:
+    def aggregate(
+        study_id: str,
+        output_id: str,
+        query_file: QueryFileType,
+        frequency: MatrixFrequency,
+        ids_to_consider: Sequence[str],
+        columns_names: Sequence[str],
+        transform_columns_headers: bool,
+        mc_years: Sequence[int] | None = None,
+    ) -> Iterator[pl.DataFrame]:
+        manager = AggregatorManager(
+            output_path, query_file, frequency, ids_to_consider, columns_names, transform_columns_headers, mc_years
+        )
+        return manager.aggregate_output_data()
+
+    storage = Mock(spec=IOutputStorage)
+    storage.aggregate_output_data.side_effect = aggregate
+    return storage
+
+
+def test_materialize_several_views_in_one_pass(storage: Mock) -> None:
+    views = [
+        VariablesViewDefinition(AreaOutputId(area_id="de"), "OP. COST"),
+        VariablesViewDefinition(ThermalClusterOutputId(area_id="de", thermal_id="01_solar"), "NODU"),
+        VariablesViewDefinition(AreaOutputId(area_id="es"), "LOAD"),
+        VariablesViewDefinition(LinkOutputId(area_from_id="de", area_to_id="fr"), "FLOW LIN."),
+    ]
+    op_cost, nodu, load, flow = materialize_variables_views(
+        storage, "study", OUTPUT_NAME, MatrixFrequency.WEEKLY, views[:3]
+    ) + materialize_variables_views(storage, "study", OUTPUT_NAME, MatrixFrequency.HOURLY, views[3:])
+
+    # Area views share the same `values` files, which are read only once
+    query_files = [call.args[2] for call in storage.aggregate_output_data.call_args_list]
+    assert query_files == [MCIndAreasQueryFile.VALUES, MCIndAreasQueryFile.DETAILS, MCIndLinksQueryFile.VALUES]
+    assert storage.aggregate_output_data.call_args_list[0].args[4:6] == (["de", "es"], ["LOAD", "OP. COST"])
+
+    # One column per MC year, one row per time step
+    assert op_cost.columns == ["1", "2"]
+    assert op_cost.to_numpy().tolist() == [[46452000.0, 46452000.0], [46452000.0, 46452000.0]]
+    assert nodu.to_numpy().tolist() == [[167.0, 167.0], [167.0, 167.0]]
+    assert load.shape == (2, 2)
+    assert flow.shape == (336, 2)
+
+
+def test_projected_columns_are_the_filtered_ones(output_path: Path) -> None:
+    def aggregate(columns_names: list[str]) -> pl.DataFrame:
+        manager = AggregatorManager(
+            output_path, MCIndAreasQueryFile.DETAILS, MatrixFrequency.WEEKLY, ["de"], columns_names, True
+        )
+        return pl.concat(manager.aggregate_output_data())
+
+    whole = aggregate([])
+    projected = aggregate(["NODU"])
+    assert projected.columns == ["area", "cluster", "mcYear", "timeId", "NODU"]
+    assert projected.equals(whole.select(projected.columns))
+
+
+def test_materialize_area_and_link_views_together(storage: Mock) -> None:
+    views = [
+        VariablesViewDefinition(AreaOutputId(area_id="de"), "OP. COST"),
+        VariablesViewDefinition(LinkOutputId(area_from_id="de", area_to_id="fr"), "FLOW LIN."),
+    ]
+    op_cost, flow = materialize_variables_views(storage, "study", OUTPUT_NAME, MatrixFrequency.HOURLY, views)
+
+    # Areas and links `values` files are different files, read separately
+    query_files = [call.args[2] for call in storage.aggregate_output_data.call_args_list]
+    assert [type(query_file) for query_file in query_files] == [MCIndAreasQueryFile, MCIndLinksQueryFile]
+    assert op_cost.shape == (336, 2)
+    assert flow.shape == (336, 2)
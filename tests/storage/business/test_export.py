@@ -136,7 +136,8 @@ def test_normalize_denormalized_methods(tmp_path: Path, study_factory: StudyFact
     # Normalize the study to come back to the initial point
     with DBStatementRecorder(db_session.bind) as db_recorder:
         raw_study_service.normalize_study(study)
-        assert len(db_recorder.sql_statements) == 1  # 1 DB request for all matrices
+        statements = [s for s in db_recorder.sql_statements if "SAVEPOINT" not in s]
+        assert len(statements) == 1  # 1 DB request for all matrices, in a SAVEPOINT
 
     assert normalized_path.exists()
     assert not denormalized_path.exists()
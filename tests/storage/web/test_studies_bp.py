@@ -98,7 +98,9 @@ def test_server() -> None:
     client = create_test_client(mock_service)
     client.get(f"/v1/studies/{STUDY1_ID}/raw?path=settings/general/params")
 
-    mock_service.get_raw_content.assert_called_once_with(STUDY1_ID, "settings/general/params", 3, True)
+    mock_service.get_raw_content.assert_called_once_with(
+        STUDY1_ID, "settings/general/params", 3, True, matrix_slice=None
+    )
 
 
 def test_404() -> None:
@@ -121,7 +123,7 @@ def test_server_with_parameters() -> None:
     result = client.get(f"/v1/studies/{STUDY1_ID}/raw?depth=4")
 
     assert result.status_code == HTTPStatus.OK
-    mock_storage_service.get_raw_content.assert_called_once_with(STUDY1_ID, "/", 4, True)
+    mock_storage_service.get_raw_content.assert_called_once_with(STUDY1_ID, "/", 4, True, matrix_slice=None)
 
     result = client.get(f"/v1/studies/{STUDY2_ID}/raw?depth=WRONG_TYPE")
     assert result.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
@@ -129,7 +131,7 @@ def test_server_with_parameters() -> None:
     result = client.get(f"/v1/studies/{STUDY2_ID}/raw")
     assert result.status_code == HTTPStatus.OK
 
-    mock_storage_service.get_raw_content.assert_called_with(STUDY2_ID, "/", 3, True)
+    mock_storage_service.get_raw_content.assert_called_with(STUDY2_ID, "/", 3, True, matrix_slice=None)
 
 
 def test_create_study(tmp_path: str, project_path: Path) -> None:
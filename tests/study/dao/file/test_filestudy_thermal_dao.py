@@ -9,8 +9,28 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+import functools
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+import polars as pl
+import pytest
+
+from antarest.blobstore.service import IBlobService
+from antarest.matrixstore.service import ISimpleMatrixService
 from antarest.study.business.model.thermal_cluster_model import ThermalCluster
 from antarest.study.dao.file.file_study_dao import FileStudyTreeDao
+from antarest.study.model import STUDY_VERSION_9_3
+from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
+from antarest.study.storage.rawstudy.model.filesystem.matrix.input_series_matrix import InputSeriesMatrix
+from antarest.study.storage.rawstudy.model.filesystem.matrix.matrix_parsing import PARSING_WORKERS, parse_matrices
+from antarest.study.storage.rawstudy.model.filesystem.matrix.matrix_storage_context import MatrixStorageContext
+from antarest.study.storage.rawstudy.model.filesystem.root.filestudytree import FileStudyTree
+from antarest.study.storage.variantstudy.business.matrix_constants_generator import GeneratorMatrixConstants
+from tests.study.dao.file.conftest import build_file_study
 from tests.study.dao.utils import save_area
 
 
@@ -25,3 +45,109 @@ def test_area_with_no_clusters_are_absent_from_clusters_dict(filestudy_dao: File
     assert "italy" not in clusters
     assert "germany" in clusters
     assert "gas" in clusters["germany"]
+
+
+@pytest.fixture
+def unmanaged_dao(tmp_path: Path, matrix_service: ISimpleMatrixService, blob_service: IBlobService) -> FileStudyTreeDao:
+    file_study = build_file_study(tmp_path, matrix_service, STUDY_VERSION_9_3)
+    matrix_storage_context = MatrixStorageContext(matrix_service=matrix_service, is_managed=False)
+    file_study = FileStudy(file_study.config, FileStudyTree(matrix_storage_context, file_study.config))
+    constants = GeneratorMatrixConstants(matrix_service)
+    constants.init_constant_matrices()
+    return FileStudyTreeDao(file_study, False, constants, blob_service, matrix_service, Mock())
+
+
+def _save_thermal_series(
+    dao: FileStudyTreeDao, matrix_service: ISimpleMatrixService, cluster_count: int, column_count: int
+) -> dict[str, str]:
+    save_area(dao, "fr")
+    dao.save_thermals({"fr": [ThermalCluster(name=f"th_{k}") for k in range(cluster_count)]})
+    rng = np.random.default_rng(42)
+    schema = [str(i) for i in range(column_count)]
+    series = {
+        f"th_{k}": matrix_service.create(pl.DataFrame(rng.uniform(0, 1000, size=(8760, column_count)).round(2), schema))
+        for k in range(cluster_count)
+    }
+    dao.save_thermal_series({"fr": series})
+    return series
+
+
+def _get_all_thermals_series(
+    dao: FileStudyTreeDao, matrix_service: ISimpleMatrixService, max_workers: int
+) -> dict[str, dict[str, str]]:
+    # The fingerprints of the files parsed before are ignored, so that all the series are parsed
+    with (
+        patch.object(matrix_service, "get_file_matrix_ids", return_value={}),
+        patch(
+            "antarest.study.dao.file.file_study_dao.parse_matrices",
+            functools.partial(parse_matrices, max_workers=max_workers),
+        ),
+    ):
+        return dao.get_all_thermals_series()
+
+
+def test_get_all_thermals_series_in_parallel(unmanaged_dao: FileStudyTreeDao, matrix_service: ISimpleMatrixService):
+    """
+    The parallel parsing of the series of an unmanaged study gives the same result as the sequential one.
+    """
+    series = _save_thermal_series(unmanaged_dao, matrix_service, cluster_count=10, column_count=2)
+    results = {
+        max_workers: _get_all_thermals_series(unmanaged_dao, matrix_service, max_workers) for max_workers in [1, 4]
+    }
+    assert results[1] == results[4] == {"fr": series}
+
+
+@pytest.mark.benchmark
+def test_get_all_thermals_series_benchmark(
+    unmanaged_dao: FileStudyTreeDao,
+    matrix_service: ISimpleMatrixService,
+    record_property: Callable[[str, object], None],
+):
+    """
+    Compares the sequential and the parallel parsing of the series of an unmanaged study.
+    """
+    cluster_count = 200
+    series = _save_thermal_series(unmanaged_dao, matrix_service, cluster_count=cluster_count, column_count=10)
+
+    durations = {}
+    for max_workers in sorted({1, PARSING_WORKERS}):
+        # Best of 3 runs, the first one also warms up the file system cache
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            result = _get_all_thermals_series(unmanaged_dao, matrix_service, max_workers)
+            timings.append(time.perf_counter() - start)
+            assert result == {"fr": series}
+        durations[max_workers] = min(timings)
+        record_property(f"duration_{max_workers}_workers", durations[max_workers])
+
+    print(
+        f"get_all_thermals_series: {cluster_count} matrices, {durations[1]:.3f}s sequential,"
+        f" {durations[PARSING_WORKERS]:.3f}s with {PARSING_WORKERS} workers"
+    )
+
+
+def test_unchanged_series_are_not_parsed_again(
+    unmanaged_dao: FileStudyTreeDao, matrix_service: ISimpleMatrixService
+) -> None:
+    save_area(unmanaged_dao, "fr")
+    unmanaged_dao.save_thermals({"fr": [ThermalCluster(name="th_1"), ThermalCluster(name="th_2")]})
+    series = {f"th_{k}": matrix_service.create(pl.DataFrame({"0": [float(k)] * 8760})) for k in range(1, 3)}
+    unmanaged_dao.save_thermal_series({"fr": series})
+
+    with patch.object(
+        InputSeriesMatrix, "parse_content", autospec=True, side_effect=InputSeriesMatrix.parse_content
+    ) as parse:
+        assert unmanaged_dao.get_all_thermals_series() == {"fr": series}
+        assert parse.call_count == 2
+
+        # The matrix IDs of the unchanged files are retrieved from their fingerprint
+        parse.reset_mock()
+        assert unmanaged_dao.get_all_thermals_series() == {"fr": series}
+        assert parse.call_count == 0
+
+        # A modified file is parsed again
+        new_series_id = matrix_service.create(pl.DataFrame({"0": [3.0] * 8760}))
+        unmanaged_dao.save_thermal_series({"fr": {"th_1": new_series_id}})
+        assert unmanaged_dao.get_all_thermals_series() == {"fr": {"th_1": new_series_id, "th_2": series["th_2"]}}
+        assert parse.call_count == 1
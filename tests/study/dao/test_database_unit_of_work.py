@@ -0,0 +1,130 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from antarest.core.exceptions import AreaNotFound
+from antarest.core.utils.utils import current_time
+from antarest.matrixstore.model import Matrix
+from antarest.matrixstore.repository import MatrixRepository
+from antarest.study.business.model.hydro_model import HydroManagement
+from antarest.study.business.model.thermal_cluster_model import ThermalCluster, initialize_thermal_cluster
+from antarest.study.dao.database.database_study_dao import DatabaseStudyDao
+from tests.study.dao.utils import save_area
+
+
+def _save_thermal(dao: DatabaseStudyDao, area_id: str, name: str) -> None:
+    cluster = ThermalCluster(name=name)
+    initialize_thermal_cluster(cluster, dao.get_version())
+    dao.save_thermals({area_id: [cluster]})
+
+
+def _count_commits(session: Session) -> list[Any]:
+    # Releasing a SAVEPOINT is not a commit of the database transaction
+    commits: list[Any] = []
+    event.listen(session.get_bind(), "commit", commits.append)
+    return commits
+
+
+def test_writes_are_committed_once(db_dao: DatabaseStudyDao, db_session: Session) -> None:
+    commits = _count_commits(db_session)
+    with db_dao.unit_of_work():
+        for area in ["fr", "de", "it"]:
+            with db_dao.operation():
+                save_area(db_dao, area)
+                _save_thermal(db_dao, area, "th_1")
+        # Nested units of work are part of the outermost one
+        with db_dao.unit_of_work():
+            save_area(db_dao, "be")
+        assert not commits
+        # The writes are visible inside the unit of work
+        assert set(db_dao.get_all_area_ids()) == {"fr", "de", "it", "be"}
+    assert len(commits) == 1
+
+    db_session.rollback()
+    assert set(db_dao.get_all_area_ids()) == {"fr", "de", "it", "be"}
+
+
+def test_failed_operations_are_discarded(db_dao: DatabaseStudyDao, db_session: Session) -> None:
+    with pytest.raises(RuntimeError):
+        with db_dao.unit_of_work():
+            with db_dao.operation():
+                save_area(db_dao, "fr")
+
+            with db_dao.operation() as operation:
+                save_area(db_dao, "de")
+                operation.discard()
+
+            with db_dao.operation():
+                _save_thermal(db_dao, "fr", "th_1")
+                raise RuntimeError("Failed operation")
+
+    # The operations preceding the failure are committed
+    db_session.rollback()
+    assert db_dao.get_all_area_ids() == ["fr"]
+    assert not db_dao.thermal_exists("fr", "th_1")
+
+
+def test_error_in_operation_keeps_previous_writes(db_dao: DatabaseStudyDao, db_session: Session) -> None:
+    with db_dao.unit_of_work():
+        with db_dao.operation():
+            save_area(db_dao, "fr")
+        with db_dao.operation():
+            save_area(db_dao, "de")
+            # The DAO rolls back the writes of the failed call only
+            with pytest.raises(AreaNotFound):
+                db_dao.save_hydro_management({"unknown": HydroManagement()})
+        with pytest.raises(RuntimeError):
+            with db_dao.operation():
+                save_area(db_dao, "it")
+                with pytest.raises(AreaNotFound):
+                    db_dao.save_hydro_management({"unknown": HydroManagement()})
+                # The operation is still isolated: its writes are discarded by a later failure
+                raise RuntimeError("Failed operation")
+
+    db_session.rollback()
+    assert sorted(db_dao.get_all_area_ids()) == ["de", "fr"]
+
+
+def test_matrices_saved_in_operation_do_not_commit(db_dao: DatabaseStudyDao, db_session: Session) -> None:
+    commits = _count_commits(db_session)
+    with pytest.raises(RuntimeError, match="Failed operation"):
+        with db_dao.unit_of_work():
+            with db_dao.operation():
+                save_area(db_dao, "fr")
+                MatrixRepository(db_session).save(
+                    Matrix(id="m1", width=1, height=1, created_at=current_time(), version=2)
+                )
+                MatrixRepository(db_session).save_batch(
+                    [
+                        Matrix(id=matrix_id, width=1, height=1, created_at=current_time(), version=2)
+                        for matrix_id in ["m1", "m2"]
+                    ]
+                )
+                raise RuntimeError("Failed operation")
+    assert len(commits) == 1
+
+    db_session.rollback()
+    assert db_dao.get_all_area_ids() == []
+    assert MatrixRepository(db_session).get("m1") is None
+
+
+def test_ended_operation_cannot_be_discarded(db_dao: DatabaseStudyDao, db_session: Session) -> None:
+    with db_dao.unit_of_work():
+        with pytest.raises(RuntimeError, match="not isolated"):
+            with db_dao.operation() as operation:
+                save_area(db_dao, "fr")
+                db_session.commit()
+                operation.discard()
@@ -0,0 +1,157 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from antarest.core.exceptions import AreaNotFound, ThermalClusterNotFound
+from antarest.matrixstore.service import ISimpleMatrixService
+from antarest.study.business.model.thermal_cluster_model import ThermalCluster, initialize_thermal_cluster
+from antarest.study.dao.database.database_study_dao import DatabaseStudyDao
+from antarest.study.dao.database.models.area import AREA_TABLE
+from tests.study.dao.utils import save_area
+
+
+@contextmanager
+def count_selects(session: Session) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def _before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+def _save_thermals(dao: DatabaseStudyDao, area_id: str, count: int) -> None:
+    clusters = []
+    for k in range(count):
+        cluster = ThermalCluster(name=f"th_{k}")
+        initialize_thermal_cluster(cluster, dao.get_version())
+        clusters.append(cluster)
+    dao.save_thermals({area_id: clusters})
+
+
+def test_lookups_select_each_key_once(db_dao: DatabaseStudyDao, db_session: Session) -> None:
+    save_area(db_dao, "fr")
+    _save_thermals(db_dao, "fr", 20)
+
+    with count_selects(db_session) as statements:
+        for _ in range(3):
+            assert db_dao.get_thermal("fr", "th_3").id == "th_3"
+            assert db_dao.thermal_exists("fr", "th_3")
+    # The version of the study is already cached: only the looked up cluster is selected
+    assert len(statements) == 1
+
+
+def test_bulk_reads_load_each_table_once(db_dao: DatabaseStudyDao, db_session: Session) -> None:
+    save_area(db_dao, "fr")
+    _save_thermals(db_dao, "fr", 20)
+
+    with count_selects(db_session) as statements:
+        assert len(db_dao.get_all_thermals()["fr"]) == 20
+        for k in range(20):
+            assert db_dao.get_thermal("fr", f"th_{k}").id == f"th_{k}"
+            assert db_dao.thermal_exists("fr", f"th_{k}")
+            assert len(db_dao.get_all_thermals_for_area("fr")) == 20
+    # The whole table is loaded by the bulk read, and serves all the lookups
+    assert len(statements) == 1
+
+
+def test_writes_of_other_sessions_are_not_tracked(db_dao: DatabaseStudyDao, db_session: Session) -> None:
+    save_area(db_dao, "fr")
+    with Session(bind=db_session.get_bind()) as other_session:
+        other_session.execute(select(1))
+        other_session.rollback()
+        assert "study_data_write_counters" not in other_session.info
+    assert db_dao.row_cache.find_row(AREA_TABLE, area_id="fr") is not None
+
+
+def test_cache_is_invalidated_by_writes(db_dao: DatabaseStudyDao, db_session: Session) -> None:
+    save_area(db_dao, "fr")
+    _save_thermals(db_dao, "fr", 1)
+    assert [c.id for c in db_dao.get_all_thermals_for_area("fr")] == ["th_0"]
+
+    # Upsert
+    _save_thermals(db_dao, "fr", 2)
+    assert [c.id for c in db_dao.get_all_thermals_for_area("fr")] == ["th_0", "th_1"]
+
+    # Deletion
+    db_dao.delete_thermal("fr", "th_0")
+    assert not db_dao.thermal_exists("fr", "th_0")
+    with pytest.raises(ThermalClusterNotFound):
+        db_dao.get_thermal("fr", "th_0")
+
+    # Deletions cascade to the dependent tables
+    db_dao.delete_area("fr")
+    with pytest.raises(AreaNotFound):
+        db_dao.get_all_thermals_for_area("fr")
+
+
+def test_cache_is_invalidated_by_rollbacks(db_dao: DatabaseStudyDao, db_session: Session) -> None:
+    save_area(db_dao, "fr")
+    cluster = ThermalCluster(name="th_0")
+    initialize_thermal_cluster(cluster, db_dao.get_version())
+    with patch.object(db_session, "commit"):
+        db_dao.save_thermals({"fr": [cluster]})
+        assert db_dao.thermal_exists("fr", "th_0")
+        db_session.rollback()
+    assert not db_dao.thermal_exists("fr", "th_0")
+
+
+def test_converted_models_are_cached(db_dao: DatabaseStudyDao) -> None:
+    save_area(db_dao, "fr")
+    _save_thermals(db_dao, "fr", 20)
+
+    with patch.object(db_dao, "_decode_thermals", wraps=db_dao._decode_thermals) as decode:
+        assert len(db_dao.get_all_thermals()["fr"]) == 20
+        cluster = db_dao.get_thermal("fr", "th_3")
+        assert len(db_dao.get_all_thermals_for_area("fr")) == 20
+        assert decode.call_count == 1
+
+        # The cached models are not modified by the callers
+        cluster.unit_count = 5
+        assert db_dao.get_thermal("fr", "th_3").unit_count == 1
+
+        # Only the written rows are converted again
+        db_dao.save_thermals({"fr": [cluster]})
+        assert db_dao.get_thermal("fr", "th_3").unit_count == 5
+        assert len(db_dao.get_all_thermals()["fr"]) == 20
+        assert decode.call_count == 2
+        assert len(decode.call_args.args[0]) == 1
+
+
+def test_cache_is_shared_by_the_daos_of_the_session(
+    db_dao: DatabaseStudyDao, db_session: Session, matrix_service: ISimpleMatrixService
+) -> None:
+    save_area(db_dao, "fr")
+    _save_thermals(db_dao, "fr", 20)
+    assert len(db_dao.get_all_thermals()["fr"]) == 20
+
+    other_dao = DatabaseStudyDao(db_dao.get_study_id(), db_session, matrix_service, db_dao.generator_matrix_constants)
+    with count_selects(db_session) as statements:
+        assert len(other_dao.get_all_thermals()["fr"]) == 20
+    assert not statements
+
+    # The writes of a DAO invalidate the cache of the others
+    db_dao.delete_thermal("fr", "th_0")
+    assert len(other_dao.get_all_thermals()["fr"]) == 19
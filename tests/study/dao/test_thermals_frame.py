@@ -0,0 +1,122 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+from typing import Any, Callable
+
+import polars as pl
+import pytest
+from antares.study.version import StudyVersion
+from polars.testing import assert_frame_equal
+
+from antarest.study.business.model.thermal_cluster_model import (
+    THERMAL_CLUSTER_FRAME_SCHEMA,
+    LawOption,
+    LocalTSGenerationBehavior,
+    ThermalCluster,
+    initialize_thermal_cluster,
+)
+from antarest.study.dao.api.study_dao import StudyDao
+from antarest.study.dao.api.thermal_dao import ReadOnlyThermalDao
+from antarest.study.model import STUDY_VERSION_8_6, STUDY_VERSION_8_7, STUDY_VERSION_9_3
+from antarest.study.storage.rawstudy.model.filesystem.config.thermal import (
+    parse_thermal_cluster,
+    parse_thermal_clusters_frame,
+)
+from tests.study.dao.utils import save_area
+
+
+def test_schema_matches_the_model() -> None:
+    assert list(THERMAL_CLUSTER_FRAME_SCHEMA) == ["area_id", *ThermalCluster.model_fields]
+
+
+def _save_thermals(dao: StudyDao) -> None:
+    save_area(dao, "fr")
+    save_area(dao, "de")
+    clusters = {
+        "fr": [
+            ThermalCluster(name="Nuclear 1", group="Nuclear", unit_count=4, nominal_capacity=900.5),
+            ThermalCluster(
+                name="gas_ccgt",
+                group="my group",
+                gen_ts=LocalTSGenerationBehavior.FORCE_GENERATION,
+                law_forced=LawOption.GEOMETRIC,
+                min_up_time=8,
+                must_run=True,
+            ),
+        ],
+        "de": [ThermalCluster(name="Lignite", group="lignite", enabled=False, co2=0.9)],
+    }
+    for area_clusters in clusters.values():
+        for cluster in area_clusters:
+            initialize_thermal_cluster(cluster, dao.get_version())
+    dao.save_thermals(clusters)
+
+
+@pytest.mark.parametrize("version", [STUDY_VERSION_8_6, STUDY_VERSION_9_3])
+def test_frame_matches_the_clusters(dao_builder: Callable[[StudyVersion], StudyDao], version: StudyVersion) -> None:
+    dao = dao_builder(version)
+    _save_thermals(dao)
+
+    frame = dao.get_thermals_frame().sort("area_id", "id")
+    # The default implementation converts the clusters models
+    expected = ReadOnlyThermalDao.get_thermals_frame(dao).sort("area_id", "id")
+    assert_frame_equal(frame, expected)
+
+    groups = dict(zip(frame["name"], frame["group"]))
+    assert groups["gas_ccgt"] == ("other 1" if version < STUDY_VERSION_9_3 else "my group")
+    assert frame.filter(frame["name"] == "gas_ccgt")["gen_ts"].item() == "force generation"
+
+
+def test_frame_columns(dao_builder: Callable[[StudyVersion], StudyDao]) -> None:
+    dao = dao_builder(STUDY_VERSION_9_3)
+    _save_thermals(dao)
+
+    frame = dao.get_thermals_frame(["unit_count", "law_forced"])
+    assert frame.columns == ["area_id", "id", "unit_count", "law_forced"]
+    # The case of the IDs depends on the backend
+    frame = frame.with_columns(pl.col("id").str.to_lowercase()).sort("area_id", "id")
+    assert frame.rows() == [
+        ("de", "lignite", 1, "uniform"),
+        ("fr", "gas_ccgt", 1, "geometric"),
+        ("fr", "nuclear 1", 4, "uniform"),
+    ]
+
+    with pytest.raises(ValueError, match="unitCount"):
+        dao.get_thermals_frame(["unitCount"])
+
+
+@pytest.mark.parametrize("version", [STUDY_VERSION_8_6, STUDY_VERSION_9_3])
+def test_frame_parsing_matches_the_models(version: StudyVersion) -> None:
+    # The values are written like in INI files, with the variations accepted by the models
+    sections: dict[str, dict[str, Any]] = {
+        "Nuclear 1": {"name": "Nuclear 1", "group": "NUCLEAR", "unitcount": 4.0, "nominalcapacity": 900.5},
+        "gas_ccgt": {
+            "name": "gas_ccgt",
+            "group": 2,
+            "gen-ts": "FORCE GENERATION",
+            "law.forced": "Geometric",
+            "min-up-time": 0,
+            "min-down-time": 500,
+            "must-run": True,
+            "nh3": 0.5,
+        },
+        "Lignite": {"name": "Lignite", "enabled": False, "co2": 0.9, "marginal-cost": 10},
+    }
+    if version >= STUDY_VERSION_8_7:
+        sections["Lignite"].update({"costgeneration": "usecosttimeseries", "efficiency": 40, "variableomcost": 2})
+
+    frame = parse_thermal_clusters_frame(version, {"fr": sections})
+
+    rows = [
+        {"area_id": "fr", **parse_thermal_cluster(version, section).model_dump(mode="json")}
+        for section in sections.values()
+    ]
+    assert_frame_equal(frame, pl.DataFrame(rows, schema=THERMAL_CLUSTER_FRAME_SCHEMA))
@@ -9,24 +9,33 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+import enum
 import uuid
+import zipfile
 from pathlib import Path
-from unittest.mock import Mock
+from typing import Any
+from unittest.mock import Mock, patch
 
 import pytest
+from sqlalchemy import JSON, Boolean, Column, Float, LargeBinary, MetaData, String, Table, select
+from sqlalchemy.dialects import postgresql
 
 from antarest.core.cache.business.local_chache import LocalCache
 from antarest.core.config import Config
 from antarest.core.utils.fastapi_sqlalchemy import db
 from antarest.matrixstore.in_memory import InMemorySimpleMatrixService
 from antarest.study.dao.database.database_study_factory_dao import DatabaseStudyDaoFactory
+from antarest.study.dao.database.sql_utils import enum_col
 from antarest.study.dao.file.file_study_factory_dao import FileStudyDaoFactory, ResourcePaths
+from antarest.study.dao.study_conversion.bulk_importer import format_copy_rows
+from antarest.study.dao.study_conversion.study_converter import StudyConverter
 from antarest.study.model import STUDY_VERSION_7_0, STUDY_VERSION_9_3, Study, StudyMetadataCreation
 from antarest.study.repository import StudyMetadataRepository
-from antarest.study.storage.database_storage import DatabaseStudyStorage
+from antarest.study.storage.database_storage import DatabaseStudyStorage, get_study_data_tables
 from antarest.study.storage.rawstudy.model.filesystem.factory import StudyFactory
 from antarest.study.storage.variantstudy.business.matrix_constants_generator import GeneratorMatrixConstants
 from tests.helpers import create_raw_study, with_db_context
+from tests.integration.assets import ASSETS_DIR as INTEGRATION_ASSETS_DIR
 
 
 @with_db_context
@@ -119,3 +128,139 @@ def test_upgrade_does_not_use_cache(tmp_path: Path, study_factory) -> None:
 
     # Asserts the cache is still empty
     assert cache.cache == {}
+
+
+def _read_study_rows(study_id: str) -> dict[str, list[tuple[Any, ...]]]:
+    rows = {}
+    for table in get_study_data_tables():
+        result = db.session.execute(select(table).where(table.c.study_id == study_id)).mappings()
+        rows[table.name] = sorted((tuple(v for k, v in row.items() if k != "study_id") for row in result), key=repr)
+    return rows
+
+
+def _create_database_storage(
+    tmp_path: Path,
+) -> tuple[DatabaseStudyStorage, DatabaseStudyDaoFactory, FileStudyDaoFactory]:
+    config = Config.model_validate({"storage": {"tmp_dir": tmp_path}})
+    cache = LocalCache()
+    matrix_service = InMemorySimpleMatrixService()
+    generator_matrix_constants = GeneratorMatrixConstants(matrix_service)
+    study_factory = StudyFactory(matrix_service=matrix_service, cache=cache)
+    db_dao_factory = DatabaseStudyDaoFactory(matrix_service, generator_matrix_constants)
+    fs_dao_factory = FileStudyDaoFactory(
+        matrix_service,
+        Mock(),
+        generator_matrix_constants,
+        study_factory,
+        cache,
+        lambda study_id: ResourcePaths(tmp_path, tmp_path),
+    )
+    database_storage = DatabaseStudyStorage(
+        config=config,
+        repository=StudyMetadataRepository(cache),
+        matrix_service=matrix_service,
+        db_dao_factory=db_dao_factory,
+        fs_dao_factory=fs_dao_factory,
+    )
+    return database_storage, db_dao_factory, fs_dao_factory
+
+
+def _extract_sta_mini(dst_dir: Path) -> Path:
+    with zipfile.ZipFile(INTEGRATION_ASSETS_DIR / "STA-mini.zip") as archive:
+        archive.extractall(dst_dir)
+    return dst_dir / "STA-mini"
+
+
+@with_db_context
+def test_copy_study_data(tmp_path: Path) -> None:
+    database_storage, db_dao_factory, _ = _create_database_storage(tmp_path)
+
+    # Import a study with areas, links and clusters
+    _extract_sta_mini(tmp_path)
+    src_study = create_raw_study(id=str(uuid.uuid4()), name="STA-mini", path=str(tmp_path / "STA-mini"))
+    database_storage.import_study(src_study, tmp_path / "STA-mini")
+    src_rows = _read_study_rows(src_study.id)
+
+    new_study = create_raw_study(id=str(uuid.uuid4()), name="copy", path=str(tmp_path / "copy"))
+    db.session.add(new_study)
+    db.session.commit()
+    database_storage.copy_study_data(src_study, new_study.id)
+
+    # All the rows are copied, and the source study is unchanged
+    assert _read_study_rows(new_study.id) == src_rows
+    assert _read_study_rows(src_study.id) == src_rows
+    assert len(src_rows["area"]) == 4
+    assert src_rows["thermal_cluster"] and src_rows["link"] and src_rows["load"]
+    new_dao = db_dao_factory.get_study_dao(new_study.id, is_study_managed=True)
+    src_dao = db_dao_factory.get_study_dao(src_study.id, is_study_managed=True)
+    assert new_dao.get_all_areas_info() == src_dao.get_all_areas_info()
+
+
+@with_db_context
+def test_import_study_matches_conversion(tmp_path: Path) -> None:
+    database_storage, db_dao_factory, fs_dao_factory = _create_database_storage(tmp_path)
+
+    # Bulk import
+    study = create_raw_study(id=str(uuid.uuid4()), name="STA-mini", path=str(tmp_path / "STA-mini"))
+    database_storage.import_study(study, _extract_sta_mini(tmp_path / "bulk"))
+
+    # Direct conversion into the database
+    ref_study_id = str(uuid.uuid4())
+    source_dao = fs_dao_factory.get_dao_from_path(
+        _extract_sta_mini(tmp_path / "ref"), study_id=ref_study_id, is_study_managed=True
+    )
+    ref_study = create_raw_study(id=ref_study_id, name="reference", version=str(source_dao.get_version()))
+    db.session.add(ref_study)
+    db.session.commit()
+    metadata = StudyMetadataCreation(id=ref_study.id, version=source_dao.get_version(), managed=True)
+    converter = StudyConverter(
+        source_dao=source_dao,
+        new_dao=db_dao_factory.create_study_dao(metadata),
+        study_version=source_dao.get_version(),
+        matrix_service=db_dao_factory._matrix_service,
+    )
+    converter.convert_study_inputs()
+
+    rows = _read_study_rows(study.id)
+    assert rows == _read_study_rows(ref_study.id)
+    assert len(rows["area"]) == 4
+
+
+@with_db_context
+def test_failed_import_leaves_no_data(tmp_path: Path) -> None:
+    database_storage, _, _ = _create_database_storage(tmp_path)
+    study = create_raw_study(id=str(uuid.uuid4()), name="STA-mini", path=str(tmp_path / "STA-mini"))
+
+    # The conversion fails after the areas, links and clusters are converted
+    with patch.object(StudyConverter, "_convert_xpansion", side_effect=ValueError("Raises for the test")):
+        with pytest.raises(ValueError, match="Raises for the test"):
+            database_storage.import_study(study, _extract_sta_mini(tmp_path))
+
+    assert db.session.get(Study, study.id) is None
+    assert all(not table_rows for table_rows in _read_study_rows(study.id).values())
+
+
+class _Color(enum.Enum):
+    RED = "red"
+
+
+def test_format_copy_rows() -> None:
+    table = Table(
+        "copy_test",
+        MetaData(),
+        Column("name", String()),
+        Column("enabled", Boolean()),
+        Column("value", Float()),
+        Column("color", enum_col(_Color)),
+        Column("options", JSON()),
+        Column("data", LargeBinary()),
+    )
+    rows = [
+        ("a\tb\tc", True, 1.5, _Color.RED, {"key": "x\ny"}, b"\x01\xff"),
+        ("back\\slash\r", False, float("nan"), None, None, None),
+    ]
+    text = format_copy_rows(table, rows, postgresql.dialect())  # type: ignore[no-untyped-call]
+    assert text.splitlines() == [
+        'a\\tb\\tc\tt\t1.5\tred\t{"key": "x\\\\ny"}\t\\\\x01ff',
+        "back\\\\slash\\r\tf\tnan\t\\N\tnull\t\\N",
+    ]
@@ -0,0 +1,141 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from antarest.core.interfaces.cache import ICache
+from antarest.core.serde.ini_writer import IniWriter
+from antarest.core.utils.files import (
+    CopyMode,
+    FileChanges,
+    record_dir_created,
+    record_file_removed,
+    track_file_changes,
+)
+from antarest.study.storage.file_study_utils import get_snapshot_dir
+from antarest.study.storage.variantstudy.model.dbmodel import VariantStudy
+from antarest.study.storage.variantstudy.snapshot.file_snapshot_manager import FileSnapshotManager
+from antarest.study.storage.variantstudy.snapshot.snapshot_layer import read_snapshot_layer, resolve_snapshot_layers
+from tests.helpers import create_raw_study, create_variant_study
+
+
+@pytest.fixture
+def root_dir(tmp_path: Path) -> Path:
+    root_dir = tmp_path / "root"
+    (root_dir / "settings").mkdir(parents=True)
+    (root_dir / "output").mkdir()
+    (root_dir / "study.antares").write_text("[antares]\n")
+    (root_dir / "settings" / "generaldata.ini").write_text("[general]\nnbyears = 1\n")
+    (root_dir / "settings" / "scenariobuilder.dat").write_text("[Default Ruleset]\n")
+    (root_dir / "output" / "result.txt").write_text("result")
+    return root_dir
+
+
+def _apply_changes(manager: FileSnapshotManager, variant: VariantStudy) -> None:
+    """
+    Modifies the snapshot of a variant like commands would do, and commits it.
+    """
+    snapshot_dir = get_snapshot_dir(variant)
+    with track_file_changes() as changes:
+        IniWriter().write({"general": {"nbyears": 5}}, snapshot_dir / "settings" / "generaldata.ini")
+        (snapshot_dir / "settings" / "scenariobuilder.dat").unlink()
+        record_file_removed(snapshot_dir / "settings" / "scenariobuilder.dat")
+        (snapshot_dir / "user").mkdir()
+        record_dir_created(snapshot_dir / "user")
+    manager.commit_snapshot(variant, changes)
+
+
+class TestFileSnapshotManager:
+    def test_layered_snapshots(self, tmp_path: Path, root_dir: Path) -> None:
+        manager = FileSnapshotManager(Mock(spec=ICache), CopyMode.HARDLINK, max_layers=2)
+        root = create_raw_study(path=str(root_dir))
+        variants = [create_variant_study(path=str(tmp_path / f"variant{k}")) for k in range(3)]
+
+        # First layer: only the recorded changes are owned by the snapshot
+        manager.create_snapshot(root, variants[0])
+        _apply_changes(manager, variants[0])
+        snapshot_dir = get_snapshot_dir(variants[0])
+        layer = read_snapshot_layer(snapshot_dir)
+        assert layer is not None
+        assert (layer.depth, layer.base_revision) == (1, None)
+        assert layer.files == ["settings/generaldata.ini"]
+        assert layer.dirs == ["user"]
+        assert layer.tombstones == ["settings/scenariobuilder.dat"]
+        assert not (snapshot_dir / "output").exists()
+        assert "nbyears = 1" in (root_dir / "settings" / "generaldata.ini").read_text()
+
+        # The files are resolved through the manifests, down to the root study
+        files, dirs = resolve_snapshot_layers(snapshot_dir)
+        assert files == {
+            "study.antares": root_dir / "study.antares",
+            "settings/generaldata.ini": snapshot_dir / "settings" / "generaldata.ini",
+        }
+        assert dirs == {"settings", "user"}
+
+        # Second layer, built from the files owned by the first one and the root study
+        manager.create_snapshot(variants[0], variants[1])
+        manager.commit_snapshot(variants[1], FileChanges())
+        second_dir = get_snapshot_dir(variants[1])
+        base_revision = layer.revision
+        layer = read_snapshot_layer(second_dir)
+        assert layer is not None
+        assert (layer.depth, layer.base_revision, layer.files, layer.tombstones) == (2, base_revision, [], [])
+        assert (second_dir / "study.antares").stat().st_nlink == 3
+        assert "nbyears = 5" in (second_dir / "settings" / "generaldata.ini").read_text()
+        assert not (second_dir / "settings" / "scenariobuilder.dat").exists()
+        assert (second_dir / "user").is_dir()
+
+        # The chain is too deep: the third snapshot is flattened
+        manager.create_snapshot(variants[1], variants[2])
+        manager.commit_snapshot(variants[2], FileChanges())
+        third_dir = get_snapshot_dir(variants[2])
+        assert read_snapshot_layer(third_dir) is None
+        assert (third_dir / "study.antares").stat().st_nlink == 1
+        assert "nbyears = 5" in (third_dir / "settings" / "generaldata.ini").read_text()
+        assert not (third_dir / "settings" / "scenariobuilder.dat").exists()
+        assert (third_dir / "user").is_dir()
+
+        manager.clear_snapshot(variants[0])
+        assert read_snapshot_layer(snapshot_dir) is None
+        assert not snapshot_dir.exists()
+
+    def test_changed_chain_is_not_resolved(self, tmp_path: Path, root_dir: Path) -> None:
+        manager = FileSnapshotManager(Mock(spec=ICache), CopyMode.HARDLINK)
+        root = create_raw_study(path=str(root_dir))
+        variants = [create_variant_study(path=str(tmp_path / f"variant{k}")) for k in range(4)]
+        manager.create_snapshot(root, variants[0])
+        _apply_changes(manager, variants[0])
+        manager.create_snapshot(variants[0], variants[1])
+        manager.commit_snapshot(variants[1], FileChanges())
+
+        # The root study was modified since the chain was built:
+        # the reference snapshot is exported as a whole
+        IniWriter().write({"antares": {"version": 880}}, root_dir / "study.antares")
+        manager.create_snapshot(variants[1], variants[2])
+        assert (get_snapshot_dir(variants[2]) / "study.antares").read_text() == "[antares]\n"
+        assert "nbyears = 5" in (get_snapshot_dir(variants[2]) / "settings" / "generaldata.ini").read_text()
+
+        # Same thing when a lower layer was regenerated
+        manager.create_snapshot(root, variants[0])
+        manager.create_snapshot(variants[1], variants[3])
+        assert "nbyears = 5" in (get_snapshot_dir(variants[3]) / "settings" / "generaldata.ini").read_text()
+        assert read_snapshot_layer(get_snapshot_dir(variants[3])) is not None
+
+    def test_copied_snapshots_are_flat(self, tmp_path: Path, root_dir: Path) -> None:
+        manager = FileSnapshotManager(Mock(spec=ICache), CopyMode.COPY)
+        variant = create_variant_study(path=str(tmp_path / "variant"))
+        manager.create_snapshot(create_raw_study(path=str(root_dir)), variant)
+        manager.commit_snapshot(variant, FileChanges())
+        assert read_snapshot_layer(get_snapshot_dir(variant)) is None
+        assert (get_snapshot_dir(variant) / "study.antares").read_text() == "[antares]\n"
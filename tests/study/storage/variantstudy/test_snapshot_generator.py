@@ -17,7 +17,7 @@ import re
 import typing as t
 import uuid
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 
 import pytest
 from antares.study.version import StudyVersion
@@ -935,24 +935,28 @@ class TestSnapshotGenerator:
             "details": [
                 {
                     "id": AnyUUID(),
+                    "metrics": ANY,
                     "name": "create_area",
                     "status": True,
                     "msg": "Area 'North' created",
                 },
                 {
                     "id": AnyUUID(),
+                    "metrics": ANY,
                     "name": "create_area",
                     "status": True,
                     "msg": "Area 'South' created",
                 },
                 {
                     "id": AnyUUID(),
+                    "metrics": ANY,
                     "name": "create_link",
                     "status": True,
                     "msg": "Link between 'north' and 'south' created",
                 },
                 {
                     "id": AnyUUID(),
+                    "metrics": ANY,
                     "name": "create_cluster",
                     "status": True,
                     "msg": "Thermal cluster 'gas_cluster' added to area 'south'.",
@@ -1044,24 +1048,28 @@ class TestSnapshotGenerator:
                 "details": [
                     {
                         "id": AnyUUID(as_string=True),
+                        "metrics": ANY,
                         "msg": "Area 'North' created",
                         "name": "create_area",
                         "status": True,
                     },
                     {
                         "id": AnyUUID(as_string=True),
+                        "metrics": ANY,
                         "msg": "Area 'South' created",
                         "name": "create_area",
                         "status": True,
                     },
                     {
                         "id": AnyUUID(as_string=True),
+                        "metrics": ANY,
                         "msg": "Link between 'north' and 'south' created",
                         "name": "create_link",
                         "status": True,
                     },
                     {
                         "id": AnyUUID(as_string=True),
+                        "metrics": ANY,
                         "msg": "Thermal cluster 'gas_cluster' added to area 'south'.",
                         "name": "create_cluster",
                         "status": True,
@@ -1166,24 +1174,28 @@ class TestSnapshotGenerator:
             "details": [
                 {
                     "id": AnyUUID(),
+                    "metrics": ANY,
                     "name": "create_area",
                     "status": True,
                     "msg": "Area 'North' created",
                 },
                 {
                     "id": AnyUUID(),
+                    "metrics": ANY,
                     "name": "create_area",
                     "status": True,
                     "msg": "Area 'South' created",
                 },
                 {
                     "id": AnyUUID(),
+                    "metrics": ANY,
                     "name": "create_link",
                     "status": True,
                     "msg": "Link between 'north' and 'south' created",
                 },
                 {
                     "id": AnyUUID(),
+                    "metrics": ANY,
                     "name": "create_cluster",
                     "status": True,
                     "msg": "Thermal cluster 'gas_cluster' added to area 'south'.",
@@ -1231,6 +1243,7 @@ class TestSnapshotGenerator:
             "details": [
                 {
                     "id": AnyUUID(),
+                    "metrics": ANY,
                     "name": "create_area",
                     "status": True,
                     "msg": "Area 'East' created",
@@ -1306,3 +1319,115 @@ class TestSnapshotGenerator:
         # Ensures we have to invalidate the cache as the `update_config` command couldn't (it's too generic)
         assert results.should_invalidate_cache
         assert cache.get(cache_key) is None
+
+    @with_admin_user
+    @with_db_context
+    def test_generate__from_checkpoint(
+        self,
+        variant_study_service: VariantStudyService,
+        variant_study_id: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        config = variant_study_service.config
+        storage_config = config.storage.model_copy(
+            update={"snapshot_checkpoint_interval": 1, "snapshot_checkpoint_min_seconds": 0}
+        )
+        monkeypatch.setattr(variant_study_service, "config", config.model_copy(update={"storage": storage_config}))
+        generator = _build_generator(variant_study_service)
+        factory = _get_dao_factory(variant_study_id, variant_study_service)
+
+        def read_snapshot() -> dict[str, bytes]:
+            snapshot_dir = get_snapshot_dir(variant_study_service.repository.get(variant_study_id))
+            return {
+                path.relative_to(snapshot_dir).as_posix(): path.read_bytes()
+                for path in sorted(snapshot_dir.rglob("*"))
+                # The study metadata contain the generation date
+                if path.is_file() and path.name != "study.antares"
+            }
+
+        # A checkpoint is saved after each command, except the last one
+        results = generator.generate_snapshot(variant_study_id, dao_factory=factory)
+        assert len(results.details) == 4
+        variant_study = variant_study_service.repository.get(variant_study_id)
+        snapshot_manager = variant_study_service.get_snapshot_manager(variant_study)
+        assert [c.index for c in snapshot_manager.list_checkpoints(variant_study)] == [1, 2, 3]
+
+        # Update the last command: the generation resumes from the last checkpoint
+        study_version = StudyVersion.parse(variant_study.version)
+        variant_study_service.update_command(
+            variant_study_id,
+            variant_study.commands[3].id,
+            CommandDTO(
+                action="create_cluster",
+                args={
+                    "area_id": "south",
+                    "cluster_name": "gas_cluster",
+                    "parameters": {"group": "Gas", "unitcount": 2, "nominalcapacity": 300},
+                },
+                study_version=study_version,
+            ),
+        )
+        results = generator.generate_snapshot(variant_study_id, dao_factory=factory)
+        assert [detail["name"] for detail in results.details] == ["create_cluster"]  # type: ignore
+
+        # Remove the link: the generation resumes from the checkpoint preceding it
+        variant_study_service.remove_command(variant_study_id, variant_study.commands[2].id)
+        results = generator.generate_snapshot(variant_study_id, dao_factory=factory)
+        assert [detail["name"] for detail in results.details] == ["create_cluster"]  # type: ignore
+        resumed_snapshot = read_snapshot()
+        assert b"south" not in resumed_snapshot["input/links/north/properties.ini"]
+
+        # The same snapshot is generated from scratch
+        results = generator.generate_snapshot(variant_study_id, dao_factory=factory, from_scratch=True)
+        assert len(results.details) == 3
+        assert read_snapshot() == resumed_snapshot
+
+    @with_admin_user
+    @with_db_context
+    def test_generate__from_sibling_checkpoint(
+        self,
+        variant_study_service: VariantStudyService,
+        root_study_id: str,
+        variant_study_id: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        config = variant_study_service.config
+        storage_config = config.storage.model_copy(
+            update={"snapshot_checkpoint_interval": 1, "snapshot_checkpoint_min_seconds": 0}
+        )
+        monkeypatch.setattr(variant_study_service, "config", config.model_copy(update={"storage": storage_config}))
+        generator = _build_generator(variant_study_service)
+        results = generator.generate_snapshot(
+            variant_study_id, dao_factory=_get_dao_factory(variant_study_id, variant_study_service)
+        )
+        assert len(results.details) == 4
+
+        # The sibling shares the first 3 commands of the variant
+        variant_study = variant_study_service.repository.get(variant_study_id)
+        sibling = variant_study_service.create_variant_study(root_study_id, "sibling")
+        commands = [command.to_dto() for command in variant_study.commands[:3]]
+        commands.append(
+            CommandDTO(
+                action="create_area",
+                args={"area_name": "East"},
+                study_version=StudyVersion.parse(variant_study.version),
+            )
+        )
+        variant_study_service.append_commands(sibling.id, commands)
+
+        factory = _get_dao_factory(sibling.id, variant_study_service)
+        results = generator.generate_snapshot(sibling.id, dao_factory=factory)
+        assert [detail["msg"] for detail in results.details] == ["Area 'East' created"]  # type: ignore
+        snapshot_dir = get_snapshot_dir(variant_study_service.repository.get(sibling.id))
+        assert sorted(path.name for path in (snapshot_dir / "input/areas").iterdir() if path.is_dir()) == [
+            "east",
+            "north",
+            "south",
+        ]
+
+        # Without sharing, all the commands are applied
+        storage_config = storage_config.model_copy(update={"snapshot_checkpoint_sharing": False})
+        monkeypatch.setattr(variant_study_service, "config", config.model_copy(update={"storage": storage_config}))
+        variant_study_service.clear_snapshot(variant_study_service.repository.get(sibling.id))
+        results = generator.generate_snapshot(sibling.id, dao_factory=factory)
+        assert len(results.details) == 4
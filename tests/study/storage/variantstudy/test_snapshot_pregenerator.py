@@ -0,0 +1,114 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from antarest.core.interfaces.eventbus import EventType
+from antarest.core.utils.utils import current_time
+from antarest.study.model import Study
+from antarest.study.storage.variantstudy.snapshot.snapshot_pregenerator import SnapshotPregenerator
+from tests.helpers import create_raw_study, create_variant_study
+
+
+class TestSnapshotPregenerator:
+    @pytest.fixture
+    def studies(self) -> dict[str, Study]:
+        now = current_time()
+        return {
+            study.id: study
+            for study in [
+                create_raw_study(id="root"),
+                # Recently accessed variant and its children
+                create_variant_study(id="v1", parent_id="root", last_access=now),
+                create_variant_study(id="v11", parent_id="v1", last_access=None),
+                create_variant_study(id="v12", parent_id="v1", last_access=None),
+                # Variant not accessed for a long time
+                create_variant_study(id="v2", parent_id="root", last_access=now - timedelta(days=30)),
+            ]
+        }
+
+    @pytest.fixture
+    def variant_study_service(self, studies: dict[str, Study]) -> Mock:
+        def get_ancestor_or_self_ids(study_id: str) -> list[str]:
+            ancestor_ids = []
+            while study_id:
+                ancestor_ids.append(study_id)
+                study_id = studies[study_id].parent_id  # type: ignore
+            return ancestor_ids
+
+        service = Mock()
+        service.repository.get.side_effect = studies.get
+        service.repository.get_children.side_effect = lambda parent_id: [
+            study for study in studies.values() if study.parent_id == parent_id
+        ]
+        service.repository.get_ancestor_or_self_ids.side_effect = get_ancestor_or_self_ids
+        service.is_snapshot_up_to_date.side_effect = lambda study: study.id == "v12"
+        service.generate_task.side_effect = lambda study: f"task-{study.id}"
+        return service
+
+    @staticmethod
+    def _create_pregenerator(variant_study_service: Mock, delay: int = 0) -> SnapshotPregenerator:
+        config = Mock()
+        config.storage.snapshot_pregeneration_delay = delay
+        config.storage.snapshot_pregeneration_workers = 2
+        config.storage.snapshot_pregeneration_access_days = 7
+        event_bus = Mock()
+        pregenerator = SnapshotPregenerator(variant_study_service, event_bus, config)
+        event_bus.add_listener.assert_called_once_with(
+            pregenerator._on_event, [EventType.STUDY_DATA_EDITED, EventType.STUDY_SNAPSHOT_OUTDATED]
+        )
+        return pregenerator
+
+    def test_pregeneration(self, variant_study_service: Mock) -> None:
+        pregenerator = self._create_pregenerator(variant_study_service)
+        final_tasks: set[str] = set()
+        variant_study_service.task_service.status_task.side_effect = lambda task_id: Mock(
+            status=Mock(is_final=Mock(return_value=task_id in final_tasks))
+        )
+        variant_study_service.is_snapshot_up_to_date.side_effect = lambda study: (
+            study.id == "v12" or f"task-{study.id}" in final_tasks
+        )
+
+        def generated_ids() -> list[str]:
+            return [call.args[0].id for call in variant_study_service.generate_task.call_args_list]
+
+        pregenerator.notify_edition("root")
+        pregenerator.process()
+        # The child waits for the snapshot of its parent, the old variant and the up-to-date snapshot are ignored
+        assert generated_ids() == ["v1"]
+
+        # Nothing more to do until the generation is over, even if the parent is edited again meanwhile
+        pregenerator.notify_edition("v1")
+        pregenerator.process()
+        assert generated_ids() == ["v1"]
+
+        final_tasks.add("task-v1")
+        pregenerator.process()
+        assert generated_ids() == ["v1", "v11"]
+
+        # The edition of the parent during its generation is checked again
+        final_tasks.add("task-v11")
+        pregenerator.process()
+        assert generated_ids() == ["v1", "v11"]
+        assert not pregenerator._edited and not pregenerator._queue and not pregenerator._running
+
+    def test_editions_are_debounced(self, variant_study_service: Mock) -> None:
+        pregenerator = self._create_pregenerator(variant_study_service, delay=3600)
+        pregenerator.notify_edition("v1")
+        pregenerator.process()
+        variant_study_service.generate_task.assert_not_called()
+
+        pregenerator.delay = 0
+        pregenerator.process()
+        assert [call.args[0].id for call in variant_study_service.generate_task.call_args_list] == ["v1"]
@@ -16,7 +16,7 @@ Test the database model.
 
 import uuid
 
-from sqlalchemy import inspect
+from sqlalchemy import inspect, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, joinedload
 
@@ -61,6 +61,11 @@ class TestStudy:
             "ix_study_updated_at",
             "ix_study_version",
         }
+        # The expression-based indexes are not reflected by SQLite
+        with db_engine.connect() as connection:
+            stmt = text("SELECT name FROM sqlite_master WHERE type = 'index' AND sql LIKE '%coalesce%'")
+            expression_index_names = set(connection.execute(stmt).scalars())
+        assert expression_index_names == {"ix_study_name_id", "ix_study_upper_name_id", "ix_study_created_at_id"}
 
     def test_index_on_create_raw_study(self, db_engine: Engine) -> None:
         inspector = inspect(db_engine)
@@ -10,17 +10,20 @@
 #
 # This file is part of the Antares project.
 
+import datetime
+import time
 import typing as t
 from unittest.mock import Mock
 
 import pytest
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from antarest.core.interfaces.cache import ICache
 from antarest.core.model import PublicMode
 from antarest.core.utils.utils import current_time
 from antarest.login.model import Group, User
-from antarest.study.model import DEFAULT_WORKSPACE_NAME, Tag
+from antarest.study.model import DEFAULT_WORKSPACE_NAME, RawStudy, Study, StudyGroup, Tag
 from antarest.study.repository import (
     AccessPermissions,
     StudyFilter,
@@ -1135,6 +1138,136 @@ def test_get_all__admin_permissions_filter(
     assert len(db_recorder.sql_statements) == 1, str(db_recorder)
 
 
+@pytest.mark.parametrize("sort_by", [None, *StudySortBy])
+def test_get_all__keyset_pagination(db_session: Session, sort_by: StudySortBy | None) -> None:
+    icache: Mock = Mock(spec=ICache)
+    repository = StudyMetadataRepository(cache_service=icache, session=db_session)
+
+    group_1 = Group(id="101", name="group1")
+    group_2 = Group(id="102", name="group2")
+    now = current_time()
+    # The names and the creation dates have ties, and some studies are in both groups
+    studies = [
+        create_raw_study(
+            id=f"{k:02d}",
+            name=f"Study-{k % 4}" if k % 2 else f"study-{k % 4}",
+            created_at=now + datetime.timedelta(days=k % 3),
+            groups=[group_1, group_2] if k % 3 else [group_1],
+        )
+        for k in range(20)
+    ]
+    # The studies without a name or a creation date come first
+    for k, study in enumerate(studies):
+        if k % 5 == 0:
+            study.name = None
+        if k % 7 == 0:
+            study.created_at = None
+    db_session.add_all([group_1, group_2, *studies])
+    db_session.commit()
+
+    sort_keys: dict[StudySortBy | None, t.Callable[[Study], t.Any]] = {
+        None: lambda s: (s.name or "", s.id),
+        StudySortBy.NAME_ASC: lambda s: ((s.name or "").upper(), s.id),
+        StudySortBy.NAME_DESC: lambda s: ((s.name or "").upper(), s.id),
+        StudySortBy.DATE_ASC: lambda s: (s.created_at or datetime.datetime.min, s.id),
+        StudySortBy.DATE_DESC: lambda s: (s.created_at or datetime.datetime.min, s.id),
+    }
+    descending = sort_by in (StudySortBy.NAME_DESC, StudySortBy.DATE_DESC)
+    expected_ids = [s.id for s in sorted(studies, key=sort_keys[sort_by], reverse=descending)]
+
+    study_filter = StudyFilter(
+        groups=[group_1.id, group_2.id],
+        access_permissions=AccessPermissions(user_id=1, user_groups=[group_1.id]),
+    )
+    pages = []
+    after = ""
+    while True:
+        with DBStatementRecorder(db_session.bind) as db_recorder:
+            page = repository.get_all(study_filter, sort_by, StudyPagination(page_size=3, after=after))
+        assert len(db_recorder.sql_statements) == 1, str(db_recorder)
+        if not page:
+            break
+        pages.append([s.id for s in page])
+        after = page[-1].id
+
+    assert [study_id for page_ids in pages for study_id in page_ids] == expected_ids
+    assert [len(page_ids) for page_ids in pages] == [3] * 6 + [2]
+
+    # The offset pagination gives the same pages
+    for page_nb, page_ids in enumerate(pages):
+        page = repository.get_all(study_filter, sort_by, StudyPagination(page_nb=page_nb, page_size=3))
+        assert [s.id for s in page] == page_ids
+
+    # The page after an unknown study is empty
+    assert repository.get_all(study_filter, sort_by, StudyPagination(page_size=3, after="unknown")) == []
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("sort_by", [StudySortBy.NAME_ASC, StudySortBy.DATE_DESC])
+@pytest.mark.parametrize("groups", [[], ["101", "102"]], ids=["permissions", "groups"])
+def test_get_all__deep_pages_benchmark(
+    db_session: Session,
+    sort_by: StudySortBy,
+    groups: list[str],
+    record_property: t.Callable[[str, object], None],
+) -> None:
+    """
+    Compares the offset and the keyset pagination of deep pages of a search among 100k studies,
+    for a user who is not an administrator. Some studies have no name or no creation date.
+    """
+    study_count = 100_000
+    page_size = 50
+    db_session.add_all([User(id=101, name="user1"), Group(id="101", name="group1"), Group(id="102", name="group2")])
+    db_session.commit()
+    now = current_time()
+    study_rows = [
+        {
+            "id": f"{k:08d}",
+            "name": None if k % 11 == 0 else f"study-{k % 5000}",
+            "type": "rawstudy",
+            "version": "880",
+            "path": f"path/to/study-{k}",
+            "created_at": None if k % 13 == 0 else now + datetime.timedelta(minutes=k % 20_000),
+            "public_mode": PublicMode.READ if k % 10 == 0 else PublicMode.NONE,
+            "owner_id": 101 if k % 7 == 0 else None,
+        }
+        for k in range(study_count)
+    ]
+    db_session.execute(insert(Study), study_rows)
+    db_session.execute(insert(RawStudy.__table__), [{"id": row["id"], "workspace": "ext"} for row in study_rows])
+    group_rows = [{"study_id": row["id"], "group_id": "101" if k % 3 else "102"} for k, row in enumerate(study_rows)]
+    db_session.execute(insert(StudyGroup), group_rows)
+    db_session.commit()
+
+    repository = StudyMetadataRepository(cache_service=Mock(spec=ICache), session=db_session)
+    study_filter = StudyFilter(groups=groups, access_permissions=AccessPermissions(user_id=102, user_groups=["102"]))
+    count = repository.count_studies(study_filter)
+    last_page_nb = (count - 1) // page_size
+    # The studies without a name or a creation date are on the first pages in ascending order,
+    # and on the last pages in descending order
+    for page_nb in [1, last_page_nb // 2, last_page_nb]:
+        previous_page = repository.get_all(
+            study_filter, sort_by, StudyPagination(page_nb=page_nb - 1, page_size=page_size)
+        )
+        start = time.perf_counter()
+        offset_page = repository.get_all(study_filter, sort_by, StudyPagination(page_nb=page_nb, page_size=page_size))
+        offset_duration = time.perf_counter() - start
+        start = time.perf_counter()
+        keyset_page = repository.get_all(
+            study_filter, sort_by, StudyPagination(page_size=page_size, after=previous_page[-1].id)
+        )
+        keyset_duration = time.perf_counter() - start
+
+        assert offset_page
+        assert [s.id for s in keyset_page] == [s.id for s in offset_page]
+        record_property(f"page_{page_nb}_offset_duration", offset_duration)
+        record_property(f"page_{page_nb}_keyset_duration", keyset_duration)
+        print(
+            f"get_all ({sort_by}, {len(groups)} groups): page {page_nb} of {count} visible studies"
+            f" among {study_count}, {offset_duration:.3f}s with offset, {keyset_duration:.3f}s with keyset"
+        )
+
+
 def test_update_tags(
     db_session: Session,
 ) -> None:
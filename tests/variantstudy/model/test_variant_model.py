@@ -13,6 +13,7 @@ import datetime
 import typing as t
 import uuid
 from pathlib import Path
+from unittest.mock import ANY
 
 import pytest
 from antares.study.version import StudyVersion
@@ -182,24 +183,28 @@ class TestVariantStudyService:
             "details": [
                 {
                     "id": AnyUUID(),
+                    "metrics": ANY,
                     "name": "create_area",
                     "status": True,
                     "msg": "Area 'Yes' created",
                 },
                 {
                     "id": AnyUUID(),
+                    "metrics": ANY,
                     "name": "create_area",
                     "status": True,
                     "msg": "Area 'No' created",
                 },
                 {
                     "id": AnyUUID(),
+                    "metrics": ANY,
                     "name": "create_link",
                     "status": True,
                     "msg": "Link between 'no' and 'yes' created",
                 },
                 {
                     "id": AnyUUID(),
+                    "metrics": ANY,
                     "name": "create_cluster",
                     "status": True,
                     "msg": "Thermal cluster 'cl1' added to area 'yes'.",
@@ -0,0 +1,107 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from antarest.core.exceptions import CommandNotValid
+from antarest.core.serde.json import to_json_string
+from antarest.core.utils.fastapi_sqlalchemy import db
+from antarest.dbmodel import Base
+from antarest.study.model import STUDY_VERSION_8_8
+from antarest.study.storage.variantstudy.command_factory import CommandFactory
+from antarest.study.storage.variantstudy.command_importer import CommandImporter, lock_next_command_index
+from antarest.study.storage.variantstudy.model.dbmodel import CommandBlock, CommandBlockMatrix, VariantStudy
+from tests.helpers import with_db_context
+
+
+def _write_commands(path: Path, commands: list[dict[str, object]]) -> Path:
+    path.write_text("\n".join(to_json_string(command) for command in commands))
+    return path
+
+
+@with_db_context
+def test_import_file(tmp_path: Path, command_factory: CommandFactory) -> None:
+    db.session.add(VariantStudy(id="variant", version="880", path=str(tmp_path)))
+    db.session.add(
+        CommandBlock(study_id="variant", index=0, command="create_area", version=1, args="{}", study_version="8.8")
+    )
+    db.session.commit()
+    matrix = [[1.0]] * 8760
+    commands: list[dict[str, object]] = [{"action": "create_area", "args": {"area_name": f"area{k}"}} for k in range(5)]
+    commands.append({"action": "replace_matrix", "args": {"target": "input/load/series/load_area0", "matrix": matrix}})
+    importer = CommandImporter(command_factory, "variant", STUDY_VERSION_8_8, user_id=None, chunk_size=2)
+    notifier = Mock()
+
+    count = importer.import_file(_write_commands(tmp_path / "commands.ndjson", commands), db.session, notifier)
+
+    assert count == len(commands)
+    blocks = db.session.query(CommandBlock).order_by(CommandBlock.index).all()
+    assert [block.index for block in blocks] == list(range(len(commands) + 1))
+    assert all(block.matrices_indexed for block in blocks[1:])
+    assert [matrix.block_id for matrix in db.session.query(CommandBlockMatrix)] == [blocks[-1].id]
+    notifier.notify_progress.assert_called_with(99)
+
+
+@with_db_context
+def test_import_file__invalid_command(tmp_path: Path, command_factory: CommandFactory) -> None:
+    db.session.add(VariantStudy(id="variant", version="880", path=str(tmp_path)))
+    db.session.commit()
+    commands: list[dict[str, object]] = [{"action": "create_area", "args": {"area_name": f"area{k}"}} for k in range(3)]
+    commands.append({"action": "create_area", "args": {}})
+    importer = CommandImporter(command_factory, "variant", STUDY_VERSION_8_8, user_id=None, chunk_size=2)
+
+    with pytest.raises(CommandNotValid, match="line 4"):
+        importer.import_file(_write_commands(tmp_path / "commands.ndjson", commands), db.session)
+
+    assert db.session.query(CommandBlock).count() == 0
+
+
+@with_db_context
+def test_lock_next_command_index(tmp_path: Path) -> None:
+    db.session.add(VariantStudy(id="variant", version="880", path=str(tmp_path)))
+    db.session.commit()
+    assert lock_next_command_index(db.session, "variant") == 0
+    for index in [0, 3]:
+        db.session.add(
+            CommandBlock(
+                study_id="variant", index=index, command="create_area", version=1, args="{}", study_version="8.8"
+            )
+        )
+    db.session.commit()
+    # The indexes follow the last command block, even if some blocks were removed
+    assert lock_next_command_index(db.session, "variant") == 4
+
+
+def test_lock_next_command_index__sqlite_write_lock(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}", connect_args={"timeout": 0.1})
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(VariantStudy(id="variant", version="880", path=str(tmp_path)))
+        session.commit()
+
+    with Session(engine) as session_1, Session(engine) as session_2:
+        assert lock_next_command_index(session_1, "variant") == 0
+        # The second transaction waits for the first one to end
+        with pytest.raises(OperationalError, match="locked"):
+            lock_next_command_index(session_2, "variant")
+        session_2.rollback()
+        session_1.add(
+            CommandBlock(study_id="variant", index=0, command="create_area", version=1, args="{}", study_version="8.8")
+        )
+        session_1.commit()
+        assert lock_next_command_index(session_2, "variant") == 1
+    engine.dispose()
@@ -0,0 +1,223 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+from antarest.matrixstore.service import MatrixService
+from antarest.study.business.model.config.playlist_model import PlaylistUpdate
+from antarest.study.business.model.thermal_cluster_model import ThermalClusterCreation
+from antarest.study.model import STUDY_VERSION_8_8
+from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
+from antarest.study.storage.variantstudy.command_optimizer import optimize_commands
+from antarest.study.storage.variantstudy.model.command.common import (
+    CommandFootprint,
+    get_resource_from_path,
+    resources_overlap,
+)
+from antarest.study.storage.variantstudy.model.command.create_area import CreateArea
+from antarest.study.storage.variantstudy.model.command.create_cluster import CreateCluster
+from antarest.study.storage.variantstudy.model.command.icommand import ICommand
+from antarest.study.storage.variantstudy.model.command.remove_cluster import RemoveCluster
+from antarest.study.storage.variantstudy.model.command.replace_matrix import ReplaceMatrix
+from antarest.study.storage.variantstudy.model.command.update_config import UpdateConfig
+from antarest.study.storage.variantstudy.model.command.update_playlist import UpdatePlaylist
+from antarest.study.storage.variantstudy.model.command_context import CommandContext
+from tests.conftest import empty_study_fixture
+from tests.helpers import build_dao_from_file_study
+
+VERSION = STUDY_VERSION_8_8
+
+
+def _read_files(study: FileStudy) -> dict[str, bytes]:
+    study_path = study.config.study_path
+    return {
+        path.relative_to(study_path).as_posix(): path.read_bytes()
+        for path in sorted(study_path.rglob("*"))
+        # The study metadata contain the creation date
+        if path.is_file() and path.name != "study.antares"
+    }
+
+
+def _generate(study: FileStudy, commands: Sequence[ICommand], command_context: CommandContext) -> bool:
+    """
+    Applies the commands until one of them fails, like the variant generation.
+
+    Returns:
+        Whether all the commands succeeded.
+    """
+    dao = build_dao_from_file_study(study, command_context)
+    return all(command.apply(dao).status for command in commands)
+
+
+def assert_equivalent_generation(
+    commands: Sequence[ICommand], tmp_path: Path, matrix_service: MatrixService, command_context: CommandContext
+) -> list[ICommand]:
+    """
+    Generates a study with the given commands and with the optimized ones, and checks that the results are identical:
+    either both generations fail, or they produce the same files.
+
+    Returns:
+        The optimized commands.
+    """
+    optimized = optimize_commands(commands)
+    original_study = empty_study_fixture(VERSION, matrix_service, tmp_path / "original")
+    optimized_study = empty_study_fixture(VERSION, matrix_service, tmp_path / "optimized")
+    succeeded = _generate(original_study, commands, command_context)
+    assert _generate(optimized_study, optimized, command_context) == succeeded
+    if succeeded:
+        assert _read_files(optimized_study) == _read_files(original_study)
+    return optimized
+
+
+class TestCommandFootprint:
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("settings/generaldata/general/nbyears", ("settings", "generaldata", "general", "nbyears")),
+            ("input/areas/fr/optimization/filtering", ("area", "fr")),
+            ("input/areas/list", None),
+            ("input/links/fr/properties/it", ("area", "fr", "links")),
+            ("input/load/series/load_fr", ("area", "fr", "load")),
+            ("input/thermal/series/fr/gas/series", ("area", "fr", "thermal")),
+            ("input/thermal/areas", None),
+            ("input/hydro/common/capacity/maxpower_fr", None),
+            ("input/bindingconstraints/bindingconstraints", ("constraints",)),
+            ("user/expansion/settings", None),
+        ],
+    )
+    def test_get_resource_from_path(self, path: str, expected: tuple[str, ...] | None) -> None:
+        assert get_resource_from_path(path) == expected
+
+    def test_conflicts(self) -> None:
+        assert resources_overlap(("area", "fr"), ("area", "fr", "thermal"))
+        assert not resources_overlap(("area", "fr", "links"), ("area", "fr", "thermal"))
+
+        create = CommandFootprint(writes=frozenset({("area", "fr", "thermal")}))
+        remove = CommandFootprint(reads=frozenset({("constraints",)}), writes=frozenset({("settings",)}))
+        assert not create.conflicts_with(remove)
+        assert remove.conflicts_with(CommandFootprint(writes=frozenset({("constraints",)})))
+        assert create.conflicts_with(CommandFootprint(reads=frozenset({("area", "fr")})))
+
+
+class TestOptimizeCommands:
+    def test_superseded_commands(
+        self, tmp_path: Path, matrix_service: MatrixService, command_context: CommandContext
+    ) -> None:
+        def update_config(target: str, data: int) -> UpdateConfig:
+            return UpdateConfig(target=target, data=data, command_context=command_context, study_version=VERSION)
+
+        def replace_matrix(value: float) -> ReplaceMatrix:
+            return ReplaceMatrix(
+                target="input/load/series/load_fr",
+                matrix=[[value]] * 8760,
+                command_context=command_context,
+                study_version=VERSION,
+            )
+
+        commands = [
+            CreateArea(area_name="FR", command_context=command_context, study_version=VERSION),
+            update_config("settings/generaldata/general/nbyears", 2),
+            replace_matrix(1),
+            update_config("settings/generaldata/general/simulation.start", 8),
+            update_config("settings/generaldata/general/nbyears", 3),
+            replace_matrix(2),
+            # The playlist depends on the number of years: the previous update cannot be skipped
+            UpdatePlaylist(
+                playlist=PlaylistUpdate.model_validate({"years": {1: {"status": False}}}),
+                command_context=command_context,
+                study_version=VERSION,
+            ),
+            update_config("settings/generaldata/general/nbyears", 4),
+        ]
+        optimized = assert_equivalent_generation(commands, tmp_path, matrix_service, command_context)
+        assert optimized == [commands[0], commands[3], commands[4], commands[5], commands[6], commands[7]]
+
+    def test_reverted_commands(
+        self, tmp_path: Path, matrix_service: MatrixService, command_context: CommandContext
+    ) -> None:
+        def create_cluster(area_id: str, name: str) -> CreateCluster:
+            return CreateCluster(
+                area_id=area_id,
+                parameters=ThermalClusterCreation(name=name, nominal_capacity=100),
+                command_context=command_context,
+                study_version=VERSION,
+            )
+
+        def remove_cluster(area_id: str, cluster_id: str) -> RemoveCluster:
+            return RemoveCluster(
+                area_id=area_id, cluster_id=cluster_id, command_context=command_context, study_version=VERSION
+            )
+
+        commands = [
+            CreateArea(area_name="DE", command_context=command_context, study_version=VERSION),
+            CreateArea(area_name="FR", command_context=command_context, study_version=VERSION),
+            create_cluster("fr", "Gas"),
+            create_cluster("de", "Coal"),
+            remove_cluster("fr", "gas"),
+            # Another cluster of the same area is created in between: both are kept
+            create_cluster("de", "Oil"),
+            create_cluster("de", "Nuclear"),
+            remove_cluster("de", "oil"),
+            # The removal of the cluster guarantees that it can be created again
+            create_cluster("fr", "Gas"),
+            remove_cluster("fr", "gas"),
+        ]
+        optimized = assert_equivalent_generation(commands, tmp_path, matrix_service, command_context)
+        assert optimized == [commands[0], commands[1], commands[3], commands[5], commands[6], commands[7]]
+
+        # The creation of the cluster may fail if the area is not new: both are kept
+        commands = [create_cluster("fr", "Gas"), remove_cluster("fr", "gas")]
+        assert optimize_commands(commands) == commands
+
+    def test_failing_commands_are_kept(
+        self, tmp_path: Path, matrix_service: MatrixService, command_context: CommandContext
+    ) -> None:
+        def replace_series() -> ReplaceMatrix:
+            return ReplaceMatrix(
+                target="input/thermal/series/fr/gas/series",
+                matrix=[[1.0]] * 8760,
+                command_context=command_context,
+                study_version=VERSION,
+            )
+
+        area = CreateArea(area_name="FR", command_context=command_context, study_version=VERSION)
+        create = CreateCluster(
+            area_id="fr",
+            parameters=ThermalClusterCreation(name="Gas", nominal_capacity=100),
+            command_context=command_context,
+            study_version=VERSION,
+        )
+        remove = RemoveCluster(area_id="fr", cluster_id="gas", command_context=command_context, study_version=VERSION)
+
+        # The series of the cluster are replaced before it exists
+        commands = [area, replace_series(), create, replace_series()]
+        assert assert_equivalent_generation(commands, tmp_path / "replace", matrix_service, command_context) == commands
+
+        # The cluster is created twice
+        commands = [area, create, create.model_copy(), remove]
+        assert assert_equivalent_generation(commands, tmp_path / "create", matrix_service, command_context) == commands
+
+    def test_unknown_footprint_is_a_barrier(self, command_context: CommandContext) -> None:
+        commands = [
+            UpdateConfig(
+                target="settings/generaldata/general/nbyears",
+                data=value,
+                command_context=command_context,
+                study_version=VERSION,
+            )
+            for value in (2, 3)
+        ]
+        area = CreateArea(area_name="FR", command_context=command_context, study_version=VERSION)
+        assert optimize_commands([commands[0], area, commands[1]]) == [commands[0], area, commands[1]]
+        assert optimize_commands([commands[0], commands[1], area]) == [commands[1], area]
@@ -0,0 +1,168 @@
+# Copyright (c) 2026, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from antarest.matrixstore.service import MatrixService
+from antarest.study.business.model.thermal_cluster_model import ThermalClusterCreation
+from antarest.study.model import STUDY_VERSION_8_8
+from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
+from antarest.study.storage.variantstudy.command_metrics import get_slowest_commands
+from antarest.study.storage.variantstudy.model.command.common import CommandFootprint
+from antarest.study.storage.variantstudy.model.command.create_area import CreateArea
+from antarest.study.storage.variantstudy.model.command.create_cluster import CreateCluster
+from antarest.study.storage.variantstudy.model.command.create_link import CreateLink
+from antarest.study.storage.variantstudy.model.command.icommand import ICommand
+from antarest.study.storage.variantstudy.model.command_context import CommandContext
+from antarest.study.storage.variantstudy.model.model import GenerationResultInfoDTO
+from antarest.study.storage.variantstudy.variant_command_generator import (
+    apply_commands_to_variant,
+    build_dependencies,
+)
+from tests.conftest import empty_study_fixture
+from tests.helpers import build_dao_from_file_study, create_variant_study
+
+VERSION = STUDY_VERSION_8_8
+AREAS = ["de", "es", "fr", "it"]
+
+
+def _read_files(study: FileStudy) -> dict[str, bytes]:
+    study_path = study.config.study_path
+    return {
+        path.relative_to(study_path).as_posix(): path.read_bytes()
+        for path in sorted(study_path.rglob("*"))
+        # The study metadata contain the creation date
+        if path.is_file() and path.name != "study.antares"
+    }
+
+
+def _create_cluster(area_id: str, name: str, command_context: CommandContext) -> CreateCluster:
+    return CreateCluster(
+        area_id=area_id,
+        parameters=ThermalClusterCreation(name=name, nominal_capacity=100),
+        command_context=command_context,
+        study_version=VERSION,
+    )
+
+
+def _without_metrics(results: GenerationResultInfoDTO) -> list[dict[str, Any]]:
+    return [{k: v for k, v in detail.items() if k != "metrics"} for detail in results.details]  # type: ignore
+
+
+def _generate(
+    study: FileStudy, commands: list[ICommand], command_context: CommandContext, max_workers: int
+) -> GenerationResultInfoDTO:
+    return apply_commands_to_variant(
+        [commands],
+        metadata=create_variant_study(id="variant"),
+        study=build_dao_from_file_study(study, command_context),
+        max_workers=max_workers,
+    )
+
+
+def test_build_dependencies() -> None:
+    def writes(*resources: tuple[str, ...]) -> CommandFootprint:
+        return CommandFootprint(writes=frozenset(resources))
+
+    footprints = [
+        None,
+        writes(("area", "fr", "thermal")),
+        writes(("area", "de", "thermal")),
+        writes(("area", "fr")),
+        writes(("area", "fr", "thermal")),
+        None,
+        writes(("settings",)),
+    ]
+    assert build_dependencies(footprints) == [[], [0], [0], [1, 0], [3, 0], [2, 3, 4], [5]]
+
+
+class TestApplyCommandsToVariant:
+    @pytest.fixture
+    def commands(self, command_context: CommandContext) -> list[ICommand]:
+        commands: list[ICommand] = [
+            CreateArea(area_name=area, command_context=command_context, study_version=VERSION) for area in AREAS
+        ]
+        for k in range(3):
+            commands.extend(_create_cluster(area, f"cluster{k}", command_context) for area in AREAS)
+        commands.extend(
+            CreateLink(
+                area1=area1,
+                area2=area2,
+                parameters={},
+                command_context=command_context,
+                study_version=VERSION,
+            )
+            for area1, area2 in zip(AREAS, AREAS[1:])
+        )
+        return commands
+
+    def test_concurrent_generation(
+        self,
+        commands: list[ICommand],
+        tmp_path: Path,
+        matrix_service: MatrixService,
+        command_context: CommandContext,
+    ) -> None:
+        sequential_study = empty_study_fixture(VERSION, matrix_service, tmp_path / "sequential")
+        concurrent_study = empty_study_fixture(VERSION, matrix_service, tmp_path / "concurrent")
+
+        sequential = _generate(sequential_study, commands, command_context, max_workers=1)
+        concurrent = _generate(concurrent_study, commands, command_context, max_workers=4)
+
+        assert sequential.success and concurrent.success
+        assert _without_metrics(concurrent) == _without_metrics(sequential)
+        assert _read_files(concurrent_study) == _read_files(sequential_study)
+
+    def test_concurrent_generation_stops_at_first_failure(
+        self,
+        commands: list[ICommand],
+        tmp_path: Path,
+        matrix_service: MatrixService,
+        command_context: CommandContext,
+    ) -> None:
+        # The cluster cannot be created in an unknown area
+        commands.insert(len(AREAS) + 1, _create_cluster("unknown", "cluster", command_context))
+        study = empty_study_fixture(VERSION, matrix_service, tmp_path)
+
+        results = _generate(study, commands, command_context, max_workers=4)
+
+        assert not results.success
+        assert len(results.details) == len(AREAS) + 2
+        assert [detail["status"] for detail in results.details] == [True] * (len(AREAS) + 1) + [False]  # type: ignore
+
+    def test_command_metrics(
+        self,
+        commands: list[ICommand],
+        tmp_path: Path,
+        matrix_service: MatrixService,
+        command_context: CommandContext,
+    ) -> None:
+        study = empty_study_fixture(VERSION, matrix_service, tmp_path)
+
+        results = _generate(study, commands, command_context, max_workers=1)
+
+        metrics = {detail["name"]: detail["metrics"] for detail in results.details}  # type: ignore
+        # The creation of an area writes its INI files and its default matrices
+        assert metrics["create_area"]["duration"] > 0
+        assert metrics["create_area"]["ini_files_touched"] > 0
+        assert metrics["create_area"]["matrices_written"] > 0
+        assert metrics["create_area"]["cache_invalidated"] is False
+        assert metrics["create_cluster"]["matrices_written"] > 0
+        assert all(metric["bytes_written"] is None or metric["bytes_written"] > 0 for metric in metrics.values())
+
+        slowest = get_slowest_commands(results.details, limit=3)
+        durations = [detail["metrics"]["duration"] for detail in slowest]
+        assert len(slowest) == 3
+        assert durations == sorted(durations, reverse=True)
+        assert durations[0] == max(detail["metrics"]["duration"] for detail in results.details)  # type: ignore
@@ -24,6 +24,7 @@ export const TaskStatus = {
 export const TaskType = {
   Export: "EXPORT",
   VariantGeneration: "VARIANT_GENERATION",
+  VariantCommandsImport: "VARIANT_COMMANDS_IMPORT",
   Copy: "COPY",
   Archive: "ARCHIVE",
   Unarchive: "UNARCHIVE",
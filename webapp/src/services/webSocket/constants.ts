@@ -18,6 +18,7 @@ export const WsEventType = {
   StudyEdited: "STUDY_EDITED",
   StudyDeleted: "STUDY_DELETED",
   StudyDataEdited: "STUDY_DATA_EDITED",
+  StudySnapshotOutdated: "STUDY_SNAPSHOT_OUTDATED",
   StudyJobStarted: "STUDY_JOB_STARTED",
   StudyJobLogUpdate: "STUDY_JOB_LOG_UPDATE",
   StudyJobCompleted: "STUDY_JOB_COMPLETED",